@@ -364,6 +364,17 @@ class AutoSlots(type):
             # away with only remembering the number of items in the
             # memo.
             #
+            cls = self.__class__
+            if (
+                not cls.__auto_slots__.has_dict
+                and cls.__getstate__ is AutoSlots.Mixin.__getstate__
+                and cls.__setstate__ is AutoSlots.Mixin.__setstate__
+            ):
+                # Fully slotized class using the generic state methods:
+                # copy the slots directly without building (and then
+                # unpacking) the intermediate state lists.
+                if self.__deepcopy_slots__(memo, new_object):
+                    return
             state = self.__getstate__()
             # It is important to keep this temporary state alive (which
             # in turn keeps things like the temporary fields dict alive)
@@ -410,6 +421,40 @@ class AutoSlots(type):
                     )
             new_object.__setstate__(new_state)
 
+        def __deepcopy_slots__(self, memo, new_object):
+            """Copy the slots from this object to the new instance
+
+            This is equivalent to (but faster than) deepcopying the
+            state generated by the generic :py:meth:`__getstate__` and
+            restoring it with :py:meth:`__setstate__`.  Returns False
+            (after restoring the memo) if any slot could not be copied.
+
+            """
+            slot_mappers = self.__auto_slots__.slot_mappers
+            setter = object.__setattr__
+            keep_alive = memo.get('__auto_slots__', None)
+            if keep_alive is None:
+                keep_alive = memo['__auto_slots__'] = []
+            memo_size = len(memo)
+            try:
+                for idx, slot in enumerate(self.__auto_slots__.slots):
+                    val = getattr(self, slot)
+                    if idx in slot_mappers:
+                        mapper = slot_mappers[idx]
+                        # The encoded value may be a temporary object:
+                        # keep it alive (see __deepcopy_state__)
+                        val = mapper(True, val)
+                        keep_alive.append(val)
+                        val = mapper(False, fast_deepcopy(val, memo))
+                    else:
+                        val = fast_deepcopy(val, memo)
+                    setter(new_object, slot, val)
+            except:
+                for _ in range(len(memo) - memo_size):
+                    memo.popitem()
+                return False
+            return True
+
         def __getstate__(self):
             """Generic implementation of `__getstate__`
 
@@ -34,6 +34,7 @@ def get_appsi_extension(in_setup=False, appsi_root=None):
             'lp_writer.cpp',
             'model_base.cpp',
             'fbbt_model.cpp',
+            'linear_repn.cpp',
             'cmodel_bindings.cpp',
         )
     ]
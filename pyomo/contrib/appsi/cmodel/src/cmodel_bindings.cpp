@@ -13,6 +13,7 @@
 #include "expression.hpp"
 #include "fbbt_model.hpp"
 #include "interval.hpp"
+#include "linear_repn.hpp"
 #include "lp_writer.hpp"
 #include "model_base.hpp"
 #include "nl_writer.hpp"
@@ -166,6 +167,10 @@ PYBIND11_MODULE(appsi_cmodel, m) {
       .def(py::init<>())
       .def("write", &LPWriter::write)
       .def("get_solve_cons", &LPWriter::get_solve_cons);
+  py::class_<LinearRepnWalker>(m, "LinearRepnWalker")
+      .def(py::init<py::dict>())
+      .def_readwrite("max_depth", &LinearRepnWalker::max_depth)
+      .def("walk", &LinearRepnWalker::walk);
   py::enum_<ExprType>(m, "ExprType", py::module_local())
       .value("py_float", ExprType::py_float)
       .value("var", ExprType::var)
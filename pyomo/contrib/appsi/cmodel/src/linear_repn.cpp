@@ -0,0 +1,561 @@
+/**___________________________________________________________________________
+ *
+ * Pyomo: Python Optimization Modeling Objects
+ * Copyright (c) 2008-2025
+ * National Technology and Engineering Solutions of Sandia, LLC
+ * Under the terms of Contract DE-NA0003525 with National Technology and
+ * Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+ * rights in this software.
+ * This software is distributed under the 3-clause BSD License.
+ * ___________________________________________________________________________
+**/
+
+#include "linear_repn.hpp"
+#include <vector>
+
+// All arithmetic is performed on the Python objects (through the
+// Python number protocol) so that the numeric types and rounding
+// exactly match the Python visitor.  Only (exact) int and finite float
+// values are supported: anything else (None, NaN, inf, numpy scalars,
+// InvalidNumber, ...) causes a fallback to the Python visitor, which
+// knows how to generate the appropriate warnings / errors.
+
+static inline bool valid_number(PyObject *val) {
+  if (PyFloat_CheckExact(val))
+    return std::isfinite(PyFloat_AS_DOUBLE(val));
+  return PyLong_CheckExact(val);
+}
+
+static inline bool number_result(py::object &ans, PyObject *res) {
+  if (res == nullptr) {
+    PyErr_Clear();
+    return false;
+  }
+  ans = py::reinterpret_steal<py::object>(res);
+  return valid_number(res);
+}
+
+static inline bool truth(PyObject *val) { return PyObject_IsTrue(val) == 1; }
+
+LinearRepnWalker::LinearRepnWalker(py::dict types) {
+  static const std::unordered_map<std::string, LinearNodeType> categories = {
+      {"var", linear_node_var},
+      {"param", linear_node_param},
+      {"param_data", linear_node_param_data},
+      {"monomial", linear_node_monomial},
+      {"linear", linear_node_linear},
+      {"sum", linear_node_sum},
+      {"negation", linear_node_negation},
+      {"product", linear_node_product},
+      {"division", linear_node_division},
+      {"npv_sum", linear_node_npv_sum},
+      {"npv_product", linear_node_npv_product},
+      {"npv_negation", linear_node_npv_negation},
+      {"npv_division", linear_node_npv_division},
+  };
+  for (auto item : types) {
+    std::string category = item.first.cast<std::string>();
+    auto it = categories.find(category);
+    if (it == categories.end())
+      throw py::value_error("Unknown linear node category '" + category + "'");
+    for (auto cls : item.second) {
+      if (!PyType_Check(cls.ptr()))
+        throw py::type_error("Expected a type in category '" + category +
+                             "'");
+      node_types[(PyTypeObject *)cls.ptr()] = it->second;
+    }
+  }
+  one = py::int_(1);
+  zero = py::int_(0);
+  neg_one = py::int_(-1);
+  str_args = py::str("_args_");
+  str_nargs = py::str("_nargs");
+  str_fixed = py::str("_fixed");
+  str_value = py::str("_value");
+  str_public_value = py::str("value");
+}
+
+LinearNodeType LinearRepnWalker::node_type(PyObject *node) {
+  auto it = node_types.find(Py_TYPE(node));
+  if (it == node_types.end())
+    return linear_node_unknown;
+  return it->second;
+}
+
+bool LinearRepnWalker::get_args(PyObject *node, bool nary, PyObject *&args,
+                                Py_ssize_t &n) {
+  // Note: the (borrowed) args are owned by the node, which is alive
+  // for the duration of the walk.
+  PyObject *_args = PyObject_GetAttr(node, str_args.ptr());
+  if (_args == nullptr) {
+    PyErr_Clear();
+    return false;
+  }
+  Py_DECREF(_args);
+  if (!PyList_Check(_args) && !PyTuple_Check(_args))
+    return false;
+  Py_ssize_t size = PySequence_Fast_GET_SIZE(_args);
+  if (nary) {
+    PyObject *nargs = PyObject_GetAttr(node, str_nargs.ptr());
+    if (nargs == nullptr) {
+      PyErr_Clear();
+      return false;
+    }
+    n = PyLong_AsSsize_t(nargs);
+    Py_DECREF(nargs);
+    if (n == -1 && PyErr_Occurred()) {
+      PyErr_Clear();
+      return false;
+    }
+    if (n > size)
+      return false;
+  } else {
+    n = size;
+  }
+  args = _args;
+  return true;
+}
+
+bool LinearRepnWalker::slot_value(PyObject *obj, py::object &ans) {
+  // Return the value stored in the _value slot of a Var / ParamData
+  PyObject *val = PyObject_GetAttr(obj, str_value.ptr());
+  if (val == nullptr) {
+    PyErr_Clear();
+    return false;
+  }
+  ans = py::reinterpret_steal<py::object>(val);
+  return valid_number(val);
+}
+
+bool LinearRepnWalker::is_fixed(PyObject *var, bool &fixed) {
+  PyObject *val = PyObject_GetAttr(var, str_fixed.ptr());
+  if (val == nullptr) {
+    PyErr_Clear();
+    return false;
+  }
+  int ans = PyObject_IsTrue(val);
+  Py_DECREF(val);
+  if (ans < 0) {
+    PyErr_Clear();
+    return false;
+  }
+  fixed = ans;
+  return true;
+}
+
+bool LinearRepnWalker::record(PyObject *var, py::object &vid,
+                              bool &as_constant) {
+  // Mirrors LinearBeforeChildDispatcher._before_var(): Vars already in
+  // the var_map are always linear terms.  Otherwise, fixed Vars are
+  // constants and free Vars are recorded in the var_map.
+  vid = py::reinterpret_steal<py::object>(PyLong_FromVoidPtr(var));
+  as_constant = false;
+  int found = PyDict_Contains(var_map, vid.ptr());
+  if (found < 0)
+    throw py::error_already_set();
+  if (found)
+    return true;
+  bool fixed;
+  if (!is_fixed(var, fixed))
+    return false;
+  if (fixed) {
+    as_constant = true;
+    return true;
+  }
+  PyObject *res = PyObject_CallFunctionObjArgs(record_var, var, nullptr);
+  if (res == nullptr)
+    throw py::error_already_set();
+  Py_DECREF(res);
+  return true;
+}
+
+bool LinearRepnWalker::evaluate(PyObject *node, py::object &ans, int depth) {
+  if (PyFloat_CheckExact(node) || PyLong_CheckExact(node)) {
+    ans = py::reinterpret_borrow<py::object>(node);
+    return valid_number(node);
+  }
+  if (depth > max_depth)
+    return false;
+  PyObject *args;
+  Py_ssize_t n;
+  py::object a, b;
+  switch (node_type(node)) {
+  case linear_node_param_data:
+    // ParamData.value returns the _value slot (or raises an exception
+    // for Param.NoValue, which is not a valid number)
+    return slot_value(node, ans);
+  case linear_node_param: {
+    PyObject *val = PyObject_GetAttr(node, str_public_value.ptr());
+    if (val == nullptr) {
+      PyErr_Clear();
+      return false;
+    }
+    ans = py::reinterpret_steal<py::object>(val);
+    return valid_number(val);
+  }
+  case linear_node_npv_sum:
+    // sum(args)
+    if (!get_args(node, true, args, n))
+      return false;
+    ans = zero;
+    for (Py_ssize_t i = 0; i < n; ++i) {
+      if (!evaluate(PySequence_Fast_GET_ITEM(args, i), a, depth + 1))
+        return false;
+      if (!number_result(ans, PyNumber_Add(ans.ptr(), a.ptr())))
+        return false;
+    }
+    return true;
+  case linear_node_npv_product:
+    if (!get_args(node, false, args, n) || n != 2)
+      return false;
+    if (!evaluate(PySequence_Fast_GET_ITEM(args, 0), a, depth + 1) ||
+        !evaluate(PySequence_Fast_GET_ITEM(args, 1), b, depth + 1))
+      return false;
+    return number_result(ans, PyNumber_Multiply(a.ptr(), b.ptr()));
+  case linear_node_npv_negation:
+    if (!get_args(node, false, args, n) || n != 1)
+      return false;
+    if (!evaluate(PySequence_Fast_GET_ITEM(args, 0), a, depth + 1))
+      return false;
+    return number_result(ans, PyNumber_Negative(a.ptr()));
+  case linear_node_npv_division:
+    if (!get_args(node, false, args, n) || n != 2)
+      return false;
+    if (!evaluate(PySequence_Fast_GET_ITEM(args, 0), a, depth + 1) ||
+        !evaluate(PySequence_Fast_GET_ITEM(args, 1), b, depth + 1) ||
+        !truth(b.ptr()))
+      return false;
+    return number_result(ans, PyNumber_TrueDivide(a.ptr(), b.ptr()));
+  default:
+    return false;
+  }
+}
+
+bool LinearRepnWalker::add_term(PyObject *linear, PyObject *vid,
+                                PyObject *coef) {
+  PyObject *current = PyDict_GetItemWithError(linear, vid);
+  if (current == nullptr) {
+    if (PyErr_Occurred())
+      throw py::error_already_set();
+    if (PyDict_SetItem(linear, vid, coef) < 0)
+      throw py::error_already_set();
+    return true;
+  }
+  py::object total;
+  if (!number_result(total, PyNumber_Add(current, coef)))
+    return false;
+  if (PyDict_SetItem(linear, vid, total.ptr()) < 0)
+    throw py::error_already_set();
+  return true;
+}
+
+bool LinearRepnWalker::merge(PyObject *dest, PyObject *mult, PyObject *src) {
+  // Mirrors pyomo.repn.linear._merge_dict()
+  int unit = PyObject_RichCompareBool(mult, one.ptr(), Py_EQ);
+  if (unit < 0) {
+    PyErr_Clear();
+    return false;
+  }
+  Py_ssize_t pos = 0;
+  PyObject *vid, *coef;
+  py::object term;
+  while (PyDict_Next(src, &pos, &vid, &coef)) {
+    if (unit) {
+      term = py::reinterpret_borrow<py::object>(coef);
+    } else if (!number_result(term, PyNumber_Multiply(mult, coef))) {
+      return false;
+    }
+    if (!add_term(dest, vid, term.ptr()))
+      return false;
+  }
+  return true;
+}
+
+bool LinearRepnWalker::append(LinearWalkerResult &dest,
+                              LinearWalkerResult &src) {
+  // Mirrors pyomo.repn.linear.LinearRepn.append()
+  if (!src.is_linear)
+    return number_result(dest.constant,
+                         PyNumber_Add(dest.constant.ptr(), src.constant.ptr()));
+  PyObject *mult = src.multiplier.ptr();
+  if (!truth(mult))
+    return true;
+  if (truth(src.constant.ptr())) {
+    py::object term;
+    if (!number_result(term, PyNumber_Multiply(mult, src.constant.ptr())) ||
+        !number_result(dest.constant,
+                       PyNumber_Add(dest.constant.ptr(), term.ptr())))
+      return false;
+  }
+  if (PyDict_GET_SIZE(src.linear.ptr()))
+    return merge(dest.linear.ptr(), mult, src.linear.ptr());
+  return true;
+}
+
+bool LinearRepnWalker::walk_node(PyObject *node, LinearWalkerResult &ans,
+                                 int depth) {
+  if (PyFloat_CheckExact(node) || PyLong_CheckExact(node)) {
+    ans.is_linear = false;
+    ans.constant = py::reinterpret_borrow<py::object>(node);
+    return valid_number(node);
+  }
+  if (depth > max_depth)
+    return false;
+  PyObject *args;
+  Py_ssize_t n;
+  py::object vid;
+  bool as_constant;
+  switch (node_type(node)) {
+  case linear_node_var:
+    if (!record(node, vid, as_constant))
+      return false;
+    ans.is_linear = !as_constant;
+    if (as_constant)
+      return slot_value(node, ans.constant);
+    ans.multiplier = one;
+    ans.constant = zero;
+    ans.linear = py::dict();
+    if (PyDict_SetItem(ans.linear.ptr(), vid.ptr(), one.ptr()) < 0)
+      throw py::error_already_set();
+    return true;
+
+  case linear_node_param:
+  case linear_node_param_data:
+  case linear_node_npv_sum:
+  case linear_node_npv_product:
+  case linear_node_npv_negation:
+  case linear_node_npv_division:
+    ans.is_linear = false;
+    return evaluate(node, ans.constant, depth);
+
+  case linear_node_monomial: {
+    // Mirrors LinearBeforeChildDispatcher._before_monomial()
+    py::object coef, val;
+    if (!get_args(node, false, args, n) || n != 2)
+      return false;
+    PyObject *var = PySequence_Fast_GET_ITEM(args, 1);
+    if (!evaluate(PySequence_Fast_GET_ITEM(args, 0), coef, depth + 1) ||
+        node_type(var) != linear_node_var)
+      return false;
+    if (!record(var, vid, as_constant))
+      return false;
+    ans.is_linear = false;
+    if (as_constant)
+      return slot_value(var, val) &&
+             number_result(ans.constant,
+                           PyNumber_Multiply(coef.ptr(), val.ptr()));
+    if (!truth(coef.ptr())) {
+      bool fixed;
+      if (!is_fixed(var, fixed) || (fixed && !slot_value(var, val)))
+        return false;
+      ans.constant = coef;
+      return true;
+    }
+    ans.is_linear = true;
+    ans.multiplier = one;
+    ans.constant = zero;
+    ans.linear = py::dict();
+    if (PyDict_SetItem(ans.linear.ptr(), vid.ptr(), coef.ptr()) < 0)
+      throw py::error_already_set();
+    return true;
+  }
+
+  case linear_node_linear: {
+    // Mirrors LinearBeforeChildDispatcher._before_linear()
+    if (!get_args(node, true, args, n))
+      return false;
+    py::object constant = zero;
+    py::dict linear;
+    py::object coef, val;
+    for (Py_ssize_t i = 0; i < n; ++i) {
+      PyObject *arg = PySequence_Fast_GET_ITEM(args, i);
+      PyObject *var = nullptr;
+      LinearNodeType arg_type = node_type(arg);
+      if (arg_type == linear_node_monomial) {
+        PyObject *m_args;
+        Py_ssize_t m_n;
+        if (!get_args(arg, false, m_args, m_n) || m_n != 2)
+          return false;
+        var = PySequence_Fast_GET_ITEM(m_args, 1);
+        if (!evaluate(PySequence_Fast_GET_ITEM(m_args, 0), coef, depth + 1) ||
+            node_type(var) != linear_node_var)
+          return false;
+        if (!truth(coef.ptr())) {
+          bool fixed;
+          if (!is_fixed(var, fixed) || (fixed && !slot_value(var, val)))
+            return false;
+          continue;
+        }
+      } else if (arg_type == linear_node_var) {
+        var = arg;
+        coef = one;
+      }
+      if (var != nullptr) {
+        if (!record(var, vid, as_constant))
+          return false;
+        if (as_constant) {
+          if (!slot_value(var, val) ||
+              !number_result(val, PyNumber_Multiply(coef.ptr(), val.ptr())) ||
+              !number_result(constant,
+                             PyNumber_Add(constant.ptr(), val.ptr())))
+            return false;
+          continue;
+        }
+        if (!add_term(linear.ptr(), vid.ptr(), coef.ptr()))
+          return false;
+        continue;
+      }
+      // Constant (native, Param, or NPV expression) term
+      if (!evaluate(arg, val, depth + 1) ||
+          !number_result(constant, PyNumber_Add(constant.ptr(), val.ptr())))
+        return false;
+    }
+    ans.constant = constant;
+    ans.is_linear = PyDict_GET_SIZE(linear.ptr()) > 0;
+    if (ans.is_linear) {
+      ans.multiplier = one;
+      ans.linear = linear;
+    }
+    return true;
+  }
+
+  case linear_node_sum: {
+    if (!get_args(node, true, args, n))
+      return false;
+    ans.multiplier = one;
+    ans.constant = zero;
+    ans.linear = py::dict();
+    for (Py_ssize_t i = 0; i < n; ++i) {
+      PyObject *arg = PySequence_Fast_GET_ITEM(args, i);
+      if (node_type(arg) == linear_node_var) {
+        // Shortcut for appending a Var (without creating a result dict)
+        if (!record(arg, vid, as_constant))
+          return false;
+        if (!as_constant) {
+          if (!add_term(ans.linear.ptr(), vid.ptr(), one.ptr()))
+            return false;
+          continue;
+        }
+      }
+      LinearWalkerResult child;
+      if (!walk_node(arg, child, depth + 1) || !append(ans, child))
+        return false;
+    }
+    // Mirrors LinearRepn.walker_exitNode()
+    ans.is_linear = PyDict_GET_SIZE(ans.linear.ptr()) > 0;
+    return true;
+  }
+
+  case linear_node_negation:
+    if (!get_args(node, false, args, n) || n != 1)
+      return false;
+    if (!walk_node(PySequence_Fast_GET_ITEM(args, 0), ans, depth + 1))
+      return false;
+    if (ans.is_linear)
+      return number_result(ans.multiplier,
+                           PyNumber_Multiply(ans.multiplier.ptr(),
+                                             neg_one.ptr()));
+    return number_result(ans.constant,
+                         PyNumber_Multiply(neg_one.ptr(), ans.constant.ptr()));
+
+  case linear_node_product: {
+    LinearWalkerResult other;
+    if (!get_args(node, false, args, n) || n != 2)
+      return false;
+    if (!walk_node(PySequence_Fast_GET_ITEM(args, 0), ans, depth + 1) ||
+        !walk_node(PySequence_Fast_GET_ITEM(args, 1), other, depth + 1))
+      return false;
+    if (!ans.is_linear) {
+      if (!other.is_linear)
+        return number_result(
+            ans.constant,
+            PyNumber_Multiply(ans.constant.ptr(), other.constant.ptr()));
+      py::object c = ans.constant;
+      ans = other;
+      return number_result(ans.multiplier,
+                           PyNumber_Multiply(ans.multiplier.ptr(), c.ptr()));
+    }
+    if (other.is_linear)
+      // Nonlinear product
+      return false;
+    return number_result(
+        ans.multiplier,
+        PyNumber_Multiply(ans.multiplier.ptr(), other.constant.ptr()));
+  }
+
+  case linear_node_division: {
+    LinearWalkerResult other;
+    if (!get_args(node, false, args, n) || n != 2)
+      return false;
+    if (!walk_node(PySequence_Fast_GET_ITEM(args, 0), ans, depth + 1) ||
+        !walk_node(PySequence_Fast_GET_ITEM(args, 1), other, depth + 1))
+      return false;
+    if (other.is_linear || !truth(other.constant.ptr()))
+      return false;
+    if (ans.is_linear)
+      return number_result(ans.multiplier,
+                           PyNumber_TrueDivide(ans.multiplier.ptr(),
+                                               other.constant.ptr()));
+    return number_result(
+        ans.constant,
+        PyNumber_TrueDivide(ans.constant.ptr(), other.constant.ptr()));
+  }
+
+  default:
+    return false;
+  }
+}
+
+bool LinearRepnWalker::finalize(LinearWalkerResult &ans) {
+  // Mirrors LinearRepnVisitor.finalizeResult()
+  if (!ans.is_linear) {
+    ans.linear = py::dict();
+    return true;
+  }
+  PyObject *linear = ans.linear.ptr();
+  PyObject *mult = ans.multiplier.ptr();
+  int unit = PyObject_RichCompareBool(mult, one.ptr(), Py_EQ);
+  if (unit < 0) {
+    PyErr_Clear();
+    return false;
+  }
+  if (!unit && !truth(mult)) {
+    ans.constant = zero;
+    ans.linear = py::dict();
+    return true;
+  }
+  std::vector<PyObject *> zeros;
+  Py_ssize_t pos = 0;
+  PyObject *vid, *coef;
+  py::object term;
+  while (PyDict_Next(linear, &pos, &vid, &coef)) {
+    if (!truth(coef)) {
+      zeros.push_back(vid);
+    } else if (!unit) {
+      if (!number_result(term, PyNumber_Multiply(coef, mult)))
+        return false;
+      // Note: replacing the value of an existing key does not
+      // invalidate the PyDict_Next iteration
+      if (PyDict_SetItem(linear, vid, term.ptr()) < 0)
+        throw py::error_already_set();
+    }
+  }
+  for (PyObject *vid : zeros) {
+    if (PyDict_DelItem(linear, vid) < 0)
+      throw py::error_already_set();
+  }
+  if (!unit && truth(ans.constant.ptr()))
+    return number_result(ans.constant,
+                         PyNumber_Multiply(ans.constant.ptr(), mult));
+  return true;
+}
+
+py::object LinearRepnWalker::walk(py::handle expr, py::dict var_map,
+                                  py::object record_var) {
+  this->var_map = var_map.ptr();
+  this->record_var = record_var.ptr();
+  LinearWalkerResult ans;
+  if (!walk_node(expr.ptr(), ans, 0) || !finalize(ans))
+    return py::none();
+  return py::make_tuple(ans.constant, ans.linear);
+}
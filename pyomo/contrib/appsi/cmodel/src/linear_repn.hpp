@@ -0,0 +1,86 @@
+/**___________________________________________________________________________
+ *
+ * Pyomo: Python Optimization Modeling Objects
+ * Copyright (c) 2008-2025
+ * National Technology and Engineering Solutions of Sandia, LLC
+ * Under the terms of Contract DE-NA0003525 with National Technology and
+ * Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+ * rights in this software.
+ * This software is distributed under the 3-clause BSD License.
+ * ___________________________________________________________________________
+**/
+
+#ifndef LINEAR_REPN_HEADER
+#define LINEAR_REPN_HEADER
+
+#include "common.hpp"
+#include <cmath>
+#include <string>
+#include <unordered_map>
+
+// Compiled implementation of the pyomo.repn.linear.LinearRepnVisitor
+// walker for the common (linear) node types.  The walker operates
+// directly on the Pyomo expression objects and reproduces the results
+// (including the numeric types and the order in which variables are
+// recorded) of the Python visitor.  Any node that is not supported
+// causes walk() to return None, and the caller is expected to fall back
+// on the Python visitor.
+
+enum LinearNodeType {
+  linear_node_unknown = 0,
+  linear_node_var,
+  linear_node_param,
+  linear_node_param_data,
+  linear_node_monomial,
+  linear_node_linear,
+  linear_node_sum,
+  linear_node_negation,
+  linear_node_product,
+  linear_node_division,
+  linear_node_npv_sum,
+  linear_node_npv_product,
+  linear_node_npv_negation,
+  linear_node_npv_division
+};
+
+struct LinearWalkerResult {
+  // If `is_linear` is false, the result is the constant in `constant`
+  bool is_linear = false;
+  py::object multiplier;
+  py::object constant;
+  py::object linear;
+};
+
+class LinearRepnWalker {
+public:
+  LinearRepnWalker(py::dict node_types);
+  py::object walk(py::handle expr, py::dict var_map, py::object record_var);
+  int max_depth = 256;
+
+private:
+  std::unordered_map<PyTypeObject *, LinearNodeType> node_types;
+  py::object one;
+  py::object zero;
+  py::object neg_one;
+  py::str str_args;
+  py::str str_nargs;
+  py::str str_fixed;
+  py::str str_value;
+  py::str str_public_value;
+  PyObject *var_map = nullptr;
+  PyObject *record_var = nullptr;
+
+  LinearNodeType node_type(PyObject *node);
+  bool walk_node(PyObject *node, LinearWalkerResult &ans, int depth);
+  bool evaluate(PyObject *node, py::object &ans, int depth);
+  bool get_args(PyObject *node, bool nary, PyObject *&args, Py_ssize_t &n);
+  bool slot_value(PyObject *obj, py::object &ans);
+  bool is_fixed(PyObject *var, bool &fixed);
+  bool record(PyObject *var, py::object &vid, bool &fixed);
+  bool append(LinearWalkerResult &dest, LinearWalkerResult &src);
+  bool add_term(PyObject *linear, PyObject *vid, PyObject *coef);
+  bool merge(PyObject *dest, PyObject *mult, PyObject *src);
+  bool finalize(LinearWalkerResult &ans);
+};
+
+#endif
@@ -9,6 +9,7 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+from concurrent.futures import Future
 from typing import Sequence, Dict, Optional, Mapping, List, Tuple
 import os
 
@@ -31,6 +32,7 @@ from pyomo.core.staleflag import StaleFlagManager
 from pyomo.scripting.solve_config import default_config_block
 from pyomo.contrib.solver.common.config import SolverConfig, PersistentSolverConfig
 from pyomo.contrib.solver.common.util import get_objective
+from pyomo.contrib.solver.common.solution_loader import load_var_values
 from pyomo.contrib.solver.common.results import (
     Results,
     legacy_solver_status_map,
@@ -62,6 +64,25 @@ class Availability(IntEnum):
         return self.name
 
 
+def run_in_future(future: Future, fcn, *args, **kwargs) -> None:
+    """Call ``fcn(*args, **kwargs)``, recording the outcome in `future`
+
+    The return value (or the raised exception) is set on the future.
+    Nothing is called if the future was cancelled before it started.
+    """
+    if not future.set_running_or_notify_cancel():
+        return
+    try:
+        result = fcn(*args, **kwargs)
+    except BaseException as e:
+        future.set_exception(e)
+        if not isinstance(e, Exception):
+            # Do not swallow KeyboardInterrupt / SystemExit
+            raise
+    else:
+        future.set_result(result)
+
+
 class SolverBase:
     """
     This base class defines the methods required for all solvers:
@@ -115,6 +136,71 @@ class SolverBase:
             f"Derived class {self.__class__.__name__} failed to implement required method 'solve'."
         )
 
+    @document_kwargs_from_configdict(CONFIG)
+    def solve_async(self, model: BlockData, **kwargs) -> Future:
+        """
+        Solve a Pyomo model, returning a future for the results.
+
+        Interfaces that run the solver in a subprocess (e.g., Ipopt)
+        return as soon as the problem has been written and complete the
+        solve in the background, allowing a single Python process to
+        drive many solvers concurrently.  The base implementation
+        solves the model in the calling thread and returns a completed
+        future.  In either case, the model should not be modified until
+        the future completes.  Use :py:func:`asyncio.wrap_future` to
+        await the result from a coroutine.
+
+        Parameters
+        ----------
+        model: BlockData
+            The Pyomo model to be solved
+        **kwargs
+            Additional keyword arguments (see :py:meth:`solve`)
+
+        Returns
+        -------
+        future: :class:`concurrent.futures.Future`
+            A future whose result is the
+            :class:`Results<pyomo.contrib.solver.common.results.Results>`
+            object (or that holds the exception raised by the solve)
+        """
+        future = Future()
+        run_in_future(future, self.solve, model, **kwargs)
+        return future
+
+    @document_kwargs_from_configdict(CONFIG)
+    def solve_batch(
+        self, models: Sequence[BlockData], max_workers: Optional[int] = None, **kwargs
+    ) -> List[Results]:
+        """
+        Solve a sequence of independent Pyomo models.
+
+        Interfaces that run the solver in a subprocess (e.g., Ipopt)
+        solve up to `max_workers` models concurrently.  The base
+        implementation solves the models one at a time.
+
+        If a solve raises an exception, no further solves are started
+        and the exception raised by the first failing model is
+        propagated once the solves already in progress have finished.
+
+        Parameters
+        ----------
+        models: Sequence[BlockData]
+            The Pyomo models to be solved (each model must be distinct)
+        max_workers: int, optional
+            The maximum number of concurrent solves (defaults to the
+            number of CPUs; ignored by interfaces that solve in-process)
+        **kwargs
+            Additional keyword arguments (see :py:meth:`solve`) applied
+            to every solve
+
+        Returns
+        -------
+        results: List[:class:`Results<pyomo.contrib.solver.common.results.Results>`]
+            The results objects (in the same order as `models`)
+        """
+        return [self.solve(model, **kwargs) for model in models]
+
     def available(self) -> Availability:
         """Test if the solver is available on this system.
 
@@ -219,8 +305,8 @@ class PersistentSolverBase(SolverBase):
             A list of the variables whose solution should be loaded. If vars_to_load
             is None, then the solution to all primal variables will be loaded.
         """
-        for var, val in self._get_primals(vars_to_load=vars_to_load).items():
-            var.set_value(val, skip_validation=True)
+        primals = self._get_primals(vars_to_load=vars_to_load)
+        load_var_values(list(primals.keys()), list(primals.values()))
         StaleFlagManager.mark_all_as_stale(delayed=True)
 
     def _get_primals(
@@ -342,6 +342,21 @@ class AutoUpdateConfig(ConfigDict):
                 certain objectives are not being modified.""",
             ),
         )
+        self.track_changes: bool = self.declare(
+            'track_changes',
+            ConfigValue(
+                domain=bool,
+                default=True,
+                description="""
+                If True, the changes checked for by the options above are detected from
+                notifications recorded as the model is modified, so that only the modified
+                components are examined on subsequent solves. If False, the entire model is
+                compared against the solver on every solve. Use False only if the model is
+                modified without going through the component APIs (e.g., when the arrays
+                returned by an array-backed Var are modified after the next solve, or when
+                constraints are reached through References to components in other models).""",
+            ),
+        )
 
 
 class PersistentSolverConfig(SolverConfig):
@@ -13,11 +13,13 @@ import abc
 import datetime
 from typing import List
 
+from pyomo.core.base.block import Block, BlockData
+from pyomo.core.base.component import _ModelChangeObservers
 from pyomo.core.base.constraint import ConstraintData, Constraint
 from pyomo.core.base.sos import SOSConstraintData, SOSConstraint
 from pyomo.core.base.var import VarData
 from pyomo.core.base.param import ParamData, Param
-from pyomo.core.base.objective import ObjectiveData
+from pyomo.core.base.objective import ObjectiveData, Objective
 from pyomo.core.staleflag import StaleFlagManager
 from pyomo.common.collections import ComponentMap
 from pyomo.common.timing import HierarchicalTimer
@@ -25,6 +27,180 @@ from pyomo.contrib.solver.common.results import Results
 from pyomo.contrib.solver.common.util import collect_vars_and_named_exprs, get_objective
 
 
+class _ModelChanges:
+    """The model components that may have changed since the last update"""
+
+    __slots__ = ('constraints', 'params', 'vars', 'named_expressions', 'objective')
+
+    def __init__(self):
+        # Constraint / SOSConstraint data that may have been added,
+        # removed, (de)activated, or modified
+        self.constraints = {}
+        # maps param id to param for params that may have been added,
+        # removed, or modified
+        self.params = {}
+        # maps var id to var for vars that may have been modified
+        self.vars = {}
+        self.named_expressions = False
+        self.objective = False
+
+
+class _ModelChangeTracker:
+    """Record the changes made to a model between updates
+
+    The tracker is registered with the model change observers (see
+    :py:class:`~pyomo.core.base.component._ModelChangeObservers`) and
+    records the components that may have been modified since the last
+    call to :py:meth:`reset`.  Structural changes (adding, removing,
+    (de)activating, or reclassifying components) are expanded into the
+    constraints and mutable parameters they contain when the
+    notification is received, as removed components are detached from
+    the model right after the notification.
+
+    Only changes to the model are recorded: changes to variables and
+    parameters are only recorded for the variables and parameters
+    already held by the solver (`variables` and `params` are the
+    solver's maps of id to variable / parameter), and changes to other
+    components are only recorded for components declared on the model.
+
+    """
+
+    def __init__(self, model, variables, params):
+        self.model = model
+        self.variables = variables
+        self.params = params
+        self.changes = _ModelChanges()
+        _ModelChangeObservers.register(self)
+
+    def detach(self):
+        """Stop recording changes"""
+        _ModelChangeObservers.unregister(self)
+        self.changes = _ModelChanges()
+
+    def reset(self):
+        """Return the changes recorded so far and start a new record"""
+        changes, self.changes = self.changes, _ModelChanges()
+        return changes
+
+    def in_model(self, obj):
+        """Return True if obj is declared (directly or indirectly) on the model"""
+        model = self.model
+        while obj is not None:
+            if obj is model:
+                return True
+            obj = obj.parent_block()
+        return False
+
+    def contains(self, obj, active):
+        """Return True if obj is part of the model
+
+        This mirrors ``model.component_data_objects(active=active,
+        descend_into=True)``: obj (and every block between obj and the
+        model) must still be stored in its parent component, the blocks
+        must be Blocks (e.g., not Disjuncts), and if `active` is True,
+        obj and all its parent blocks must be active.
+
+        """
+        model = self.model
+        while obj is not model:
+            comp = obj.parent_component()
+            if comp is None:
+                return False
+            key = None if comp is obj else obj.index()
+            if comp._data.get(key, None) is not obj:
+                return False
+            if active and not obj.active:
+                return False
+            obj = comp.parent_block()
+            if obj is None:
+                return False
+            if obj is not model and obj.parent_component().ctype is not Block:
+                return False
+        return not active or obj.active
+
+    #
+    # _ModelChangeObservers notification interface
+    #
+
+    def structure_changed(self, obj):
+        if not self.in_model(obj):
+            return
+        changes = self.changes
+        if isinstance(obj, BlockData):
+            blocks = (obj,)
+        elif isinstance(obj, Block):
+            blocks = obj.values()
+        else:
+            blocks = ()
+            ctype = obj.ctype
+            if ctype is Constraint or ctype is SOSConstraint:
+                if obj.parent_component() is obj:
+                    changes.constraints.update(dict.fromkeys(obj.values()))
+                else:
+                    changes.constraints[obj] = None
+            elif ctype is Param:
+                self._record_params(obj)
+            elif ctype is Objective:
+                changes.objective = True
+        for blk in blocks:
+            changes.constraints.update(
+                dict.fromkeys(
+                    blk.component_data_objects(
+                        (Constraint, SOSConstraint), active=None, descend_into=True
+                    )
+                )
+            )
+            for p in blk.component_objects(Param, descend_into=True):
+                self._record_params(p)
+            changes.objective = True
+
+    def _record_params(self, obj):
+        # Record the (mutable) parameters added to / removed from the model
+        comp = obj.parent_component()
+        if comp is None or not comp.mutable:
+            return
+        params = self.changes.params
+        if isinstance(obj, ParamData):
+            params[id(obj)] = obj
+        else:
+            for p in obj.values():
+                params[id(p)] = p
+
+    def var_changed(self, obj):
+        known = self.variables
+        _vars = self.changes.vars
+        if isinstance(obj, VarData):
+            if id(obj) in known:
+                _vars[id(obj)] = obj
+        else:
+            # Note: only the existing data are checked (so that we do
+            # not create the data of array-backed Vars)
+            for v in list(obj._data.values()):
+                if id(v) in known:
+                    _vars[id(v)] = v
+
+    def param_changed(self, obj):
+        known = self.params
+        params = self.changes.params
+        if isinstance(obj, ParamData):
+            if id(obj) in known:
+                params[id(obj)] = obj
+        else:
+            for p in obj.values():
+                if id(p) in known:
+                    params[id(p)] = p
+
+    def expression_changed(self, obj):
+        if isinstance(obj, (ConstraintData, SOSConstraintData)):
+            if self.in_model(obj):
+                self.changes.constraints[obj] = None
+        elif isinstance(obj, ObjectiveData):
+            if self.in_model(obj):
+                self.changes.objective = True
+        else:
+            self.changes.named_expressions = True
+
+
 class PersistentSolverUtils(abc.ABC):
     def __init__(self, treat_fixed_vars_as_params=True):
         """
@@ -61,6 +237,10 @@ class PersistentSolverUtils(abc.ABC):
         self._expr_types = None
         self._treat_fixed_vars_as_params = treat_fixed_vars_as_params
         self._active_config = self.config
+        if getattr(self, '_change_tracker', None) is not None:
+            # Resetting the solver: stop recording changes to the old model
+            self._change_tracker.detach()
+        self._change_tracker = None
 
     def set_instance(self, model):
         saved_config = self.config
@@ -127,9 +307,19 @@ class PersistentSolverUtils(abc.ABC):
         for con in cons:
             if con in self._named_expressions:
                 raise ValueError(f'Constraint {con.name} has already been added')
-            self._active_constraints[con] = con.expr
-            tmp = collect_vars_and_named_exprs(con.expr)
-            named_exprs, variables, fixed_vars, external_functions = tmp
+            if con._linear_canonical_form:
+                # Linear constraints stored in canonical form (e.g.,
+                # MatrixConstraint rows) can not be modified: collect
+                # the variables directly from the linear terms (without
+                # generating the constraint expression)
+                self._active_constraints[con] = None
+                named_exprs = external_functions = ()
+                variables = list({id(v): v for v, c in con.terms}.values())
+                fixed_vars = [v for v in variables if v.fixed]
+            else:
+                self._active_constraints[con] = con.expr
+                tmp = collect_vars_and_named_exprs(con.expr)
+                named_exprs, variables, fixed_vars, external_functions = tmp
             self._check_for_new_vars(variables)
             self._named_expressions[con] = [(e, e.expr) for e in named_exprs]
             if len(external_functions) > 0:
@@ -200,6 +390,12 @@ class PersistentSolverUtils(abc.ABC):
             self._set_objective(obj)
 
     def add_block(self, block):
+        if block is self._model:
+            # (Re)start recording the changes made to the model (so
+            # that update() does not need to compare the entire model)
+            if self._change_tracker is not None:
+                self._change_tracker.detach()
+            self._change_tracker = _ModelChangeTracker(block, self._vars, self._params)
         param_dict = {}
         for p in block.component_objects(Param, descend_into=True):
             if p.mutable:
@@ -338,6 +534,13 @@ class PersistentSolverUtils(abc.ABC):
         if timer is None:
             timer = HierarchicalTimer()
         config = self._active_config.auto_updates
+        # The changes recorded since the last update (or None if we
+        # need to compare the entire model)
+        changes = None
+        if self._change_tracker is not None:
+            changes = self._change_tracker.reset()
+            if not config.track_changes:
+                changes = None
         new_vars = []
         old_vars = []
         new_params = []
@@ -350,10 +553,22 @@ class PersistentSolverUtils(abc.ABC):
         current_sos_dict = {}
         timer.start('vars')
         if config.update_vars:
-            start_vars = {v_id: v_tuple[0] for v_id, v_tuple in self._vars.items()}
+            if changes is None:
+                start_vars = {v_id: v_tuple[0] for v_id, v_tuple in self._vars.items()}
+            else:
+                start_vars = {
+                    v_id: v for v_id, v in changes.vars.items() if v_id in self._vars
+                }
         timer.stop('vars')
         timer.start('params')
-        if config.check_for_new_or_removed_params:
+        if config.check_for_new_or_removed_params and changes is not None:
+            for p_id, p in changes.params.items():
+                if self._change_tracker.contains(p, False):
+                    if p_id not in self._params:
+                        new_params.append(p)
+                elif p_id in self._params:
+                    old_params.append(p)
+        elif config.check_for_new_or_removed_params:
             current_params_dict = {}
             for p in self._model.component_objects(Param, descend_into=True):
                 if p.mutable:
@@ -367,7 +582,18 @@ class PersistentSolverUtils(abc.ABC):
                     old_params.append(p)
         timer.stop('params')
         timer.start('cons')
-        if config.check_for_new_or_removed_constraints or config.update_constraints:
+        if changes is not None:
+            if config.check_for_new_or_removed_constraints or config.update_constraints:
+                self._sort_changed_constraints(
+                    changes.constraints,
+                    current_cons_dict,
+                    current_sos_dict,
+                    new_cons,
+                    old_cons,
+                    new_sos,
+                    old_sos,
+                )
+        elif config.check_for_new_or_removed_constraints or config.update_constraints:
             current_cons_dict = {
                 c: None
                 for c in self._model.component_data_objects(
@@ -405,7 +631,7 @@ class PersistentSolverUtils(abc.ABC):
 
         # sticking this between removal and addition
         # is important so that we don't do unnecessary work
-        if config.update_parameters:
+        if config.update_parameters and (changes is None or changes.params):
             self.update_parameters()
 
         self.add_parameters(new_params)
@@ -422,7 +648,11 @@ class PersistentSolverUtils(abc.ABC):
         need_to_set_objective = False
         if config.update_constraints:
             for c in current_cons_dict.keys():
-                if c not in new_cons_set and c.expr is not self._active_constraints[c]:
+                if (
+                    c not in new_cons_set
+                    and not c._linear_canonical_form
+                    and c.expr is not self._active_constraints[c]
+                ):
                     cons_to_remove_and_add[c] = None
             sos_to_update = []
             for c in current_sos_dict.keys():
@@ -433,8 +663,15 @@ class PersistentSolverUtils(abc.ABC):
         timer.stop('cons')
         timer.start('vars')
         if config.update_vars:
-            end_vars = {v_id: v_tuple[0] for v_id, v_tuple in self._vars.items()}
-            vars_to_check = [v for v_id, v in end_vars.items() if v_id in start_vars]
+            if changes is None:
+                end_vars = {v_id: v_tuple[0] for v_id, v_tuple in self._vars.items()}
+                vars_to_check = [
+                    v for v_id, v in end_vars.items() if v_id in start_vars
+                ]
+            else:
+                vars_to_check = [
+                    v for v_id, v in start_vars.items() if v_id in self._vars
+                ]
         if config.update_vars:
             vars_to_update = []
             for v in vars_to_check:
@@ -460,7 +697,9 @@ class PersistentSolverUtils(abc.ABC):
         self.add_constraints(cons_to_remove_and_add)
         timer.stop('cons')
         timer.start('named expressions')
-        if config.update_named_expressions:
+        if config.update_named_expressions and (
+            changes is None or changes.named_expressions
+        ):
             cons_to_update = []
             for c, expr_list in self._named_expressions.items():
                 if c in new_cons_set:
@@ -477,18 +716,24 @@ class PersistentSolverUtils(abc.ABC):
                     break
         timer.stop('named expressions')
         timer.start('objective')
-        if self._active_config.auto_updates.check_for_new_objective:
-            pyomo_obj = get_objective(self._model)
-            if pyomo_obj is not self._objective:
-                need_to_set_objective = True
-        else:
-            pyomo_obj = self._objective
-        if self._active_config.auto_updates.update_objective:
-            if pyomo_obj is not None and pyomo_obj.expr is not self._objective_expr:
-                need_to_set_objective = True
-            elif pyomo_obj is not None and pyomo_obj.sense is not self._objective_sense:
-                # we can definitely do something faster here than resetting the whole objective
-                need_to_set_objective = True
+        pyomo_obj = self._objective
+        # Note: if changes were recorded, we only need to look for a
+        # new or modified objective if an objective (or the model
+        # structure) was changed
+        if changes is None or changes.objective:
+            if config.check_for_new_objective:
+                pyomo_obj = get_objective(self._model)
+                if pyomo_obj is not self._objective:
+                    need_to_set_objective = True
+            if config.update_objective:
+                if pyomo_obj is not None and pyomo_obj.expr is not self._objective_expr:
+                    need_to_set_objective = True
+                elif (
+                    pyomo_obj is not None
+                    and pyomo_obj.sense is not self._objective_sense
+                ):
+                    # we can definitely do something faster here than resetting the whole objective
+                    need_to_set_objective = True
         if need_to_set_objective:
             self.set_objective(pyomo_obj)
         timer.stop('objective')
@@ -499,6 +744,41 @@ class PersistentSolverUtils(abc.ABC):
         self.remove_variables(old_vars)
         timer.stop('vars')
 
+    def _sort_changed_constraints(
+        self,
+        constraints,
+        current_cons_dict,
+        current_sos_dict,
+        new_cons,
+        old_cons,
+        new_sos,
+        old_sos,
+    ):
+        """Sort the (possibly) changed constraints recorded by the change tracker
+
+        Constraints that are now active in the model (but were not
+        added to the solver) are new, constraints that were added to
+        the solver but are no longer active in the model are old, and
+        the remaining (active and added) constraints are recorded in
+        the current constraint dicts to be checked for modifications.
+
+        """
+        contains = self._change_tracker.contains
+        for c in constraints:
+            is_sos = isinstance(c, SOSConstraintData)
+            active = contains(c, True) and c.ctype is (
+                SOSConstraint if is_sos else Constraint
+            )
+            if c in self._vars_referenced_by_con:
+                if not active:
+                    (old_sos if is_sos else old_cons).append(c)
+                elif is_sos:
+                    current_sos_dict[c] = None
+                else:
+                    current_cons_dict[c] = None
+            elif active:
+                (new_sos if is_sos else new_cons).append(c)
+
 
 class PersistentSolverMixin:
     """
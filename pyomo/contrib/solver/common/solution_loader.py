@@ -11,11 +11,55 @@
 
 from typing import Sequence, Dict, Optional, Mapping, NoReturn
 
+from pyomo.common.numeric_types import native_numeric_types
+from pyomo.core.base.component import _ModelChangeObservers
 from pyomo.core.base.constraint import ConstraintData
 from pyomo.core.base.var import VarData
 from pyomo.core.staleflag import StaleFlagManager
 
 
+def load_var_values(variables: Sequence[VarData], values) -> None:
+    """
+    Load a vector of values into the value attribute of a list of variables.
+
+    This is the bulk equivalent of calling ``var.set_value(val,
+    skip_validation=True)`` for each variable: the values are converted
+    to Python floats in a single call and stored directly on the
+    variable data in one pass (no unit conversion, domain, or bounds
+    checking is performed for float values).  As with the per-variable path, callers
+    are responsible for marking all other variables as stale after
+    the batch update.  Model change observers are notified of the
+    changes to the values of fixed variables (see
+    :py:class:`~pyomo.core.base.component._ModelChangeObservers`).
+
+    Parameters
+    ----------
+    variables: list
+        The variables to load.
+    values: numpy.ndarray or list
+        The values to load, in the same order as `variables`.
+    """
+    if hasattr(values, 'tolist'):
+        values = values.tolist()
+    flag = StaleFlagManager.get_flag(0)
+    # If we are in the "delayed" stale mode, then updating a non-stale
+    # variable must advance the global stale flag (see
+    # StaleFlagManager.get_flag).  Do that once for the entire batch.
+    if any(var._stale == flag for var in variables):
+        flag = StaleFlagManager.get_flag(flag)
+    notify = bool(_ModelChangeObservers.observers)
+    for var, val in zip(variables, values):
+        if val.__class__ not in native_numeric_types:
+            # Non-float values (e.g., numeric expressions or values with
+            # units) go through the standard (conversion) path
+            var.set_value(val, skip_validation=True)
+            continue
+        var._value = val
+        var._stale = flag
+        if notify and var._fixed:
+            _ModelChangeObservers.notify('var_changed', var)
+
+
 class SolutionLoaderBase:
     """
     Base class for all future SolutionLoader classes.
@@ -35,8 +79,8 @@ class SolutionLoaderBase:
             vars_to_load is specified, the values of other variables may also be
             loaded depending on the interface.
         """
-        for var, val in self.get_primals(vars_to_load=vars_to_load).items():
-            var.set_value(val, skip_validation=True)
+        primals = self.get_primals(vars_to_load=vars_to_load)
+        load_var_values(list(primals.keys()), list(primals.values()))
         StaleFlagManager.mark_all_as_stale(delayed=True)
 
     def get_primals(
@@ -9,10 +9,16 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+from operator import attrgetter
+
+from pyomo.common.dependencies import numpy as np
 from pyomo.common.errors import PyomoException
+from pyomo.core.expr.numvalue import value
 from pyomo.core.expr.visitor import ExpressionValueVisitor, nonpyomo_leaf_types
 import pyomo.core.expr as EXPR
 from pyomo.core.base.objective import Objective
+from pyomo.core.base.param import ParamData
+from pyomo.core.base.var import VarData
 
 
 class NoFeasibleSolutionError(PyomoException):
@@ -120,3 +126,143 @@ def collect_vars_and_named_exprs(expr):
         list(_visitor.fixed_vars.values()),
         list(_visitor._external_functions.values()),
     )
+
+
+def _scale_affine(val, factor):
+    const, terms = val
+    return const * factor, {
+        k: (leaf, coef * factor) for k, (leaf, coef) in terms.items()
+    }
+
+
+class _AffineLeafCollector(ExpressionValueVisitor):
+    """Decompose a fixed expression into ``const + sum(coef * leaf)``
+
+    The leaves are the mutable (non-constant) objects in the expression
+    (i.e., mutable Params and fixed Vars).  Results are ``(const,
+    terms)`` tuples, where ``terms`` maps ``id(leaf)`` to ``(leaf,
+    coef)``.  Expressions that are not affine in the leaves return
+    None.
+
+    """
+
+    def visit(self, node, values):
+        if None in values:
+            return None
+        if node.is_named_expression_type():
+            return values[0]
+        if isinstance(node, EXPR.SumExpression):
+            const = 0
+            terms = {}
+            for c, t in values:
+                const += c
+                for k, (leaf, coef) in t.items():
+                    if k in terms:
+                        terms[k] = (leaf, terms[k][1] + coef)
+                    else:
+                        terms[k] = (leaf, coef)
+            return const, terms
+        if isinstance(node, EXPR.NegationExpression):
+            return _scale_affine(values[0], -1)
+        if isinstance(node, EXPR.ProductExpression):
+            if not values[0][1]:
+                return _scale_affine(values[1], values[0][0])
+            if not values[1][1]:
+                return _scale_affine(values[0], values[1][0])
+            return None
+        if isinstance(node, EXPR.DivisionExpression):
+            const, terms = values[1]
+            if terms or not const:
+                return None
+            return _scale_affine(values[0], 1 / const)
+        if any(t for c, t in values):
+            return None
+        return node._apply_operation([c for c, t in values]), {}
+
+    def visiting_potential_leaf(self, node):
+        if type(node) in nonpyomo_leaf_types:
+            return True, (node, {})
+        if node.is_expression_type():
+            return False, None
+        if node.is_constant():
+            return True, (value(node), {})
+        return True, (0, {id(node): (node, 1)})
+
+
+_affine_collector = _AffineLeafCollector()
+
+
+class VectorizedEvaluator(object):
+    """Evaluate a list of fixed expressions into a NumPy array
+
+    Each expression (e.g., a mutable coefficient or bound in a solver
+    model) is compiled into an affine function of the (unique) mutable
+    Params and fixed Vars that it contains.  Calling the evaluator
+    gathers the value of each leaf once and evaluates all the affine
+    expressions with vectorized NumPy operations.  Expressions that are
+    not affine in their leaves are evaluated individually using
+    :py:func:`value`.
+
+    Parameters
+    ----------
+    exprs: Iterable
+        The expressions to evaluate (in order)
+
+    """
+
+    def __init__(self, exprs):
+        leaf_index = {}
+        self._leaves = []
+        self._fallback = []
+        constant = []
+        rows = []
+        cols = []
+        coefs = []
+        for i, expr in enumerate(exprs):
+            repn = _affine_collector.dfs_postorder_stack(expr)
+            if repn is None:
+                self._fallback.append((i, expr))
+                constant.append(0)
+                continue
+            const, terms = repn
+            constant.append(const)
+            for k, (leaf, coef) in terms.items():
+                if k not in leaf_index:
+                    leaf_index[k] = len(self._leaves)
+                    self._leaves.append(leaf)
+                rows.append(i)
+                cols.append(leaf_index[k])
+                coefs.append(coef)
+        # Mutable Params and Vars (the overwhelmingly common leaves) can
+        # be gathered without the overhead of value()
+        if all(isinstance(leaf, (ParamData, VarData)) for leaf in self._leaves):
+            self._get_value = attrgetter('_value')
+        else:
+            self._get_value = value
+        self._n = len(constant)
+        self._constant = np.array(constant, dtype=np.double)
+        self._rows = np.array(rows, dtype=np.intp)
+        self._cols = np.array(cols, dtype=np.intp)
+        self._coefs = np.array(coefs, dtype=np.double)
+
+    def __len__(self):
+        return self._n
+
+    def __call__(self):
+        n = len(self._leaves)
+        try:
+            leaf_values = np.fromiter(
+                map(self._get_value, self._leaves), dtype=np.double, count=n
+            )
+        except (TypeError, ValueError):
+            # Leaves without valid values: value() raises an informative
+            # exception (or handles values that NumPy cannot convert)
+            leaf_values = np.fromiter(
+                map(value, self._leaves), dtype=np.double, count=n
+            )
+        ans = self._constant + np.bincount(
+            self._rows, weights=self._coefs * leaf_values[self._cols], minlength=self._n
+        )
+        for i, expr in self._fallback:
+            ans[i] = value(expr)
+        return ans
@@ -11,6 +11,7 @@
 
 import datetime
 import io
+import itertools
 import math
 import operator
 import os
@@ -41,7 +42,10 @@ from pyomo.contrib.solver.common.results import (
     SolutionStatus,
     TerminationCondition,
 )
-from pyomo.contrib.solver.common.solution_loader import SolutionLoaderBase
+from pyomo.contrib.solver.common.solution_loader import (
+    SolutionLoaderBase,
+    load_var_values,
+)
 
 
 gurobipy, gurobipy_available = attempt_import('gurobipy')
@@ -117,12 +121,14 @@ class GurobiDirectSolutionLoader(SolutionLoaderBase):
         if self._grb_model.SolCount == 0:
             raise NoSolutionError()
 
-        iterator = zip(self._pyo_vars, self._grb_vars.x.tolist())
+        variables = self._pyo_vars
+        values = self._grb_vars.x.tolist()
         if vars_to_load:
             vars_to_load = ComponentSet(vars_to_load)
-            iterator = filter(lambda var_val: var_val[0] in vars_to_load, iterator)
-        for p_var, g_var in iterator:
-            p_var.set_value(g_var, skip_validation=True)
+            mask = list(map(vars_to_load.__contains__, variables))
+            variables = list(itertools.compress(variables, mask))
+            values = list(itertools.compress(values, mask))
+        load_var_values(variables, values)
         StaleFlagManager.mark_all_as_stale(delayed=True)
 
     def get_primals(self, vars_to_load=None, solution_number=0):
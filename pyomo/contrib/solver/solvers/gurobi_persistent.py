@@ -16,7 +16,7 @@ from typing import List, Optional
 from collections.abc import Iterable
 
 from pyomo.common.collections import ComponentSet, ComponentMap, OrderedSet
-from pyomo.common.dependencies import attempt_import
+from pyomo.common.dependencies import attempt_import, numpy as np
 from pyomo.common.errors import ApplicationError
 from pyomo.common.tee import capture_output, TeeStream
 from pyomo.common.timing import HierarchicalTimer
@@ -29,7 +29,6 @@ from pyomo.core.base.sos import SOSConstraintData
 from pyomo.core.base.param import ParamData
 from pyomo.core.expr.numvalue import value, is_constant, is_fixed, native_numeric_types
 from pyomo.repn import generate_standard_repn
-from pyomo.core.expr.numeric_expr import NPV_MaxExpression, NPV_MinExpression
 from pyomo.contrib.solver.common.base import PersistentSolverBase, Availability
 from pyomo.contrib.solver.common.results import (
     Results,
@@ -48,12 +47,16 @@ from pyomo.contrib.solver.common.util import (
     NoReducedCostsError,
     NoSolutionError,
     IncompatibleModelError,
+    VectorizedEvaluator,
 )
 from pyomo.contrib.solver.common.persistent import (
     PersistentSolverUtils,
     PersistentSolverMixin,
 )
-from pyomo.contrib.solver.common.solution_loader import PersistentSolutionLoader
+from pyomo.contrib.solver.common.solution_loader import (
+    PersistentSolutionLoader,
+    load_var_values,
+)
 from pyomo.core.staleflag import StaleFlagManager
 
 
@@ -110,21 +113,17 @@ class GurobiSolutionLoader(PersistentSolutionLoader):
 
 
 class _MutableLowerBound:
-    def __init__(self, expr):
+    def __init__(self, expr, domain_bound):
         self.var = None
         self.expr = expr
-
-    def update(self):
-        self.var.setAttr('lb', value(self.expr))
+        self.domain_bound = domain_bound
 
 
 class _MutableUpperBound:
-    def __init__(self, expr):
+    def __init__(self, expr, domain_bound):
         self.var = None
         self.expr = expr
-
-    def update(self):
-        self.var.setAttr('ub', value(self.expr))
+        self.domain_bound = domain_bound
 
 
 class _MutableLinearCoefficient:
@@ -132,10 +131,8 @@ class _MutableLinearCoefficient:
         self.expr = None
         self.var = None
         self.con = None
-        self.gurobi_model = None
-
-    def update(self):
-        self.gurobi_model.chgCoeff(self.con, self.var, value(self.expr))
+        # the coefficient value last sent to the solver
+        self.value = None
 
 
 class _MutableRangeConstant:
@@ -144,14 +141,14 @@ class _MutableRangeConstant:
         self.rhs_expr = None
         self.con = None
         self.slack_name = None
-        self.gurobi_model = None
+        # the gurobipy handle of the range slack variable (looked up
+        # the first time the bounds are updated)
+        self.slack = None
 
-    def update(self):
-        rhs_val = value(self.rhs_expr)
-        lhs_val = value(self.lhs_expr)
-        self.con.rhs = rhs_val
-        slack = self.gurobi_model.getVarByName(self.slack_name)
-        slack.ub = rhs_val - lhs_val
+    def get_slack(self, gurobi_model):
+        if self.slack is None:
+            self.slack = gurobi_model.getVarByName(self.slack_name)
+        return self.slack
 
 
 class _MutableConstant:
@@ -159,9 +156,6 @@ class _MutableConstant:
         self.expr = None
         self.con = None
 
-    def update(self):
-        self.con.rhs = value(self.expr)
-
 
 class _MutableQuadraticConstraint:
     def __init__(
@@ -207,10 +201,8 @@ class _MutableObjective:
         self.last_quadratic_coef_values = [value(i.expr) for i in self.quadratic_coefs]
 
     def get_updated_expression(self):
-        for ndx, coef in enumerate(self.linear_coefs):
-            coef.var.obj = value(coef.expr)
-        self.gurobi_model.ObjCon = value(self.constant.expr)
-
+        # Note: the linear coefficients and the constant are updated
+        # by _VectorizedUpdates
         gurobi_expr = None
         for ndx, coef in enumerate(self.quadratic_coefs):
             if value(coef.expr) != self.last_quadratic_coef_values[ndx]:
@@ -233,6 +225,94 @@ class _MutableQuadraticCoefficient:
         self.var2 = None
 
 
+class _VectorizedUpdates:
+    """Batched re-evaluation of the mutable helpers in a GurobiPersistent
+    interface
+
+    All mutable expressions of each kind are compiled into a single
+    :py:class:`VectorizedEvaluator`, and the results are sent to Gurobi
+    with one ``Model.setAttr()`` call per attribute.  Gurobi does not
+    provide a bulk method for changing matrix coefficients, so only the
+    coefficients whose values changed are sent (one at a time).  This
+    object is discarded (and rebuilt) whenever helpers are added or
+    removed.  Quadratic constraints and objective terms are updated by
+    their own helpers.
+
+    """
+
+    def __init__(self, solver):
+        coefs = []
+        constants = []
+        ranges = []
+        for helpers in solver._mutable_helpers.values():
+            for helper in helpers:
+                if helper.__class__ is _MutableLinearCoefficient:
+                    coefs.append(helper)
+                elif helper.__class__ is _MutableConstant:
+                    constants.append(helper)
+                else:
+                    ranges.append(helper)
+        self.coefs = coefs
+        self.coef_values = VectorizedEvaluator(h.expr for h in coefs)
+        self.last_coef_values = np.array([h.value for h in coefs], dtype=np.double)
+
+        self.rhs_cons = [h.con for h in constants]
+        self.rhs_values = VectorizedEvaluator(h.expr for h in constants)
+
+        self.ranges = ranges
+        self.range_cons = [h.con for h in ranges]
+        self.range_slacks = None
+        self.range_lhs_values = VectorizedEvaluator(h.lhs_expr for h in ranges)
+        self.range_rhs_values = VectorizedEvaluator(h.rhs_expr for h in ranges)
+
+        lbs = []
+        ubs = []
+        for v, helper in solver._mutable_bounds.values():
+            if helper.__class__ is _MutableLowerBound:
+                lbs.append(helper)
+            else:
+                ubs.append(helper)
+        self.lb_vars = [h.var for h in lbs]
+        self.lb_values = VectorizedEvaluator(h.expr for h in lbs)
+        self.domain_lbs = np.array([h.domain_bound for h in lbs], dtype=np.double)
+        self.ub_vars = [h.var for h in ubs]
+        self.ub_values = VectorizedEvaluator(h.expr for h in ubs)
+        self.domain_ubs = np.array([h.domain_bound for h in ubs], dtype=np.double)
+
+        objective = solver._mutable_objective
+        self.obj_vars = [c.var for c in objective.linear_coefs]
+        self.obj_values = VectorizedEvaluator(c.expr for c in objective.linear_coefs)
+        self.obj_constant = objective.constant
+
+    def update(self, gurobi_model):
+        if self.coefs:
+            vals = self.coef_values()
+            changed = np.flatnonzero(vals != self.last_coef_values)
+            for i, val in zip(changed.tolist(), vals[changed].tolist()):
+                helper = self.coefs[i]
+                gurobi_model.chgCoeff(helper.con, helper.var, val)
+                helper.value = val
+            self.last_coef_values = vals
+        if self.rhs_cons:
+            gurobi_model.setAttr('RHS', self.rhs_cons, self.rhs_values().tolist())
+        if self.range_cons:
+            lhs = self.range_lhs_values()
+            rhs = self.range_rhs_values()
+            gurobi_model.setAttr('RHS', self.range_cons, rhs.tolist())
+            if self.range_slacks is None:
+                self.range_slacks = [h.get_slack(gurobi_model) for h in self.ranges]
+            gurobi_model.setAttr('UB', self.range_slacks, (rhs - lhs).tolist())
+        if self.lb_vars:
+            lbs = np.maximum(self.lb_values(), self.domain_lbs)
+            gurobi_model.setAttr('LB', self.lb_vars, lbs.tolist())
+        if self.ub_vars:
+            ubs = np.minimum(self.ub_values(), self.domain_ubs)
+            gurobi_model.setAttr('UB', self.ub_vars, ubs.tolist())
+        if self.obj_vars:
+            gurobi_model.setAttr('Obj', self.obj_vars, self.obj_values().tolist())
+        gurobi_model.ObjCon = value(self.obj_constant.expr)
+
+
 class GurobiPersistent(
     GurobiSolverMixin,
     PersistentSolverMixin,
@@ -265,6 +345,7 @@ class GurobiPersistent(
         self._mutable_bounds = {}
         self._mutable_quadratic_helpers = {}
         self._mutable_objective = None
+        self._vectorized_updates = None
         self._needs_updated = True
         self._callback = None
         self._callback_func = None
@@ -353,7 +434,7 @@ class GurobiPersistent(
         else:
             if _lb is not None:
                 if not is_constant(_lb):
-                    mutable_bound = _MutableLowerBound(NPV_MaxExpression((_lb, lb)))
+                    mutable_bound = _MutableLowerBound(_lb, lb)
                     if gurobipy_var is None:
                         mutable_lbs[ndx] = mutable_bound
                     else:
@@ -362,7 +443,7 @@ class GurobiPersistent(
                 lb = max(value(_lb), lb)
             if _ub is not None:
                 if not is_constant(_ub):
-                    mutable_bound = _MutableUpperBound(NPV_MinExpression((_ub, ub)))
+                    mutable_bound = _MutableUpperBound(_ub, ub)
                     if gurobipy_var is None:
                         mutable_ubs[ndx] = mutable_bound
                     else:
@@ -373,6 +454,7 @@ class GurobiPersistent(
         return lb, ub, vtype
 
     def _add_variables(self, variables: List[VarData]):
+        self._vectorized_updates = None
         var_names = []
         vtypes = []
         lbs = []
@@ -440,9 +522,12 @@ class GurobiPersistent(
             self.set_objective(None)
 
     def _get_expr_from_pyomo_expr(self, expr):
+        repn = generate_standard_repn(expr, quadratic=True, compute_values=False)
+        return self._get_expr_from_pyomo_repn(repn)
+
+    def _get_expr_from_pyomo_repn(self, repn):
         mutable_linear_coefficients = []
         mutable_quadratic_coefficients = []
-        repn = generate_standard_repn(expr, quadratic=True, compute_values=False)
 
         degree = repn.polynomial_degree()
         if (degree is None) or (degree > 2):
@@ -453,14 +538,16 @@ class GurobiPersistent(
         if len(repn.linear_vars) > 0:
             linear_coef_vals = []
             for ndx, coef in enumerate(repn.linear_coefs):
+                coef_val = value(coef)
                 if not is_constant(coef):
                     mutable_linear_coefficient = _MutableLinearCoefficient()
                     mutable_linear_coefficient.expr = coef
                     mutable_linear_coefficient.var = self._pyomo_var_to_solver_var_map[
                         id(repn.linear_vars[ndx])
                     ]
+                    mutable_linear_coefficient.value = coef_val
                     mutable_linear_coefficients.append(mutable_linear_coefficient)
-                linear_coef_vals.append(value(coef))
+                linear_coef_vals.append(coef_val)
             new_expr = gurobipy.LinExpr(
                 linear_coef_vals,
                 [self._pyomo_var_to_solver_var_map[id(i)] for i in repn.linear_vars],
@@ -490,14 +577,23 @@ class GurobiPersistent(
         )
 
     def _add_constraints(self, cons: List[ConstraintData]):
+        self._vectorized_updates = None
         for con in cons:
             conname = self._symbol_map.getSymbol(con, self._labeler)
+            if con._linear_canonical_form:
+                # e.g., MatrixConstraint rows: process the linear terms
+                # directly (without generating the body expression)
+                repn = con.canonical_form()
+            else:
+                repn = generate_standard_repn(
+                    con.body, quadratic=True, compute_values=False
+                )
             (
                 gurobi_expr,
                 repn_constant,
                 mutable_linear_coefficients,
                 mutable_quadratic_coefficients,
-            ) = self._get_expr_from_pyomo_expr(con.body)
+            ) = self._get_expr_from_pyomo_repn(repn)
 
             if (
                 gurobi_expr.__class__ in {gurobipy.LinExpr, gurobipy.Var}
@@ -529,7 +625,6 @@ class GurobiPersistent(
                         mutable_range_constant.rhs_expr = rhs_expr
                         mutable_range_constant.con = gurobipy_con
                         mutable_range_constant.slack_name = 'Rg' + conname
-                        mutable_range_constant.gurobi_model = self._solver_model
                         self._mutable_helpers[con] = [mutable_range_constant]
                 elif con.has_lb():
                     rhs_expr = con.lower - repn_constant
@@ -560,7 +655,6 @@ class GurobiPersistent(
                     )
                 for tmp in mutable_linear_coefficients:
                     tmp.con = gurobipy_con
-                    tmp.gurobi_model = self._solver_model
                 if len(mutable_linear_coefficients) > 0:
                     if con not in self._mutable_helpers:
                         self._mutable_helpers[con] = mutable_linear_coefficients
@@ -646,6 +740,7 @@ class GurobiPersistent(
         self._needs_updated = True
 
     def _remove_constraints(self, cons: List[ConstraintData]):
+        self._vectorized_updates = None
         for con in cons:
             if con in self._constraints_added_since_update:
                 self._update_gurobi_model()
@@ -670,6 +765,7 @@ class GurobiPersistent(
         self._needs_updated = True
 
     def _remove_variables(self, variables: List[VarData]):
+        self._vectorized_updates = None
         for var in variables:
             v_id = id(var)
             if var in self._vars_added_since_update:
@@ -685,6 +781,7 @@ class GurobiPersistent(
         pass
 
     def _update_variables(self, variables: List[VarData]):
+        self._vectorized_updates = None
         for var in variables:
             var_id = id(var)
             if var_id not in self._pyomo_var_to_solver_var_map:
@@ -703,11 +800,9 @@ class GurobiPersistent(
         self._needs_updated = True
 
     def update_parameters(self):
-        for con, helpers in self._mutable_helpers.items():
-            for helper in helpers:
-                helper.update()
-        for k, (v, helper) in self._mutable_bounds.items():
-            helper.update()
+        if self._vectorized_updates is None:
+            self._vectorized_updates = _VectorizedUpdates(self)
+        self._vectorized_updates.update(self._solver_model)
 
         for con, helper in self._mutable_quadratic_helpers.items():
             if con in self._constraints_added_since_update:
@@ -769,6 +864,7 @@ class GurobiPersistent(
             mutable_quadratic_coefficients,
         )
         self._mutable_objective = mutable_objective
+        self._vectorized_updates = None
 
         # These two lines are needed as a workaround
         # see PR #2454
@@ -877,36 +973,54 @@ class GurobiPersistent(
             raise ValueError(
                 'Cannot obtain suboptimal solutions for a continuous model'
             )
-        var_map = self._pyomo_var_to_solver_var_map
-        ref_vars = self._referenced_variables
         original_solution_number = self.get_gurobi_param_info('SolutionNumber')[2]
         self.set_gurobi_param('SolutionNumber', solution_number)
-        gurobi_vars_to_load = [var_map[pyomo_var] for pyomo_var in vars_to_load]
-        vals = self._solver_model.getAttr("Xn", gurobi_vars_to_load)
-        res = ComponentMap()
-        for var_id, val in zip(vars_to_load, vals):
-            using_cons, using_sos, using_obj = ref_vars[var_id]
-            if using_cons or using_sos or (using_obj is not None):
-                res[self._vars[var_id][0]] = val
+        res = self._get_var_attr_vector("Xn", vars_to_load)
         self.set_gurobi_param('SolutionNumber', original_solution_number)
         return res
 
+    def _get_var_attr_vector(self, attr, var_ids_to_load):
+        """Return the referenced variables and the corresponding attribute values
+
+        Returns a list of VarData and a list of the values of the
+        Gurobi attribute `attr` for those variables (filtered to only
+        include variables that are referenced by the model)
+
+        """
+        ref_vars = self._referenced_variables
+        var_ids = []
+        for var_id in var_ids_to_load:
+            using_cons, using_sos, using_obj = ref_vars[var_id]
+            if using_cons or using_sos or (using_obj is not None):
+                var_ids.append(var_id)
+        var_map = self._pyomo_var_to_solver_var_map
+        vals = self._solver_model.getAttr(attr, [var_map[var_id] for var_id in var_ids])
+        return [self._vars[var_id][0] for var_id in var_ids], vals
+
     def _load_vars(self, vars_to_load=None, solution_number=0):
-        for v, val in self._get_primals(
-            vars_to_load=vars_to_load, solution_number=solution_number
-        ).items():
-            v.set_value(val, skip_validation=True)
+        load_var_values(
+            *self._get_primal_vector(
+                vars_to_load=vars_to_load, solution_number=solution_number
+            )
+        )
         StaleFlagManager.mark_all_as_stale(delayed=True)
 
     def _get_primals(self, vars_to_load=None, solution_number=0):
+        return ComponentMap(
+            zip(
+                *self._get_primal_vector(
+                    vars_to_load=vars_to_load, solution_number=solution_number
+                )
+            )
+        )
+
+    def _get_primal_vector(self, vars_to_load=None, solution_number=0):
         if self._needs_updated:
             self._update_gurobi_model()  # this is needed to ensure that solutions cannot be loaded after the model has been changed
 
         if self._solver_model.SolCount == 0:
             raise NoSolutionError()
 
-        var_map = self._pyomo_var_to_solver_var_map
-        ref_vars = self._referenced_variables
         if vars_to_load is None:
             vars_to_load = self._pyomo_var_to_solver_var_map.keys()
         else:
@@ -917,15 +1031,7 @@ class GurobiPersistent(
                 vars_to_load=vars_to_load, solution_number=solution_number
             )
 
-        gurobi_vars_to_load = [var_map[pyomo_var_id] for pyomo_var_id in vars_to_load]
-        vals = self._solver_model.getAttr("X", gurobi_vars_to_load)
-
-        res = ComponentMap()
-        for var_id, val in zip(vars_to_load, vals):
-            using_cons, using_sos, using_obj = ref_vars[var_id]
-            if using_cons or using_sos or (using_obj is not None):
-                res[self._vars[var_id][0]] = val
-        return res
+        return self._get_var_attr_vector("X", vars_to_load)
 
     def _get_reduced_costs(self, vars_to_load=None):
         if self._needs_updated:
@@ -934,23 +1040,12 @@ class GurobiPersistent(
         if self._solver_model.Status != gurobipy.GRB.OPTIMAL:
             raise NoReducedCostsError()
 
-        var_map = self._pyomo_var_to_solver_var_map
-        ref_vars = self._referenced_variables
-        res = ComponentMap()
         if vars_to_load is None:
             vars_to_load = self._pyomo_var_to_solver_var_map.keys()
         else:
             vars_to_load = [id(v) for v in vars_to_load]
 
-        gurobi_vars_to_load = [var_map[pyomo_var_id] for pyomo_var_id in vars_to_load]
-        vals = self._solver_model.getAttr("Rc", gurobi_vars_to_load)
-
-        for var_id, val in zip(vars_to_load, vals):
-            using_cons, using_sos, using_obj = ref_vars[var_id]
-            if using_cons or using_sos or (using_obj is not None):
-                res[self._vars[var_id][0]] = val
-
-        return res
+        return ComponentMap(zip(*self._get_var_attr_vector("Rc", vars_to_load)))
 
     def _get_duals(self, cons_to_load=None):
         if self._needs_updated:
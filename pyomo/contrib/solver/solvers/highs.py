@@ -25,7 +25,6 @@ from pyomo.core.base.sos import SOSConstraintData
 from pyomo.core.base.param import ParamData
 from pyomo.core.expr.numvalue import value, is_constant
 from pyomo.repn import generate_standard_repn
-from pyomo.core.expr.numeric_expr import NPV_MaxExpression, NPV_MinExpression
 from pyomo.common.dependencies import numpy as np
 from pyomo.core.staleflag import StaleFlagManager
 
@@ -40,7 +39,10 @@ from pyomo.contrib.solver.common.persistent import (
     PersistentSolverUtils,
     PersistentSolverMixin,
 )
-from pyomo.contrib.solver.common.solution_loader import PersistentSolutionLoader
+from pyomo.contrib.solver.common.solution_loader import (
+    PersistentSolutionLoader,
+    load_var_values,
+)
 from pyomo.contrib.solver.common.util import (
     NoFeasibleSolutionError,
     NoOptimalSolutionError,
@@ -48,6 +50,7 @@ from pyomo.contrib.solver.common.util import (
     NoReducedCostsError,
     NoSolutionError,
     IncompatibleModelError,
+    VectorizedEvaluator,
 )
 
 logger = logging.getLogger(__name__)
@@ -56,69 +59,117 @@ highspy, highspy_available = attempt_import('highspy')
 
 
 class _MutableVarBounds:
-    def __init__(self, lower_expr, upper_expr, pyomo_var_id, var_map, highs):
+    def __init__(self, lower_expr, upper_expr, domain_lb, domain_ub, pyomo_var_id):
         self.pyomo_var_id = pyomo_var_id
         self.lower_expr = lower_expr
         self.upper_expr = upper_expr
-        self.var_map = var_map
-        self.highs = highs
-
-    def update(self):
-        col_ndx = self.var_map[self.pyomo_var_id]
-        lb = value(self.lower_expr)
-        ub = value(self.upper_expr)
-        self.highs.changeColBounds(col_ndx, lb, ub)
+        self.domain_lb = domain_lb
+        self.domain_ub = domain_ub
 
 
 class _MutableLinearCoefficient:
-    def __init__(self, pyomo_con, pyomo_var_id, con_map, var_map, expr, highs):
+    def __init__(self, pyomo_con, pyomo_var_id, expr, value):
         self.expr = expr
-        self.highs = highs
         self.pyomo_var_id = pyomo_var_id
         self.pyomo_con = pyomo_con
-        self.con_map = con_map
-        self.var_map = var_map
-
-    def update(self):
-        row_ndx = self.con_map[self.pyomo_con]
-        col_ndx = self.var_map[self.pyomo_var_id]
-        self.highs.changeCoeff(row_ndx, col_ndx, value(self.expr))
+        # the coefficient value last sent to the solver
+        self.value = value
 
 
 class _MutableObjectiveCoefficient:
-    def __init__(self, pyomo_var_id, var_map, expr, highs):
+    def __init__(self, pyomo_var_id, expr):
         self.expr = expr
-        self.highs = highs
         self.pyomo_var_id = pyomo_var_id
-        self.var_map = var_map
-
-    def update(self):
-        col_ndx = self.var_map[self.pyomo_var_id]
-        self.highs.changeColCost(col_ndx, value(self.expr))
 
 
 class _MutableObjectiveOffset:
-    def __init__(self, expr, highs):
+    def __init__(self, expr):
         self.expr = expr
-        self.highs = highs
-
-    def update(self):
-        self.highs.changeObjectiveOffset(value(self.expr))
 
 
 class _MutableConstraintBounds:
-    def __init__(self, lower_expr, upper_expr, pyomo_con, con_map, highs):
+    def __init__(self, lower_expr, upper_expr, pyomo_con):
         self.lower_expr = lower_expr
         self.upper_expr = upper_expr
         self.con = pyomo_con
-        self.con_map = con_map
-        self.highs = highs
 
-    def update(self):
-        row_ndx = self.con_map[self.con]
-        lb = value(self.lower_expr)
-        ub = value(self.upper_expr)
-        self.highs.changeRowBounds(row_ndx, lb, ub)
+
+class _VectorizedUpdates:
+    """Batched re-evaluation of the mutable helpers in a Highs interface
+
+    All mutable expressions of each kind are compiled into a single
+    :py:class:`VectorizedEvaluator`, and the results are sent to HiGHS
+    with the bulk ``changeRowsBounds`` / ``changeColsBounds`` /
+    ``changeColsCost`` calls.  HiGHS does not provide a bulk method for
+    changing matrix coefficients, so only the coefficients whose values
+    changed are sent (one at a time).  This object is discarded (and
+    rebuilt) whenever helpers are added or removed, or rows / columns
+    are renumbered.
+
+    """
+
+    def __init__(self, solver):
+        con_map = solver._pyomo_con_to_solver_con_map
+        var_map = solver._pyomo_var_to_solver_var_map
+
+        coefs = []
+        con_bounds = []
+        for helpers in solver._mutable_helpers.values():
+            for helper in helpers:
+                if helper.__class__ is _MutableLinearCoefficient:
+                    coefs.append(helper)
+                else:
+                    con_bounds.append(helper)
+        self.coefs = coefs
+        self.coef_rows = [con_map[h.pyomo_con] for h in coefs]
+        self.coef_cols = [var_map[h.pyomo_var_id] for h in coefs]
+        self.coef_values = VectorizedEvaluator(h.expr for h in coefs)
+        self.last_coef_values = np.array([h.value for h in coefs], dtype=np.double)
+
+        self.con_rows = np.array([con_map[h.con] for h in con_bounds])
+        self.con_lbs = VectorizedEvaluator(h.lower_expr for h in con_bounds)
+        self.con_ubs = VectorizedEvaluator(h.upper_expr for h in con_bounds)
+
+        var_bounds = [h for v, h in solver._mutable_bounds.values()]
+        self.var_cols = np.array([var_map[h.pyomo_var_id] for h in var_bounds])
+        self.var_lbs = VectorizedEvaluator(h.lower_expr for h in var_bounds)
+        self.var_ubs = VectorizedEvaluator(h.upper_expr for h in var_bounds)
+        self.domain_lbs = np.array([h.domain_lb for h in var_bounds], dtype=np.double)
+        self.domain_ubs = np.array([h.domain_ub for h in var_bounds], dtype=np.double)
+
+        obj_coefs = []
+        self.obj_offsets = []
+        for helper in solver._objective_helpers:
+            if helper.__class__ is _MutableObjectiveCoefficient:
+                obj_coefs.append(helper)
+            else:
+                self.obj_offsets.append(helper)
+        self.obj_cols = np.array([var_map[h.pyomo_var_id] for h in obj_coefs])
+        self.obj_coefs = VectorizedEvaluator(h.expr for h in obj_coefs)
+
+    def update(self, highs):
+        if self.coefs:
+            vals = self.coef_values()
+            changed = np.flatnonzero(vals != self.last_coef_values)
+            for i, val in zip(changed.tolist(), vals[changed].tolist()):
+                highs.changeCoeff(self.coef_rows[i], self.coef_cols[i], val)
+                self.coefs[i].value = val
+            self.last_coef_values = vals
+        if len(self.con_rows):
+            highs.changeRowsBounds(
+                len(self.con_rows), self.con_rows, self.con_lbs(), self.con_ubs()
+            )
+        if len(self.var_cols):
+            highs.changeColsBounds(
+                len(self.var_cols),
+                self.var_cols,
+                np.maximum(self.var_lbs(), self.domain_lbs),
+                np.minimum(self.var_ubs(), self.domain_ubs),
+            )
+        if len(self.obj_cols):
+            highs.changeColsCost(len(self.obj_cols), self.obj_cols, self.obj_coefs())
+        for helper in self.obj_offsets:
+            highs.changeObjectiveOffset(value(helper.expr))
 
 
 class Highs(PersistentSolverMixin, PersistentSolverUtils, PersistentSolverBase):
@@ -143,6 +194,7 @@ class Highs(PersistentSolverMixin, PersistentSolverUtils, PersistentSolverBase):
         self._mutable_helpers = {}
         self._mutable_bounds = {}
         self._objective_helpers = []
+        self._vectorized_updates = None
         self._last_results_object: Optional[Results] = None
         self._sol = None
 
@@ -225,11 +277,11 @@ class Highs(PersistentSolverMixin, PersistentSolverUtils, PersistentSolverBase):
                     else:
                         tmp_ub = _ub
                     mutable_bound = _MutableVarBounds(
-                        lower_expr=NPV_MaxExpression((tmp_lb, lb)),
-                        upper_expr=NPV_MinExpression((tmp_ub, ub)),
+                        lower_expr=tmp_lb,
+                        upper_expr=tmp_ub,
+                        domain_lb=lb,
+                        domain_ub=ub,
                         pyomo_var_id=var_id,
-                        var_map=self._pyomo_var_to_solver_var_map,
-                        highs=self._solver_model,
                     )
                     self._mutable_bounds[var_id] = (_v, mutable_bound)
             if _lb is not None:
@@ -243,6 +295,7 @@ class Highs(PersistentSolverMixin, PersistentSolverUtils, PersistentSolverBase):
         self._sol = None
         if self._last_results_object is not None:
             self._last_results_object.solution_loader.invalidate()
+        self._vectorized_updates = None
         lbs = []
         ubs = []
         indices = []
@@ -302,6 +355,7 @@ class Highs(PersistentSolverMixin, PersistentSolverUtils, PersistentSolverBase):
         self._sol = None
         if self._last_results_object is not None:
             self._last_results_object.solution_loader.invalidate()
+        self._vectorized_updates = None
         current_num_cons = len(self._pyomo_con_to_solver_con_map)
         lbs = []
         ubs = []
@@ -310,9 +364,14 @@ class Highs(PersistentSolverMixin, PersistentSolverUtils, PersistentSolverBase):
         coef_values = []
 
         for con in cons:
-            repn = generate_standard_repn(
-                con.body, quadratic=False, compute_values=False
-            )
+            if con._linear_canonical_form:
+                # e.g., MatrixConstraint rows: process the linear terms
+                # directly (without generating the body expression)
+                repn = con.canonical_form()
+            else:
+                repn = generate_standard_repn(
+                    con.body, quadratic=False, compute_values=False
+                )
             if repn.nonlinear_expr is not None:
                 raise IncompatibleModelError(
                     f'Highs interface does not support expressions of degree {repn.polynomial_degree()}'
@@ -325,12 +384,7 @@ class Highs(PersistentSolverMixin, PersistentSolverUtils, PersistentSolverBase):
                 coef_val = value(coef)
                 if not is_constant(coef):
                     mutable_linear_coefficient = _MutableLinearCoefficient(
-                        pyomo_con=con,
-                        pyomo_var_id=v_id,
-                        con_map=self._pyomo_con_to_solver_con_map,
-                        var_map=self._pyomo_var_to_solver_var_map,
-                        expr=coef,
-                        highs=self._solver_model,
+                        pyomo_con=con, pyomo_var_id=v_id, expr=coef, value=coef_val
                     )
                     if con not in self._mutable_helpers:
                         self._mutable_helpers[con] = []
@@ -351,11 +405,7 @@ class Highs(PersistentSolverMixin, PersistentSolverUtils, PersistentSolverBase):
 
             if not is_constant(lb) or not is_constant(ub):
                 mutable_con_bounds = _MutableConstraintBounds(
-                    lower_expr=lb,
-                    upper_expr=ub,
-                    pyomo_con=con,
-                    con_map=self._pyomo_con_to_solver_con_map,
-                    highs=self._solver_model,
+                    lower_expr=lb, upper_expr=ub, pyomo_con=con
                 )
                 if con not in self._mutable_helpers:
                     self._mutable_helpers[con] = [mutable_con_bounds]
@@ -388,6 +438,7 @@ class Highs(PersistentSolverMixin, PersistentSolverUtils, PersistentSolverBase):
         self._sol = None
         if self._last_results_object is not None:
             self._last_results_object.solution_loader.invalidate()
+        self._vectorized_updates = None
         indices_to_remove = []
         for con in cons:
             con_ndx = self._pyomo_con_to_solver_con_map.pop(con)
@@ -419,6 +470,7 @@ class Highs(PersistentSolverMixin, PersistentSolverUtils, PersistentSolverBase):
         self._sol = None
         if self._last_results_object is not None:
             self._last_results_object.solution_loader.invalidate()
+        self._vectorized_updates = None
         indices_to_remove = []
         for v in variables:
             v_id = id(v)
@@ -444,6 +496,7 @@ class Highs(PersistentSolverMixin, PersistentSolverUtils, PersistentSolverBase):
         self._sol = None
         if self._last_results_object is not None:
             self._last_results_object.solution_loader.invalidate()
+        self._vectorized_updates = None
         indices = []
         lbs = []
         ubs = []
@@ -473,13 +526,9 @@ class Highs(PersistentSolverMixin, PersistentSolverUtils, PersistentSolverBase):
         self._sol = None
         if self._last_results_object is not None:
             self._last_results_object.solution_loader.invalidate()
-        for con, helpers in self._mutable_helpers.items():
-            for helper in helpers:
-                helper.update()
-        for k, (v, helper) in self._mutable_bounds.items():
-            helper.update()
-        for helper in self._objective_helpers:
-            helper.update()
+        if self._vectorized_updates is None:
+            self._vectorized_updates = _VectorizedUpdates(self)
+        self._vectorized_updates.update(self._solver_model)
 
     def _set_objective(self, obj):
         self._sol = None
@@ -489,6 +538,7 @@ class Highs(PersistentSolverMixin, PersistentSolverUtils, PersistentSolverBase):
         indices = np.arange(n)
         costs = np.zeros(n, dtype=np.double)
         self._objective_helpers = []
+        self._vectorized_updates = None
         if obj is None:
             sense = highspy.ObjSense.kMinimize
             self._solver_model.changeObjectiveOffset(0)
@@ -514,18 +564,13 @@ class Highs(PersistentSolverMixin, PersistentSolverUtils, PersistentSolverBase):
                 costs[v_ndx] = value(coef)
                 if not is_constant(coef):
                     mutable_objective_coef = _MutableObjectiveCoefficient(
-                        pyomo_var_id=v_id,
-                        var_map=self._pyomo_var_to_solver_var_map,
-                        expr=coef,
-                        highs=self._solver_model,
+                        pyomo_var_id=v_id, expr=coef
                     )
                     self._objective_helpers.append(mutable_objective_coef)
 
             self._solver_model.changeObjectiveOffset(value(repn.constant))
             if not is_constant(repn.constant):
-                mutable_objective_offset = _MutableObjectiveOffset(
-                    expr=repn.constant, highs=self._solver_model
-                )
+                mutable_objective_offset = _MutableObjectiveOffset(expr=repn.constant)
                 self._objective_helpers.append(mutable_objective_offset)
 
         self._solver_model.changeObjectiveSense(sense)
@@ -624,15 +669,28 @@ class Highs(PersistentSolverMixin, PersistentSolverUtils, PersistentSolverBase):
         return results
 
     def _load_vars(self, vars_to_load=None):
-        for v, val in self._get_primals(vars_to_load=vars_to_load).items():
-            v.set_value(val, skip_validation=True)
+        load_var_values(*self._get_primal_vector(vars_to_load))
         StaleFlagManager.mark_all_as_stale(delayed=True)
 
-    def _get_primals(self, vars_to_load=None):
+    def _get_var_vector(self, var_ids_to_load, var_vals):
+        """Gather the solver values for a list of variable ids
+
+        Returns the list of VarData and a NumPy array of the
+        corresponding entries in `var_vals` (a HiGHS column vector)
+
+        """
+        variables = [self._vars[v_id][0] for v_id in var_ids_to_load]
+        ndx = np.fromiter(
+            map(self._pyomo_var_to_solver_var_map.__getitem__, var_ids_to_load),
+            dtype=np.int64,
+            count=len(var_ids_to_load),
+        )
+        return variables, np.asarray(var_vals, dtype=np.double)[ndx]
+
+    def _get_primal_vector(self, vars_to_load=None):
         if self._sol is None or not self._sol.value_valid:
             raise NoSolutionError()
 
-        res = ComponentMap()
         if vars_to_load is None:
             var_ids_to_load = []
             for v, ref_info in self._referenced_variables.items():
@@ -642,45 +700,36 @@ class Highs(PersistentSolverMixin, PersistentSolverUtils, PersistentSolverBase):
         else:
             var_ids_to_load = [id(v) for v in vars_to_load]
 
-        var_vals = self._sol.col_value
-
-        for v_id in var_ids_to_load:
-            v = self._vars[v_id][0]
-            v_ndx = self._pyomo_var_to_solver_var_map[v_id]
-            res[v] = var_vals[v_ndx]
+        return self._get_var_vector(var_ids_to_load, self._sol.col_value)
 
-        return res
+    def _get_primals(self, vars_to_load=None):
+        variables, vals = self._get_primal_vector(vars_to_load)
+        return ComponentMap(zip(variables, vals.tolist()))
 
     def _get_reduced_costs(self, vars_to_load=None):
         if self._sol is None or not self._sol.dual_valid:
             raise NoReducedCostsError()
-        res = ComponentMap()
         if vars_to_load is None:
             var_ids_to_load = list(self._vars.keys())
         else:
             var_ids_to_load = [id(v) for v in vars_to_load]
 
-        var_vals = self._sol.col_dual
-
-        for v_id in var_ids_to_load:
-            v = self._vars[v_id][0]
-            v_ndx = self._pyomo_var_to_solver_var_map[v_id]
-            res[v] = var_vals[v_ndx]
-
-        return res
+        variables, vals = self._get_var_vector(var_ids_to_load, self._sol.col_dual)
+        return ComponentMap(zip(variables, vals.tolist()))
 
     def _get_duals(self, cons_to_load=None):
         if self._sol is None or not self._sol.dual_valid:
             raise NoDualsError()
 
-        res = {}
         if cons_to_load is None:
             cons_to_load = list(self._pyomo_con_to_solver_con_map.keys())
+        else:
+            cons_to_load = list(cons_to_load)
 
-        duals = self._sol.row_dual
-
-        for c in cons_to_load:
-            c_ndx = self._pyomo_con_to_solver_con_map[c]
-            res[c] = duals[c_ndx]
-
-        return res
+        ndx = np.fromiter(
+            map(self._pyomo_con_to_solver_con_map.__getitem__, cons_to_load),
+            dtype=np.int64,
+            count=len(cons_to_load),
+        )
+        duals = np.asarray(self._sol.row_dual, dtype=np.double)[ndx]
+        return dict(zip(cons_to_load, duals.tolist()))
@@ -15,7 +15,10 @@ import subprocess
 import datetime
 import io
 import re
+import queue
 import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional, Tuple, Union, Mapping, List, Dict, Any, Sequence
 
 from pyomo.common import Executable
@@ -24,6 +27,7 @@ from pyomo.common.config import (
     document_kwargs_from_configdict,
     ConfigDict,
     ADVANCED_OPTION,
+    Bool,
 )
 from pyomo.common.errors import (
     ApplicationError,
@@ -35,7 +39,7 @@ from pyomo.common.timing import HierarchicalTimer
 from pyomo.core.base.var import VarData
 from pyomo.core.staleflag import StaleFlagManager
 from pyomo.repn.plugins.nl_writer import NLWriter, NLWriterInfo
-from pyomo.contrib.solver.common.base import SolverBase, Availability
+from pyomo.contrib.solver.common.base import SolverBase, Availability, run_in_future
 from pyomo.contrib.solver.common.config import SolverConfig
 from pyomo.contrib.solver.common.results import (
     Results,
@@ -61,6 +65,23 @@ logger = logging.getLogger(__name__)
 # in ipopt's output, per https://coin-or.github.io/Ipopt/OUTPUT.html
 _ALPHA_PR_CHARS = set("fFhHkKnNRwstTr")
 
+# Candidate locations for temporary directories on a memory-backed
+# (tmpfs) filesystem
+_MEMORY_BACKED_DIRS = ('/dev/shm',)
+
+
+def _memory_backed_tempdir():
+    """Return a writable directory on a memory-backed filesystem
+
+    Returns None if no such directory is available on this system (in
+    which case the default temporary directory should be used).
+
+    """
+    for dname in _MEMORY_BACKED_DIRS:
+        if os.path.isdir(dname) and os.access(dname, os.W_OK | os.X_OK):
+            return dname
+    return None
+
 
 class IpoptConfig(SolverConfig):
     def __init__(
@@ -90,6 +111,19 @@ class IpoptConfig(SolverConfig):
         self.writer_config: ConfigDict = self.declare(
             'writer_config', NLWriter.CONFIG()
         )
+        self.memory_backed_files: bool = self.declare(
+            'memory_backed_files',
+            ConfigValue(
+                domain=Bool,
+                default=False,
+                description="If True (and no `working_dir` is specified), the "
+                "NL, options, and SOL files are exchanged with Ipopt through a "
+                "temporary directory on a memory-backed filesystem (e.g., "
+                "``/dev/shm``) so that they never touch the disk (or a network "
+                "filesystem).  Falls back to the default temporary directory "
+                "on systems without a memory-backed filesystem.",
+            ),
+        )
 
 
 class IpoptSolutionLoader(SolSolutionLoader):
@@ -210,6 +244,14 @@ ipopt_command_line_options = {
 }
 
 
+def _finish_steps(steps):
+    try:
+        next(steps)
+    except StopIteration as e:
+        return e.value
+    raise DeveloperError("Ipopt._solve_steps() yielded more than once")
+
+
 class Ipopt(SolverBase):
     CONFIG = IpoptConfig()
 
@@ -312,6 +354,115 @@ class Ipopt(SolverBase):
     @document_kwargs_from_configdict(CONFIG)
     def solve(self, model, **kwds) -> Results:
         "Solve a model using Ipopt"
+        steps = self._solve_steps(model, kwds)
+        next(steps)
+        return _finish_steps(steps)
+
+    def solve_async(self, model, **kwds) -> Future:
+        """Solve a model using Ipopt without waiting for Ipopt to finish
+
+        The NL file is written in the calling thread.  The Ipopt
+        subprocess is then run (and its results parsed and loaded into
+        the model) in a separate thread, so that a single Python process
+        can drive many Ipopt subprocesses concurrently.  The model
+        should not be modified until the returned future completes.
+
+        """
+        future = Future()
+        steps = self._solve_steps(model, kwds)
+        try:
+            next(steps)
+        except Exception as e:
+            future.set_running_or_notify_cancel()
+            future.set_exception(e)
+            return future
+        threading.Thread(
+            target=run_in_future,
+            args=(future, _finish_steps, steps),
+            name=f'{self.name}: {model.name}',
+        ).start()
+        return future
+
+    def solve_batch(self, models, max_workers=None, **kwds) -> List[Results]:
+        """Solve a sequence of independent models using Ipopt
+
+        Up to `max_workers` (default: the number of CPUs) Ipopt
+        subprocesses are run concurrently by a pool of threads, while
+        the NL files for the following models are written in the
+        calling thread.  Unless a `working_dir` is specified, the files
+        are written into a fixed set of temporary directories that are
+        reused (and emptied) from one solve to the next.  If a
+        `working_dir` is specified, the files for each model are kept
+        in a subdirectory of `working_dir` named after the model's
+        position in `models` (e.g., ``working_dir/0/``), so that models
+        with the same name do not overwrite each other's files.
+
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        config = self.config(value=kwds, preserve_implicit=True)
+        reuse_dirs = config.working_dir is None
+        if reuse_dirs and config.memory_backed_files:
+            parent_dir = _memory_backed_tempdir()
+        else:
+            parent_dir = None
+        if not reuse_dirs and not os.path.exists(config.working_dir):
+            os.mkdir(config.working_dir)
+        failed = []
+
+        def _finish(steps, dname):
+            try:
+                return _finish_steps(steps)
+            except BaseException:
+                failed.append(True)
+                raise
+            finally:
+                if reuse_dirs:
+                    for fname in os.listdir(dname):
+                        os.remove(os.path.join(dname, fname))
+                slots.put(dname)
+
+        futures = []
+        with (
+            TempfileManager.new_context() as tempfile,
+            ThreadPoolExecutor(max_workers=max_workers) as executor,
+        ):
+            # Each slot is a (reusable) working directory for one
+            # model; the number of slots also bounds the number of
+            # models written but not yet solved.
+            slots = queue.SimpleQueue()
+            for i in range(2 * max_workers):
+                slots.put(tempfile.mkdtemp(dir=parent_dir) if reuse_dirs else None)
+            for i, model in enumerate(models):
+                dname = slots.get()
+                if failed:
+                    break
+                if reuse_dirs:
+                    wdir = dname
+                else:
+                    wdir = os.path.join(config.working_dir, str(i))
+                steps = self._solve_steps(model, dict(kwds, working_dir=wdir))
+                future = Future()
+                futures.append(future)
+                try:
+                    next(steps)
+                except Exception as e:
+                    future.set_running_or_notify_cancel()
+                    future.set_exception(e)
+                    break
+                executor.submit(run_in_future, future, _finish, steps, dname)
+        return [future.result() for future in futures]
+
+    def _solve_steps(self, model, kwds):
+        """Generator implementing solve()
+
+        The generator yields once the problem has been written; the
+        remaining steps (running Ipopt and processing the results) are
+        performed when the generator is resumed, which may be in a
+        different thread.  The Results object is the generator's return
+        value.
+
+        """
         # Begin time tracking
         start_timestamp = datetime.datetime.now(datetime.timezone.utc)
         # Update configuration options, based on keywords passed to solve
@@ -335,7 +486,10 @@ class Ipopt(SolverBase):
         StaleFlagManager.mark_all_as_stale()
         with TempfileManager.new_context() as tempfile:
             if config.working_dir is None:
-                dname = tempfile.mkdtemp()
+                parent_dir = None
+                if config.memory_backed_files:
+                    parent_dir = _memory_backed_tempdir()
+                dname = tempfile.mkdtemp(dir=parent_dir)
             else:
                 dname = config.working_dir
             if not os.path.exists(dname):
@@ -350,8 +504,12 @@ class Ipopt(SolverBase):
             # be terminated with '\n' regardless of platform.  We will
             # disable universal newlines in the NL file to prevent
             # Python from mapping those '\n' to '\r\n' on Windows.
+            if config.writer_config.binary:
+                nl_file = open(basename + '.nl', 'wb')
+            else:
+                nl_file = open(basename + '.nl', 'w', newline='\n', encoding='utf-8')
             with (
-                open(basename + '.nl', 'w', newline='\n', encoding='utf-8') as nl_file,
+                nl_file,
                 open(basename + '.row', 'w', encoding='utf-8') as row_file,
                 open(basename + '.col', 'w', encoding='utf-8') as col_file,
             ):
@@ -369,6 +527,7 @@ class Ipopt(SolverBase):
                 except InfeasibleConstraintException:
                     proven_infeasible = True
                 timer.stop('write_nl_file')
+            yield
             if not proven_infeasible and len(nl_info.variables) > 0:
                 # Get a copy of the environment to pass to the subprocess
                 env = os.environ.copy()
@@ -440,7 +599,9 @@ class Ipopt(SolverBase):
                     results.timing_info.total_seconds = 0
             else:
                 if os.path.isfile(basename + '.sol'):
-                    with open(basename + '.sol', 'r', encoding='utf-8') as sol_file:
+                    # Note: the sol file may be binary (if the NL file
+                    # was binary); the parser detects the format
+                    with open(basename + '.sol', 'rb') as sol_file:
                         timer.start('parse_sol')
                         results = self._parse_solution(sol_file, nl_info)
                         timer.stop('parse_sol')
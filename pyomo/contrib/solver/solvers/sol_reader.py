@@ -10,9 +10,12 @@
 #  ___________________________________________________________________________
 
 
-from typing import Tuple, Dict, Any, List, Sequence, Optional, Mapping, NoReturn
+from typing import Tuple, Dict, Any, List, Sequence, Optional, Mapping, NoReturn, Union
 import io
+import itertools
+import struct
 
+from pyomo.common.dependencies import numpy as np, numpy_available
 from pyomo.core.base.constraint import ConstraintData
 from pyomo.core.base.var import VarData
 from pyomo.core.expr import value
@@ -26,7 +29,10 @@ from pyomo.contrib.solver.common.results import (
     SolutionStatus,
     TerminationCondition,
 )
-from pyomo.contrib.solver.common.solution_loader import SolutionLoaderBase
+from pyomo.contrib.solver.common.solution_loader import (
+    SolutionLoaderBase,
+    load_var_values,
+)
 
 
 class SolFileData:
@@ -35,8 +41,10 @@ class SolFileData:
     """
 
     def __init__(self) -> None:
-        self.primals: List[float] = []
-        self.duals: List[float] = []
+        # Note: when numpy is available, the parser stores the primals
+        # and duals as numpy arrays
+        self.primals: Union[List[float], np.ndarray] = []
+        self.duals: Union[List[float], np.ndarray] = []
         self.var_suffixes: Dict[str, Dict[int, Any]] = {}
         self.con_suffixes: Dict[str, Dict[Any]] = {}
         self.obj_suffixes: Dict[str, Dict[int, Any]] = {}
@@ -62,16 +70,16 @@ class SolSolutionLoader(SolutionLoaderBase):
         if self._sol_data is None:
             assert len(self._nl_info.variables) == 0
         else:
+            primals = self._sol_data.primals
             if self._nl_info.scaling:
-                for var, val, scale in zip(
-                    self._nl_info.variables,
-                    self._sol_data.primals,
-                    self._nl_info.scaling.variables,
-                ):
-                    var.set_value(val / scale, skip_validation=True)
-            else:
-                for var, val in zip(self._nl_info.variables, self._sol_data.primals):
-                    var.set_value(val, skip_validation=True)
+                if primals.__class__ is list:
+                    primals = [
+                        val / scale
+                        for val, scale in zip(primals, self._nl_info.scaling.variables)
+                    ]
+                else:
+                    primals = primals / np.array(self._nl_info.scaling.variables)
+            load_var_values(self._nl_info.variables, primals)
 
         for var, v_expr in self._nl_info.eliminated_vars:
             var.value = value(v_expr)
@@ -95,7 +103,7 @@ class SolSolutionLoader(SolutionLoaderBase):
             else:
                 scale_list = self._nl_info.scaling.variables
             for var, val, scale in zip(
-                self._nl_info.variables, self._sol_data.primals, scale_list
+                self._nl_info.variables, _to_list(self._sol_data.primals), scale_list
             ):
                 val_map[id(var)] = val / scale
 
@@ -144,58 +152,175 @@ class SolSolutionLoader(SolutionLoaderBase):
         else:
             cons_to_load = set(cons_to_load)
         for con, val, scale in zip(
-            self._nl_info.constraints, self._sol_data.duals, scale_list
+            self._nl_info.constraints, _to_list(self._sol_data.duals), scale_list
         ):
             if con in cons_to_load:
                 res[con] = val * scale / obj_scale
         return res
 
 
+def _to_list(values):
+    if values.__class__ is list:
+        return values
+    return values.tolist()
+
+
+def _read_text_vector(sol_file, n):
+    """Read `n` lines (one float per line) from a text sol file
+
+    When numpy is available, the values are decoded directly into a
+    numpy array (without building an intermediate list of floats)
+
+    """
+    try:
+        if numpy_available:
+            return np.fromiter(
+                map(float, itertools.islice(sol_file, n)), dtype=np.float64, count=n
+            )
+        return [float(sol_file.readline()) for i in range(n)]
+    except ValueError as e:
+        raise PyomoException(
+            f"ERROR READING `sol` FILE. Expected {n} values; the file is "
+            f"truncated or contains a line that is not a number ({e})."
+        ) from e
+
+
+class _BinarySolReader:
+    """Reader for binary (ASL) sol files
+
+    Binary sol files are written by ASL-based solvers when they are
+    given a binary NL file.  The file is a sequence of Fortran-style
+    records (an int record length, the record data, and the int record
+    length repeated), using the native byte order:
+
+    - a record containing the string 'binary'
+    - one record per line of the solver message, terminated by an
+      empty record
+    - a record of ints: the number of options, the options, then the
+      number of constraints, duals, variables, and primals
+    - a record of doubles with the duals (if there are any)
+    - a record of doubles with the primals (if there are any)
+    - a record of 2 ints: the objective number and the solve result code
+    - for each suffix: a record of 4 ints (the suffix kind, number of
+      entries, name length, and table length), a record with the suffix
+      name, a record with the table (if the table length is nonzero),
+      and a record with the (int index, int or double value) entries
+
+    """
+
+    magic = b'binary'
+    int_fmt = struct.Struct('=i')
+
+    def __init__(self, sol_file):
+        self.sol_file = sol_file
+
+    @classmethod
+    def detect(cls, sol_file):
+        """Return True (and consume the header) if sol_file is a binary sol file"""
+        pos = sol_file.tell()
+        header = sol_file.read(cls.int_fmt.size + len(cls.magic))
+        if header == cls.int_fmt.pack(len(cls.magic)) + cls.magic:
+            sol_file.read(cls.int_fmt.size)
+            return True
+        sol_file.seek(pos)
+        return False
+
+    def read_record(self):
+        """Read the next record, returning the raw bytes (or None at EOF)"""
+        L = self.sol_file.read(self.int_fmt.size)
+        if not L:
+            return None
+        (n,) = self.int_fmt.unpack(L)
+        data = self.sol_file.read(n)
+        if len(data) != n or self.sol_file.read(self.int_fmt.size) != L:
+            raise PyomoException("ERROR READING binary `sol` FILE. Truncated record.")
+        return data
+
+    def read_ints(self):
+        data = self.read_record()
+        return list(struct.unpack('=%di' % (len(data) // 4), data))
+
+    def read_vector(self, n):
+        if not n:
+            return np.zeros(0) if numpy_available else []
+        data = self.read_record()
+        if len(data) != n * 8:
+            raise PyomoException(
+                f"ERROR READING binary `sol` FILE. Expected {n} values; "
+                f"received {len(data) // 8}."
+            )
+        if numpy_available:
+            return np.frombuffer(data, dtype=np.float64)
+        return list(struct.unpack('=%dd' % n, data))
+
+    def read_header(self):
+        message = []
+        line = self.read_record()
+        while line:
+            message.append(line.decode('utf-8').strip())
+            line = self.read_record()
+        if line is None:
+            raise PyomoException("ERROR READING `sol` FILE. No 'Options' found.")
+        model_objects = self.read_ints()
+        return message, model_objects[0], model_objects[1:]
+
+    def read_suffixes(self, sol_data):
+        header = self.read_record()
+        while header:
+            read_data_type, number_of_entries, _, table_length = struct.unpack(
+                '=4i', header
+            )
+            suffix_name = self.read_record().decode('utf-8').strip()
+            if table_length:
+                sol_data.other.extend(
+                    self.read_record().decode('utf-8').splitlines(True)
+                )
+            data_type = read_data_type & 3  # 0-var, 1-con, 2-obj, 3-prob
+            entry = '=id' if read_data_type & 4 else '=ii'
+            entries = struct.iter_unpack(entry, self.read_record())
+            if data_type == 3:
+                sol_data.problem_suffixes[suffix_name] = [val for _, val in entries]
+            else:
+                target = (
+                    sol_data.var_suffixes,
+                    sol_data.con_suffixes,
+                    sol_data.obj_suffixes,
+                )[data_type]
+                target[suffix_name] = dict(entries)
+            header = self.read_record()
+
+
 def parse_sol_file(
     sol_file: io.TextIOBase, nl_info: NLWriterInfo, result: Results
 ) -> Tuple[Results, SolFileData]:
     """
     Parse a .sol file and populate to Pyomo objects
+
+    `sol_file` may be either a text stream, or a binary stream
+    containing either a binary or text sol file.
     """
     sol_data = SolFileData()
 
-    #
-    # Some solvers (minto) do not write a message.  We will assume
-    # all non-blank lines up to the 'Options' line is the message.
-    # For backwards compatibility and general safety, we will parse all
-    # lines until "Options" appears. Anything before "Options" we will
-    # consider to be the solver message.
-    options_found = False
-    message = []
-    model_objects = []
-    for line in sol_file:
-        if not line:
-            break
-        line = line.strip()
-        if "Options" in line:
-            # Once "Options" appears, we must now read the content under it.
-            options_found = True
-            line = sol_file.readline()
-            number_of_options = int(line)
-            # We are adding in this DeveloperError to see if the alternative case
-            # is ever actually hit in the wild. In a previous iteration of the sol
-            # reader, there was logic to check for the number of options, but it
-            # was uncovered by tests and unclear if actually necessary.
-            if number_of_options > 4:
-                raise DeveloperError(
-                    """
-    The sol file reader has hit an unexpected error while parsing. The number of
-    options recorded is greater than 4. Please report this error to the Pyomo
-    developers.
-    """
-                )
-            for i in range(number_of_options + 4):
-                line = sol_file.readline()
-                model_objects.append(int(line))
-            break
-        message.append(line)
-    if not options_found:
-        raise PyomoException("ERROR READING `sol` FILE. No 'Options' line found.")
+    binary_reader = None
+    text_wrapper = None
+    if not isinstance(sol_file, io.TextIOBase):
+        if _BinarySolReader.detect(sol_file):
+            binary_reader = _BinarySolReader(sol_file)
+        else:
+            sol_file = text_wrapper = io.TextIOWrapper(sol_file, encoding='utf-8')
+    try:
+        return _parse_sol_file(sol_file, binary_reader, nl_info, result, sol_data)
+    finally:
+        if text_wrapper is not None:
+            # Do not close the underlying (binary) stream
+            text_wrapper.detach()
+
+
+def _parse_sol_file(sol_file, binary_reader, nl_info, result, sol_data):
+    if binary_reader is not None:
+        message, number_of_options, model_objects = binary_reader.read_header()
+    else:
+        message, number_of_options, model_objects = _parse_text_header(sol_file)
     message = '\n'.join(message)
     # Identify the total number of variables and constraints
     number_of_cons = model_objects[number_of_options + 1]
@@ -203,23 +328,19 @@ def parse_sol_file(
     assert number_of_cons == len(nl_info.constraints)
     assert number_of_vars == len(nl_info.variables)
 
-    duals = [float(sol_file.readline()) for i in range(number_of_cons)]
-    variable_vals = [float(sol_file.readline()) for i in range(number_of_vars)]
-
-    # Parse the exit code line and capture it
-    exit_code = [0, 0]
-    line = sol_file.readline()
-    if line and ('objno' in line):
-        exit_code_line = line.split()
-        if len(exit_code_line) != 3:
+    if binary_reader is not None:
+        duals = binary_reader.read_vector(number_of_cons)
+        variable_vals = binary_reader.read_vector(number_of_vars)
+        exit_code = binary_reader.read_ints()
+        if len(exit_code) != 2:
             raise PyomoException(
-                f"ERROR READING `sol` FILE. Expected two numbers in `objno` line; received {line}."
+                "ERROR READING `sol` FILE. Expected two numbers in `objno` "
+                f"record; received {exit_code}."
             )
-        exit_code = [int(exit_code_line[1]), int(exit_code_line[2])]
     else:
-        raise PyomoException(
-            f"ERROR READING `sol` FILE. Expected `objno`; received {line}."
-        )
+        duals = _read_text_vector(sol_file, number_of_cons)
+        variable_vals = _read_text_vector(sol_file, number_of_vars)
+        exit_code = _parse_text_objno(sol_file)
     result.extra_info.solver_message = message.strip().replace('\n', '; ')
     exit_code_message = ''
     if (exit_code[1] >= 0) and (exit_code[1] <= 99):
@@ -265,6 +386,9 @@ def parse_sol_file(
         sol_data.primals = variable_vals
         sol_data.duals = duals
         ### Read suffixes ###
+        if binary_reader is not None:
+            binary_reader.read_suffixes(sol_data)
+            return result, sol_data
         line = sol_file.readline()
         while line:
             line = line.strip()
@@ -331,3 +455,62 @@ def parse_sol_file(
             line = sol_file.readline()
 
     return result, sol_data
+
+
+def _parse_text_header(sol_file):
+    #
+    # Some solvers (minto) do not write a message.  We will assume
+    # all non-blank lines up to the 'Options' line is the message.
+    # For backwards compatibility and general safety, we will parse all
+    # lines until "Options" appears. Anything before "Options" we will
+    # consider to be the solver message.
+    options_found = False
+    message = []
+    model_objects = []
+    for line in sol_file:
+        if not line:
+            break
+        line = line.strip()
+        if "Options" in line:
+            # Once "Options" appears, we must now read the content under it.
+            options_found = True
+            line = sol_file.readline()
+            number_of_options = int(line)
+            # We are adding in this DeveloperError to see if the alternative case
+            # is ever actually hit in the wild. In a previous iteration of the sol
+            # reader, there was logic to check for the number of options, but it
+            # was uncovered by tests and unclear if actually necessary.
+            if number_of_options > 4:
+                raise DeveloperError(
+                    """
+    The sol file reader has hit an unexpected error while parsing. The number of
+    options recorded is greater than 4. Please report this error to the Pyomo
+    developers.
+    """
+                )
+            for i in range(number_of_options + 4):
+                line = sol_file.readline()
+                model_objects.append(int(line))
+            break
+        message.append(line)
+    if not options_found:
+        raise PyomoException("ERROR READING `sol` FILE. No 'Options' line found.")
+    return message, number_of_options, model_objects
+
+
+def _parse_text_objno(sol_file):
+    # Parse the exit code line and capture it
+    exit_code = [0, 0]
+    line = sol_file.readline()
+    if line and ('objno' in line):
+        exit_code_line = line.split()
+        if len(exit_code_line) != 3:
+            raise PyomoException(
+                f"ERROR READING `sol` FILE. Expected two numbers in `objno` line; received {line}."
+            )
+        exit_code = [int(exit_code_line[1]), int(exit_code_line[2])]
+    else:
+        raise PyomoException(
+            f"ERROR READING `sol` FILE. Expected `objno`; received {line}."
+        )
+    return exit_code
@@ -269,6 +269,33 @@ class TestGurobiPersistent(unittest.TestCase):
         res = opt.solve(m)
         self.assertAlmostEqual(m.x.value, 3)
 
+    def test_range_constraint_slack_handles(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var([1, 2])
+        m.xl = pyo.Param(initialize=-1, mutable=True)
+        m.xu = pyo.Param(initialize=1, mutable=True)
+        m.c = pyo.Constraint([1, 2], rule=lambda m, i: (m.xl, m.x[i], i * m.xu))
+        m.obj = pyo.Objective(expr=m.x[1] + m.x[2], sense=pyo.maximize)
+
+        opt = GurobiPersistent()
+        opt.set_instance(m)
+        opt.solve(m)
+        self.assertAlmostEqual(m.x[2].value, 2)
+
+        m.xu.value = 3
+        opt.solve(m)
+        self.assertAlmostEqual(m.x[1].value, 3)
+        self.assertAlmostEqual(m.x[2].value, 6)
+        # The slack variables are looked up by name once and then reused
+        slacks = [opt._mutable_helpers[m.c[i]][0].slack for i in (1, 2)]
+        self.assertNotIn(None, slacks)
+
+        m.xu.value = 2
+        opt.solve(m)
+        self.assertAlmostEqual(m.x[2].value, 4)
+        for i, slack in zip((1, 2), slacks):
+            self.assertIs(opt._mutable_helpers[m.c[i]][0].slack, slack)
+
     def test_quadratic_constraint_with_params(self):
         m = pyo.ConcreteModel()
         m.a = pyo.Param(initialize=1, mutable=True)
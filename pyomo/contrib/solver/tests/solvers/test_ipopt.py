@@ -9,6 +9,7 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import io
 import os
 import subprocess
 
@@ -18,7 +19,7 @@ from pyomo.common.config import ConfigDict, ADVANCED_OPTION
 from pyomo.common.errors import DeveloperError
 from pyomo.common.tee import capture_output
 import pyomo.contrib.solver.solvers.ipopt as ipopt
-from pyomo.contrib.solver.common.util import NoSolutionError
+from pyomo.contrib.solver.common.util import NoSolutionError, NoOptimalSolutionError
 from pyomo.contrib.solver.common.factory import SolverFactory
 from pyomo.common import unittest, Executable
 from pyomo.common.tempfiles import TempfileManager
@@ -44,6 +45,7 @@ class TestIpoptSolverConfig(unittest.TestCase):
         # Unique to this object
         self.assertIsInstance(config.executable, type(Executable('path')))
         self.assertIsInstance(config.writer_config, type(NLWriter.CONFIG()))
+        self.assertFalse(config.memory_backed_files)
 
     def test_custom_instantiation(self):
         config = ipopt.IpoptConfig(description="A description")
@@ -106,6 +108,8 @@ class TestIpoptInterface(unittest.TestCase):
             'has_linear_solver',
             'is_persistent',
             'solve',
+            'solve_async',
+            'solve_batch',
             'version',
             'name',
         ]
@@ -433,6 +437,18 @@ Ipopt 3.14.17: Optimal Solution Found
         with self.assertRaises(ValueError):
             result = opt._create_command_line('myfile', opt.config, False)
 
+    def test_memory_backed_tempdir(self):
+        orig = ipopt._MEMORY_BACKED_DIRS
+        try:
+            with TempfileManager.new_context() as tempfile:
+                dname = tempfile.mkdtemp()
+                ipopt._MEMORY_BACKED_DIRS = ('/bogus/path', dname)
+                self.assertEqual(ipopt._memory_backed_tempdir(), dname)
+            ipopt._MEMORY_BACKED_DIRS = ('/bogus/path',)
+            self.assertIsNone(ipopt._memory_backed_tempdir())
+        finally:
+            ipopt._MEMORY_BACKED_DIRS = orig
+
 
 @unittest.skipIf(not ipopt_available, "The 'ipopt' command is not available")
 class TestIpopt(unittest.TestCase):
@@ -464,6 +480,74 @@ class TestIpopt(unittest.TestCase):
         model = self.create_model()
         ipopt.Ipopt().solve(model)
 
+    def test_ipopt_solve_async(self):
+        models = [self.create_model() for i in range(4)]
+        logs = [io.StringIO() for m in models]
+        solver = ipopt.Ipopt()
+        futures = [solver.solve_async(m, tee=log) for m, log in zip(models, logs)]
+        for m, log, future in zip(models, logs, futures):
+            results = future.result()
+            self.assertEqual(results.iteration_count, 11)
+            self.assertAlmostEqual(m.x.value, 1)
+            self.assertAlmostEqual(m.y.value, 1)
+            self.assertIn('Optimal Solution Found', log.getvalue())
+        # Errors are reported through the future
+        model = self.create_model()
+        model.x.setlb(2)
+        model.x.setub(1)
+        future = solver.solve_async(model)
+        with self.assertRaises(NoOptimalSolutionError):
+            future.result()
+
+    def test_ipopt_solve_batch(self):
+        models = [self.create_model() for i in range(6)]
+        for i, m in enumerate(models):
+            m.x.setub(i / 5)
+        solver = ipopt.Ipopt()
+        results = solver.solve_batch(models, max_workers=2)
+        self.assertEqual(len(results), len(models))
+        for i, (m, res) in enumerate(zip(models, results)):
+            self.assertAlmostEqual(m.x.value, i / 5, 5)
+            self.assertAlmostEqual(res.incumbent_objective, pyo.value(m.obj))
+        # Results are still returned in order when the files are kept
+        # (and models with the same name do not share files)
+        for m in models:
+            m.x.value = None
+        with TempfileManager.new_context() as tempfile:
+            dname = tempfile.mkdtemp()
+            results = solver.solve_batch(models, max_workers=2, working_dir=dname)
+            for i, (m, res) in enumerate(zip(models, results)):
+                self.assertAlmostEqual(m.x.value, i / 5, 5)
+                self.assertAlmostEqual(res.incumbent_objective, pyo.value(m.obj))
+            self.assertEqual(
+                sorted(os.listdir(dname)), [str(i) for i in range(len(models))]
+            )
+            for i, m in enumerate(models):
+                self.assertTrue(
+                    os.path.exists(os.path.join(dname, str(i), m.name + '.nl'))
+                )
+
+    def test_ipopt_memory_backed_files(self):
+        model = self.create_model()
+        solver = ipopt.Ipopt()
+        orig = ipopt._MEMORY_BACKED_DIRS
+        try:
+            with TempfileManager.new_context() as tempfile:
+                dname = tempfile.mkdtemp()
+                ipopt._MEMORY_BACKED_DIRS = (dname,)
+                steps = solver._solve_steps(model, {'memory_backed_files': True})
+                next(steps)
+                # The NL file was written into the memory-backed directory
+                (subdir,) = os.listdir(dname)
+                self.assertIn('unknown.nl', os.listdir(os.path.join(dname, subdir)))
+                results = ipopt._finish_steps(steps)
+                self.assertEqual(os.listdir(dname), [])
+        finally:
+            ipopt._MEMORY_BACKED_DIRS = orig
+        self.assertEqual(results.iteration_count, 11)
+        self.assertAlmostEqual(model.x.value, 1)
+        self.assertAlmostEqual(model.y.value, 1)
+
     def test_ipopt_results(self):
         model = self.create_model()
         results = ipopt.Ipopt().solve(model)
@@ -9,12 +9,22 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import io
+import os
+import struct
+from types import SimpleNamespace
+
 from pyomo.common import unittest
+from pyomo.common.dependencies import numpy as np, numpy_available
+from pyomo.common.errors import PyomoException
 from pyomo.common.fileutils import this_file_dir
 from pyomo.common.tempfiles import TempfileManager
-from pyomo.contrib.solver.solvers.sol_reader import SolFileData
+from pyomo.contrib.solver.common.results import Results, SolutionStatus
+from pyomo.contrib.solver.solvers import sol_reader
+from pyomo.contrib.solver.solvers.sol_reader import SolFileData, parse_sol_file
 
 currdir = this_file_dir()
+sol_files = os.path.join(os.path.dirname(currdir), 'unit', 'sol_files')
 
 
 class TestSolFileData(unittest.TestCase):
@@ -49,3 +59,84 @@ class TestSolParser(unittest.TestCase):
 
     def test_infeasible2(self):
         pass
+
+    def _check_conopt_optimal(self, result, sol_data):
+        self.assertEqual(result.solution_status, SolutionStatus.optimal)
+        self.assertEqual(
+            result.extra_info.solver_message,
+            "CONOPT 3.17A: Optimal; objective 1; 4 iterations; evals: nf = 2, "
+            "ng = 0, nc = 2, nJ = 0, nH = 0, nHv = 0",
+        )
+        self.assertEqual(list(sol_data.duals), [1])
+        self.assertEqual(list(sol_data.primals), [1])
+        if numpy_available:
+            self.assertIsInstance(sol_data.primals, np.ndarray)
+        self.assertEqual(sol_data.var_suffixes, {'sstatus': {0: 1}})
+        self.assertEqual(sol_data.con_suffixes['sstatus'], {0: 3})
+
+    def test_parse_text(self):
+        nl_info = SimpleNamespace(constraints=[None], variables=[None])
+        fname = os.path.join(sol_files, 'conopt_optimal.sol')
+        with open(fname, 'r') as FILE:
+            self._check_conopt_optimal(*parse_sol_file(FILE, nl_info, Results()))
+        # Text sol files can also be parsed from binary streams
+        with open(fname, 'rb') as FILE:
+            self._check_conopt_optimal(*parse_sol_file(FILE, nl_info, Results()))
+            self.assertFalse(FILE.closed)
+
+    def test_parse_truncated_text(self):
+        nl_info = SimpleNamespace(constraints=[None], variables=[None])
+        with open(os.path.join(sol_files, 'conopt_optimal.sol'), 'r') as FILE:
+            # Drop the primal values (and everything after them)
+            sol = ''.join(FILE.readlines()[:13])
+        for np_available in (True, False) if numpy_available else (False,):
+            with unittest.mock.patch.object(
+                sol_reader, 'numpy_available', np_available
+            ):
+                with self.assertRaisesRegex(
+                    PyomoException,
+                    "ERROR READING `sol` FILE. Expected 1 values; the file "
+                    "is truncated",
+                ):
+                    parse_sol_file(io.StringIO(sol), nl_info, Results())
+
+    def test_parse_binary(self):
+        def record(data):
+            return struct.pack('=i', len(data)) + data + struct.pack('=i', len(data))
+
+        def ints(*args):
+            return struct.pack('=%di' % len(args), *args)
+
+        sol = io.BytesIO(
+            b''.join(
+                [
+                    record(b'binary'),
+                    record(b'CONOPT 3.17A: Optimal; objective 1'),
+                    record(
+                        b'4 iterations; evals: nf = 2, ng = 0, nc = 2, '
+                        b'nJ = 0, nH = 0, nHv = 0'
+                    ),
+                    record(b''),
+                    # Options: 3 options, then n_cons, n_duals, n_vars, n_primals
+                    record(ints(3, 1, 1, 0, 1, 1, 1, 1)),
+                    record(struct.pack('=d', 1)),
+                    record(struct.pack('=d', 1)),
+                    # objno
+                    record(ints(0, 0)),
+                    # suffixes
+                    record(ints(0, 1, 8, 0)),
+                    record(b'sstatus'),
+                    record(ints(0, 1)),
+                    record(ints(1, 1, 8, 0)),
+                    record(b'sstatus'),
+                    record(ints(0, 3)),
+                    record(ints(4 | 1, 1, 5, 0)),
+                    record(b'dual'),
+                    record(struct.pack('=id', 0, 2.5)),
+                ]
+            )
+        )
+        nl_info = SimpleNamespace(constraints=[None], variables=[None])
+        result, sol_data = parse_sol_file(sol, nl_info, Results())
+        self._check_conopt_optimal(result, sol_data)
+        self.assertEqual(sol_data.con_suffixes['dual'], {0: 2.5})
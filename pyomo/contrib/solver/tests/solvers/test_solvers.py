@@ -33,6 +33,8 @@ from pyomo.contrib.solver.solvers.ipopt import Ipopt
 from pyomo.contrib.solver.solvers.gurobi_persistent import GurobiPersistent
 from pyomo.contrib.solver.solvers.gurobi_direct import GurobiDirect
 from pyomo.contrib.solver.solvers.highs import Highs
+from pyomo.core.base.component import _ModelChangeObservers
+from pyomo.core.base.matrix_constraint import MatrixConstraint
 from pyomo.core.expr.numeric_expr import LinearExpression
 from pyomo.core.expr.compare import assertExpressionsEqual
 
@@ -882,6 +884,42 @@ class TestSolvers(unittest.TestCase):
                 bound = res.objective_bound
             self.assertTrue(bound <= m.y.value)
 
+    @parameterized.expand(input=_load_tests(all_solvers))
+    @unittest.skipUnless(numpy_available, 'numpy is not available')
+    def test_matrix_constraint(
+        self, name: str, opt_class: Type[SolverBase], use_presolve: bool
+    ):
+        opt: SolverBase = opt_class()
+        if not opt.available():
+            raise unittest.SkipTest(f'Solver {opt.name} not available.')
+        if any(name.startswith(i) for i in nl_solvers_set):
+            if use_presolve:
+                opt.config.writer_config.linear_presolve = True
+            else:
+                opt.config.writer_config.linear_presolve = False
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var([0, 1])
+        m.y = pyo.Var()
+        m.obj = pyo.Objective(expr=m.y)
+        # y >= x[0]; y >= x[1]; x[0] + x[1] == 3
+        m.c = MatrixConstraint(
+            [[1, -1, 0], [1, 0, -1], [0, 1, 1]],
+            lb=[0, 0, 3],
+            ub=[None, None, 3],
+            x=[m.y, m.x[0], m.x[1]],
+        )
+        res: Results = opt.solve(m)
+        self.assertEqual(res.solution_status, SolutionStatus.optimal)
+        self.assertAlmostEqual(m.y.value, 1.5)
+        self.assertAlmostEqual(m.x[0].value, 1.5)
+        self.assertAlmostEqual(m.x[1].value, 1.5)
+
+        m.x[1].fix(0.5)
+        res = opt.solve(m)
+        self.assertEqual(res.solution_status, SolutionStatus.optimal)
+        self.assertAlmostEqual(m.y.value, 2.5)
+        self.assertAlmostEqual(m.x[0].value, 2.5)
+
     @parameterized.expand(input=_load_tests(all_solvers))
     def test_no_objective(
         self, name: str, opt_class: Type[SolverBase], use_presolve: bool
@@ -984,6 +1022,126 @@ class TestSolvers(unittest.TestCase):
         self.assertAlmostEqual(duals[m.c1], -(1 + a1 / (a2 - a1)))
         self.assertAlmostEqual(duals[m.c2], a1 / (a2 - a1))
 
+    @parameterized.expand(input=_load_tests(mip_solvers))
+    def test_tracked_changes(
+        self, name: str, opt_class: Type[SolverBase], use_presolve: bool
+    ):
+        opt: SolverBase = opt_class()
+        if not opt.available():
+            raise unittest.SkipTest(f'Solver {opt.name} not available.')
+        if not opt.is_persistent():
+            raise unittest.SkipTest(f'Solver {opt.name} is not persistent.')
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var([1, 2, 3], bounds=(0, 10))
+        m.p = pyo.Param([1, 2], mutable=True, initialize=1)
+        m.e = pyo.Expression(expr=m.x[1] + m.x[2])
+        m.obj = pyo.Objective(expr=m.x[1] + 2 * m.x[2] + 3 * m.x[3])
+        m.c = pyo.ConstraintList()
+        m.c.add(m.e >= m.p[1])
+
+        def check(modify):
+            modify()
+            res = opt.solve(m)
+            ref = opt_class().solve(m)
+            self.assertAlmostEqual(res.incumbent_objective, ref.incumbent_objective)
+
+        check(lambda: None)
+        check(lambda: m.p[1].set_value(2))
+        check(lambda: m.x[1].setub(1))
+        check(lambda: m.c.add(m.x[2] + m.x[3] >= m.p[2] + 2))
+        check(lambda: m.x[2].fix(1))
+        check(lambda: m.x[2].unfix())
+        check(lambda: setattr(m.x[3], 'domain', pyo.Integers))
+        check(lambda: m.x[3].setlb(0.5))
+        check(lambda: m.c[2].deactivate())
+        check(lambda: m.c[2].activate())
+        check(lambda: m.c.__delitem__(2))
+        check(lambda: setattr(m.e, 'expr', m.x[1] + 2 * m.x[2]))
+        check(lambda: setattr(m, 'b', pyo.Block()))
+        check(lambda: setattr(m.b, 'c', pyo.Constraint(expr=m.x[3] >= 3)))
+        check(lambda: m.b.deactivate())
+        check(lambda: m.b.activate())
+        check(lambda: m.b.c.set_value(m.x[3] >= 2))
+        check(lambda: m.del_component(m.b))
+        check(lambda: setattr(m.obj, 'sense', pyo.maximize))
+        check(lambda: m.obj.set_value(m.x[1] + m.x[3]))
+        check(
+            lambda: m.obj.deactivate() or setattr(m, 'obj2', pyo.Objective(expr=m.x[2]))
+        )
+        check(lambda: m.obj2.deactivate() or m.obj.activate())
+        check(lambda: m.x.setub(2))
+
+        # Changes to other models are not recorded, except for the
+        # variables that are used in this model
+        n = pyo.ConcreteModel()
+        n.x = pyo.Var([1, 2], bounds=(0, 10))
+        n.p = pyo.Param(mutable=True, initialize=1)
+        n.obj = pyo.Objective(expr=n.x[2])
+        n.c = pyo.Constraint(expr=n.x[2] >= n.p)
+        check(lambda: m.c.add(m.x[1] + n.x[1] >= 4))
+        tracker = opt._change_tracker
+        n.x[2].setlb(1)
+        n.x.setub(5)
+        n.p.set_value(3)
+        n.obj.sense = pyo.maximize
+        n.c.set_value(n.x[2] >= 2 * n.p)
+        self.assertEqual(list(tracker.changes.vars), [id(n.x[1])])
+        self.assertEqual(tracker.changes.params, {})
+        self.assertEqual(tracker.changes.constraints, {})
+        self.assertFalse(tracker.changes.objective)
+        check(lambda: n.x[1].setlb(3))
+
+        # The tracker stops recording when the solver is reset
+        opt.set_instance(m)
+        self.assertNotIn(tracker, [ref() for ref in _ModelChangeObservers.observers])
+        m.x[1].setlb(0.5)
+        self.assertEqual(tracker.changes.vars, {})
+        self.assertIn(id(m.x[1]), opt._change_tracker.changes.vars)
+
+        # The full comparison reaches the same solution
+        opt.config.auto_updates.track_changes = False
+        check(lambda: m.x.setub(3))
+
+    @parameterized.expand(input=_load_tests(mip_solvers))
+    def test_mutable_param_sweep(
+        self, name: str, opt_class: Type[SolverBase], use_presolve: bool
+    ):
+        opt: SolverBase = opt_class()
+        if not opt.available():
+            raise unittest.SkipTest(f'Solver {opt.name} not available.')
+        if not opt.is_persistent():
+            raise unittest.SkipTest(f'Solver {opt.name} is not persistent.')
+        m = pyo.ConcreteModel()
+        m.I = pyo.RangeSet(4)
+        m.a = pyo.Param(m.I, m.I, mutable=True, initialize=1)
+        m.b = pyo.Param(m.I, mutable=True, initialize=1)
+        m.c = pyo.Param(m.I, mutable=True, initialize=1)
+        m.u = pyo.Param(mutable=True, initialize=5)
+        m.x = pyo.Var(m.I, bounds=(0, m.u))
+        m.obj = pyo.Objective(expr=sum(m.c[i] * m.x[i] for i in m.I) + m.u)
+        m.con = pyo.Constraint(
+            m.I,
+            rule=lambda m, i: (
+                m.b[i],
+                sum(m.a[i, j] * m.x[j] for j in m.I),
+                2 * m.b[i] + m.u,
+            ),
+        )
+
+        for k in range(6):
+            for i in m.I:
+                m.b[i] = (i + k) % 3
+                m.c[i] = 1 + (i * k) % 4
+                for j in m.I:
+                    # includes coefficients changing to / from zero
+                    m.a[i, j] = (i + j + k) % 3
+            m.u = 4 + k % 2
+            if k == 3:
+                m.con[1].deactivate()
+            res = opt.solve(m)
+            ref = opt_class().solve(m)
+            self.assertAlmostEqual(res.incumbent_objective, ref.incumbent_objective)
+
     @parameterized.expand(input=_load_tests(all_solvers))
     def test_results_infeasible(
         self, name: str, opt_class: Type[SolverBase], use_presolve: bool
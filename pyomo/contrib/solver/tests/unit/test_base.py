@@ -10,6 +10,7 @@
 #  ___________________________________________________________________________
 
 import os
+import sys
 
 from pyomo.common import unittest
 from pyomo.common.config import ConfigDict
@@ -22,7 +23,15 @@ class _LegacyWrappedSolverBase(base.LegacySolverWrapper, base.SolverBase):
 
 class TestSolverBase(unittest.TestCase):
     def test_class_method_list(self):
-        expected_list = ['CONFIG', 'available', 'is_persistent', 'solve', 'version']
+        expected_list = [
+            'CONFIG',
+            'available',
+            'is_persistent',
+            'solve',
+            'solve_async',
+            'solve_batch',
+            'version',
+        ]
         method_list = [
             method for method in dir(base.SolverBase) if method.startswith('_') is False
         ]
@@ -54,6 +63,45 @@ class TestSolverBase(unittest.TestCase):
         instance = base.SolverBase(name='my_unique_name')
         self.assertEqual(instance.name, 'my_unique_name')
 
+    def test_solve_async(self):
+        class _Solver(base.SolverBase):
+            def solve(self, model, **kwds):
+                config = self.config(value=kwds)
+                if config.tee:
+                    raise RuntimeError('tee')
+                return model
+
+        instance = _Solver()
+        future = instance.solve_async('model')
+        self.assertTrue(future.done())
+        self.assertEqual(future.result(), 'model')
+        future = instance.solve_async('model', tee=True)
+        self.assertTrue(future.done())
+        with self.assertRaisesRegex(RuntimeError, 'tee'):
+            future.result()
+        future = base.SolverBase().solve_async(None)
+        self.assertIsInstance(future.exception(), NotImplementedError)
+
+    def test_solve_batch(self):
+        class _Solver(base.SolverBase):
+            def solve(self, model, **kwds):
+                config = self.config(value=kwds)
+                self.solved.append(model)
+                if model == 'bad':
+                    raise RuntimeError('bad model')
+                return model, config.tee
+
+        instance = _Solver()
+        instance.solved = []
+        self.assertEqual(
+            instance.solve_batch(['a', 'b', 'c'], tee=True),
+            [('a', [sys.stdout]), ('b', [sys.stdout]), ('c', [sys.stdout])],
+        )
+        instance.solved = []
+        with self.assertRaisesRegex(RuntimeError, 'bad model'):
+            instance.solve_batch(['a', 'bad', 'c'])
+        self.assertEqual(instance.solved, ['a', 'bad'])
+
 
 class TestPersistentSolverBase(unittest.TestCase):
     def test_class_method_list(self):
@@ -76,6 +124,8 @@ class TestPersistentSolverBase(unittest.TestCase):
             'set_instance',
             'set_objective',
             'solve',
+            'solve_async',
+            'solve_batch',
             'update_parameters',
             'update_variables',
             'version',
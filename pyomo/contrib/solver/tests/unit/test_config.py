@@ -116,6 +116,7 @@ class TestAutoUpdateConfig(unittest.TestCase):
         self.assertTrue(config.update_named_expressions)
         self.assertTrue(config.update_objective)
         self.assertTrue(config.update_objective)
+        self.assertTrue(config.track_changes)
 
     def test_interface_custom_instantiation(self):
         config = AutoUpdateConfig(description="A description")
@@ -9,11 +9,16 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import pyomo.environ as pyo
 from pyomo.common import unittest
+from pyomo.common.dependencies import numpy as np, numpy_available
 from pyomo.contrib.solver.common.solution_loader import (
     SolutionLoaderBase,
     PersistentSolutionLoader,
+    load_var_values,
 )
+from pyomo.core.base.component import _ModelChangeObservers
+from pyomo.core.staleflag import StaleFlagManager
 
 
 class TestSolutionLoaderBase(unittest.TestCase):
@@ -36,6 +41,74 @@ class TestSolutionLoaderBase(unittest.TestCase):
             self.instance.get_reduced_costs()
 
 
+class TestLoadVarValues(unittest.TestCase):
+    def test_load_var_values(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var([1, 2, 3], bounds=(0, 1), domain=pyo.Integers)
+        m.y = pyo.Var()
+
+        StaleFlagManager.mark_all_as_stale()
+        # Note: no domain / bounds validation is performed
+        load_var_values([m.x[3], m.x[1]], [2.5, -1])
+        StaleFlagManager.mark_all_as_stale(delayed=True)
+        self.assertEqual(m.x[1].value, -1)
+        self.assertIsNone(m.x[2].value)
+        self.assertEqual(m.x[3].value, 2.5)
+        self.assertFalse(m.x[1].stale)
+        self.assertTrue(m.x[2].stale)
+        self.assertFalse(m.x[3].stale)
+
+        # Updating non-stale variables in the delayed mode marks all
+        # other variables stale
+        load_var_values([m.x[1], m.y], [0, pyo.value(2 * m.x[3])])
+        self.assertEqual(m.x[1].value, 0)
+        self.assertEqual(m.y.value, 5)
+        self.assertFalse(m.x[1].stale)
+        self.assertFalse(m.y.stale)
+        self.assertTrue(m.x[3].stale)
+
+        # Non-float values are converted
+        m.p = pyo.Param(initialize=3, mutable=True)
+        load_var_values([m.x[2]], [m.p + 1])
+        self.assertEqual(m.x[2].value, 4)
+
+    def test_load_var_values_notifies_fixed(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var([1, 2])
+        m.x[2].fix(1)
+
+        class Observer(object):
+            def __init__(self):
+                self.changed = []
+
+            def var_changed(self, obj):
+                self.changed.append(obj)
+
+        obs = Observer()
+        _ModelChangeObservers.register(obs)
+        try:
+            load_var_values([m.x[1], m.x[2]], [3.0, 4.0])
+        finally:
+            _ModelChangeObservers.unregister(obs)
+        self.assertEqual(m.x[2].value, 4)
+        # Only the change to the fixed variable is notified (as in
+        # VarData.set_value)
+        self.assertEqual(len(obs.changed), 1)
+        self.assertIs(obs.changed[0], m.x[2])
+
+    @unittest.skipUnless(numpy_available, "numpy is not available")
+    def test_load_var_values_numpy(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var(range(5))
+
+        StaleFlagManager.mark_all_as_stale()
+        load_var_values(list(m.x.values()), np.arange(5, dtype=float) / 2)
+        StaleFlagManager.mark_all_as_stale(delayed=True)
+        self.assertEqual([v.value for v in m.x.values()], [0, 0.5, 1, 1.5, 2])
+        self.assertIs(type(m.x[1].value), float)
+        self.assertFalse(any(v.stale for v in m.x.values()))
+
+
 class TestSolSolutionLoader(unittest.TestCase):
     # I am currently unsure how to test this further because it relies heavily on
     # SolFileData and NLWriterInfo
@@ -10,8 +10,13 @@
 #  ___________________________________________________________________________
 
 from pyomo.common import unittest
+from pyomo.common.dependencies import numpy_available
 import pyomo.environ as pyo
-from pyomo.contrib.solver.common.util import collect_vars_and_named_exprs, get_objective
+from pyomo.contrib.solver.common.util import (
+    collect_vars_and_named_exprs,
+    get_objective,
+    VectorizedEvaluator,
+)
 from pyomo.opt.results.solver import (
     SolverStatus as LegacySolverStatus,
     TerminationCondition as LegacyTerminationCondition,
@@ -70,6 +75,37 @@ class TestGenericUtils(unittest.TestCase):
         model.Constraint1 = pyo.Constraint(expr=3 * model.x[1] + 4 * model.x[2] >= 1)
         return model
 
+    @unittest.skipUnless(numpy_available, 'numpy is not available')
+    def test_vectorized_evaluator(self):
+        m = pyo.ConcreteModel()
+        m.p = pyo.Param([1, 2], mutable=True, initialize=2)
+        m.q = pyo.Param(initialize=3)
+        m.x = pyo.Var()
+        m.x.fix(4)
+        m.e = pyo.Expression(expr=m.p[1] * m.q)
+        exprs = [
+            m.p[1],
+            3 * m.p[1] - m.p[2] / 2 + 1,
+            m.p[1] * m.p[2],
+            2 * m.x + m.e,
+            -m.p[1],
+            pyo.log(m.p[1]),
+            5,
+            m.p[2] / m.q,
+            m.p[1] - m.p[1],
+        ]
+        evaluator = VectorizedEvaluator(exprs)
+        self.assertEqual(len(evaluator), len(exprs))
+        # only p[1]*p[2] and log(p[1]) are not affine in the Params
+        self.assertEqual([i for i, e in evaluator._fallback], [2, 5])
+        self.assertEqual(len(evaluator._leaves), 3)
+        self.assertEqual(list(evaluator()), [pyo.value(e) for e in exprs])
+        m.p[1] = 7
+        m.p[2] = -1
+        m.x.fix(0.5)
+        self.assertEqual(list(evaluator()), [pyo.value(e) for e in exprs])
+        self.assertEqual(len(VectorizedEvaluator([])()), 0)
+
     def test_get_objective_success(self):
         model = self.simple_model()
         self.assertEqual(model.OBJ, get_objective(model))
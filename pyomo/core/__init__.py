@@ -196,6 +196,7 @@ from pyomo.core.base.transformation import (
 )
 
 from pyomo.core.base.instance2dat import instance2dat
+from pyomo.core.base.snapshot import save_snapshot, load_snapshot
 
 from pyomo.core.util import (
     prod,
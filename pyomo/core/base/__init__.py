@@ -146,6 +146,7 @@ from pyomo.core.base.suffix import (
 from pyomo.core.base.var import Var, VarData, ScalarVar, VarList
 
 from pyomo.core.base.instance2dat import instance2dat
+from pyomo.core.base.snapshot import save_snapshot, load_snapshot
 
 #
 # These APIs are deprecated and should be removed in the near future
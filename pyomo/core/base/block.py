@@ -12,6 +12,8 @@
 from __future__ import annotations
 import copy
 import logging
+import marshal
+import pickle
 import sys
 import weakref
 import textwrap
@@ -19,9 +21,10 @@ import textwrap
 from collections import defaultdict
 from contextlib import contextmanager
 from inspect import isclass, currentframe
-from io import StringIO
+from io import BytesIO, StringIO
 from itertools import filterfalse, chain
 from operator import itemgetter, attrgetter
+from types import CellType, FunctionType
 from typing import Union, Any, Type
 
 from pyomo.common.autoslots import AutoSlots
@@ -35,8 +38,11 @@ from pyomo.common.timing import ConstructionTimer
 from pyomo.core.base.component import (
     Component,
     ComponentData,
+    ActiveComponent,
     ActiveComponentData,
     ModelComponentFactory,
+    _StructureChangeCounter,
+    _ModelChangeObservers,
 )
 from pyomo.core.base.enums import SortComponents, TraversalStrategy
 from pyomo.core.base.global_set import UnindexedComponent_index
@@ -243,6 +249,53 @@ def _isNotNone(val):
     return val is not None
 
 
+# Cached component_data_objects() traversals (keyed by the block the
+# traversal was started from, then by the traversal arguments).  See
+# BlockData.component_data_objects().
+_component_data_cache = weakref.WeakKeyDictionary()
+_cacheable_ctypes = {}
+
+
+def _is_cacheable_ctype(ctype):
+    """Return True if traversals over `ctype` can be cached
+
+    We only cache traversals over (tuples of) component types that can
+    be activated / deactivated (Constraint, Objective, Block, ...), as
+    those are the traversals where filtering on the active flag visits
+    component data that are not returned.
+    """
+    try:
+        ans = _cacheable_ctypes.get(ctype, None)
+    except TypeError:
+        # Unhashable ctype argument (e.g., a list)
+        return False
+    if ans is None:
+        ctypes = ctype if type(ctype) is tuple else (ctype,)
+        ans = _cacheable_ctypes[ctype] = all(
+            isclass(t) and issubclass(t, ActiveComponent) for t in ctypes
+        )
+    return ans
+
+
+def _traversal_ctypes(block, ctype, descend_into):
+    """Return the ctypes whose structural changes can affect a traversal
+
+    This includes the component types returned by the traversal, the
+    type of the block the traversal starts from, and the types of the
+    blocks that the traversal descends into (see
+    :py:meth:`BlockData.block_data_objects`).
+    """
+    ctypes = set(ctype) if type(ctype) is tuple else {ctype}
+    ctypes.add(block.ctype)
+    if descend_into is True:
+        ctypes.add(Block)
+    elif isclass(descend_into):
+        ctypes.add(descend_into)
+    elif descend_into:
+        ctypes.update(descend_into)
+    return tuple(ctypes)
+
+
 class _BlockConstruction(object):
     """
     This class holds a "global" dict used when constructing
@@ -252,6 +305,131 @@ class _BlockConstruction(object):
     data = {}
 
 
+class _ParallelBlockConstruction(object):
+    """
+    This class holds the "global" state shared with the worker
+    processes forked to construct the data of an indexed Block in
+    parallel (see :py:meth:`Block._construct_in_parallel`).
+    """
+
+    # The (component, list of indices) being constructed.  This is set
+    # before the worker pool is created so that it is inherited by the
+    # forked worker processes.
+    target = None
+    # True within a worker process (nested parallel construction is
+    # done serially)
+    in_worker = False
+    # Map of ComponentUID to the (parent process) component used when
+    # unpickling block data returned by the workers
+    resolved = None
+
+
+def _function_is_importable(fcn):
+    obj = sys.modules.get(fcn.__module__, None)
+    for name in fcn.__qualname__.split('.'):
+        obj = getattr(obj, name, None)
+    return obj is fcn
+
+
+def _rebuild_function(code, module, qualname, defaults, kwdefaults, ncells):
+    fcn = FunctionType(
+        marshal.loads(code),
+        sys.modules[module].__dict__,
+        None,
+        defaults,
+        tuple(CellType() for i in range(ncells)),
+    )
+    fcn.__qualname__ = qualname
+    fcn.__kwdefaults__ = kwdefaults
+    return fcn
+
+
+def _set_function_closure(fcn, cell_contents):
+    for cell, val in zip(fcn.__closure__, cell_contents):
+        cell.cell_contents = val
+
+
+def _resolve_external_component(cuid):
+    resolved = _ParallelBlockConstruction.resolved
+    if cuid not in resolved:
+        model = _ParallelBlockConstruction.target[0].model()
+        resolved[cuid] = cuid.find_component_on(model)
+    return resolved[cuid]
+
+
+class _BlockDataPickler(pickle.Pickler):
+    """Pickler used to return block data constructed in a worker process
+
+    Components and component data that are not owned by (a descendant
+    of) one of the block data being transferred already exist in the
+    parent process.  They are pickled by reference (ComponentUID) so
+    that the unpickled block data refer to the original objects (and
+    not copies of them).  Functions declared within the block rule
+    (e.g., lambdas used as component rules) only exist in the worker
+    process and are pickled by value: as the worker was forked from the
+    parent process, the code objects (and defining modules) are
+    guaranteed to be compatible.
+    """
+
+    def __init__(self, file, model, internal_blocks):
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self._model = model
+        self._internal_blocks = internal_blocks
+        self._component_types = {}
+
+    def reducer_override(self, obj):
+        cls = obj.__class__
+        if cls is FunctionType:
+            if _function_is_importable(obj):
+                return NotImplemented
+            closure = obj.__closure__ or ()
+            return (
+                _rebuild_function,
+                (
+                    marshal.dumps(obj.__code__),
+                    obj.__module__,
+                    obj.__qualname__,
+                    obj.__defaults__,
+                    obj.__kwdefaults__,
+                    len(closure),
+                ),
+                tuple(cell.cell_contents for cell in closure),
+                None,
+                None,
+                _set_function_closure,
+            )
+        is_component = self._component_types.get(cls, None)
+        if is_component is None:
+            is_component = self._component_types[cls] = issubclass(
+                cls, (ComponentData, Component)
+            )
+        if not is_component or id(obj) in self._internal_blocks:
+            return NotImplemented
+        parent = obj.parent_block()
+        if parent is not None and id(parent) in self._internal_blocks:
+            return NotImplemented
+        if obj.model() is not self._model:
+            # Not part of this model (e.g., global sets): pickle normally
+            return NotImplemented
+        return _resolve_external_component, (ComponentUID(obj),)
+
+
+def _construct_block_chunk(chunk):
+    """Construct (and pickle) a contiguous set of block data
+
+    This is run in a forked worker process.
+    """
+    _ParallelBlockConstruction.in_worker = True
+    component, indices = _ParallelBlockConstruction.target
+    blocks = [component._getitem_when_not_present(idx) for idx in indices[chunk]]
+    internal = set()
+    for blk in blocks:
+        internal.update(map(id, blk.block_data_objects(descend_into=True)))
+    buf = BytesIO()
+    _BlockDataPickler(buf, component.model(), internal).dump(blocks)
+    return buf.getvalue()
+
+
 class PseudoMap(AutoSlots.Mixin):
     """
     This class presents a "mock" dict interface to the internal
@@ -1039,6 +1217,7 @@ component, use the block del_component() and add_component() methods.
             idx_info[2] += 1
         else:
             self._ctypes[_type] = [_new_idx, _new_idx, 1]
+        _StructureChangeCounter.increment(_type)
         #
         # Error, for disabled support implicit rule names
         #
@@ -1056,6 +1235,8 @@ component, use the block del_component() and add_component() methods.
         # another.
         #
         if val._constructed is True:
+            if _ModelChangeObservers.observers:
+                _ModelChangeObservers.notify('structure_changed', val)
             return
         #
         # If the block is Concrete, construct the component
@@ -1111,6 +1292,10 @@ component, use the block del_component() and add_component() methods.
                     extra={'cleandoc': False},
                 )
                 raise
+            finally:
+                _StructureChangeCounter.increment(_type)
+                if _ModelChangeObservers.observers:
+                    _ModelChangeObservers.notify('structure_changed', val)
             if generate_debug_messages:
                 if _blockName[-1] == "'":
                     _blockName = _blockName[:-1] + '.' + name + "'"
@@ -1161,6 +1346,9 @@ component, use the block del_component() and add_component() methods.
                 "Attempting to delete a reserved block component:\n\t%s" % (obj.name,)
             )
 
+        if _ModelChangeObservers.observers:
+            _ModelChangeObservers.notify('structure_changed', obj)
+
         # Replace the component in the master list with a None placeholder
         idx = self._decl[name]
         del self._decl[name]
@@ -1188,6 +1376,7 @@ component, use the block del_component() and add_component() methods.
         # correct way to add the attribute is to delegate the work to
         # the next class up the MRO.
         super(BlockData, self).__delattr__(name)
+        _StructureChangeCounter.increment(obj.ctype)
 
     def reclassify_component_type(
         self, name_or_object, new_ctype, preserve_declaration_order=True
@@ -1199,6 +1388,7 @@ component, use the block del_component() and add_component() methods.
         # FIXME: Is this necessary?  Should this raise an exception?
         if obj is None:
             return
+        old_ctype = obj.ctype
 
         if obj.ctype is new_ctype:
             return
@@ -1214,6 +1404,8 @@ component, use the block del_component() and add_component() methods.
             return
 
         idx = self._decl[name]
+        if _ModelChangeObservers.observers:
+            _ModelChangeObservers.notify('structure_changed', obj)
 
         # Update the ctype linked lists
         ctype_info = self._ctypes[obj.ctype]
@@ -1262,6 +1454,10 @@ component, use the block del_component() and add_component() methods.
                 tmp = self._decl_order[tmp][1]
             self._decl_order[prev] = (self._decl_order[prev][0], idx)
             self._decl_order[idx] = (obj, tmp)
+        _StructureChangeCounter.increment(old_ctype)
+        _StructureChangeCounter.increment(new_ctype)
+        if _ModelChangeObservers.observers:
+            _ModelChangeObservers.notify('structure_changed', obj)
 
     def clone(self, memo=None):
         """Make a copy of this block (and all components contained in it).
@@ -1620,12 +1816,116 @@ component, use the block del_component() and add_component() methods.
         block.  By default, this generator recursively
         descends into sub-blocks.
         """
+        if ctype is not None and _is_cacheable_ctype(ctype):
+            key = (ctype, active, sort, descend_into, descent_order)
+            try:
+                hash(key)
+            except TypeError:
+                pass
+            else:
+                yield from self._cached_component_data_objects(key)
+                return
         dedup = _DeduplicateInfo()
         for _block in self.block_data_objects(
             active, sort, descend_into, descent_order
         ):
             yield from _block._component_data_itervalues(ctype, active, sort, dedup)
 
+    def _cached_component_data_objects(self, key):
+        """Return the component_data_objects() traversal, using a cache
+
+        The traversal results are cached (per block and traversal
+        arguments) the first time a traversal runs to completion without
+        the model being changed.  Subsequent traversals return the
+        cached results as long as no structural change (adding or
+        removing components or component data, or (de)activating
+        components or component data) was made since the cache was
+        created to any component of the traversed types (or of the
+        block types that the traversal descends into).  As an
+        additional safeguard against component data stored without
+        going through the standard IndexedComponent API, the number of
+        data in each component is also verified.
+
+        """
+        ctype, active, sort, descend_into, descent_order = key
+        counts = _StructureChangeCounter.counts
+        cache = _component_data_cache.get(self, None)
+        entry = None if cache is None else cache.get(key, None)
+        if entry is not None:
+            ctypes, version, components, data = entry
+            if [counts[t] for t in ctypes] == version and all(
+                len(comp._data) == n for comp, n in components
+            ):
+                changes = _StructureChangeCounter.value
+                for i, obj in enumerate(data):
+                    if _StructureChangeCounter.value != changes:
+                        if [counts[t] for t in ctypes] != version:
+                            # The model was changed while iterating over
+                            # the cached results: revalidate the remaining
+                            # data before returning them
+                            yield from self._revalidate_component_data(
+                                data[i:], data[i - 1] if i else None, active
+                            )
+                            return
+                        changes = _StructureChangeCounter.value
+                    yield obj
+                return
+
+        # Cache miss: perform the traversal, recording the results
+        ctypes = _traversal_ctypes(self, ctype, descend_into)
+        version = [counts[t] for t in ctypes]
+        dedup = _DeduplicateInfo()
+        data = []
+        for _block in self.block_data_objects(
+            active, sort, descend_into, descent_order
+        ):
+            for obj in _block._component_data_itervalues(ctype, active, sort, dedup):
+                data.append(obj)
+                yield obj
+        # Do not cache the results if the model was changed during the
+        # traversal, or if the traversal went through References (where
+        # the referenced data can change without changing the
+        # Reference component)
+        if [counts[t] for t in ctypes] != version or dedup.seen_comp_thru_reference:
+            return
+        components = []
+        for _block in self.block_data_objects(
+            active, sort, descend_into, descent_order
+        ):
+            for comp in PseudoMap(_block, ctype, active, sort).values():
+                if comp.is_reference():
+                    return
+                if hasattr(comp, '_data'):
+                    components.append((comp, len(comp._data)))
+        if cache is None:
+            cache = _component_data_cache[self] = {}
+        cache[key] = (ctypes, version, components, data)
+
+    def _revalidate_component_data(self, data, last, active):
+        """Filter cached traversal results after a model change
+
+        This emulates the behavior of the (generator-based) traversal:
+        data that were deleted or no longer match the `active` filter
+        are skipped, and the active flag of the containing block is
+        checked when the traversal "enters" a new block.
+
+        """
+        last_block = None if last is None else last.parent_block()
+        for obj in data:
+            comp = obj.parent_component()
+            if comp is None:
+                continue
+            _block = comp.parent_block()
+            if _block is None:
+                continue
+            if _block is not last_block:
+                if active is not None and _block.active != active:
+                    continue
+                last_block = _block
+            if active is not None and obj.active != active:
+                continue
+            yield obj
+
     @deprecated(
         "The component_data_iterindex method is deprecated.  "
         "Components now know their index, so it is more efficient to use the "
@@ -2106,12 +2406,22 @@ class Block(ActiveIndexedComponent):
     # `options` is ignored since it is deprecated
     @overload
     def __init__(
-        self, *indexes, rule=None, concrete=False, dense=True, name=None, doc=None
+        self,
+        *indexes,
+        rule=None,
+        concrete=False,
+        dense=True,
+        parallel=None,
+        name=None,
+        doc=None,
     ): ...
 
     def __init__(self, *args, **kwargs):
         """Constructor"""
         _rule = kwargs.pop('rule', None)
+        # The number of worker processes used to construct the data of
+        # an indexed block
+        self._parallel = kwargs.pop('parallel', None)
         _options = kwargs.pop('options', None)
         # As concrete applies to the Block at declaration time, we will
         # not use an initializer.
@@ -2225,9 +2535,18 @@ class Block(ActiveIndexedComponent):
                 if self.index_set().isfinite() and (
                     self._dense or self._rule is not None
                 ):
-                    for _idx in self.index_set():
-                        # Trigger population & call the rule
-                        self._getitem_when_not_present(_idx)
+                    if (
+                        self._parallel
+                        and self._parallel > 1
+                        and self._rule is not None
+                        and not _BlockConstruction.data
+                        and not _ParallelBlockConstruction.in_worker
+                    ):
+                        self._construct_in_parallel(self._parallel)
+                    else:
+                        for _idx in self.index_set():
+                            # Trigger population & call the rule
+                            self._getitem_when_not_present(_idx)
             else:
                 # We must check that any pre-existing components are
                 # constructed.  This catches the case where someone is
@@ -2261,6 +2580,57 @@ class Block(ActiveIndexedComponent):
                 _BlockConstruction.data.pop(id(self), None)
             timer.report()
 
+    def _construct_in_parallel(self, workers):
+        """Construct the block data using a pool of forked processes
+
+        The index set is split into contiguous chunks that are
+        constructed (by calling the block rule) in worker processes.
+        The resulting block data are pickled back to this process, where
+        any references to components outside the new block data (e.g.,
+        linking variables declared on the parent model) are resolved to
+        the original components.  The block data are then added to this
+        component in index order, so the result is identical to serial
+        construction.
+
+        Block rules must be independent: any changes that a rule makes
+        to components outside its own block are not returned to this
+        process.  As transferring the block data back to this process
+        is not free, this is only beneficial when the rules are
+        computationally expensive relative to the size of the blocks
+        they generate.
+
+        This requires the 'fork' multiprocessing start method; on
+        platforms where it is not available, the blocks are constructed
+        serially.
+
+        """
+        import multiprocessing
+
+        indices = list(self.index_set())
+        n_chunks = min(len(indices), 4 * workers)
+        if n_chunks < 2 or 'fork' not in multiprocessing.get_all_start_methods():
+            for _idx in indices:
+                self._getitem_when_not_present(_idx)
+            return
+        chunk_size = -(-len(indices) // n_chunks)
+        chunks = [slice(i, i + chunk_size) for i in range(0, len(indices), chunk_size)]
+        _ParallelBlockConstruction.target = self, indices
+        _ParallelBlockConstruction.resolved = {}
+        try:
+            with multiprocessing.get_context('fork').Pool(
+                min(workers, len(chunks))
+            ) as pool:
+                results = pool.imap(_construct_block_chunk, chunks)
+                for chunk, buf in zip(chunks, results):
+                    for idx, blk in zip(indices[chunk], pickle.loads(buf)):
+                        self._data[idx] = blk
+                _StructureChangeCounter.increment(self._ctype)
+                if _ModelChangeObservers.observers:
+                    _ModelChangeObservers.notify('structure_changed', self)
+        finally:
+            _ParallelBlockConstruction.target = None
+            _ParallelBlockConstruction.resolved = None
+
     def _pprint_callback(self, ostream, idx, data):
         if not self.is_indexed():
             data._pprint_blockdata_components(ostream)
@@ -11,6 +11,7 @@
 
 import logging
 import sys
+from collections import defaultdict
 from copy import deepcopy
 from pickle import PickleError
 from weakref import ref as weakref_ref
@@ -80,6 +81,78 @@ class CloneError(pyomo.common.errors.PyomoException):
     pass
 
 
+class _StructureChangeCounter(object):
+    """Counters incremented whenever the structure of any model changes
+
+    Structural changes include adding or removing components and
+    component data and (de)activating components and component data.
+    The counters are kept per component type (`counts`, keyed by
+    ctype), so that changing (e.g.) Constraints does not invalidate
+    cached traversals over Objectives.  `value` is incremented on every
+    change, and provides a single test to detect that *something*
+    changed.  The counters are used to validate cached model
+    traversals (see :py:meth:`BlockData.component_data_objects`).
+
+    """
+
+    value = 0
+    counts = defaultdict(int)
+
+    @classmethod
+    def increment(cls, ctype):
+        cls.value += 1
+        cls.counts[ctype] += 1
+
+
+class _ModelChangeObservers(object):
+    """Registry of observers notified whenever a model is modified
+
+    Observers are (weakly) registered with :py:meth:`register` and are
+    notified of changes by calling the observer method corresponding to
+    the type of change with the modified object:
+
+    - ``structure_changed(obj)``: a component or component data was
+      added, removed, (de)activated, or reclassified.  Removals are
+      notified *before* the object is detached from the model.
+    - ``var_changed(obj)``: the bounds, domain, or fixed flag of a
+      variable (or the value of a fixed variable) may have changed.
+      `obj` is either a :py:class:`VarData` or a Var component (when
+      all variables in the component may have changed).
+    - ``param_changed(obj)``: the value of a mutable parameter may have
+      changed.  `obj` is either a :py:class:`ParamData` or a Param
+      component.
+    - ``expression_changed(obj)``: the expression of a Constraint,
+      Objective, or Expression (or the sense of an Objective, or the
+      members of an SOSConstraint) may have changed.
+
+    Notifications are only generated while observers are registered,
+    so modifying models costs a single (class attribute) test when
+    nobody is listening.
+
+    """
+
+    observers = ()
+
+    @classmethod
+    def register(cls, observer):
+        cls.observers += (weakref_ref(observer, cls._remove_ref),)
+
+    @classmethod
+    def unregister(cls, observer):
+        cls.observers = tuple(ref for ref in cls.observers if ref() is not observer)
+
+    @classmethod
+    def _remove_ref(cls, ref):
+        cls.observers = tuple(_ref for _ref in cls.observers if _ref is not ref)
+
+    @classmethod
+    def notify(cls, event, obj):
+        for ref in cls.observers:
+            observer = ref()
+            if observer is not None:
+                getattr(observer, event)(obj)
+
+
 class ComponentBase(PyomoObject):
     """A base class for Component and ComponentData
 
@@ -721,10 +794,16 @@ class ActiveComponent(Component):
     def activate(self):
         """Set the active attribute to True"""
         self._active = True
+        _StructureChangeCounter.increment(self._ctype)
+        if _ModelChangeObservers.observers:
+            _ModelChangeObservers.notify('structure_changed', self)
 
     def deactivate(self):
         """Set the active attribute to False"""
         self._active = False
+        _StructureChangeCounter.increment(self._ctype)
+        if _ModelChangeObservers.observers:
+            _ModelChangeObservers.notify('structure_changed', self)
 
 
 class ComponentData(ComponentBase):
@@ -1000,7 +1079,13 @@ class ActiveComponentData(ComponentData):
     def activate(self):
         """Set the active attribute to True"""
         self._active = self.parent_component()._active = True
+        _StructureChangeCounter.increment(self.ctype)
+        if _ModelChangeObservers.observers:
+            _ModelChangeObservers.notify('structure_changed', self)
 
     def deactivate(self):
         """Set the active attribute to False"""
         self._active = False
+        _StructureChangeCounter.increment(self.ctype)
+        if _ModelChangeObservers.observers:
+            _ModelChangeObservers.notify('structure_changed', self)
@@ -41,7 +41,11 @@ from pyomo.core.expr import (
 from pyomo.core.expr.expr_common import _type_check_exception_arg
 from pyomo.core.expr.relational_expr import TrivialRelationalExpression
 from pyomo.core.expr.template_expr import templatize_constraint
-from pyomo.core.base.component import ActiveComponentData, ModelComponentFactory
+from pyomo.core.base.component import (
+    ActiveComponentData,
+    ModelComponentFactory,
+    _ModelChangeObservers,
+)
 from pyomo.core.base.global_set import UnindexedComponent_index
 from pyomo.core.base.indexed_component import (
     ActiveIndexedComponent,
@@ -384,6 +388,8 @@ class ConstraintData(ActiveComponentData):
 
     def set_value(self, expr):
         """Set the expression on this constraint."""
+        if _ModelChangeObservers.observers:
+            _ModelChangeObservers.notify('expression_changed', self)
         if expr.__class__ in _known_relational_expression_types:
             if getattr(expr, 'strict', False) in _strict_relational_exprs:
                 raise ValueError(
@@ -574,6 +580,11 @@ class Constraint(ActiveIndexedComponent):
             A Pyomo expression for this constraint
         rule
             A function that is used to construct constraint expressions
+        lazy
+            If True, defer calling the rule for each index until that
+            constraint is first accessed (or the component is iterated
+            over, e.g., by a writer).  Only applies to indexed constraints
+            whose rule is called for every member of a finite index set.
         name
             A name for this component
         doc
@@ -634,10 +645,13 @@ class Constraint(ActiveIndexedComponent):
             return super().__new__(IndexedConstraint)
 
     @overload
-    def __init__(self, *indexes, expr=None, rule=None, name=None, doc=None): ...
+    def __init__(
+        self, *indexes, expr=None, rule=None, lazy=False, name=None, doc=None
+    ): ...
 
     def __init__(self, *args, **kwargs):
         _init = self._pop_from_kwargs('Constraint', kwargs, ('rule', 'expr'), None)
+        self._lazy = kwargs.pop('lazy', False)
         # Special case: we accept 2- and 3-tuples as constraints
         if type(_init) is tuple:
             self.rule = Initializer(_init, treat_sequences_as_mappings=False)
@@ -691,6 +705,8 @@ class Constraint(ActiveIndexedComponent):
                 # assumption is that the user will trigger specific
                 # indices to be created at a later time).
                 pass
+            elif self._lazy and self.is_indexed():
+                self._defer_construction(rule)
             else:
                 if TEMPLATIZE_CONSTRAINTS:
                     try:
@@ -882,6 +898,8 @@ class ScalarConstraint(ConstraintData, Constraint):
         return ConstraintData.strict_upper.fget(self)
 
     def clear(self):
+        if _ModelChangeObservers.observers and self._data:
+            _ModelChangeObservers.notify('structure_changed', self)
         self._data = {}
 
     def set_value(self, expr):
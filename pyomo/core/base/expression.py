@@ -28,7 +28,11 @@ from pyomo.common.numeric_types import (
 import pyomo.core.expr as EXPR
 from pyomo.core.expr.expr_common import _type_check_exception_arg
 import pyomo.core.expr.numeric_expr as numeric_expr
-from pyomo.core.base.component import ComponentData, ModelComponentFactory
+from pyomo.core.base.component import (
+    ComponentData,
+    ModelComponentFactory,
+    _ModelChangeObservers,
+)
 from pyomo.core.base.global_set import UnindexedComponent_index
 from pyomo.core.base.indexed_component import (
     IndexedComponent,
@@ -144,6 +148,8 @@ class NamedExpressionData(numeric_expr.NumericValue):
 
     def set_value(self, expr):
         """Set the expression on this expression."""
+        if _ModelChangeObservers.observers:
+            _ModelChangeObservers.notify('expression_changed', self)
         if expr is None or expr.__class__ in native_numeric_types:
             self._args_ = (expr,)
             return
@@ -255,6 +261,12 @@ class Expression(IndexedComponent, IndexedComponent_NDArrayMixin):
     expr :
         A synonym for `rule`
 
+    lazy : bool
+        If True, defer calling the rule for each index until that
+        expression is first accessed (or the component is iterated over).
+        Only applies to indexed expressions initialized by a rule
+        function over a finite index set.
+
     name : str
         Name of this component; will be overridden if this is assigned
         to a Block.
@@ -278,13 +290,21 @@ class Expression(IndexedComponent, IndexedComponent_NDArrayMixin):
 
     @overload
     def __init__(
-        self, *indexes, rule=None, expr=None, initialize=None, name=None, doc=None
+        self,
+        *indexes,
+        rule=None,
+        expr=None,
+        initialize=None,
+        lazy=False,
+        name=None,
+        doc=None,
     ): ...
 
     def __init__(self, *args, **kwds):
         _init = self._pop_from_kwargs(
             'Expression', kwds, ('rule', 'expr', 'initialize'), None
         )
+        self._lazy = kwds.pop('lazy', False)
         # Historically, Expression objects were dense (but None):
         # setting arg_not_specified causes Initializer to recognize
         # _init==None as a constant initializer returning None
@@ -349,6 +369,8 @@ class Expression(IndexedComponent, IndexedComponent_NDArrayMixin):
                 "None in input new values map."
             )
 
+        if self._lazy_construction is not None:
+            self._materialize()
         for index, new_value in new_values.items():
             self._data[index].set_value(new_value)
 
@@ -386,7 +408,18 @@ class Expression(IndexedComponent, IndexedComponent_NDArrayMixin):
         try:
             # We do not (currently) accept data for constructing Constraints
             assert data is None
-            self._construct_from_rule_using_setitem()
+            rule = self._rule
+            if (
+                self._lazy
+                and self.is_indexed()
+                and rule is not None
+                and not rule.constant()
+                and not rule.contains_indices()
+                and self.index_set().isfinite()
+            ):
+                self._defer_construction(rule)
+            else:
+                self._construct_from_rule_using_setitem()
         finally:
             timer.report()
 
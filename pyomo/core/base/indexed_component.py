@@ -18,7 +18,13 @@ import pyomo.core.expr as EXPR
 import pyomo.core.base as BASE
 from pyomo.core.base.indexed_component_slice import IndexedComponent_slice
 from pyomo.core.base.initializer import Initializer
-from pyomo.core.base.component import Component, ActiveComponent, ComponentData
+from pyomo.core.base.component import (
+    Component,
+    ActiveComponent,
+    ComponentData,
+    _StructureChangeCounter,
+    _ModelChangeObservers,
+)
 from pyomo.core.base.config import PyomoOptions
 from pyomo.core.base.enums import SortComponents
 from pyomo.core.base.global_set import UnindexedComponent_set
@@ -254,6 +260,24 @@ def rule_wrapper(rule, wrapping_fcn, positional_arg_map=None, map_types=None):
     return _env['wrapper_function']
 
 
+class _LazyConstruction(object):
+    """Record of the deferred construction of an IndexedComponent
+
+    Components declared with ``lazy=True`` do not call their rule when
+    they are constructed.  Instead, this object holds on to the rule
+    and the indices that were explicitly set, deleted, or skipped by
+    the user (and therefore must not be generated from the rule) until
+    the component data are requested.
+
+    """
+
+    __slots__ = ('rule', 'excluded')
+
+    def __init__(self, rule):
+        self.rule = rule
+        self.excluded = set()
+
+
 class IndexedComponent(Component):
     """This is the base class for all indexed modeling components.
     This class stores a dictionary, self._data, that maps indices
@@ -287,6 +311,10 @@ class IndexedComponent(Component):
             that compose attributes like _index_set, but are not
             themselves explicitly assigned (and named) on any Block
 
+        _lazy_construction: A _LazyConstruction record if the rule
+            has not yet been applied to every index (see
+            :py:meth:`_defer_construction`), otherwise None
+
     """
 
     class Skip(object):
@@ -301,6 +329,8 @@ class IndexedComponent(Component):
     #
     _DEFAULT_INDEX_CHECKING_ENABLED = True
 
+    _lazy_construction = None
+
     def __init__(self, *args, **kwds):
         #
         kwds.pop('noruleinit', None)
@@ -366,6 +396,8 @@ class IndexedComponent(Component):
 
     def to_dense_data(self):
         """TODO"""
+        if self._lazy_construction is not None:
+            self._materialize()
         for idx in self._index_set:
             if idx in self._data:
                 continue
@@ -378,7 +410,11 @@ class IndexedComponent(Component):
     def clear(self):
         """Clear the data in this component"""
         if self.is_indexed():
+            if _ModelChangeObservers.observers:
+                _ModelChangeObservers.notify('structure_changed', self)
             self._data = {}
+            self._lazy_construction = None
+            _StructureChangeCounter.increment(self._ctype)
         else:
             raise DeveloperError(
                 "Derived scalar component %s failed to define clear()."
@@ -411,11 +447,18 @@ class IndexedComponent(Component):
         Return the number of component data objects stored by this
         component.
         """
+        if self._lazy_construction is not None:
+            self._materialize()
         return len(self._data)
 
     def __contains__(self, idx):
         """Return true if the index is in the dictionary"""
-        return idx in self._data
+        if idx in self._data:
+            return True
+        lazy = self._lazy_construction
+        if lazy is None or idx in lazy.excluded or idx not in self._index_set:
+            return False
+        return self._construct_lazy_index(idx) is not None
 
     # The default implementation is for keys() and __iter__ to be
     # synonyms.  The logic is implemented in keys() so that
@@ -455,6 +498,8 @@ class IndexedComponent(Component):
             )
             if ordered:
                 sort = sort | SortComponents.ORDERED_INDICES
+        if self._lazy_construction is not None:
+            self._materialize()
         if not self._index_set.isfinite():
             #
             # If the index set is virtual (e.g., Any) then return the
@@ -520,7 +565,26 @@ You can silence this warning by one of three ways:
             # small number of indices.  However, this provides a
             # consistent ordering that the user expects.
             #
-            ans = filter(self._data.__contains__, ans)
+            # If the data is very sparse and the index set can
+            # efficiently compute positions (e.g., a large SetProduct),
+            # then we instead sort the keys by their position.
+            #
+            _sorted = None
+            if SortComponents.SORTED_INDICES not in sort and len(self._data) * 32 < len(
+                self._index_set
+            ):
+                _sort_by_position = getattr(self._index_set, '_sort_by_position', None)
+                if _sort_by_position is not None:
+                    try:
+                        _sorted = _sort_by_position(self._data)
+                    except (ValueError, IndexError):
+                        # Some data keys are no longer in the index
+                        # set: fall back on filtering the index
+                        _sorted = None
+            if _sorted is None:
+                ans = filter(self._data.__contains__, ans)
+            else:
+                ans = iter(_sorted)
         return ans
 
     def values(self, sort=SortComponents.UNSORTED, ordered=NOTSET):
@@ -659,6 +723,12 @@ You can silence this warning by one of three ways:
             # the default value
             #
             if obj is _NotFound:
+                lazy = self._lazy_construction
+                if lazy is not None and index not in lazy.excluded:
+                    obj = self._construct_lazy_index(index)
+                    if obj is None:
+                        raise KeyError(index)
+                    return obj
                 return self._getitem_when_not_present(index)
 
         return obj
@@ -715,6 +785,10 @@ You can silence this warning by one of three ways:
         else:
             obj = self._data.get(index, _NotFound)
             if obj is _NotFound:
+                if self._lazy_construction is not None:
+                    # Explicitly set values take precedence over the
+                    # (deferred) rule
+                    self._lazy_construction.excluded.add(index)
                 return self._setitem_when_not_present(index, val)
             else:
                 return self._setitem_impl(index, obj, val)
@@ -742,11 +816,20 @@ You can silence this warning by one of three ways:
             for idx in list(index.expanded_keys()):
                 del self[idx]
         else:
+            lazy = self._lazy_construction
+            if lazy is not None and index not in lazy.excluded:
+                # Prevent the deferred rule from (re)creating this index
+                lazy.excluded.add(index)
+                if index not in self._data:
+                    return
             # Handle the normal deletion operation
+            if _ModelChangeObservers.observers:
+                _ModelChangeObservers.notify('structure_changed', self._data[index])
             if self.is_indexed():
                 # Remove reference to this object
                 self._data[index]._component = None
             del self._data[index]
+            _StructureChangeCounter.increment(self._ctype)
 
     def _construct_from_rule_using_setitem(self):
         if self._rule is None:
@@ -794,6 +877,60 @@ You can silence this warning by one of three ways:
             )
             raise
 
+    def _defer_construction(self, rule):
+        """Defer calling the construction rule until the data are requested
+
+        Component data are generated from the rule on first access
+        (through :py:meth:`__getitem__` or :py:meth:`__contains__`).
+        Any operation that needs the complete set of component data
+        (iteration, :py:meth:`__len__`, writers walking the model, etc.)
+        will materialize all remaining indices in a single pass.
+
+        """
+        self._lazy_construction = _LazyConstruction(rule)
+
+    def _construct_lazy_index(self, index):
+        """Apply the deferred rule to create the data for a single index"""
+        try:
+            obj = self._setitem_when_not_present(
+                index, self._lazy_construction.rule(self.parent_block(), index)
+            )
+        except:
+            err = sys.exc_info()[1]
+            logger.error(
+                "Rule failed for %s '%s' with index %s:\n%s: %s"
+                % (self.ctype.__name__, self.name, str(index), type(err).__name__, err)
+            )
+            raise
+        if obj is None:
+            # The rule returned Skip: remember that so that we do not
+            # call the rule for this index again
+            self._lazy_construction.excluded.add(index)
+        elif not self.active:
+            # Match the state that the data would have had if it had
+            # been constructed before the component was deactivated
+            obj.deactivate()
+        return obj
+
+    def _materialize(self):
+        """Construct all component data deferred by lazy construction"""
+        lazy = self._lazy_construction
+        if lazy is None:
+            return
+        data = self._data
+        excluded = lazy.excluded
+        for index in self._index_set:
+            if index not in data and index not in excluded:
+                if self._lazy_construction is not lazy:
+                    # A rule triggered (and completed) the materialization
+                    return
+                self._construct_lazy_index(index)
+        self._lazy_construction = None
+        # Data created on demand were added out of order: restore the
+        # ordering that eager construction would have produced
+        self._data = {idx: data[idx] for idx in self._index_set if idx in data}
+        _StructureChangeCounter.increment(self._ctype)
+
     def _not_constructed_error(self, idx):
         # Generate an error because the component is not constructed
         if not self.is_indexed():
@@ -1106,12 +1243,15 @@ value() function."""
         else:
             obj = self._data[index] = self._ComponentDataClass(component=self)
         obj._index = index
+        _StructureChangeCounter.increment(self._ctype)
         try:
             if value is not _NotSpecified:
                 obj.set_value(value)
         except:
             self._data.pop(index, None)
             raise
+        if _ModelChangeObservers.observers:
+            _ModelChangeObservers.notify('structure_changed', obj)
         return obj
 
     def set_value(self, value):
@@ -1174,14 +1314,26 @@ class ActiveIndexedComponent(IndexedComponent, ActiveComponent):
         """Set the active attribute to True"""
         super(ActiveIndexedComponent, self).activate()
         if self.is_indexed():
-            for component_data in self.values():
+            if self._lazy_construction is not None:
+                # Data not yet generated by the deferred rule will pick
+                # up the component state when it is created
+                _values = self._data.values()
+            else:
+                _values = self.values()
+            for component_data in _values:
                 component_data.activate()
 
     def deactivate(self):
         """Set the active attribute to False"""
         super(ActiveIndexedComponent, self).deactivate()
         if self.is_indexed():
-            for component_data in self.values():
+            if self._lazy_construction is not None:
+                # Data not yet generated by the deferred rule will pick
+                # up the component state when it is created
+                _values = self._data.values()
+            else:
+                _values = self.values()
+            for component_data in _values:
                 component_data.deactivate()
 
 
@@ -13,28 +13,44 @@
 import logging
 import weakref
 
+from pyomo.common.dependencies import numpy as np
+from pyomo.common.deprecation import RenamedClass
 from pyomo.common.gc_manager import PauseGC
 from pyomo.common.log import is_debug_set
 from pyomo.common.modeling import NOTSET
-from pyomo.core.base.set_types import Any
+from pyomo.common.timing import ConstructionTimer
 from pyomo.core.expr.expr_common import _type_check_exception_arg
 from pyomo.core.expr.numvalue import value
 from pyomo.core.expr.numeric_expr import LinearExpression
+from pyomo.core.expr.relational_expr import (
+    EqualityExpression,
+    InequalityExpression,
+    RangedExpression,
+)
 from pyomo.core.base.component import ModelComponentFactory
 from pyomo.core.base.constraint import IndexedConstraint, ConstraintData
+from pyomo.core.base.indexed_component import IndexedComponent
+from pyomo.core.base.set import RangeSet
 from pyomo.repn.standard_repn import StandardRepn
 
-from collections.abc import Mapping
-
-
 logger = logging.getLogger('pyomo.core')
 
+_inf = float('inf')
+_ninf = -_inf
 
-class _MatrixConstraintData(ConstraintData):
+
+class MatrixConstraintData(ConstraintData):
     """
     This class defines the data for a single linear constraint
         derived from a canonical form Ax=b constraint.
 
+    The row (coefficients, column indices, and bounds) is stored on
+    the parent :py:class:`MatrixConstraint` in compressed sparse row
+    (CSR) form.  The body expression is only generated when it is
+    explicitly requested (e.g., through :py:attr:`body` or
+    :py:attr:`expr`): writers and solver interfaces should use
+    :py:attr:`terms` (or :py:meth:`canonical_form`) instead.
+
     Constructor arguments:
         index           The index of this component within the container.
         component       The Constraint object that owns this data.
@@ -61,71 +77,65 @@ class _MatrixConstraintData(ConstraintData):
     __slots__ = ()
 
     # the super secret flag that makes the writers
-    # handle _MatrixConstraintData objects more efficiently
+    # handle MatrixConstraintData objects more efficiently
     _linear_canonical_form = True
 
+    def __init__(self, index, component_ref):
+        #
+        # These lines represent in-lining of the
+        # following constructors:
+        #   - ConstraintData,
+        #   - ActiveComponentData
+        #   - ComponentData
+        self._component = component_ref
+        self._active = True
+        self._expr = None
+
+        # row index into the sparse matrix stored on the parent
+        assert index >= 0
+        self._index = index
+
     #
     # Define methods that writers expect when the
     # _linear_canonical_form flag is True
     #
 
-    def canonical_form(self, compute_values=True):
-        """Build a canonical representation of the body of
-        this constraints"""
+    @property
+    def terms(self):
+        """An iterator over the terms in the body of this
+        constraint as (variable, coefficient) tuples"""
         comp = self.parent_component()
-        index = self._index
-        data = comp._A_data
-        indices = comp._A_indices
         indptr = comp._A_indptr
-        x = comp._x
+        index = self._index
+        s = indptr[index]
+        e = indptr[index + 1]
+        return zip(
+            map(comp._x.__getitem__, comp._A_indices[s:e].tolist()),
+            comp._A_data[s:e].tolist(),
+        )
 
+    def canonical_form(self, compute_values=True):
+        """Build a canonical representation of the body of
+        this constraints"""
         variables = []
         coefficients = []
         constant = 0
-        for p in range(indptr[index], indptr[index + 1]):
-            v = x[indices[p]]
-            c = data[p]
+        # Note: the coefficients are always native floats, so
+        # compute_values has no effect on them
+        for v, c in self.terms:
             if not v.fixed:
                 variables.append(v)
-                if compute_values:
-                    coefficients.append(value(c))
-                else:
-                    coefficients.append(c)
+                coefficients.append(c)
+            elif compute_values:
+                constant += c * v.value
             else:
-                if compute_values:
-                    constant += value(c) * v.value
-                else:
-                    constant += c * v
+                constant += c * v
         repn = StandardRepn()
         repn.linear_vars = tuple(variables)
         repn.linear_coefs = tuple(coefficients)
         repn.constant = constant
         return repn
 
-    def __init__(self, index, component_ref):
-        #
-        # These lines represent in-lining of the
-        # following constructors:
-        #   - ConstraintData,
-        #   - ActiveComponentData
-        #   - ComponentData
-        self._component = component_ref
-        self._active = True
-
-        # row index into the sparse matrix stored on the parent
-        assert index >= 0
-        self._index = index
-
-    def __getstate__(self):
-        """
-        This method must be defined because this class uses slots.
-        """
-        result = super(_MatrixConstraintData, self).__getstate__()
-        return result
-
-    # Since this class requires no special processing of the state
-    # dictionary, it does not need to implement __setstate__()
-
     #
     # Override the default interface methods to
     # avoid generating the body expression where
@@ -135,31 +145,34 @@ class _MatrixConstraintData(ConstraintData):
     def __call__(self, exception=NOTSET):
         """Compute the value of the body of this constraint."""
         exception = _type_check_exception_arg(self, exception)
-        comp = self.parent_component()
-        index = self._index
-        data = comp._A_data
-        indices = comp._A_indices
-        indptr = comp._A_indptr
-        x = comp._x
-        ptrs = range(indptr[index], indptr[index + 1])
         try:
-            return sum(x[indices[p]].value * data[p] for p in ptrs)
+            return sum(v.value * c for v, c in self.terms)
         except (ValueError, TypeError):
             if exception:
                 raise
             return None
 
+    def to_bounded_expression(self, evaluate_bounds=False):
+        """Convert this constraint to a tuple of 3 expressions (lb, body, ub)
+
+        The bounds of a :py:class:`MatrixConstraint` row are always
+        `None` or finite floats (regardless of `evaluate_bounds`).
+        Note that this generates the body expression: clients that
+        can process the linear terms directly should use
+        :py:attr:`terms` instead.
+
+        """
+        return self.lb, self.body, self.ub
+
     def has_lb(self):
         """Returns :const:`False` when the lower bound is
         :const:`None` or negative infinity"""
-        lb = self.lower
-        return (lb is not None) and (lb != float('-inf'))
+        return self.lb is not None
 
     def has_ub(self):
         """Returns :const:`False` when the upper bound is
         :const:`None` or positive infinity"""
-        ub = self.upper
-        return (ub is not None) and (ub != float('inf'))
+        return self.ub is not None
 
     def lslack(self):
         """Lower slack (body - lb). Returns :const:`None` if
@@ -170,12 +183,7 @@ class _MatrixConstraintData(ConstraintData):
         body = self(exception=False)
         if body is None:
             return None
-        lb = self.lower
-        if lb is None:
-            lb = -float('inf')
-        else:
-            lb = value(lb)
-        return body - lb
+        return body - self.parent_component()._lower[self._index].item()
 
     def uslack(self):
         """Upper slack (ub - body). Returns :const:`None` if
@@ -186,12 +194,7 @@ class _MatrixConstraintData(ConstraintData):
         body = self(exception=False)
         if body is None:
             return None
-        ub = self.upper
-        if ub is None:
-            ub = float('inf')
-        else:
-            ub = value(ub)
-        return ub - body
+        return self.parent_component()._upper[self._index].item() - body
 
     def slack(self):
         """min(lslack, uslack). Returns :const:`None` if a
@@ -204,13 +207,6 @@ class _MatrixConstraintData(ConstraintData):
             return None
         return min(self.lslack(), self.uslack())
 
-    #
-    # Override some default implementations on ComponentData
-    #
-
-    def index(self):
-        return self._index
-
     #
     # Abstract Interface (ConstraintData)
     #
@@ -218,16 +214,10 @@ class _MatrixConstraintData(ConstraintData):
     @property
     def body(self):
         """Access the body of a constraint expression."""
-        comp = self.parent_component()
-        index = self._index
-        data = comp._A_data
-        indices = comp._A_indices
-        indptr = comp._A_indptr
-        x = comp._x
-        ptrs = range(indptr[index], indptr[index + 1])
+        terms = list(self.terms)
         return LinearExpression(
-            linear_vars=[x[indices[p]] for p in ptrs],
-            linear_coefs=[data[p] for p in ptrs],
+            linear_vars=[v for v, c in terms],
+            linear_coefs=[c for v, c in terms],
             constant=0,
         )
 
@@ -235,17 +225,25 @@ class _MatrixConstraintData(ConstraintData):
     def lower(self):
         """Access the lower bound of a constraint
         expression."""
-        comp = self.parent_component()
-        index = self._index
-        return comp._lower[index]
+        return self.lb
 
     @property
     def upper(self):
         """Access the upper bound of a constraint
         expression."""
-        comp = self.parent_component()
-        index = self._index
-        return comp._upper[index]
+        return self.ub
+
+    @property
+    def lb(self):
+        """float : the value of the lower bound of a constraint expression."""
+        lb = self.parent_component()._lower[self._index].item()
+        return None if lb == _ninf else lb
+
+    @property
+    def ub(self):
+        """float : the value of the upper bound of a constraint expression."""
+        ub = self.parent_component()._upper[self._index].item()
+        return None if ub == _inf else ub
 
     @property
     def equality(self):
@@ -253,9 +251,8 @@ class _MatrixConstraintData(ConstraintData):
         constraint."""
         comp = self.parent_component()
         index = self._index
-        if (comp._lower[index] is None) or (comp._upper[index] is None):
-            return False
-        return comp._lower[index] == comp._upper[index]
+        lb = comp._lower[index]
+        return bool(lb == comp._upper[index] and lb != _ninf)
 
     @property
     def strict_lower(self):
@@ -269,38 +266,100 @@ class _MatrixConstraintData(ConstraintData):
         a strict upper bound."""
         return False
 
+    @property
+    def expr(self):
+        """Return the (generated) expression associated with this
+        constraint."""
+        lb, body, ub = self.to_bounded_expression()
+        if lb is None:
+            if ub is None:
+                return None
+            return InequalityExpression((body, ub), False)
+        elif ub is None:
+            return InequalityExpression((lb, body), False)
+        elif lb == ub:
+            return EqualityExpression((body, ub))
+        return RangedExpression((lb, body, ub), False)
+
     def set_value(self, expr):
         """Set the expression on this constraint."""
         raise NotImplementedError("MatrixConstraint row elements can not be updated")
 
 
+class _MatrixConstraintData(metaclass=RenamedClass):
+    __renamed__new_class__ = MatrixConstraintData
+    __renamed__version__ = '6.9.3'
+
+
+def _bounds_array(bound, m, default, name):
+    """Convert a bound specification to a float array of length `m`
+
+    `None` (either as the bound or as an entry in the bound array) is
+    mapped to the (infinite) `default`.
+
+    """
+    if bound is None:
+        return np.full(m, default)
+    if not hasattr(bound, '__len__'):
+        return np.full(m, default if bound is None else float(value(bound)))
+    try:
+        ans = np.array(bound, dtype=float)
+    except TypeError:
+        ans = np.array(
+            [default if b is None else float(value(b)) for b in bound], dtype=float
+        )
+    else:
+        # Note: NaN can only come from None entries (through the
+        # float conversion) or explicit NaN values
+        ans[np.isnan(ans)] = default
+    if ans.shape != (m,):
+        raise ValueError(
+            f"MatrixConstraint: the '{name}' array must have length {m} "
+            f"(one entry per row); found shape {ans.shape}"
+        )
+    return ans
+
+
 @ModelComponentFactory.register("A set of constraint expressions in Ax=b form.")
-class MatrixConstraint(Mapping, IndexedConstraint):
+class MatrixConstraint(IndexedConstraint):
     """
     Defines a set of linear constraints of the form:
 
        lb <= Ax <= ub
 
-    where A is specified in the standard compressed sparse
-    row (CSR) format. Variables must be provided as a list,
-    whose ordering maps the variables to their column index
-    in the associated coefficient matrix. This modeling
-    component allows for fast construction of large linear
-    constraint sets as it bypasses Pyomo's expression
-    system.
+    where A is stored in the standard compressed sparse row (CSR)
+    format.  Variables must be provided as a list (or an ordered
+    indexed Var), whose ordering maps the variables to their column
+    index in the associated coefficient matrix. This modeling component
+    allows for fast construction of large linear constraint sets as it
+    bypasses Pyomo's expression system: the problem writers (LP, NL,
+    and the linear standard form compiler) and the persistent solver
+    interfaces process the CSR data directly without generating the
+    constraint body expressions.
+
+    The constraint rows are indexed by the integers ``0 .. m-1``.
+
+    The constraint matrix can be provided either as a matrix (a
+    :py:mod:`scipy.sparse` matrix / array or a dense 2-D array-like)
+    or as the three CSR arrays ``(A_data, A_indices, A_indptr)``.
 
     Parameters
     ----------
+    A : matrix
+        The (sparse or dense) constraint coefficient matrix
     A_data : list
         The values of the CSR format sparse matrix
     A_indices : list
         The column indices of the CSR format sparse matrix
     A_indptr : list
         The row start-stop pointers of the CSR format sparse matrix
-    lb : list
-        The list of constraint lower bounds
-    ub : list
-        The list of constraint upper bounds
+    lb : float or list
+        The constraint lower bounds (``None`` indicates no lower bound)
+    ub : float or list
+        The constraint upper bounds (``None`` indicates no upper bound)
+    rhs : float or list
+        The constraint right-hand sides (for equality constraints).
+        This can not be used with `lb` or `ub`.
     x : list
         The list of pyomo variables mapped to their appropriate column
 
@@ -319,60 +378,163 @@ class MatrixConstraint(Mapping, IndexedConstraint):
     >>> ub      = [ 0.0,  0.0]
     >>> x       = [model.v[0], model.v[1], model.v[2]]
     >>> model.c = MatrixConstraint(data, indices, indptr, lb, ub, x)
+    >>>
+    >>> # (equivalent form using a dense matrix)
+    >>> model.d = MatrixConstraint([[1, -1, 0], [0, 1, -1]], ub=0, x=model.v)
     """
 
-    def __init__(self, A_data, A_indices, A_indptr, lb, ub, x):
-        m = len(lb)
-        n = len(x)
-        nnz = len(A_data)
-        assert len(A_indices) == nnz
-        assert len(A_indptr) == m + 1
-        assert len(ub) == m
-        IndexedConstraint.__init__(self, Any)
-
-        self._A_data = A_data
-        self._A_indices = A_indices
-        self._A_indptr = A_indptr
-        self._lower = lb
-        self._upper = ub
+    def __init__(self, *args, lb=None, ub=None, rhs=None, x=None, **kwds):
+        if len(args) == 1:
+            A_data, A_indices, A_indptr, n = self._process_matrix(args[0])
+        elif 3 <= len(args) <= 6:
+            A_data, A_indices, A_indptr = args[:3]
+            if len(args) > 3:
+                lb = args[3]
+            if len(args) > 4:
+                ub = args[4]
+            if len(args) > 5:
+                x = args[5]
+            n = None
+        else:
+            raise TypeError(
+                "MatrixConstraint expects either the constraint matrix (A) "
+                "or the CSR arrays (A_data, A_indices, A_indptr); "
+                f"received {len(args)} positional arguments"
+            )
+        if x is None:
+            raise ValueError("MatrixConstraint: the variable list 'x' is required")
+        if isinstance(x, IndexedComponent):
+            x = x.values()
         self._x = tuple(x)
+        if n is not None and n != len(self._x):
+            raise ValueError(
+                f"MatrixConstraint: the variable list 'x' must have length {n} "
+                f"(one entry per column); found {len(self._x)}"
+            )
+
+        self._A_data = np.array(A_data, dtype=float)
+        self._A_indices = np.array(A_indices, dtype=np.int64)
+        self._A_indptr = np.array(A_indptr, dtype=np.int64)
+        m = len(self._A_indptr) - 1
+        nnz = len(self._A_data)
+        if (
+            m < 0
+            or len(self._A_indices) != nnz
+            or self._A_indptr[0] != 0
+            or self._A_indptr[-1] != nnz
+            or (m and (np.diff(self._A_indptr) < 0).any())
+        ):
+            raise ValueError("MatrixConstraint: invalid CSR matrix data")
+        if nnz and (self._A_indices.min() < 0 or self._A_indices.max() >= len(self._x)):
+            raise ValueError(
+                "MatrixConstraint: column index out of range for the "
+                f"{len(self._x)} variables in 'x'"
+            )
+        for _arr in (self._A_data, self._A_indices, self._A_indptr):
+            _arr.setflags(write=False)
+
+        if rhs is None:
+            self._lower = _bounds_array(lb, m, _ninf, 'lb')
+            self._upper = _bounds_array(ub, m, _inf, 'ub')
+        else:
+            if lb is not None or ub is not None:
+                raise ValueError(
+                    "The 'rhs' keyword can not be used with the 'lb' or "
+                    "'ub' keywords to initialize a MatrixConstraint."
+                )
+            self._lower = self._upper = _bounds_array(rhs, m, np.nan, 'rhs')
+            if np.isnan(self._lower).any():
+                raise ValueError("MatrixConstraint: 'rhs' can not contain None")
+        if np.isposinf(self._lower).any() or np.isneginf(self._upper).any():
+            raise ValueError(
+                "MatrixConstraint: lower bounds can not be +inf and upper "
+                "bounds can not be -inf"
+            )
+        for _arr in (self._lower, self._upper):
+            _arr.setflags(write=False)
+
+        IndexedConstraint.__init__(self, RangeSet(0, m - 1), **kwds)
+
+    @staticmethod
+    def _process_matrix(A):
+        if hasattr(A, 'tocsr'):
+            # scipy.sparse matrix / array
+            A = A.tocsr()
+            A.sum_duplicates()
+            return A.data, A.indices, A.indptr, A.shape[1]
+        A = np.array(A, dtype=float)
+        if A.ndim != 2:
+            raise ValueError(
+                f"MatrixConstraint: the constraint matrix must be 2-dimensional "
+                f"(found {A.ndim} dimensions)"
+            )
+        rows, cols = np.nonzero(A)
+        indptr = np.zeros(A.shape[0] + 1, dtype=np.int64)
+        np.cumsum(np.count_nonzero(A, axis=1), out=indptr[1:])
+        return A[rows, cols], cols, indptr, A.shape[1]
 
     def construct(self, data=None):
         """Construct the expression(s) for this constraint."""
-        if is_debug_set(logger):
-            logger.debug("Constructing constraint %s" % (self.name))
         if self._constructed:
             return
         self._constructed = True
+        if is_debug_set(logger):
+            logger.debug("Constructing constraint %s" % (self.name))
+        timer = ConstructionTimer(self)
+
+        if self._anonymous_sets is not None:
+            for _set in self._anonymous_sets:
+                _set.construct()
 
         ref = weakref.ref(self)
         with PauseGC():
-            self._data = tuple(
-                _MatrixConstraintData(i, ref) for i in range(len(self._lower))
-            )
+            self._data = {
+                i: MatrixConstraintData(i, ref) for i in range(len(self._lower))
+            }
+        timer.report()
 
     #
-    # Override some IndexedComponent methods
+    # Read-only access to the constraint data
     #
 
-    def __getitem__(self, key):
-        return self._data[key]
+    @property
+    def A(self):
+        """The constraint matrix as a (read-only) :py:class:`scipy.sparse.csr_array`"""
+        from pyomo.common.dependencies import scipy
+
+        return scipy.sparse.csr_array(
+            (self._A_data, self._A_indices, self._A_indptr),
+            shape=(len(self._lower), len(self._x)),
+            copy=False,
+        )
+
+    @property
+    def lb(self):
+        """The (read-only) array of constraint lower bounds (-inf
+        indicates no lower bound)"""
+        return self._lower.view()
 
-    def __len__(self):
-        return self._data.__len__()
+    @property
+    def ub(self):
+        """The (read-only) array of constraint upper bounds (inf
+        indicates no upper bound)"""
+        return self._upper.view()
 
-    def __iter__(self):
-        return iter(i for i in range(len(self)))
+    @property
+    def x(self):
+        """The tuple of variables associated with the columns of the
+        constraint matrix"""
+        return self._x
 
     #
     # Remove methods that allow modifying this constraint
     #
 
-    def add(self, index, expr):  # pragma:nocover
-        raise NotImplementedError
+    def add(self, index, expr):
+        raise NotImplementedError("MatrixConstraint rows can not be added")
 
-    def __delitem__(self):  # pragma:nocover
-        raise NotImplementedError
+    def __delitem__(self, index):
+        raise NotImplementedError("MatrixConstraint rows can not be removed")
 
-    def __setitem__(self, key, value):  # pragma:nocover
-        raise NotImplementedError
+    def __setitem__(self, key, value):
+        raise NotImplementedError("MatrixConstraint row elements can not be updated")
@@ -25,7 +25,11 @@ from pyomo.common.timing import ConstructionTimer
 from pyomo.core.expr.expr_common import _type_check_exception_arg
 from pyomo.core.expr.numvalue import value
 from pyomo.core.expr.template_expr import templatize_rule
-from pyomo.core.base.component import ActiveComponentData, ModelComponentFactory
+from pyomo.core.base.component import (
+    ActiveComponentData,
+    ModelComponentFactory,
+    _ModelChangeObservers,
+)
 from pyomo.core.base.global_set import UnindexedComponent_index
 from pyomo.core.base.indexed_component import (
     ActiveIndexedComponent,
@@ -153,6 +157,8 @@ class ObjectiveData(NamedExpressionData, ActiveComponentData):
     def set_sense(self, sense):
         """Set the sense (direction) of this objective."""
         self._sense = ObjectiveSense(sense)
+        if _ModelChangeObservers.observers:
+            _ModelChangeObservers.notify('expression_changed', self)
 
 
 class _ObjectiveData(metaclass=RenamedClass):
@@ -494,6 +500,8 @@ class ScalarObjective(ObjectiveData, Objective):
     #
 
     def clear(self):
+        if _ModelChangeObservers.observers and self._data:
+            _ModelChangeObservers.notify('structure_changed', self)
         self._data = {}
 
     def set_value(self, expr):
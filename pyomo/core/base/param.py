@@ -25,7 +25,11 @@ from pyomo.common.numeric_types import native_types, value as expr_value
 from pyomo.common.timing import ConstructionTimer
 from pyomo.core.expr.expr_common import _type_check_exception_arg
 from pyomo.core.expr.numvalue import NumericValue
-from pyomo.core.base.component import ComponentData, ModelComponentFactory
+from pyomo.core.base.component import (
+    ComponentData,
+    ModelComponentFactory,
+    _ModelChangeObservers,
+)
 from pyomo.core.base.global_set import UnindexedComponent_index
 from pyomo.core.base.indexed_component import (
     IndexedComponent,
@@ -201,6 +205,8 @@ class ParamData(ComponentData, NumericValue):
         except:
             self._value = old_value
             raise
+        if _ModelChangeObservers.observers:
+            _ModelChangeObservers.notify('param_changed', self)
 
     def __call__(self, exception=NOTSET):
         """
@@ -565,6 +571,8 @@ class Param(IndexedComponent, IndexedComponent_NDArrayMixin):
                 new_values = new_values[None]
             # scalars have to be handled differently
             self[None] = new_values
+        if _ModelChangeObservers.observers:
+            _ModelChangeObservers.notify('param_changed', self)
 
     def set_default(self, val):
         """
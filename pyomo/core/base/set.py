@@ -21,8 +21,9 @@ from collections.abc import Iterator
 from functools import partial
 from typing import Union, Type, Any as typingAny
 
-from pyomo.common.autoslots import AutoSlots
+from pyomo.common.autoslots import AutoSlots, fast_deepcopy
 from pyomo.common.collections import ComponentSet
+from pyomo.common.dependencies import numpy as np, numpy_available
 from pyomo.common.deprecation import deprecated, deprecation_warning, RenamedClass
 from pyomo.common.errors import DeveloperError, PyomoException
 from pyomo.common.log import is_debug_set
@@ -1773,6 +1774,531 @@ class _OrderedSetMixin(object):
             )
 
 
+# Sentinels and constants for the _CompactSetValues hash table
+_COMPACT_EMPTY = -1
+_COMPACT_DELETED = -2
+_COMPACT_INT_MIN = -(2**63)
+_COMPACT_INT_MAX = 2**63 - 1
+# Number of members converted to Python objects at a time when iterating
+_COMPACT_CHUNK = 4096
+# Number of new members collected before moving them into the arrays
+_COMPACT_BATCH = 65536
+# Constants from the CPython (xxHash-based) tuple hash
+_XXPRIME_1 = 11400714785074694791
+_XXPRIME_2 = 14029467366897019727
+_XXPRIME_5 = 2870177450012600261
+_UHASH_MASK = 2**64 - 1
+# Multiplier for the (Fibonacci) scrambling of the hash into a slot
+_COMPACT_FIB = 11400714819323198485
+
+_compact_storage_available = None
+
+
+def compact_storage_available():
+    """Return True if Set members can be stored in a _CompactSetValues
+
+    This requires NumPy and a Python whose ``hash()`` of ints and
+    tuples of ints matches the vectorized implementation in
+    :meth:`_CompactSetValues.hash_rows`.
+
+    """
+    global _compact_storage_available
+    if _compact_storage_available is None:
+        _compact_storage_available = False
+        if numpy_available and sys.hash_info.width == 64:
+            ints = [0, 1, -1, -2, 2**61 - 1, 2**61, -(2**61), 2**63 - 1, -(2**63)]
+            tuples = list(zip(ints, reversed(ints), ints))
+            _compact_storage_available = _CompactSetValues.hash_rows(
+                np.array(ints, dtype=np.int64)
+            ).astype(np.int64).tolist() == list(map(hash, ints)) and (
+                _CompactSetValues.hash_rows(np.array(tuples, dtype=np.int64))
+                .astype(np.int64)
+                .tolist()
+                == list(map(hash, tuples))
+            )
+    return _compact_storage_available
+
+
+class _CompactSetValues(object):
+    """Array-backed storage for the members of an ordered Set
+
+    Members that are all ``int`` (or all tuples of the same length
+    containing only ``int``) are stored (in order) as the rows of an
+    integer NumPy array, using the narrowest integer type that holds
+    all the members.  Positions are found through an open-addressing
+    hash table (also a NumPy array) keyed on the Python ``hash()`` of
+    the member, so that lookups do not create any NumPy objects and
+    values that compare equal to a member (e.g., ``1.0`` or
+    ``numpy.int64(1)``) are found exactly as they would be in a
+    ``dict``.  As the hash of an ``int`` is the ``int`` itself, the
+    hash is scrambled (Fibonacci hashing) before selecting the slot so
+    that contiguous members do not form long probe sequences.  The
+    result uses a fraction of the memory of the equivalent ``dict`` of
+    Python tuples.
+
+    New members are collected in a small ``dict`` (``_pending``) and
+    moved into the arrays in batches.  Removed members are only
+    dropped from the hash table (``_removed`` records their rows); the
+    rows are compressed the next time the positions are needed.
+
+    Sets restored from a :mod:`~pyomo.core.base.snapshot` share the
+    (read-only) arrays with the snapshot (``_shared``); the arrays are
+    duplicated before they are first modified.
+
+    This class implements the subset of the ``dict`` API that
+    :class:`OrderedSetData` uses for its ``_values``: ``in``,
+    ``len()``, iteration, ``pop()``, ``clear()``, and ``values[member]``
+    (which returns the 0-based position of the member).
+
+    """
+
+    __slots__ = (
+        '_rows',
+        '_len',
+        '_dimen',
+        '_table',
+        '_mask',
+        '_shift',
+        '_deleted',
+        '_removed',
+        '_pending',
+        '_shared',
+    )
+
+    def __init__(self, rows):
+        self._rows = self._narrow(rows)
+        self._len = len(rows)
+        self._dimen = 1 if rows.ndim == 1 else rows.shape[1]
+        self._pending = {}
+        self._removed = []
+        self._shared = False
+        self._build_index()
+
+    def __getstate__(self):
+        return self.rows()
+
+    def __setstate__(self, state):
+        self.__init__(state.copy())
+
+    def __deepcopy__(self, memo):
+        ans = self.__class__.__new__(self.__class__)
+        memo[id(self)] = ans
+        ans._len = self._len
+        ans._dimen = self._dimen
+        ans._mask = self._mask
+        ans._shift = self._shift
+        ans._deleted = self._deleted
+        ans._removed = list(self._removed)
+        ans._pending = {fast_deepcopy(k, memo): v for k, v in self._pending.items()}
+        ans._rows = self._rows.copy()
+        ans._table = self._table.copy()
+        ans._shared = False
+        return ans
+
+    def _unshare(self):
+        # Take ownership of arrays shared with a snapshot before
+        # modifying them in place
+        self._rows = self._rows.copy()
+        self._table = self._table.copy()
+        self._shared = False
+
+    @staticmethod
+    def member_rows(members, dimen=None):
+        """Return the int64 array holding ``members``
+
+        Returns None if the members are not all ``int`` (or all
+        equal-length tuples of ``int``) that fit in 64 bits.
+
+        """
+        if members.__class__ is not list:
+            members = list(members)
+        if not members:
+            return None
+        if dimen is None:
+            dimen = len(members[0]) if members[0].__class__ is tuple else 1
+        if dimen == 1:
+            if set(map(type, members)) != {int}:
+                return None
+            try:
+                return np.fromiter(members, np.int64, len(members))
+            except OverflowError:
+                return None
+        if (
+            dimen < 2
+            or set(map(type, members)) != {tuple}
+            or set(map(len, members)) != {dimen}
+            or set(map(type, itertools.chain.from_iterable(members))) != {int}
+        ):
+            return None
+        try:
+            return np.fromiter(
+                itertools.chain.from_iterable(members), np.int64, len(members) * dimen
+            ).reshape(len(members), dimen)
+        except OverflowError:
+            return None
+
+    def _fits(self, val):
+        if self._dimen == 1:
+            val = (val,)
+        elif val.__class__ is not tuple or len(val) != self._dimen:
+            return False
+        for k in val:
+            if k.__class__ is not int or k < _COMPACT_INT_MIN or k > _COMPACT_INT_MAX:
+                return False
+        return True
+
+    @staticmethod
+    def product_rows(sets):
+        """Return the rows of the cross product of ``sets``
+
+        Returns None if the members of any set cannot be stored in a
+        :class:`_CompactSetValues`.
+
+        """
+        ans = None
+        for s in sets:
+            values = getattr(s, '_values', None)
+            if values.__class__ is _CompactSetValues:
+                rows = values.rows()
+            else:
+                rows = _CompactSetValues.member_rows(s)
+                if rows is None:
+                    return None
+            if rows.ndim == 1:
+                rows = rows.reshape(len(rows), 1)
+            if ans is None:
+                ans = rows
+            else:
+                ans = np.hstack(
+                    (np.repeat(ans, len(rows), axis=0), np.tile(rows, (len(ans), 1)))
+                )
+        return ans
+
+    @staticmethod
+    def _narrow(rows):
+        if rows.size:
+            lb, ub = rows.min(), rows.max()
+            for dtype in (np.int8, np.int16, np.int32):
+                info = np.iinfo(dtype)
+                if info.min <= lb and ub <= info.max:
+                    return rows.astype(dtype)
+        return rows.astype(np.int64)
+
+    @staticmethod
+    def _hash_ints(col):
+        # Vectorized hash() of ints: sign(k) * (abs(k) % modulus),
+        # except that hash(-1) is -2.  The result is returned as uint64.
+        col = col.astype(np.int64)
+        neg = col < 0
+        h = col.astype(np.uint64)
+        h[neg] = ~h[neg] + np.uint64(1)
+        h %= np.uint64(sys.hash_info.modulus)
+        h[neg] = ~h[neg] + np.uint64(1)
+        h[h == np.uint64(_UHASH_MASK)] = np.uint64(_UHASH_MASK - 1)
+        return h
+
+    @staticmethod
+    def hash_rows(rows):
+        """Return the Python hash() of each member (row), as uint64"""
+        if rows.ndim == 1:
+            return _CompactSetValues._hash_ints(rows)
+        acc = np.full(len(rows), _XXPRIME_5, dtype=np.uint64)
+        for col in rows.T:
+            acc += _CompactSetValues._hash_ints(col) * np.uint64(_XXPRIME_2)
+            acc = (acc << np.uint64(31)) | (acc >> np.uint64(33))
+            acc *= np.uint64(_XXPRIME_1)
+        acc += np.uint64(rows.shape[1] ^ (_XXPRIME_5 ^ 3527539))
+        acc[acc == np.uint64(_UHASH_MASK)] = np.uint64(1546275796)
+        return acc
+
+    def _slots(self, rows):
+        # Note: this must match the slot computed in _probe()
+        h = self.hash_rows(rows) * np.uint64(_COMPACT_FIB)
+        return (h >> np.uint64(self._shift)).astype(np.int64)
+
+    def _build_index(self):
+        n = self._len
+        bits = max(3, (2 * n).bit_length())
+        size = 1 << bits
+        self._mask = size - 1
+        self._shift = 64 - bits
+        self._deleted = 0
+        self._table = np.full(
+            size, _COMPACT_EMPTY, dtype=np.int32 if size < 2**31 else np.int64
+        )
+        live = np.arange(n, dtype=np.int64)
+        if self._removed:
+            live = np.delete(live, self._removed)
+        self._place(live, self._slots(self._rows[live]))
+
+    def _place(self, pending, slots):
+        # Vectorized linear probing: every round, each pending member
+        # writes itself into its current slot (if the slot is empty).
+        # Only one member survives per slot, and everyone else moves
+        # to the next slot.
+        table = self._table
+        mask = self._mask
+        while pending.size:
+            free = table[slots] == _COMPACT_EMPTY
+            table[slots[free]] = pending[free]
+            lost = table[slots] != pending
+            pending = pending[lost]
+            slots = (slots[lost] + 1) & mask
+
+    def _lookup(self, rows):
+        # Vectorized lookup: return the position of each row (or -1)
+        table = self._table
+        mask = self._mask
+        ans = np.full(len(rows), -1, dtype=np.int64)
+        pending = np.arange(len(rows), dtype=np.int64)
+        slots = self._slots(rows)
+        while pending.size:
+            pos = table[slots].astype(np.int64)
+            match = pos >= 0
+            cand = np.flatnonzero(match)
+            eq = self._rows[pos[cand]] == rows[pending[cand]]
+            if self._dimen != 1:
+                eq = eq.all(axis=1)
+            match[cand[~eq]] = False
+            ans[pending[match]] = pos[match]
+            active = ~match & (pos != _COMPACT_EMPTY)
+            pending = pending[active]
+            slots = (slots[active] + 1) & mask
+        return ans
+
+    def _probe(self, val):
+        # Return (position, slot): the position of val in the rows (or
+        # -1), and the slot holding it (or the slot where it should be
+        # inserted).  Note that like a dict, this raises TypeError for
+        # unhashable values.
+        mask = self._mask
+        slot = ((hash(val) * _COMPACT_FIB) & _UHASH_MASK) >> self._shift
+        dimen = self._dimen
+        if dimen != 1 and (not isinstance(val, tuple) or len(val) != dimen):
+            # Cannot be a member
+            val = None
+        rows = self._rows
+        table = self._table
+        free = None
+        while True:
+            pos = table.item(slot)
+            if pos == _COMPACT_EMPTY:
+                return -1, slot if free is None else free
+            if pos == _COMPACT_DELETED:
+                if free is None:
+                    free = slot
+            elif dimen == 1:
+                if rows.item(pos) == val:
+                    return pos, slot
+            elif val is not None:
+                for i, k in enumerate(val):
+                    if not (rows.item(pos, i) == k):
+                        break
+                else:
+                    return pos, slot
+            slot = (slot + 1) & mask
+
+    def _flush(self):
+        # Move the pending members into the arrays.  If a member does
+        # not fit, the members before it are moved and it (and all
+        # following members that are not already stored) are left
+        # pending.  Returns True if no members were left pending.
+        pending = list(self._pending)
+        self._pending.clear()
+        new = self.member_rows(pending, self._dimen)
+        if new is None:
+            i = 0
+            while self._fits(pending[i]):
+                i += 1
+            if i:
+                self._append(self.member_rows(pending[:i], self._dimen))
+            for val in pending[i:]:
+                if self._probe(val)[0] < 0:
+                    self._pending[val] = None
+            return not self._pending
+        self._append(new)
+        return True
+
+    def _append(self, new):
+        new = new[self._lookup(new) < 0]
+        if not new.size:
+            return
+        if self._shared:
+            self._unshare()
+        dtype = np.promote_types(self._rows.dtype, self._narrow(new).dtype)
+        if dtype != self._rows.dtype:
+            self._rows = self._rows.astype(dtype)
+        n = self._len
+        self._len = N = n + len(new)
+        if N > len(self._rows):
+            rows = np.empty((max(N, 2 * n),) + self._rows.shape[1:], dtype=dtype)
+            rows[:n] = self._rows[:n]
+            self._rows = rows
+        self._rows[n:N] = new
+        if 2 * (N + self._deleted) > len(self._table):
+            self._build_index()
+        else:
+            self._place(np.arange(n, N, dtype=np.int64), self._slots(new))
+
+    def update(self, values):
+        """Add members from the ``values`` iterator
+
+        Returns False if a member could not be stored.  In that case
+        the storage holds all members added so far (the ones that do
+        not fit are left in ``_pending``) and the rest of the
+        ``values`` iterator is left unconsumed.
+
+        """
+        pending = self._pending
+        while True:
+            # Note that members are added to _pending one at a time, so
+            # they are visible to the iterator generating the values
+            counter = itertools.count()
+            pending.update(zip(itertools.islice(values, _COMPACT_BATCH), counter))
+            if pending and not self._flush():
+                return False
+            if next(counter) < _COMPACT_BATCH:
+                return True
+
+    def _compress(self):
+        # Drop the rows of the members removed by pop() (and re-index
+        # the remaining rows)
+        keep = np.ones(self._len, dtype=bool)
+        keep[self._removed] = False
+        self._rows = self._rows[: self._len][keep]
+        self._len = len(self._rows)
+        self._removed = []
+        self._shared = False
+        self._build_index()
+
+    def rows(self):
+        """Return (a view of) the array of members"""
+        if self._pending:
+            self._flush()
+        if self._removed:
+            self._compress()
+        return self._rows[: self._len]
+
+    def _pending_members(self):
+        # Members that could not be moved into the arrays
+        if self._pending:
+            self._flush()
+        return list(self._pending)
+
+    def members(self):
+        """Return a sequence view of the members (indexed by position)"""
+        return _CompactSetMembers(self)
+
+    def at(self, i):
+        """Return the member at (0-based) position ``i``"""
+        if self._pending:
+            self._flush()
+        if self._removed:
+            self._compress()
+        if i >= self._len:
+            return self._pending_members()[i - self._len]
+        if i < 0:
+            raise IndexError(i)
+        if self._dimen == 1:
+            return self._rows.item(i)
+        return tuple(self._rows[i].tolist())
+
+    def sort(self):
+        """Sort the members (in place)"""
+        rows = self.rows()
+        if self._dimen == 1:
+            order = np.argsort(rows, kind='stable')
+        else:
+            order = np.lexsort(rows.T[::-1])
+        self._rows = rows[order]
+        self._build_index()
+
+    def pop(self, val):
+        if self._pending:
+            self._flush()
+        pos, slot = self._probe(val)
+        if pos < 0:
+            raise KeyError(val)
+        if self._shared:
+            self._unshare()
+        # The row is left in place until the positions are next needed
+        # (see _compress()), so that removing members is O(1)
+        self._table[slot] = _COMPACT_DELETED
+        self._deleted += 1
+        self._removed.append(pos)
+
+    def clear(self):
+        self._pending.clear()
+        self._rows = self._rows[:0].copy()
+        self._len = 0
+        self._removed = []
+        self._build_index()
+
+    def __contains__(self, val):
+        if self._pending and val in self._pending:
+            return True
+        return self._probe(val)[0] >= 0
+
+    def __getitem__(self, val):
+        if self._pending:
+            self._flush()
+        if self._removed:
+            self._compress()
+        pos = self._probe(val)[0]
+        if pos < 0:
+            if val in self._pending:
+                return self._len + self._pending_members().index(val)
+            raise KeyError(val)
+        return pos
+
+    def __len__(self):
+        if self._pending:
+            self._flush()
+        return self._len - len(self._removed) + len(self._pending)
+
+    def __iter__(self):
+        rows = self.rows()
+        for start in range(0, len(rows), _COMPACT_CHUNK):
+            chunk = rows[start : start + _COMPACT_CHUNK]
+            if self._dimen == 1:
+                yield from chunk.tolist()
+            else:
+                yield from zip(*chunk.T.tolist())
+        yield from self._pending_members()
+
+    def __reversed__(self):
+        yield from reversed(self._pending_members())
+        rows = self.rows()
+        for end in range(len(rows), 0, -_COMPACT_CHUNK):
+            start = end - _COMPACT_CHUNK - 1
+            chunk = rows[end - 1 : start if start >= 0 else None : -1]
+            if self._dimen == 1:
+                yield from chunk.tolist()
+            else:
+                yield from zip(*chunk.T.tolist())
+
+
+class _CompactSetMembers(object):
+    """Positional (0-based) view of the members of a _CompactSetValues"""
+
+    __slots__ = ('_values',)
+
+    def __init__(self, values):
+        self._values = values
+
+    def __getitem__(self, i):
+        return self._values.at(i)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __reversed__(self):
+        return reversed(self._values)
+
+
 class OrderedSetData(_OrderedSetMixin, FiniteSetData):
     """
     This class defines the base class for an ordered set of concrete data.
@@ -1784,6 +2310,13 @@ class OrderedSetData(_OrderedSetMixin, FiniteSetData):
 
          issubclass(SortedSetData, InsertionOrderSetData) == False
 
+    If the owning Set was declared with ``compact=True`` and the Set
+    grows to ``_compact_threshold`` members that are all ``int`` (or
+    all equal-length tuples of ``int``), the members are moved from
+    the ``dict`` to a :class:`_CompactSetValues` (NumPy arrays).  The
+    storage reverts to a ``dict`` if a member that does not fit is
+    later added.
+
     Constructor Arguments:
         component   The Set object that owns this data.
 
@@ -1792,11 +2325,73 @@ class OrderedSetData(_OrderedSetMixin, FiniteSetData):
 
     __slots__ = ('_ordered_values',)
 
+    _compact_threshold = 65536
+
     def __init__(self, component):
         self._values = {}
         self._ordered_values = None
         FiniteSetData.__init__(self, component=component)
 
+    def _initialize(self, val):
+        if not self._values and self._initialize_from_product(val):
+            return
+        super()._initialize(val)
+
+    def _can_compact(self):
+        if not self.parent_component()._compact_storage:
+            return False
+        if not normalize_index.flatten:
+            return False
+        if isinstance(self, _SortedSetMixin):
+            return self.parent_component()._sort_fcn is sorted_robust
+        return True
+
+    def _compact(self):
+        """Move the members to a _CompactSetValues (if possible)"""
+        if (
+            self._values.__class__ is not dict
+            or len(self._values) < self._compact_threshold
+            or not self._can_compact()
+            or not compact_storage_available()
+        ):
+            return
+        rows = _CompactSetValues.member_rows(list(self._values))
+        if rows is not None:
+            self._values = _CompactSetValues(rows)
+            self._ordered_values = None
+
+    def _initialize_from_product(self, val):
+        # Build the members of a (large) Set initialized from the cross
+        # product of integer Sets directly as NumPy arrays, bypassing
+        # the creation of the Python tuples.
+        if (
+            val.__class__ is not SetProduct_OrderedSet
+            or not FLATTEN_CROSS_PRODUCT
+            or self._domain is not Any
+            or self._dimen is None
+        ):
+            return False
+        comp = self.parent_component()
+        if comp._filter is not None or comp._validate is not None:
+            return False
+        val.construct()
+        if (
+            len(val) < self._compact_threshold
+            or not self._can_compact()
+            or not compact_storage_available()
+        ):
+            return False
+        rows = _CompactSetValues.product_rows(val.subsets(False))
+        if rows is None:
+            return False
+        if self._dimen is UnknownSetDimen:
+            self._dimen = rows.shape[1]
+        elif self._dimen != rows.shape[1]:
+            return False
+        self._values = _CompactSetValues(rows)
+        self._ordered_values = None
+        return True
+
     def _iter_impl(self):
         """
         Return an iterator for the set.
@@ -1807,13 +2402,40 @@ class OrderedSetData(_OrderedSetMixin, FiniteSetData):
         return reversed(self._values)
 
     def _update_impl(self, values):
+        _values = self._values
+        if (
+            _values.__class__ is dict
+            and len(_values) < self._compact_threshold
+            and self._can_compact()
+        ):
+            # Fill the dict up to the compact threshold
+            limit = self._compact_threshold
+            while len(_values) < limit:
+                count = limit - len(_values)
+                for val in itertools.islice(values, count):
+                    # Note that we reset _ordered_values within the loop
+                    # because of an old example where the initializer
+                    # rule makes reference to values previously inserted
+                    # into the Set (which triggered the creation of the
+                    # _ordered_values)
+                    self._ordered_values = None
+                    _values[val] = None
+                    count -= 1
+                if count:
+                    # The values are exhausted
+                    return
+            self._compact()
+            _values = self._values
+        if _values.__class__ is _CompactSetValues:
+            self._ordered_values = None
+            if _values.update(values):
+                return
+            # A member that does not fit the compact storage: revert
+            # to a dict
+            self._values = _values = dict.fromkeys(_values)
         for val in values:
-            # Note that we reset _ordered_values within the loop because
-            # of an old example where the initializer rule makes
-            # reference to values previously inserted into the Set
-            # (which triggered the creation of the _ordered_values)
             self._ordered_values = None
-            self._values[val] = None
+            _values[val] = None
 
     def remove(self, val):
         self._values.pop(val)
@@ -1879,8 +2501,15 @@ class OrderedSetData(_OrderedSetMixin, FiniteSetData):
         except KeyError:
             raise ValueError("%s.ord(x): x not in %s" % (self.name, self.name))
 
+    def _sort_by_position(self, values):
+        """Return the (member) values sorted by their position in this Set"""
+        return sorted(values, key=self.ord)
+
     def _rebuild_ordered_values(self):
         _set = self._values
+        if _set.__class__ is _CompactSetValues:
+            self._ordered_values = _set.members()
+            return
         self._ordered_values = list(_set)
         for i, v in enumerate(self._ordered_values):
             _set[v] = i
@@ -1978,15 +2607,6 @@ class SortedSetData(_SortedSetMixin, OrderedSetData):
             self._rebuild_ordered_values()
         return reversed(self._ordered_values)
 
-    def _update_impl(self, values):
-        for val in values:
-            # Note that we reset _ordered_values within the loop because
-            # of an old example where the initializer rule makes
-            # reference to values previously inserted into the Set
-            # (which triggered the creation of the _ordered_values)
-            self._ordered_values = None
-            self._values[val] = None
-
     # Note: removing data does not affect the sorted flag
     # def remove(self, val):
     # def discard(self, val):
@@ -1996,6 +2616,10 @@ class SortedSetData(_SortedSetMixin, OrderedSetData):
 
     def _rebuild_ordered_values(self):
         _set = self._values
+        if _set.__class__ is _CompactSetValues:
+            _set.sort()
+            self._ordered_values = _set.members()
+            return
         self._ordered_values = list(self.parent_component()._sort_fcn(_set))
         for i, v in enumerate(self._ordered_values):
             _set[v] = i
@@ -2089,6 +2713,12 @@ class Set(IndexedComponent):
         and returns True if the data belongs in the set.  Set will
         raise a ``ValueError`` for any values where `validate`
         returns False.
+    compact : bool, optional
+        If True, large Sets whose members are all ``int`` (or all
+        equal-length tuples of ``int``) store their members in NumPy
+        arrays instead of a ``dict``.  This reduces the memory used by
+        very large Sets at the cost of slower member access.
+        [default: False]
 
     name : str, optional
         The name of the set
@@ -2125,6 +2755,7 @@ class Set(IndexedComponent):
 
     _ValidOrderedArguments = {True, False, InsertionOrder, SortedOrder}
     _UnorderedInitializers = {set}
+    _compact_storage = False
 
     @overload
     def __new__(cls: Type[Set], *args, **kwds) -> Union[SetData, IndexedSet]: ...
@@ -2205,6 +2836,7 @@ class Set(IndexedComponent):
         bounds=None,
         filter=None,
         validate=None,
+        compact=False,
         name=None,
         doc=None,
     ): ...
@@ -2248,6 +2880,7 @@ class Set(IndexedComponent):
         )
         self._validate = Initializer(kwds.pop('validate', None), additional_args=1)
         self._filter = Initializer(kwds.pop('filter', None), additional_args=1)
+        self._compact_storage = bool(kwds.pop('compact', False))
 
         if 'virtual' in kwds:
             deprecation_warning(
@@ -2856,6 +3489,15 @@ class FiniteRangeSetData(
             % (item, self.name)
         )
 
+    def _sort_by_position(self, values):
+        """Return the (member) values sorted by their position in this Set
+
+        Returns None if positions cannot be computed efficiently.
+        """
+        if len(self._ranges) != 1:
+            return None
+        return sorted(values, key=self.ord)
+
     # We must redefine ranges(), bounds(), and domain so that we get the
     # InfiniteRangeSetData version and not the one from
     # _FiniteSetMixin.
@@ -4035,12 +4677,96 @@ class SetProduct(SetOperator):
                 val = val[:i] + val[i] + val[i + 1 :]
         return val
 
+    def _factor_sets(self):
+        """Return the factor sets of this product and their cut points
+
+        When flattening cross products, the members of nested SetProduct
+        operands are flattened into the members of this product, so
+        this product is equivalent to the product of the "leaf" factor
+        sets.  This returns those sets, along with the list of cut
+        points that locate each factor within a (flattened) member
+        (factor ``i`` is ``member[cuts[i]:cuts[i+1]]``).  The cut points
+        are None if any factor does not have a fixed (positive) dimen.
+
+        If cross products are not being flattened, this returns the
+        operands of this product (and None for the cut points).
+
+        """
+        if not (FLATTEN_CROSS_PRODUCT and normalize_index.flatten):
+            return self._sets, None
+        sets = []
+        self._collect_factor_sets(sets)
+        cuts = [0]
+        for s in sets:
+            s_dim = s.dimen
+            if s_dim is None or s_dim is UnknownSetDimen or s_dim < 1:
+                return sets, None
+            cuts.append(cuts[-1] + s_dim)
+        return sets, cuts
+
+    def _collect_factor_sets(self, sets):
+        for s in self._sets:
+            if isinstance(s, SetProduct):
+                s._collect_factor_sets(sets)
+            else:
+                sets.append(s)
+
+    def _split_val(self, val, sets, cuts):
+        """Split val into the corresponding members of the factor sets
+
+        This requires factor sets with fixed dimen (see
+        :py:meth:`_factor_sets`) and returns None if val is not in this
+        product.
+
+        """
+        val = normalize_index(val)
+        if val.__class__ is not tuple:
+            val = (val,)
+        if len(val) != cuts[-1]:
+            return None
+        ans = []
+        i = 0
+        for s, j in zip(sets, cuts[1:]):
+            v = val[i] if j == i + 1 else val[i:j]
+            if v not in s:
+                return None
+            ans.append(v)
+            i = j
+        return ans
+
+    def _product_iter(self, sets, cuts):
+        # Iterate over the product of (iterables over) the members of
+        # the factor sets, flattening the members in native code (by
+        # wrapping scalar members in 1-tuples and chaining the result)
+        if cuts is None or cuts[-1] == len(sets):
+            return itertools.product(*sets)
+        return map(
+            tuple,
+            map(
+                itertools.chain.from_iterable,
+                itertools.product(
+                    *(
+                        zip(s) if j == i + 1 else s
+                        for s, i, j in zip(sets, cuts, cuts[1:])
+                    )
+                ),
+            ),
+        )
+
 
 class SetProduct_InfiniteSet(SetProduct):
     __slots__ = tuple()
 
     def get(self, val, default=None):
         # return self._find_val(val) is not None
+        sets, cuts = self._factor_sets()
+        if cuts is not None:
+            # All the factors have a fixed dimen: there is only one way
+            # to split val
+            val = self._split_val(val, sets, cuts)
+            if val is None:
+                return default
+            return val[0] if len(val) == 1 else self._flatten_product(tuple(val))
         v = self._find_val(val)
         if v is None:
             return default
@@ -4201,13 +4927,16 @@ class SetProduct_FiniteSet(_FiniteSetMixin, SetProduct_InfiniteSet):
     __slots__ = tuple()
 
     def _iter_impl(self):
-        _iter = itertools.product(*self._sets)
-        # Note: if all the member sets are simple 1-d sets, then there
-        # is no need to call flatten_product.
+        sets, cuts = self._factor_sets()
+        _iter = self._product_iter(sets, cuts)
+        # Note: if all the member sets are simple 1-d sets (or have a
+        # fixed dimen, in which case _product_iter() flattens the
+        # members), then there is no need to call flatten_product.
         if (
-            FLATTEN_CROSS_PRODUCT
+            cuts is None
+            and FLATTEN_CROSS_PRODUCT
             and normalize_index.flatten
-            and self.dimen != len(self._sets)
+            and self.dimen != len(sets)
         ):
             return (self._flatten_product(_) for _ in _iter)
         return _iter
@@ -4227,16 +4956,29 @@ class SetProduct_OrderedSet(
 ):
     __slots__ = tuple()
 
+    def __reversed__(self):
+        sets, cuts = self._factor_sets()
+        _iter = self._product_iter([tuple(reversed(s)) for s in sets], cuts)
+        if (
+            cuts is None
+            and FLATTEN_CROSS_PRODUCT
+            and normalize_index.flatten
+            and self.dimen != len(sets)
+        ):
+            return (self._flatten_product(_) for _ in _iter)
+        return _iter
+
     def at(self, index):
+        sets = self._factor_sets()[0]
         _idx = self._to_0_based_index(index)
-        _ord = list(len(_) for _ in self._sets)
+        _ord = list(len(_) for _ in sets)
         i = len(_ord)
         while i:
             i -= 1
             _ord[i], _idx = _idx % _ord[i], _idx // _ord[i]
         if _idx:
             raise IndexError(f"{self.name} index out of range")
-        ans = tuple(s.at(i + 1) for s, i in zip(self._sets, _ord))
+        ans = tuple(s.at(i + 1) for s, i in zip(sets, _ord))
         if FLATTEN_CROSS_PRODUCT and normalize_index.flatten and self.dimen != len(ans):
             return self._flatten_product(ans)
         return ans
@@ -4249,6 +4991,20 @@ class SetProduct_OrderedSet(
 
         If the search item is not in the Set, then an IndexError is raised.
         """
+        sets, cuts = self._factor_sets()
+        if cuts is not None:
+            # All the factors have a fixed dimen: compute the position
+            # directly from the positions within the factor sets
+            val = self._split_val(item, sets, cuts)
+            if val is None:
+                raise IndexError(
+                    "Cannot identify position of %s in Set %s: item not in Set"
+                    % (item, self.name)
+                )
+            ans = 0
+            for s, v in zip(sets, val):
+                ans = ans * len(s) + s.ord(v) - 1
+            return ans + 1
         found = self._find_val(item)
         if found is None:
             raise IndexError(
@@ -4269,6 +5025,16 @@ class SetProduct_OrderedSet(
             ans *= n
         return ans + 1
 
+    def _sort_by_position(self, values):
+        """Return the (member) values sorted by their position in this Set
+
+        Returns None if positions cannot be computed efficiently (i.e.,
+        if any factor set does not have a fixed dimen).
+        """
+        if self._factor_sets()[1] is None:
+            return None
+        return sorted(values, key=self.ord)
+
 
 ############################################################################
 
@@ -0,0 +1,1200 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+"""Binary snapshots of constructed models
+
+:func:`save_snapshot` writes a constructed (concrete) model to a file
+that :func:`load_snapshot` can rebuild much faster than unpickling the
+model.  Instead of pickling every component data object (and every
+expression node) individually, the snapshot stores the model as a
+small header describing the block tree and the components, plus a
+handful of contiguous NumPy arrays holding the per-object state:
+variable values, bounds and flags, parameter values, constraint and
+objective flags, and all expressions flattened into a single DAG
+(with the nodes grouped by type and arity, so that each group is an
+array of argument references).
+
+The header is written with pickle protocol 5 and the arrays as
+out-of-band buffers (aligned in the file), so that loading a snapshot
+memory-maps the file and decodes the arrays directly from the mapped
+pages without reading or copying them first.
+
+Snapshots hold the *state* of a model, not how it was built: rules,
+initializers, validation / filter callbacks, and non-component block
+attributes are not saved.  Only the core modeling components are
+supported (:class:`Block`, :class:`Set`, :class:`RangeSet`,
+:class:`Param`, :class:`Var`, :class:`Expression`,
+:class:`Constraint`, and :class:`Objective`, including the ``List``
+variants and array-backed variables); saving a model that contains any
+other component raises a :class:`ValueError`.
+
+.. warning::
+
+   As with :mod:`pickle`, only load snapshots from trusted sources.
+
+"""
+
+import collections
+import mmap
+import operator
+import pickle
+import struct
+from itertools import repeat
+from weakref import ref as weakref_ref
+
+from pyomo.common.dependencies import numpy as np
+from pyomo.common.enums import ObjectiveSense
+from pyomo.common.gc_manager import PauseGC
+from pyomo.common.numeric_types import native_types
+from pyomo.common.sorting import sorted_robust
+from pyomo.core.expr.base import ExpressionBase
+from pyomo.core.expr.numeric_expr import (
+    _MutableSumExpression,
+    _MutableLinearExpression,
+    _MutableNPVSumExpression,
+    SumExpression,
+    LinearExpression,
+    NPV_SumExpression,
+)
+from pyomo.core.expr.numvalue import NumericConstant
+from pyomo.core.staleflag import StaleFlagManager
+from pyomo.core.base.block import Block, ScalarBlock, IndexedBlock, BlockData
+from pyomo.core.base.component import PyomoObject
+from pyomo.core.base.constraint import (
+    Constraint,
+    ScalarConstraint,
+    IndexedConstraint,
+    ConstraintList,
+)
+from pyomo.core.base.expression import Expression, ScalarExpression, IndexedExpression
+from pyomo.core.base.global_set import GlobalSetBase
+from pyomo.core.base.objective import (
+    Objective,
+    ScalarObjective,
+    IndexedObjective,
+    ObjectiveList,
+)
+from pyomo.core.base.param import Param, ScalarParam, IndexedParam, _ImplicitAny
+from pyomo.core.base.PyomoModel import ConcreteModel
+from pyomo.core.base.set import (
+    Set,
+    RangeSet,
+    IndexedSet,
+    FiniteScalarSet,
+    OrderedScalarSet,
+    SortedScalarSet,
+    FiniteScalarRangeSet,
+    InfiniteScalarRangeSet,
+    SetProduct,
+    SetUnion,
+    SetIntersection,
+    SetDifference,
+    SetSymmetricDifference,
+    OrderedSetData,
+    SortedSetData,
+    _CompactSetValues,
+    compact_storage_available,
+)
+from pyomo.core.base.var import (
+    Var,
+    ScalarVar,
+    IndexedVar,
+    ArrayIndexedVar,
+    VarList,
+    _stale_array_mapper,
+)
+
+_MAGIC = b'PYOMOSNP'
+_VERSION = 1
+# Alignment of the array buffers in the snapshot file
+_ALIGN = 64
+
+# Kinds of "leaves" referenced by the flattened expressions
+_VAR, _PARAM, _NAMED, _CONST, _ARRAY_VAR = range(5)
+
+# Kinds of values encoded by _encode_values
+_FLOAT, _INT, _NONE, _OTHER = range(4)
+_VALUE_KIND = {float: _FLOAT, int: _INT, type(None): _NONE}
+# Integers that round-trip through a float64 exactly
+_MAX_EXACT_INT = 2**53
+
+# Groups of nodes with at most this many arguments are built column-wise
+_MAX_COLUMN_ARGS = 4
+
+# Mutable expression nodes are restored as their immutable counterparts
+_IMMUTABLE_NODE = {
+    _MutableSumExpression: SumExpression,
+    _MutableLinearExpression: LinearExpression,
+    _MutableNPVSumExpression: NPV_SumExpression,
+}
+
+_SET_OPERATORS = (
+    (SetUnion, '|', operator.or_),
+    (SetIntersection, '&', operator.and_),
+    (SetDifference, '-', operator.sub),
+    (SetSymmetricDifference, '^', operator.xor),
+)
+
+
+def _consume(iterator):
+    collections.deque(iterator, maxlen=0)
+
+
+def _encode_values(values, encode_other=None):
+    """Encode a list of (mostly) numbers as (float64, kind) arrays
+
+    Floats, ints that are exactly representable as floats, and None
+    are stored in the arrays; all other values are returned in a list
+    (after mapping them through ``encode_other``).
+
+    """
+    kinds = [_VALUE_KIND.get(v.__class__, _OTHER) for v in values]
+    others = []
+    for i, k in enumerate(kinds):
+        if k == _INT and not -_MAX_EXACT_INT < values[i] < _MAX_EXACT_INT:
+            kinds[i] = k = _OTHER
+        if k == _OTHER:
+            v = values[i]
+            others.append(v if encode_other is None else encode_other(v))
+    nums = np.fromiter(
+        (v if k < _NONE else 0 for v, k in zip(values, kinds)), float, len(values)
+    )
+    return nums, np.array(kinds, dtype=np.int8), others
+
+
+def _decode_values(encoded):
+    """Return the list of values encoded by :func:`_encode_values`"""
+    nums, kinds, others = encoded
+    if not kinds.any():
+        return nums.tolist()
+    n = len(kinds)
+    if (kinds == _NONE).all():
+        return [None] * n
+    if (kinds == _INT).all():
+        return nums.astype(np.int64).tolist()
+    ans = nums.tolist()
+    idx = np.flatnonzero(kinds == _INT)
+    for i, v in zip(idx.tolist(), nums[idx].astype(np.int64).tolist()):
+        ans[i] = v
+    for i in np.flatnonzero(kinds == _NONE).tolist():
+        ans[i] = None
+    for i, v in zip(np.flatnonzero(kinds == _OTHER).tolist(), others):
+        ans[i] = v
+    return ans
+
+
+def _encode_members(members):
+    """Encode Set members (or component indices) compactly"""
+    members = list(members)
+    rows = _CompactSetValues.member_rows(members) if members else None
+    if rows is None:
+        return ('list', members)
+    return ('rows', rows)
+
+
+def _decode_members(encoded):
+    if encoded[0] == 'list':
+        return encoded[1]
+    rows = encoded[1]
+    if rows.ndim == 1:
+        return rows.tolist()
+    return list(map(tuple, rows.tolist()))
+
+
+class _SnapshotWriter(object):
+    def __init__(self):
+        self.records = []
+        self.blocks = {}
+        self.sets = {}
+        # Registries of the objects that expressions may reference
+        self.var_ids = {}
+        self.param_ids = {}
+        self.named_ids = {}
+        self.array_vars = {}
+        self.array_var_leaves = []
+        # Variable state (for all VarData in the snapshot)
+        self.var_values = []
+        self.var_lb = [np.empty(0), np.empty(0, dtype=np.int8), []]
+        self.var_ub = [np.empty(0), np.empty(0, dtype=np.int8), []]
+        self.var_fixed = []
+        self.var_stale = []
+        self.var_domain = []
+        self.domains = {}
+        self.domain_specs = []
+        # Expressions to encode once all components are registered
+        self.pending = []
+        # The flattened expression DAG
+        self.refs = {}
+        self.leaf_kind = []
+        self.leaf_idx = []
+        self.consts = []
+        self.node_height = []
+        self.node_cls = []
+        self.node_extra = []
+        self.node_args = []
+        self.classes = {}
+        self.class_table = []
+        self.extras = {}
+        self.extra_table = []
+
+    def save(self, block):
+        if not isinstance(block, BlockData):
+            raise ValueError(
+                "save_snapshot() requires a Block (received %s)" % (type(block),)
+            )
+        if block.is_indexed():
+            raise ValueError(
+                "save_snapshot() requires a scalar Block: cannot save IndexedBlock "
+                "'%s'" % (block.name,)
+            )
+        self.blocks[id(block)] = 0
+        self.save_block(block)
+
+        # All components are registered: flatten the expressions
+        for rec, field, exprs in self.pending:
+            rec[field] = [self.expr_ref(e) for e in exprs]
+        for bounds in (self.var_lb, self.var_ub):
+            bounds[2] = [self.expr_ref(e) for e in bounds[2]]
+        expr = self.expression_groups()
+        for rec, field, exprs in self.pending:
+            rec[field] = self.remap(rec[field])
+        for bounds in (self.var_lb, self.var_ub):
+            bounds[2] = self.remap(bounds[2]).tolist()
+
+        return {
+            'version': _VERSION,
+            'name': block.name,
+            'records': self.records,
+            'vars': {
+                'value': _encode_values(self.var_values),
+                'lb': self.var_lb,
+                'ub': self.var_ub,
+                'fixed': np.array(self.var_fixed, dtype=bool),
+                'stale': np.array(self.var_stale, dtype=bool),
+                'domain': np.array(self.var_domain, dtype=np.int32),
+                'domains': self.domain_specs,
+            },
+            'expr': expr,
+        }
+
+    def expression_groups(self):
+        """Return the flattened expression DAG
+
+        The nodes are sorted by their height in the DAG (so all
+        arguments of a node precede it) and then grouped by class,
+        extra slot values, and number of arguments.  Each group is
+        stored as a (count, nargs) array of argument references, which
+        allows :meth:`_SnapshotReader.build_expressions` to create the
+        nodes in bulk.  References index into the "pool" of all leaves
+        followed by all nodes (in sorted order).
+
+        """
+        n_leaves = len(self.leaf_kind)
+        n_nodes = len(self.node_args)
+        nargs = np.fromiter(map(len, self.node_args), np.int64, n_nodes)
+        keys = np.array(
+            [self.node_height, self.node_cls, self.node_extra, nargs], dtype=np.int64
+        ).reshape(4, n_nodes)
+        order = np.lexsort(keys[::-1])
+        self.position = np.empty(n_nodes, dtype=np.int64)
+        self.position[order] = np.arange(n_leaves, n_leaves + n_nodes)
+        keys = keys[:, order]
+        # The start of each group (where any of the keys change)
+        starts = np.flatnonzero(
+            np.concatenate(([n_nodes > 0], (keys[:, 1:] != keys[:, :-1]).any(axis=0)))
+        )
+        counts = np.diff(np.append(starts, n_nodes))
+        node_args = self.node_args
+        groups = []
+        for start, count in zip(starts.tolist(), counts.tolist()):
+            _, cls, extra, n = keys[:, start].tolist()
+            refs = self.remap(
+                [
+                    ref
+                    for i in order[start : start + count].tolist()
+                    for ref in node_args[i]
+                ]
+            )
+            groups.append((cls, extra, refs.reshape(count, n)))
+        return {
+            'leaf_kind': np.array(self.leaf_kind, dtype=np.int8),
+            'leaf_idx': np.array(self.leaf_idx, dtype=np.int64),
+            'consts': self.consts,
+            'array_vars': self.array_var_leaves,
+            'classes': self.class_table,
+            'extras': self.extra_table,
+            'groups': groups,
+        }
+
+    def remap(self, refs):
+        # Map (negative) node references to their position in the pool
+        refs = np.array(refs, dtype=np.int64)
+        nodes = refs < 0
+        refs[nodes] = self.position[~refs[nodes]]
+        return refs
+
+    #
+    # Components
+    #
+
+    def save_block(self, block):
+        for comp in block.component_objects(descend_into=False):
+            if not comp._constructed:
+                raise ValueError(
+                    "Cannot save the unconstructed component '%s' to a snapshot"
+                    % (comp.name,)
+                )
+            handler = self._handlers.get(comp.__class__, None)
+            if handler is None:
+                raise ValueError(
+                    "Cannot save component '%s' to a snapshot: components of "
+                    "type %s are not supported" % (comp.name, type(comp).__name__)
+                )
+            if getattr(comp, '_units', None) is not None:
+                raise ValueError(
+                    "Cannot save component '%s' to a snapshot: components with "
+                    "units are not supported" % (comp.name,)
+                )
+            if getattr(comp, '_lazy_construction', None) is not None:
+                comp._materialize()
+            rec = {
+                'type': handler[0],
+                'name': comp.local_name,
+                'block': self.blocks[id(block)],
+                'doc': comp.doc,
+            }
+            self.records.append(rec)
+            handler[1](self, comp, rec)
+
+    def component_index(self, comp, rec):
+        # Record the index set and (unless the component is dense) the
+        # indices of the component data
+        if not comp.is_indexed():
+            rec['index'] = None
+            rec['keys'] = list(comp._data)
+            return list(comp._data.values())
+        index_set = comp.index_set()
+        if isinstance(index_set, SetProduct) and not self.is_declared(index_set):
+            rec['index'] = [self.set_spec(s) for s in index_set.subsets(False)]
+        else:
+            rec['index'] = [self.set_spec(index_set)]
+        keys = list(comp._data)
+        if len(keys) == len(index_set) and keys == list(index_set):
+            rec['keys'] = None
+        else:
+            rec['keys'] = _encode_members(keys)
+        return list(comp._data.values())
+
+    def list_index(self, comp, rec):
+        rec['starting_index'] = comp._starting_index
+        rec['members'] = _encode_members(comp.index_set())
+        keys = list(comp._data)
+        if keys == list(comp.index_set()):
+            rec['keys'] = None
+        else:
+            rec['keys'] = _encode_members(keys)
+        return list(comp._data.values())
+
+    def save_Block(self, comp, rec):
+        objs = self.component_index(comp, rec)
+        if comp.is_indexed():
+            for obj in objs:
+                if obj.__class__ is not BlockData:
+                    raise ValueError(
+                        "Cannot save block '%s' to a snapshot: block data of "
+                        "type %s is not supported" % (obj.name, type(obj).__name__)
+                    )
+        rec['active'] = comp._active
+        rec['data_active'] = np.array([obj._active for obj in objs], dtype=bool)
+        for obj in objs:
+            self.blocks[id(obj)] = len(self.blocks)
+        for obj in objs:
+            self.save_block(obj)
+
+    def save_Set(self, comp, rec):
+        self.sets[id(comp)] = len(self.sets)
+        objs = self.component_index(comp, rec)
+        data_class = comp._ComponentDataClass if comp.is_indexed() else comp.__class__
+        if issubclass(data_class, SortedSetData):
+            if comp._sort_fcn is sorted_robust:
+                rec['ordered'] = Set.SortedOrder
+            else:
+                rec['ordered'] = comp._sort_fcn
+        elif issubclass(data_class, OrderedSetData):
+            rec['ordered'] = Set.InsertionOrder
+        else:
+            rec['ordered'] = False
+        rec['compact'] = comp._compact_storage
+        rec['data'] = [
+            (obj._dimen, self.set_spec(obj._domain), self.set_members(obj))
+            for obj in objs
+        ]
+
+    def set_members(self, obj):
+        values = obj._values
+        if values.__class__ is _CompactSetValues:
+            return (
+                'compact',
+                values.rows(),
+                values._table,
+                values._mask,
+                values._deleted,
+            )
+        return _encode_members(obj)
+
+    def save_RangeSet(self, comp, rec):
+        self.sets[id(comp)] = len(self.sets)
+        rec['ranges'] = list(comp.ranges())
+
+    def save_Param(self, comp, rec):
+        objs = self.component_index(comp, rec)
+        rec['mutable'] = comp._mutable
+        rec['default'] = comp._default_val
+        if comp.domain.__class__ is _ImplicitAny:
+            rec['domain'] = ('obj', None)
+        else:
+            rec['domain'] = self.set_spec(comp.domain)
+        if not comp.is_indexed():
+            values = [comp._value] if objs else []
+        elif comp._mutable:
+            values = [obj._value for obj in objs]
+        else:
+            values = objs
+        if comp._mutable:
+            for obj in objs:
+                self.param_ids[id(obj)] = len(self.param_ids)
+        rec['values'] = _encode_values(values)
+
+    def save_Var(self, comp, rec):
+        if rec['type'] == 'VarList':
+            objs = self.list_index(comp, rec)
+        else:
+            objs = self.component_index(comp, rec)
+        rec['n'] = len(objs)
+        domains = set(id(obj._domain) for obj in objs)
+        if len(domains) == 1:
+            rec['domain'] = self.set_spec(objs[0]._domain)
+        else:
+            rec['domain'] = None
+        for obj in objs:
+            self.var_ids[id(obj)] = len(self.var_ids)
+            domain = self.domains.get(id(obj._domain), None)
+            if domain is None:
+                domain = self.domains[id(obj._domain)] = len(self.domain_specs)
+                self.domain_specs.append(self.set_spec(obj._domain))
+            self.var_domain.append(domain)
+        self.var_values.extend(obj._value for obj in objs)
+        self.var_fixed.extend(obj._fixed for obj in objs)
+        self.var_stale.extend(StaleFlagManager.is_stale(obj._stale) for obj in objs)
+        # Bounds may be (non-variable) expressions
+        for bounds, attr in ((self.var_lb, '_lb'), (self.var_ub, '_ub')):
+            values = [getattr(obj, attr) for obj in objs]
+            nums, kinds, exprs = _encode_values(values)
+            bounds[0] = np.concatenate((bounds[0], nums))
+            bounds[1] = np.concatenate((bounds[1], kinds))
+            bounds[2].extend(exprs)
+
+    def save_ArrayVar(self, comp, rec):
+        self.array_vars[id(comp)] = len(self.array_vars)
+        self.component_index(comp, rec)
+        comp._sync_arrays()
+        rec['arrays'] = {
+            'value': comp._value_array,
+            'lb': comp._lb_array,
+            'ub': comp._ub_array,
+            'fixed': comp._fixed_array,
+            'stale': _stale_array_mapper(True, comp._stale_array),
+        }
+        rec['domain'] = self.set_spec(comp._domain_default)
+        rec['domain_map'] = {
+            pos: self.set_spec(domain) for pos, domain in comp._domain_map.items()
+        }
+
+    def save_Expression(self, comp, rec):
+        objs = self.component_index(comp, rec)
+        for obj in objs:
+            self.named_ids[id(obj)] = len(self.named_ids)
+        self.pending.append((rec, 'exprs', [obj._args_[0] for obj in objs]))
+
+    def save_Constraint(self, comp, rec):
+        if rec['type'] == 'ConstraintList':
+            objs = self.list_index(comp, rec)
+        else:
+            objs = self.component_index(comp, rec)
+        rec['active'] = comp._active
+        rec['data_active'] = np.array([obj._active for obj in objs], dtype=bool)
+        self.pending.append((rec, 'exprs', [obj._expr for obj in objs]))
+
+    def save_Objective(self, comp, rec):
+        if rec['type'] == 'ObjectiveList':
+            objs = self.list_index(comp, rec)
+        else:
+            objs = self.component_index(comp, rec)
+        for obj in objs:
+            self.named_ids[id(obj)] = len(self.named_ids)
+        rec['active'] = comp._active
+        rec['data_active'] = np.array([obj._active for obj in objs], dtype=bool)
+        rec['sense'] = np.array([int(obj._sense) for obj in objs], dtype=np.int8)
+        self.pending.append((rec, 'exprs', [obj._args_[0] for obj in objs]))
+
+    _handlers = {
+        ScalarBlock: ('Block', save_Block),
+        IndexedBlock: ('Block', save_Block),
+        FiniteScalarSet: ('Set', save_Set),
+        OrderedScalarSet: ('Set', save_Set),
+        SortedScalarSet: ('Set', save_Set),
+        IndexedSet: ('Set', save_Set),
+        FiniteScalarRangeSet: ('RangeSet', save_RangeSet),
+        InfiniteScalarRangeSet: ('RangeSet', save_RangeSet),
+        ScalarParam: ('Param', save_Param),
+        IndexedParam: ('Param', save_Param),
+        ScalarVar: ('Var', save_Var),
+        IndexedVar: ('Var', save_Var),
+        VarList: ('VarList', save_Var),
+        ArrayIndexedVar: ('ArrayVar', save_ArrayVar),
+        ScalarExpression: ('Expression', save_Expression),
+        IndexedExpression: ('Expression', save_Expression),
+        ScalarConstraint: ('Constraint', save_Constraint),
+        IndexedConstraint: ('Constraint', save_Constraint),
+        ConstraintList: ('ConstraintList', save_Constraint),
+        ScalarObjective: ('Objective', save_Objective),
+        IndexedObjective: ('Objective', save_Objective),
+        ObjectiveList: ('ObjectiveList', save_Objective),
+    }
+
+    #
+    # Sets
+    #
+
+    def is_declared(self, s):
+        # Return True if the Set is a component declared on a block
+        # (as opposed to an anonymous / implicit Set)
+        comp = s.parent_component()
+        block = comp.parent_block()
+        return block is not None and block.component(comp.local_name) is comp
+
+    def set_spec(self, s):
+        """Return a description of a Set that can be resolved when loading"""
+        if s is None or isinstance(s, GlobalSetBase):
+            return ('obj', s)
+        comp = s.parent_component()
+        if id(comp) in self.sets:
+            if comp is s:
+                return ('ref', self.sets[id(comp)])
+            return ('item', self.sets[id(comp)], s.index())
+        if self.is_declared(s):
+            raise ValueError(
+                "Cannot save a reference to Set '%s' to a snapshot: the Set is "
+                "not part of the snapshot (or is declared after it is used)" % (s.name,)
+            )
+        if isinstance(s, SetProduct):
+            return ('product', [self.set_spec(_s) for _s in s.subsets(False)])
+        for cls, op, _ in _SET_OPERATORS:
+            if isinstance(s, cls):
+                return ('op', op, [self.set_spec(_s) for _s in s._sets])
+        if isinstance(s, RangeSet):
+            return ('range', list(s.ranges()))
+        if s.__class__ in (FiniteScalarSet, OrderedScalarSet, SortedScalarSet):
+            if s.__class__ is SortedScalarSet:
+                if s._sort_fcn is not sorted_robust:
+                    raise ValueError(
+                        "Cannot save the Set '%s' to a snapshot: anonymous Sets "
+                        "with custom sort functions are not supported" % (s.name,)
+                    )
+                ordered = Set.SortedOrder
+            else:
+                ordered = s.__class__ is OrderedScalarSet
+            return ('members', ordered, s._dimen, _encode_members(s))
+        raise ValueError(
+            "Cannot save the Set '%s' (%s) to a snapshot" % (s.name, type(s).__name__)
+        )
+
+    #
+    # Expressions
+    #
+
+    def expr_ref(self, expr):
+        """Return the reference to (the flattened) ``expr``
+
+        References to leaves are non-negative indices into the leaf
+        table; references to nodes are negative (``~node_index``) until
+        they are remapped when the snapshot is finalized.
+
+        """
+        refs = self.refs
+        ref = refs.get(id(expr), None)
+        if ref is not None:
+            return ref
+        if not self.is_node(expr):
+            return self.leaf_ref(expr)
+        # Iterative postorder traversal, so nodes are numbered after
+        # their arguments (and shared subexpressions are only stored
+        # once)
+        stack = [[expr, expr.args, 0]]
+        while stack:
+            frame = stack[-1]
+            node, args, i = frame
+            while i < len(args):
+                arg = args[i]
+                i += 1
+                if id(arg) in refs:
+                    continue
+                if self.is_node(arg):
+                    frame[2] = i
+                    stack.append([arg, arg.args, 0])
+                    break
+                self.leaf_ref(arg)
+            else:
+                stack.pop()
+                self.add_node(node, args)
+        return refs[id(expr)]
+
+    def is_node(self, obj):
+        if obj.__class__ in self.classes:
+            return True
+        return (
+            obj.__class__ not in native_types
+            and isinstance(obj, ExpressionBase)
+            and not obj.is_named_expression_type()
+        )
+
+    def leaf_ref(self, obj):
+        kind = None
+        if obj.__class__ in native_types or obj.__class__ is NumericConstant:
+            kind, idx = _CONST, len(self.consts)
+            self.consts.append(obj)
+        elif not isinstance(obj, PyomoObject):
+            pass
+        elif obj.is_variable_type():
+            if id(obj) in self.var_ids:
+                kind, idx = _VAR, self.var_ids[id(obj)]
+            elif id(obj.parent_component()) in self.array_vars:
+                kind, idx = _ARRAY_VAR, len(self.array_var_leaves)
+                comp = obj.parent_component()
+                self.array_var_leaves.append((self.array_vars[id(comp)], obj._pos))
+        elif obj.is_parameter_type():
+            if id(obj) in self.param_ids:
+                kind, idx = _PARAM, self.param_ids[id(obj)]
+        elif obj.is_named_expression_type():
+            if id(obj) in self.named_ids:
+                kind, idx = _NAMED, self.named_ids[id(obj)]
+        if kind is None:
+            if isinstance(obj, PyomoObject) and obj.is_component_type():
+                raise ValueError(
+                    "Cannot save an expression referencing '%s' to a snapshot: "
+                    "the component is not part of the snapshot" % (obj.name,)
+                )
+            raise ValueError(
+                "Cannot save an expression containing '%s' (%s) to a snapshot"
+                % (obj, type(obj).__name__)
+            )
+        self.refs[id(obj)] = ref = len(self.leaf_kind)
+        self.leaf_kind.append(kind)
+        self.leaf_idx.append(idx)
+        return ref
+
+    def add_node(self, node, args):
+        info = self.classes.get(node.__class__, None)
+        if info is None:
+            info = self.register_class(node)
+        cls_idx, extra_slots = info
+        self.node_cls.append(cls_idx)
+        if extra_slots:
+            extra = tuple(getattr(node, slot) for slot in extra_slots)
+            if any(isinstance(v, PyomoObject) for v in extra):
+                raise ValueError(
+                    "Cannot save the expression node '%s' (%s) to a snapshot"
+                    % (node, type(node).__name__)
+                )
+            extra_idx = self.extras.get(extra, None)
+            if extra_idx is None:
+                extra_idx = self.extras[extra] = len(self.extra_table)
+                self.extra_table.append(extra)
+            self.node_extra.append(extra_idx)
+        else:
+            self.node_extra.append(-1)
+        refs = self.refs
+        args = [refs[id(arg)] for arg in args]
+        height = self.node_height
+        self.node_height.append(
+            1 + max((height[~ref] for ref in args if ref < 0), default=0)
+        )
+        self.node_args.append(args)
+        refs[id(node)] = ~(len(self.node_cls) - 1)
+
+    def register_class(self, node):
+        cls = node.__class__
+        if not cls.__module__.startswith('pyomo.core.expr.') or hasattr(
+            node, '__dict__'
+        ):
+            raise ValueError(
+                "Cannot save the expression node '%s' (%s) to a snapshot"
+                % (node, cls.__name__)
+            )
+        slots = []
+        for base in reversed(cls.__mro__):
+            base_slots = base.__dict__.get('__slots__', ())
+            if isinstance(base_slots, str):
+                base_slots = (base_slots,)
+            slots.extend(
+                s
+                for s in base_slots
+                if s not in ('_args_', '_nargs', '__weakref__') and s not in slots
+            )
+        is_list = hasattr(node, '_nargs')
+        info = self.classes[cls] = (len(self.class_table), tuple(slots))
+        self.class_table.append((_IMMUTABLE_NODE.get(cls, cls), is_list, info[1]))
+        return info
+
+
+class _SnapshotReader(object):
+    def __init__(self, state):
+        self.state = state
+        self.blocks = []
+        self.sets = []
+        self.array_vars = []
+        # The registries of objects that expressions may reference
+        self.vars = []
+        self.params = []
+        self.named = []
+        # Data objects that are assigned expressions once the
+        # expression nodes are built
+        self.pending = []
+        self.fresh = StaleFlagManager.get_flag(0)
+
+    def load(self):
+        state = self.state
+        model = ConcreteModel(name=state['name'])
+        self.blocks.append(model)
+
+        var_state = state['vars']
+        self.var_values = _decode_values(var_state['value'])
+        self.var_lb = _decode_values(var_state['lb'])
+        self.var_ub = _decode_values(var_state['ub'])
+        self.var_fixed = var_state['fixed'].tolist()
+        self.var_stale = var_state['stale'].tolist()
+        self.var_domain = var_state['domain'].tolist()
+        self.domains = [None] * len(var_state['domains'])
+        self.domain_specs = var_state['domains']
+
+        for rec in state['records']:
+            block = self.blocks[rec['block']]
+            getattr(self, 'load_' + rec['type'])(block, rec)
+
+        pool = self.build_expressions(state['expr'])
+
+        for objs, refs, setter in self.pending:
+            for obj, ref in zip(objs, refs.tolist()):
+                setter(obj, pool[ref])
+        for bounds, attr in ((var_state['lb'], '_lb'), (var_state['ub'], '_ub')):
+            for i, ref in zip(np.flatnonzero(bounds[1] == _OTHER).tolist(), bounds[2]):
+                setattr(self.vars[i], attr, pool[ref])
+        return model
+
+    def build_expressions(self, expr):
+        tables = [self.vars, self.params, self.named, expr['consts'], None]
+        if expr['array_vars']:
+            tables[_ARRAY_VAR] = [
+                self.array_vars[comp][self.array_vars[comp].index_set().at(pos + 1)]
+                for comp, pos in expr['array_vars']
+            ]
+        pool = [
+            tables[kind][idx]
+            for kind, idx in zip(expr['leaf_kind'].tolist(), expr['leaf_idx'].tolist())
+        ]
+        getitem = pool.__getitem__
+        classes = expr['classes']
+        extras = expr['extras']
+        for cls_idx, extra_idx, refs in expr['groups']:
+            cls, is_list, extra_slots = classes[cls_idx]
+            count, nargs = refs.shape
+            nodes = list(map(cls.__new__, repeat(cls, count)))
+            if not nargs:
+                args = repeat((), count)
+            elif nargs <= _MAX_COLUMN_ARGS:
+                # Gather the arguments column by column
+                args = zip(*(map(getitem, col) for col in refs.T.tolist()))
+            else:
+                args = (map(getitem, row) for row in refs.tolist())
+            if is_list:
+                args = map(list, args)
+                _consume(map(setattr, nodes, repeat('_nargs'), repeat(nargs)))
+            elif nargs > _MAX_COLUMN_ARGS:
+                args = map(tuple, args)
+            _consume(map(setattr, nodes, repeat('_args_'), args))
+            if extra_idx >= 0:
+                for slot, val in zip(extra_slots, extras[extra_idx]):
+                    _consume(map(setattr, nodes, repeat(slot), repeat(val)))
+            pool.extend(nodes)
+        return pool
+
+    #
+    # Components
+    #
+
+    def add_component(self, block, rec, comp, construct=True):
+        comp.doc = rec['doc']
+        if not comp.is_indexed():
+            # Scalar components become "concrete" when constructed
+            construct = True
+        if not construct:
+            # The component data will be restored directly from the
+            # snapshot: skip constructing it (except for its anonymous
+            # index sets)
+            comp._constructed = True
+        block.add_component(rec['name'], comp)
+        if not construct and comp._anonymous_sets is not None:
+            for _set in comp._anonymous_sets:
+                _set.construct()
+        return comp
+
+    def index_args(self, rec):
+        if rec['index'] is None:
+            return ()
+        return tuple(self.resolve_set(spec, True) for spec in rec['index'])
+
+    def component_data(self, comp, rec):
+        """Create (empty) component data for the saved indices"""
+        if rec['index'] is None:
+            if rec['keys']:
+                comp._data = {None: comp}
+                return [comp]
+            comp._data = {}
+            return []
+        if rec['keys'] is None:
+            keys = list(comp.index_set())
+        else:
+            keys = _decode_members(rec['keys'])
+        cls = comp._ComponentDataClass
+        new = cls.__new__
+        objs = [new(cls) for _ in keys]
+        ref = weakref_ref(comp)
+        for obj, key in zip(objs, keys):
+            obj._component = ref
+            obj._index = key
+        comp._data = dict(zip(keys, objs))
+        return objs
+
+    def list_data(self, comp, rec):
+        index_set = comp.index_set()
+        index_set._update_impl(iter(_decode_members(rec['members'])))
+        if rec['keys'] is None:
+            keys = list(index_set)
+        else:
+            keys = _decode_members(rec['keys'])
+        cls = comp._ComponentDataClass
+        new = cls.__new__
+        objs = [new(cls) for _ in keys]
+        ref = weakref_ref(comp)
+        for obj, key in zip(objs, keys):
+            obj._component = ref
+            obj._index = key
+        comp._data = dict(zip(keys, objs))
+        return objs
+
+    def load_Block(self, block, rec):
+        comp = Block(*self.index_args(rec), dense=False)
+        self.add_component(block, rec, comp)
+        comp._active = rec['active']
+        if rec['index'] is None:
+            objs = [comp]
+        elif rec['keys'] is None:
+            objs = [comp[idx] for idx in comp.index_set()]
+        else:
+            objs = [comp[idx] for idx in _decode_members(rec['keys'])]
+        for obj, active in zip(objs, rec['data_active'].tolist()):
+            obj._active = active
+        self.blocks.extend(objs)
+
+    def load_Set(self, block, rec):
+        comp = Set(
+            *self.index_args(rec),
+            ordered=rec['ordered'],
+            compact=rec.get('compact', False),
+        )
+        self.add_component(block, rec, comp)
+        self.sets.append(comp)
+        if rec['index'] is None:
+            objs = [comp]
+        elif rec['keys'] is None:
+            objs = [comp[idx] for idx in comp.index_set()]
+        else:
+            objs = [comp[idx] for idx in _decode_members(rec['keys'])]
+        for obj, (dimen, domain, members) in zip(objs, rec['data']):
+            obj._dimen = dimen
+            obj._domain = self.resolve_set(domain)
+            if members[0] == 'compact' and compact_storage_available():
+                values = _CompactSetValues.__new__(_CompactSetValues)
+                values._rows, values._table, values._mask, values._deleted = members[1:]
+                values._len = len(values._rows)
+                values._shift = 64 - values._mask.bit_length()
+                values._removed = []
+                values._dimen = 1 if values._rows.ndim == 1 else values._rows.shape[1]
+                values._pending = {}
+                # The arrays are (read-only) views into the snapshot:
+                # they are copied before they are first modified
+                values._shared = True
+                obj._values = values
+                obj._ordered_values = None
+                continue
+            if members[0] == 'compact':
+                members = ('rows', members[1])
+            obj._update_impl(iter(_decode_members(members)))
+
+    def load_RangeSet(self, block, rec):
+        comp = RangeSet(ranges=rec['ranges'])
+        self.add_component(block, rec, comp)
+        self.sets.append(comp)
+
+    def load_Param(self, block, rec):
+        comp = Param(
+            *self.index_args(rec),
+            mutable=rec['mutable'],
+            default=rec['default'],
+            within=self.resolve_set(rec['domain']),
+        )
+        self.add_component(block, rec, comp, construct=False)
+        values = _decode_values(rec['values'])
+        if rec['index'] is None:
+            if rec['keys']:
+                comp._value = values[0]
+                comp._data = {None: comp}
+            else:
+                comp._data = {}
+            objs = [comp]
+        elif comp._mutable:
+            objs = self.component_data(comp, rec)
+            for obj, val in zip(objs, values):
+                obj._value = val
+        else:
+            if rec['keys'] is None:
+                keys = list(comp.index_set())
+            else:
+                keys = _decode_members(rec['keys'])
+            comp._data = dict(zip(keys, values))
+            return
+        if comp._mutable:
+            self.params.extend(objs)
+
+    def load_Var(self, block, rec):
+        kwds = {}
+        if rec['domain'] is not None:
+            kwds['within'] = self.resolve_set(rec['domain'])
+        if rec['type'] == 'VarList':
+            comp = VarList(starting_index=rec['starting_index'], **kwds)
+            self.add_component(block, rec, comp, construct=False)
+            objs = self.list_data(comp, rec)
+        else:
+            if rec['index'] is not None:
+                kwds['dense'] = False
+            comp = Var(*self.index_args(rec), **kwds)
+            self.add_component(block, rec, comp, construct=False)
+            objs = self.component_data(comp, rec)
+        start = len(self.vars)
+        end = start + rec['n']
+        fresh = self.fresh
+        domains = self.domains
+        for obj, val, lb, ub, fixed, stale, domain in zip(
+            objs,
+            self.var_values[start:end],
+            self.var_lb[start:end],
+            self.var_ub[start:end],
+            self.var_fixed[start:end],
+            self.var_stale[start:end],
+            self.var_domain[start:end],
+        ):
+            obj._value = val
+            obj._lb = lb
+            obj._ub = ub
+            obj._fixed = fixed
+            obj._stale = 0 if stale else fresh
+            obj._domain = domains[domain]
+            if obj._domain is None:
+                obj._domain = domains[domain] = self.resolve_set(
+                    self.domain_specs[domain]
+                )
+        self.vars.extend(objs)
+
+    load_VarList = load_Var
+
+    def load_ArrayVar(self, block, rec):
+        comp = Var(
+            *self.index_args(rec), array=True, within=self.resolve_set(rec['domain'])
+        )
+        self.add_component(block, rec, comp)
+        arrays = rec['arrays']
+        # Copy the arrays out of the (read-only) snapshot, as the
+        # variable updates them in place
+        comp._value_array = np.array(arrays['value'])
+        comp._lb_array = np.array(arrays['lb'])
+        comp._ub_array = np.array(arrays['ub'])
+        comp._fixed_array = np.array(arrays['fixed'])
+        comp._stale_array = _stale_array_mapper(False, arrays['stale'])
+        comp._domain_map = {
+            pos: self.resolve_set(spec) for pos, spec in rec['domain_map'].items()
+        }
+        self.array_vars.append(comp)
+
+    def load_Expression(self, block, rec):
+        comp = Expression(*self.index_args(rec))
+        self.add_component(block, rec, comp, construct=False)
+        objs = self.component_data(comp, rec)
+        self.named.extend(objs)
+        self.pending.append((objs, rec['exprs'], _set_named_expr))
+
+    def load_Constraint(self, block, rec):
+        if rec['type'] == 'ConstraintList':
+            comp = ConstraintList(starting_index=rec['starting_index'])
+            self.add_component(block, rec, comp, construct=False)
+            objs = self.list_data(comp, rec)
+        else:
+            comp = Constraint(*self.index_args(rec))
+            self.add_component(block, rec, comp, construct=False)
+            objs = self.component_data(comp, rec)
+        comp._active = rec['active']
+        for obj, active in zip(objs, rec['data_active'].tolist()):
+            obj._active = active
+        self.pending.append((objs, rec['exprs'], _set_constraint_expr))
+
+    load_ConstraintList = load_Constraint
+
+    def load_Objective(self, block, rec):
+        if rec['type'] == 'ObjectiveList':
+            comp = ObjectiveList(starting_index=rec['starting_index'])
+            self.add_component(block, rec, comp, construct=False)
+            objs = self.list_data(comp, rec)
+        else:
+            comp = Objective(*self.index_args(rec))
+            self.add_component(block, rec, comp, construct=False)
+            objs = self.component_data(comp, rec)
+        comp._active = rec['active']
+        for obj, active, sense in zip(
+            objs, rec['data_active'].tolist(), rec['sense'].tolist()
+        ):
+            obj._active = active
+            obj._sense = ObjectiveSense(sense)
+        self.named.extend(objs)
+        self.pending.append((objs, rec['exprs'], _set_named_expr))
+
+    load_ObjectiveList = load_Objective
+
+    #
+    # Sets
+    #
+
+    def resolve_set(self, spec, as_arg=False):
+        kind = spec[0]
+        if kind == 'obj':
+            return spec[1]
+        if kind == 'ref':
+            return self.sets[spec[1]]
+        if kind == 'item':
+            return self.sets[spec[1]][spec[2]]
+        if kind == 'product':
+            return SetProduct(*(self.resolve_set(s) for s in spec[1]))
+        if kind == 'op':
+            op = {_op: fcn for _, _op, fcn in _SET_OPERATORS}[spec[1]]
+            a, b = (self.resolve_set(s) for s in spec[2])
+            return op(a, b)
+        if kind == 'range':
+            return RangeSet(ranges=spec[1])
+        if kind == 'members':
+            return Set(
+                initialize=_decode_members(spec[3]), ordered=spec[1], dimen=spec[2]
+            )
+        raise ValueError("Unrecognized Set in the snapshot: %s" % (kind,))
+
+
+def _set_constraint_expr(obj, expr):
+    obj._expr = expr
+
+
+def _set_named_expr(obj, expr):
+    obj._args_ = (expr,)
+
+
+def save_snapshot(block, filename):
+    """Save a constructed model (or Block) to a binary snapshot file
+
+    The snapshot holds the block hierarchy and the current state of
+    all Sets, Params, Vars, Expressions, Constraints, and Objectives
+    on ``block`` (and its sub-blocks).  See :mod:`pyomo.core.base.snapshot`
+    for the list of supported components.
+
+    Parameters
+    ----------
+    block: BlockData
+        The (scalar) model or block to save
+
+    filename: str
+        The name of the snapshot file to write
+
+    """
+    buffers = []
+    with PauseGC():
+        state = _SnapshotWriter().save(block)
+        header = pickle.dumps(state, protocol=5, buffer_callback=buffers.append)
+    views = [buf.raw() for buf in buffers]
+    # File layout: magic, header length, buffer count, (offset,
+    # length) for each buffer, header, and then the (aligned) buffers
+    offset = len(_MAGIC) + 16 * (1 + len(views)) + len(header)
+    table = []
+    for view in views:
+        offset += -offset % _ALIGN
+        table.extend((offset, view.nbytes))
+        offset += view.nbytes
+    with open(filename, 'wb') as FILE:
+        FILE.write(_MAGIC)
+        FILE.write(struct.pack('<QQ', len(header), len(views)))
+        FILE.write(struct.pack('<%dQ' % len(table), *table))
+        FILE.write(header)
+        for view, buf_offset in zip(views, table[::2]):
+            FILE.write(b'\0' * (buf_offset - FILE.tell()))
+            FILE.write(view)
+
+
+def load_snapshot(filename):
+    """Load a model from a snapshot written by :func:`save_snapshot`
+
+    The snapshot file is memory-mapped, and the arrays are decoded
+    directly from the mapped file.  Large integer Sets keep sharing
+    the (read-only) mapped pages until they are first modified.
+
+    Returns
+    -------
+    ConcreteModel
+        The model restored from the snapshot
+
+    """
+    with open(filename, 'rb') as FILE:
+        data = mmap.mmap(FILE.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(data)
+    if bytes(view[: len(_MAGIC)]) != _MAGIC:
+        raise ValueError("'%s' is not a Pyomo model snapshot" % (filename,))
+    offset = len(_MAGIC)
+    header_len, nbuffers = struct.unpack_from('<QQ', view, offset)
+    offset += 16
+    table = struct.unpack_from('<%dQ' % (2 * nbuffers), view, offset)
+    offset += 16 * nbuffers
+    buffers = [
+        view[buf_offset : buf_offset + nbytes]
+        for buf_offset, nbytes in zip(table[::2], table[1::2])
+    ]
+    # Loading creates many (non-cyclic) objects: pause the garbage
+    # collector so it is not repeatedly triggered
+    with PauseGC():
+        state = pickle.loads(view[offset : offset + header_len], buffers=buffers)
+        if state.get('version', None) != _VERSION:
+            raise ValueError(
+                "Unsupported Pyomo model snapshot version (%s) in '%s'"
+                % (state.get('version', None), filename)
+            )
+        return _SnapshotReader(state).load()
@@ -17,7 +17,11 @@ from pyomo.common.log import is_debug_set
 from pyomo.common.timing import ConstructionTimer
 
 from pyomo.core.base.misc import apply_indexed_rule
-from pyomo.core.base.component import ActiveComponentData, ModelComponentFactory
+from pyomo.core.base.component import (
+    ActiveComponentData,
+    ModelComponentFactory,
+    _ModelChangeObservers,
+)
 from pyomo.core.base.global_set import UnindexedComponent_index
 from pyomo.core.base.indexed_component import (
     ActiveIndexedComponent,
@@ -72,6 +76,8 @@ class SOSConstraintData(ActiveComponentData):
         if level not in PositiveIntegers:
             raise ValueError("SOS Constraint level must be a positive integer")
         self._level = level
+        if _ModelChangeObservers.observers:
+            _ModelChangeObservers.notify('expression_changed', self)
 
     @property
     def variables(self):
@@ -90,6 +96,8 @@ class SOSConstraintData(ActiveComponentData):
             yield v, w
 
     def set_items(self, variables, weights):
+        if _ModelChangeObservers.observers:
+            _ModelChangeObservers.notify('expression_changed', self)
         self._variables = []
         self._weights = []
         for v, w in zip(variables, weights):
@@ -12,10 +12,13 @@
 from __future__ import annotations
 import logging
 import sys
+from itertools import islice
 from pyomo.common.pyomo_typing import overload
 from weakref import ref as weakref_ref
 from typing import Union, Type
 
+from pyomo.common.autoslots import AutoSlots
+from pyomo.common.dependencies import numpy as np
 from pyomo.common.deprecation import RenamedClass
 from pyomo.common.log import is_debug_set
 from pyomo.common.modeling import NOTSET
@@ -31,7 +34,11 @@ from pyomo.core.expr.numvalue import (
     is_potentially_variable,
     native_numeric_types,
 )
-from pyomo.core.base.component import ComponentData, ModelComponentFactory
+from pyomo.core.base.component import (
+    ComponentData,
+    ModelComponentFactory,
+    _ModelChangeObservers,
+)
 from pyomo.core.base.global_set import UnindexedComponent_index
 from pyomo.core.base.disable_methods import disable_methods
 from pyomo.core.base.indexed_component import (
@@ -58,6 +65,7 @@ logger = logging.getLogger('pyomo.core')
 
 _inf = float('inf')
 _ninf = -_inf
+_nan = float('nan')
 _nonfinite_values = {_inf, _ninf}
 _known_global_real_domains = dict(
     [(_, True) for _ in real_global_set_ids]
@@ -148,6 +156,8 @@ class VarData(ComponentData, NumericValue):
         if val is None:
             self._value = None
             self._stale = 0  # True
+            if _ModelChangeObservers.observers and self._fixed:
+                _ModelChangeObservers.notify('var_changed', self)
             return
         # TODO: generate a warning/error:
         #
@@ -188,6 +198,8 @@ class VarData(ComponentData, NumericValue):
 
         self._value = val
         self._stale = StaleFlagManager.get_flag(self._stale)
+        if _ModelChangeObservers.observers and self._fixed:
+            _ModelChangeObservers.notify('var_changed', self)
 
     @property
     def value(self):
@@ -221,6 +233,8 @@ class VarData(ComponentData, NumericValue):
                 extra={'id': 'E2001'},
             )
             raise
+        if _ModelChangeObservers.observers:
+            _ModelChangeObservers.notify('var_changed', self)
 
     def has_lb(self):
         """Returns :const:`False` when the lower bound is
@@ -384,6 +398,8 @@ class VarData(ComponentData, NumericValue):
     @lower.setter
     def lower(self, val):
         self._lb = self._process_bound(val, 'lower')
+        if _ModelChangeObservers.observers:
+            _ModelChangeObservers.notify('var_changed', self)
 
     @property
     def upper(self):
@@ -409,6 +425,8 @@ class VarData(ComponentData, NumericValue):
     @upper.setter
     def upper(self, val):
         self._ub = self._process_bound(val, 'upper')
+        if _ModelChangeObservers.observers:
+            _ModelChangeObservers.notify('var_changed', self)
 
     def get_units(self):
         """Return the units for this variable entry."""
@@ -452,6 +470,8 @@ class VarData(ComponentData, NumericValue):
     @fixed.setter
     def fixed(self, val):
         self._fixed = bool(val)
+        if _ModelChangeObservers.observers:
+            _ModelChangeObservers.notify('var_changed', self)
 
     @property
     def stale(self):
@@ -582,6 +602,86 @@ class _GeneralVarData(metaclass=RenamedClass):
     __renamed__version__ = '6.7.2'
 
 
+class ArrayVarData(VarData):
+    """A "flyweight" view of a single variable in an :class:`ArrayIndexedVar`
+
+    The variable state (value, bounds, fixed and stale flags, and
+    domain) is not stored on this object: the private attributes used
+    by :class:`VarData` are redirected to the corresponding position in
+    the arrays owned by the parent component.  Instances are created on
+    demand (and are then held by the parent component).
+
+    """
+
+    __slots__ = ('_pos',)
+
+    @property
+    def _value(self):
+        val = self._component()._value_array.item(self._pos)
+        # NaN is the sentinel for "no value"
+        return None if val != val else val
+
+    @_value.setter
+    def _value(self, val):
+        self._component()._value_array[self._pos] = _nan if val is None else val
+
+    @property
+    def _lb(self):
+        val = self._component()._lb_array.item(self._pos)
+        return None if val == _ninf else val
+
+    @_lb.setter
+    def _lb(self, val):
+        self._component()._lb_array[self._pos] = _ninf if val is None else value(val)
+
+    @property
+    def _ub(self):
+        val = self._component()._ub_array.item(self._pos)
+        return None if val == _inf else val
+
+    @_ub.setter
+    def _ub(self, val):
+        self._component()._ub_array[self._pos] = _inf if val is None else value(val)
+
+    @property
+    def _fixed(self):
+        return self._component()._fixed_array.item(self._pos)
+
+    @_fixed.setter
+    def _fixed(self, val):
+        self._component()._fixed_array[self._pos] = val
+
+    @property
+    def _stale(self):
+        return self._component()._stale_array.item(self._pos)
+
+    @_stale.setter
+    def _stale(self, val):
+        self._component()._stale_array[self._pos] = val
+
+    @property
+    def _domain(self):
+        comp = self._component()
+        return comp._domain_map.get(self._pos, comp._domain_default)
+
+    @_domain.setter
+    def _domain(self, domain):
+        comp = self._component()
+        if domain is comp._domain_default:
+            comp._domain_map.pop(self._pos, None)
+        else:
+            comp._domain_map[self._pos] = domain
+
+    def __getstate__(self):
+        # The variable state lives on the parent component: only the
+        # reference to the parent and the position need to be preserved
+        return [AutoSlots.weakref_mapper(True, self._component), self._index, self._pos]
+
+    def __setstate__(self, state):
+        component, self._index, self._pos = state
+        self._component = AutoSlots.weakref_mapper(False, component)
+
+
 @ModelComponentFactory.register("Decision variables.")
 class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
     """A numeric variable, which may be defined over an index.
@@ -601,6 +701,9 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
             :meth:`index_set` when constructing the Var (True) or just the
             variables returned by ``initialize``/``rule`` (False).  Defaults
             to ``True``.
+        array (bool, optional): Store the values, bounds, and fixed
+            flags of an indexed Var in contiguous NumPy arrays (see
+            :class:`ArrayIndexedVar`).  Defaults to ``False``.
         units (pyomo units expression, optional): Set the units corresponding
             to the entries in this variable.
         name (str, optional): Name for this component.
@@ -623,6 +726,8 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
             return super(Var, cls).__new__(cls)
         if not args or (args[0] is UnindexedComponent_set and len(args) == 1):
             return super(Var, cls).__new__(AbstractScalarVar)
+        elif kwargs.get('array', False):
+            return super(Var, cls).__new__(ArrayIndexedVar)
         else:
             return super(Var, cls).__new__(IndexedVar)
 
@@ -636,6 +741,7 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
         initialize=None,
         rule=None,
         dense=True,
+        array=False,
         units=None,
         name=None,
         doc=None,
@@ -653,6 +759,7 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
         )
         _bounds_arg = kwargs.pop('bounds', None)
         self._dense = kwargs.pop('dense', True)
+        _array = kwargs.pop('array', False)
         self._units = kwargs.pop('units', None)
         if self._units is not None:
             self._units = units.get_units(self._units)
@@ -670,6 +777,11 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
                 "for scalar variables; converting to dense=True" % (self.name,)
             )
             self._dense = True
+        if _array and not self.is_indexed():
+            logger.warning(
+                "ScalarVar object '%s': array=True is not allowed "
+                "for scalar variables; ignoring" % (self.name,)
+            )
         self._rule_bounds = BoundInitializer(_bounds_arg, self)
 
     def flag_as_stale(self):
@@ -985,6 +1097,8 @@ class IndexedVar(Var):
                 extra={'id': 'E2001'},
             )
             raise
+        if _ModelChangeObservers.observers:
+            _ModelChangeObservers.notify('var_changed', self)
 
     # Because CP supports indirection [the ability to index objects by
     # another (inter) Var] for certain types (including Var), we will
@@ -1010,6 +1124,544 @@ class IndexedVar(Var):
             raise
 
 
+def _stale_array_mapper(encode, val):
+    """__autoslot_mappers__ mapper for the ArrayIndexedVar stale flags
+
+    This is the vectorized equivalent of
+    :meth:`StaleFlagManager.stale_mapper`.
+
+    """
+    if val is None:
+        return val
+    if encode:
+        return StaleFlagManager.is_stale(val)
+    else:
+        return np.where(val, 0, StaleFlagManager.get_flag(0))
+
+
+class ArrayIndexedVar(IndexedVar):
+    """An array of variables whose data is stored in NumPy arrays.
+
+    This is declared by passing ``array=True`` to :class:`Var`.  The
+    values, lower and upper bounds, and fixed / stale flags for all
+    variables are stored in contiguous NumPy arrays (ordered by the
+    position of the index in the index set).  :class:`ArrayVarData`
+    objects are created on demand when individual variables are
+    accessed (e.g., when used in expressions or when iterating over
+    the component), and are then held by the component so that each
+    variable keeps its identity (and ``id()``).  Variables that were
+    never accessed do not consume any memory beyond their entries in
+    the arrays.
+
+    The component-level methods (:meth:`fix`, :meth:`setlb`,
+    :meth:`get_values`, etc.) operate directly on the arrays, and
+    :meth:`get_values_array` / :meth:`set_values_array` provide
+    vectorized access to the variable values.
+
+    Array-backed variables must be dense and indexed by a finite,
+    ordered Set.  Values and bounds are stored as floating point
+    numbers: integer values are returned as floats, and bounds
+    specified using (non-variable) expressions (e.g., mutable Params)
+    are evaluated when the bound is set.
+
+    """
+
+    _ComponentDataClass = ArrayVarData
+    __autoslot_mappers__ = {'_stale_array': _stale_array_mapper}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if not self._dense:
+            raise ValueError(
+                "Var '%s': array-backed variables (array=True) must be "
+                "dense" % (self.name,)
+            )
+        self._init_arrays()
+
+    def _init_arrays(self):
+        self._data = {}
+        self._value_array = None
+        self._lb_array = None
+        self._ub_array = None
+        self._fixed_array = None
+        self._stale_array = None
+        self._domain_default = None
+        self._domain_map = {}
+
+    def __len__(self):
+        if self._value_array is None:
+            return 0
+        return len(self._index_set)
+
+    def __contains__(self, idx):
+        if self._value_array is None:
+            return False
+        return idx in self._index_set
+
+    def __delitem__(self, index):
+        raise TypeError(
+            "Cannot delete individual variables from the array-backed "
+            "Var '%s'" % (self.name,)
+        )
+
+    def clear(self):
+        self._init_arrays()
+
+    def construct(self, data=None):
+        """
+        Construct the arrays for this variable
+        """
+        if self._constructed:
+            return
+        self._constructed = True
+
+        timer = ConstructionTimer(self)
+        if is_debug_set(logger):
+            logger.debug("Constructing array-backed Variable %s" % (self.name,))
+
+        if self._anonymous_sets is not None:
+            for _set in self._anonymous_sets:
+                _set.construct()
+
+        try:
+            # We do not (currently) accept data for constructing Variables
+            assert data is None
+
+            index_set = self.index_set()
+            if not index_set.isfinite() or not index_set.isordered():
+                raise ValueError(
+                    "Var '%s': array-backed variables (array=True) must be "
+                    "indexed by a finite, ordered Set" % (self.name,)
+                )
+            if self._rule_init is not None and self._rule_init.contains_indices():
+                # As with Var, allow initialization from a sparse map
+                # (mapping missing keys to None), but validate the
+                # incoming indices
+                for index in self._rule_init.indices():
+                    self._validate_index(index)
+                self._rule_init = DefaultInitializer(self._rule_init, None, KeyError)
+            self._initialize_arrays(list(index_set))
+        except Exception:
+            err = sys.exc_info()[1]
+            logger.error(
+                "Rule failed when initializing variable for "
+                "Var %s:\n%s: %s" % (self.name, type(err).__name__, err)
+            )
+            raise
+        finally:
+            timer.report()
+
+    def _initialize_arrays(self, indices):
+        """Extend the arrays with (and initialize) the specified indices"""
+        if self._value_array is None:
+            start = 0
+            self._value_array = np.empty(0, dtype=float)
+            self._lb_array = np.empty(0, dtype=float)
+            self._ub_array = np.empty(0, dtype=float)
+            self._fixed_array = np.empty(0, dtype=bool)
+            self._stale_array = np.empty(0, dtype=np.int64)
+        else:
+            start = len(self._value_array)
+        n = len(indices)
+        if not n:
+            return
+        self._value_array = np.concatenate((self._value_array, np.full(n, _nan)))
+        self._lb_array = np.concatenate((self._lb_array, np.full(n, _ninf)))
+        self._ub_array = np.concatenate((self._ub_array, np.full(n, _inf)))
+        self._fixed_array = np.concatenate((self._fixed_array, np.zeros(n, bool)))
+        # Note: 0 is always a "stale" flag
+        self._stale_array = np.concatenate((self._stale_array, np.zeros(n, np.int64)))
+
+        block = self.parent_block()
+        rule = self._rule_domain
+        if rule.constant():
+            if self._domain_default is None:
+                self._domain_default = rule(block, indices[0], self)
+        else:
+            for pos, index in enumerate(indices, start):
+                domain = rule(block, index, self)
+                if self._domain_default is None:
+                    self._domain_default = domain
+                elif domain is not self._domain_default:
+                    self._domain_map[pos] = domain
+
+        rule = self._rule_bounds
+        if rule is not None:
+            if rule.constant():
+                lb, ub = rule(block, indices[0])
+                self._lb_array[start:] = self._process_bound_value(lb, 'lower')
+                self._ub_array[start:] = self._process_bound_value(ub, 'upper')
+            else:
+                lb_array = self._lb_array
+                ub_array = self._ub_array
+                for pos, index in enumerate(indices, start):
+                    lb, ub = rule(block, index)
+                    lb_array[pos] = self._process_bound_value(lb, 'lower')
+                    ub_array[pos] = self._process_bound_value(ub, 'upper')
+
+        rule = self._rule_init
+        if rule is not None:
+            if rule.constant():
+                vals = rule(block, indices[0])
+            else:
+                vals = [rule(block, index) for index in indices]
+            self._set_values(slice(start, None), vals, False)
+
+    def _sync_arrays(self):
+        """Extend the arrays if indices were added to the index set"""
+        n = len(self._value_array)
+        if len(self._index_set) != n:
+            self._initialize_arrays(list(islice(self._index_set, n, None)))
+
+    def _getitem_when_not_present(self, index):
+        """Returns the (flyweight) variable for an index in the index set"""
+        pos = self._index_set.ord(index) - 1
+        if pos >= len(self._value_array):
+            self._sync_arrays()
+        obj = self._ComponentDataClass.__new__(self._ComponentDataClass)
+        obj._component = weakref_ref(self)
+        obj._index = index
+        obj._pos = pos
+        self._data[index] = obj
+        return obj
+
+    def _process_bound_value(self, val, bound_type):
+        """Convert a bound to the value stored in the bound arrays"""
+        if val is None:
+            return _ninf if bound_type == 'lower' else _inf
+        if val.__class__ in native_numeric_types:
+            return val
+        if is_potentially_variable(val):
+            raise ValueError(
+                "Potentially variable input of type '%s' supplied as "
+                "%s bound for variable '%s' - legal types must be constants "
+                "or non-potentially variable expressions."
+                % (type(val).__name__, bound_type, self.name)
+            )
+        if self._units is not None:
+            val = units.convert(val, to_units=self._units)
+        return value(val)
+
+    def _process_value(self, val):
+        """Convert a value to the value stored in the value array
+
+        This mirrors the conversion in :meth:`VarData.set_value`.
+
+        """
+        if val is None:
+            return _nan
+        if val.__class__ in native_numeric_types:
+            return val
+        if self._units is not None:
+            _src_magnitude = value(val)
+            # Note: value() could have just registered a new numeric type
+            if val.__class__ in native_numeric_types:
+                return _src_magnitude
+            return units.convert_value(
+                num_value=_src_magnitude,
+                from_units=units.get_units(val),
+                to_units=self._units,
+            )
+        return value(val)
+
+    def _set_values(self, pos, vals, skip_validation):
+        """Store values into the value array at positions `pos`"""
+        if isinstance(vals, np.ndarray) and vals.dtype.kind in 'biuf':
+            vals = vals.astype(float, copy=False)
+        elif not hasattr(vals, '__len__') or isinstance(vals, str):
+            vals = self._process_value(vals)
+        elif all(v.__class__ in native_numeric_types or v is None for v in vals):
+            # Note: numpy converts None to NaN
+            vals = np.array(vals, dtype=float)
+        else:
+            vals = np.array([self._process_value(v) for v in vals], dtype=float)
+        self._value_array[pos] = vals
+        if _ModelChangeObservers.observers:
+            _ModelChangeObservers.notify('var_changed', self)
+
+        # Update the stale flags.  As with load_var_values(), if we are
+        # in the "delayed" stale mode, updating a non-stale variable
+        # must advance the global stale flag: do that once for the
+        # entire batch.
+        stale = self._stale_array
+        flag = StaleFlagManager.get_flag(0)
+        if (stale[pos] == flag).any():
+            flag = StaleFlagManager.get_flag(flag)
+        stale[pos] = np.where(np.isnan(self._value_array[pos]), 0, flag)
+
+        if not skip_validation:
+            self._validate_values(pos)
+
+    def _in_domain(self, domain, vals):
+        """Return a boolean array indicating which vals are in domain"""
+        interval = domain.get_interval()
+        if interval is None:
+            unique, inverse = np.unique(vals, return_inverse=True)
+            return np.array([v in domain for v in unique.tolist()], dtype=bool)[inverse]
+        lb, ub, step = interval
+        ans = np.ones(len(vals), dtype=bool)
+        if lb is not None:
+            ans &= vals >= lb
+        if ub is not None:
+            ans &= vals <= ub
+        if step:
+            ans &= np.mod(vals - (lb or 0), step) == 0
+        return ans
+
+    def _validate_values(self, pos):
+        """Log warnings for values that violate the domain or bounds
+
+        This generates the same warnings as :meth:`VarData.set_value`.
+
+        """
+        positions = np.arange(len(self._value_array))[pos]
+        vals = self._value_array[positions]
+        has_value = ~np.isnan(vals)
+        in_domain = self._in_domain(self._domain_default, vals)
+        if self._domain_map:
+            overrides = np.fromiter(self._domain_map, dtype=np.int64)
+            for i in np.flatnonzero(np.isin(positions, overrides)).tolist():
+                in_domain[i] = vals.item(i) in self._domain_map[positions.item(i)]
+        not_in_domain = has_value & ~in_domain
+        out_of_bounds = (
+            has_value
+            & in_domain
+            & ((vals < self._lb_array[positions]) | (vals > self._ub_array[positions]))
+        )
+        index_at = self._index_set.at
+        for i in np.flatnonzero(not_in_domain | out_of_bounds).tolist():
+            obj = self[index_at(positions.item(i) + 1)]
+            val = vals.item(i)
+            if not_in_domain[i]:
+                logger.warning(
+                    "Setting Var '%s' to a value `%s` (%s) not in domain %s."
+                    % (obj.name, val, type(val).__name__, obj.domain),
+                    extra={'id': 'W1001'},
+                )
+            else:
+                logger.warning(
+                    "Setting Var '%s' to a numeric value `%s` "
+                    "outside the bounds %s." % (obj.name, val, obj.bounds),
+                    extra={'id': 'W1002'},
+                )
+
+    def get_values_array(self):
+        """Return the array of variable values.
+
+        The array is ordered by the position of the index in the index
+        set and uses ``NaN`` for variables with no value.  The array is
+        the underlying storage: modifying it in place updates the
+        variable values *without* validation or updating the stale
+        flags (see :meth:`set_values_array`).
+
+        """
+        self._sync_arrays()
+        if _ModelChangeObservers.observers:
+            # The caller may modify the (fixed) variable values in place
+            _ModelChangeObservers.notify('var_changed', self)
+        return self._value_array
+
+    def set_values_array(self, values, skip_validation=False):
+        """Set the values of all variables from an array.
+
+        `values` is an array (or sequence) of values ordered by the
+        position of the index in the index set (``NaN`` or ``None``
+        clears the variable value).  As with :meth:`VarData.set_value`,
+        the values are validated against the variable domains and
+        bounds unless ``skip_validation`` is True.
+
+        """
+        self._sync_arrays()
+        if hasattr(values, '__len__') and len(values) != len(self._value_array):
+            raise ValueError(
+                "Var '%s': cannot set values from an array of length %s "
+                "(expected %s)" % (self.name, len(values), len(self._value_array))
+            )
+        self._set_values(slice(None), values, skip_validation)
+
+    def get_bounds_arrays(self):
+        """Return the arrays of (numeric) lower and upper bounds.
+
+        As with :attr:`VarData.bounds`, the bounds are the tighter of
+        the variable bounds and the domain bounds.  Missing bounds are
+        returned as ``-inf`` / ``inf``.  The returned arrays are copies
+        (see :meth:`set_bounds_arrays`).
+
+        """
+        self._sync_arrays()
+        lb = self._lb_array.copy()
+        ub = self._ub_array.copy()
+        for positions, domain in self._domains():
+            dlb, dub = domain.bounds()
+            if dlb is not None:
+                lb[positions] = np.maximum(lb[positions], dlb)
+            if dub is not None:
+                ub[positions] = np.minimum(ub[positions], dub)
+        return lb, ub
+
+    def set_bounds_arrays(self, lb=NOTSET, ub=NOTSET):
+        """Set the lower and / or upper bounds of all variables from arrays.
+
+        Missing bounds can be specified with ``None``, ``NaN``, or
+        ``-inf`` / ``inf``.
+
+        """
+        self._sync_arrays()
+        for bound, arr, missing in (
+            (lb, self._lb_array, _ninf),
+            (ub, self._ub_array, _inf),
+        ):
+            if bound is NOTSET:
+                continue
+            bound = np.array(bound, dtype=float)
+            bound[np.isnan(bound)] = missing
+            arr[:] = bound
+        if _ModelChangeObservers.observers:
+            _ModelChangeObservers.notify('var_changed', self)
+
+    def get_fixed_array(self):
+        """Return the (boolean) array of fixed flags.
+
+        The array is the underlying storage: modifying it in place
+        fixes / unfixes the variables.
+
+        """
+        self._sync_arrays()
+        if _ModelChangeObservers.observers:
+            # The caller may fix / unfix the variables in place
+            _ModelChangeObservers.notify('var_changed', self)
+        return self._fixed_array
+
+    def _domains(self):
+        """Generate (positions, domain) tuples for all variables"""
+        if not self._domain_map:
+            yield slice(None), self._domain_default
+            return
+        positions = np.fromiter(self._domain_map, dtype=np.int64)
+        default = np.ones(len(self._value_array), dtype=bool)
+        default[positions] = False
+        yield default, self._domain_default
+        for pos, domain in self._domain_map.items():
+            yield pos, domain
+
+    def flag_as_stale(self):
+        """
+        Set the 'stale' attribute of every variable data object to True.
+        """
+        if self._stale_array is not None:
+            self._stale_array[:] = 0
+
+    def get_values(self, include_fixed_values=True):
+        """
+        Return a dictionary of index-value pairs.
+        """
+        self._sync_arrays()
+        vals = (None if v != v else v for v in self._value_array.tolist())
+        if include_fixed_values:
+            return dict(zip(self._index_set, vals))
+        return {
+            idx: val
+            for idx, val, fixed in zip(
+                self._index_set, vals, self._fixed_array.tolist()
+            )
+            if not fixed
+        }
+
+    extract_values = get_values
+
+    def set_values(self, new_values, skip_validation=False):
+        """
+        Set the values of a dictionary.
+
+        The default behavior is to validate the values in the
+        dictionary.
+        """
+        self._sync_arrays()
+        ordinal = self._index_set.ord
+        positions = np.fromiter(
+            (ordinal(self._validate_index(idx)) - 1 for idx in new_values),
+            dtype=np.int64,
+            count=len(new_values),
+        )
+        self._set_values(positions, list(new_values.values()), skip_validation)
+
+    def setlb(self, val):
+        """
+        Set the lower bound for this variable.
+        """
+        self._sync_arrays()
+        self._lb_array[:] = self._process_bound_value(val, 'lower')
+        if _ModelChangeObservers.observers:
+            _ModelChangeObservers.notify('var_changed', self)
+
+    def setub(self, val):
+        """
+        Set the upper bound for this variable.
+        """
+        self._sync_arrays()
+        self._ub_array[:] = self._process_bound_value(val, 'upper')
+        if _ModelChangeObservers.observers:
+            _ModelChangeObservers.notify('var_changed', self)
+
+    def fix(self, value=NOTSET, skip_validation=False):
+        """Fix all variables in this :class:`ArrayIndexedVar` (treat as nonvariable)
+
+        This sets the :attr:`fixed` indicator to True for every variable
+        in this ArrayIndexedVar.  If ``value`` is provided, the value
+        (and the ``skip_validation`` flag) are first passed to
+        :meth:`set_values_array`.
+
+        """
+        self._sync_arrays()
+        self._fixed_array[:] = True
+        if value is not NOTSET:
+            self._set_values(slice(None), value, skip_validation)
+        if _ModelChangeObservers.observers:
+            _ModelChangeObservers.notify('var_changed', self)
+
+    def unfix(self):
+        """Unfix all variables in this :class:`ArrayIndexedVar` (treat as variable)
+
+        This sets the :attr:`VarData.fixed` indicator to False for
+        every variable in this :class:`ArrayIndexedVar`.
+
+        """
+        self._sync_arrays()
+        self._fixed_array[:] = False
+        if _ModelChangeObservers.observers:
+            _ModelChangeObservers.notify('var_changed', self)
+
+    @property
+    def domain(self):
+        return IndexedVar.domain.fget(self)
+
+    @domain.setter
+    def domain(self, domain):
+        """Sets the domain for all variables in this container."""
+        domain_rule = SetInitializer(domain)
+        if domain_rule.constant():
+            try:
+                domain = domain_rule(self.parent_block(), None, self)
+            except:
+                logger.error(
+                    "%s is not a valid domain. Variable domains must be an "
+                    "instance of a Pyomo Set or convertible to a Pyomo Set."
+                    % (domain,),
+                    extra={'id': 'E2001'},
+                )
+                raise
+            self._domain_default = domain
+            self._domain_map = {}
+            if _ModelChangeObservers.observers:
+                _ModelChangeObservers.notify('var_changed', self)
+        else:
+            IndexedVar.domain.fset(self, domain)
+
+    def _pprint(self):
+        headers, _, labels, fcn = super()._pprint()
+        return headers, self.items(), labels, fcn
+
+
 @ModelComponentFactory.register("List of decision variables.")
 class VarList(IndexedVar):
     """
@@ -130,6 +130,7 @@ from .numeric_expr import (
     linear_expression,
     nonlinear_expression,
     mutable_expression,
+    intern_expressions,
 )
 from .numvalue import (
     as_numeric,
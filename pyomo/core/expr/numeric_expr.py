@@ -13,6 +13,7 @@ import collections
 import logging
 import math
 import operator
+import threading
 
 logger = logging.getLogger('pyomo.core')
 
@@ -216,6 +217,179 @@ class linear_expression(mutable_expression):
     """
 
 
+class intern_expressions(object):
+    """Context manager for interning (hash-consing) expression nodes.
+
+    While this context is active, the arithmetic operators and the
+    intrinsic functions (e.g., :py:func:`exp`) return an existing node
+    instead of creating a new node that is structurally identical to
+    it.  Rules that repeatedly generate the same subexpression (e.g.,
+    the same ``a[i]*x[i]`` term appearing in many constraints) then
+    share a single node, reducing the model memory and allowing
+    consumers to recognize shared subexpressions by identity.
+
+    Nodes are identical if they have the same type, the same (already
+    interned) arguments, and the same node data (e.g., the function
+    for a :py:class:`UnaryFunctionExpression`).  N-ary sums are built
+    incrementally (and rarely repeated), and are not interned.
+
+    The intern table holds references to all nodes generated within
+    the context until the (outermost) context exits.  Nested contexts
+    share the table of the outermost context.
+
+    Interning is scoped to the thread that entered the context: each
+    thread has its own intern table, and nodes generated by other
+    threads (e.g., the writer threads started by
+    :py:meth:`solve_async()
+    <pyomo.contrib.solver.common.base.SolverBase.solve_async>`) are not
+    interned.  However, the operator dispatchers are replaced
+    process-wide while any thread is within the context, so all threads
+    pay the (small) cost of the interning wrapper.
+
+    Example
+    -------
+
+    >>> m = ConcreteModel()
+    >>> m.x = Var([1, 2])
+    >>> with intern_expressions():
+    ...     e1 = 2 * m.x[1] * m.x[2] + 1
+    ...     e2 = 2 * m.x[1] * m.x[2] - 1
+    >>> e1.arg(0) is e2.arg(0)
+    True
+
+    """
+
+    def __enter__(self):
+        tid = threading.get_ident()
+        with _intern_lock:
+            table = _intern_tables.get(tid, None)
+            if table is None:
+                if not _intern_tables:
+                    _globals = globals()
+                    for name in _interned_dispatchers:
+                        _globals[name] = _InterningDispatcher(_globals[name])
+                table = _intern_tables[tid] = _InternTable()
+            table.depth += 1
+        return self
+
+    def __exit__(self, *args):
+        tid = threading.get_ident()
+        with _intern_lock:
+            table = _intern_tables[tid]
+            table.depth -= 1
+            if not table.depth:
+                del _intern_tables[tid]
+                if not _intern_tables:
+                    _globals = globals()
+                    for name in _interned_dispatchers:
+                        _globals[name] = _globals[name].dispatcher
+
+
+class _InternTable(object):
+    __slots__ = ('depth', 'nodes', 'node_slots')
+
+    def __init__(self):
+        self.depth = 0
+        # map of node key -> (canonical) node
+        self.nodes = {}
+        # map of node type -> additional slots that are part of the
+        # node key (or None if the type is not interned)
+        self.node_slots = {}
+
+    def intern(self, node):
+        cls = node.__class__
+        slots = self.node_slots.get(cls, 0)
+        if slots == 0:
+            slots = self.node_slots[cls] = self._node_slots(node)
+        if slots is None:
+            return node
+        # Note that the node holds references to its arguments, so the
+        # argument ids remain valid as long as the node is in the table
+        key = (
+            cls,
+            tuple(
+                (arg.__class__, arg) if arg.__class__ in native_types else id(arg)
+                for arg in node._args_
+            ),
+        )
+        if slots:
+            key += tuple(getattr(node, slot) for slot in slots)
+        return self.nodes.setdefault(key, node)
+
+    @staticmethod
+    def _node_slots(node):
+        if (
+            not isinstance(node, ExpressionBase)
+            or node.is_named_expression_type()
+            or hasattr(node, '__dict__')
+        ):
+            return None
+        slots = []
+        for base in node.__class__.__mro__:
+            base_slots = base.__dict__.get('__slots__', ())
+            if base_slots.__class__ is str:
+                base_slots = (base_slots,)
+            slots.extend(base_slots)
+        if '_nargs' in slots:
+            # N-ary (and mutable) sums
+            return None
+        return tuple(slot for slot in slots if slot not in ('_args_', '__weakref__'))
+
+
+class _InterningDispatcher(dict):
+    """Operator dispatcher that interns the results of another dispatcher
+
+    Results are interned into the intern table of the calling thread
+    (and returned unchanged if the calling thread is not within an
+    :py:class:`intern_expressions` context).
+
+    """
+
+    __slots__ = ('dispatcher',)
+
+    def __init__(self, dispatcher):
+        self.dispatcher = dispatcher
+
+    def __missing__(self, key):
+        # Note: this may return one of the "_register_new_*_handler"
+        # functions, which will (re)register the actual handler through
+        # __setitem__.  As the registration function is wrapped, the
+        # node it returns (the first node generated for these argument
+        # types) is interned like all others.
+        ans = self._wrap(self.dispatcher[key])
+        dict.__setitem__(self, key, ans)
+        return ans
+
+    def __setitem__(self, key, handler):
+        self.dispatcher[key] = handler
+        dict.__setitem__(self, key, self._wrap(handler))
+
+    @staticmethod
+    def _wrap(handler):
+        def interning_handler(*args):
+            table = _intern_tables.get(threading.get_ident(), None)
+            if table is None:
+                return handler(*args)
+            return table.intern(handler(*args))
+
+        return interning_handler
+
+
+# map of thread id -> _InternTable for the threads within an
+# intern_expressions context
+_intern_tables = {}
+_intern_lock = threading.Lock()
+_interned_dispatchers = (
+    '_add_dispatcher',
+    '_mul_dispatcher',
+    '_div_dispatcher',
+    '_pow_dispatcher',
+    '_neg_dispatcher',
+    '_abs_dispatcher',
+    '_fcn_dispatcher',
+)
+
+
 class NumericValue(PyomoObject):
     """
     This is the base class for numeric values used in Pyomo.
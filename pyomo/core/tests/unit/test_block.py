@@ -14,6 +14,7 @@
 
 from io import StringIO
 import logging
+import multiprocessing
 import os
 import sys
 import types
@@ -60,6 +61,7 @@ from pyomo.core.base.block import (
     declare_custom_block,
 )
 import pyomo.core.expr as EXPR
+from pyomo.core.expr.compare import assertExpressionsEqual
 from pyomo.opt import check_available_solvers
 
 from pyomo.gdp import Disjunct
@@ -2301,6 +2303,142 @@ class TestBlock(unittest.TestCase):
         )
         self.assertEqual(test, ref)
 
+    def test_component_data_objects_cache(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3])
+        m.b = Block([1, 2])
+        for b in m.b.values():
+            b.c = Constraint([1, 2, 3], rule=lambda b, i: m.x[i] >= i)
+        m.c = Constraint(expr=m.x[1] <= 10)
+
+        def names(**kwds):
+            return [
+                c.name
+                for c in m.component_data_objects(Constraint, active=True, **kwds)
+            ]
+
+        ref = ['c'] + ['b[%s].c[%s]' % (i, j) for i in (1, 2) for j in (1, 2, 3)]
+        self.assertEqual(names(), ref)
+        # Cache hit
+        self.assertEqual(names(), ref)
+        # Structural changes are reflected
+        m.b[1].c[2].deactivate()
+        ref.remove('b[1].c[2]')
+        self.assertEqual(names(), ref)
+        m.b[2].deactivate()
+        ref = ref[:3]
+        self.assertEqual(names(), ref)
+        m.b[2].activate()
+        del m.b[2].c[3]
+        m.b[2].d = Constraint(expr=m.x[2] == 1)
+        ref += ['b[2].c[1]', 'b[2].c[2]', 'b[2].d']
+        self.assertEqual(names(), ref)
+        m.b[1].del_component('c')
+        ref = ['c', 'b[2].c[1]', 'b[2].c[2]', 'b[2].d']
+        self.assertEqual(names(), ref)
+        self.assertEqual(names(sort=True), ref)
+        self.assertEqual(
+            [c.name for c in m.component_data_objects(Constraint, active=False)], []
+        )
+        # Data added directly to the _data dict are detected
+        m.b[2].c._data[3] = m.b[2].c._ComponentDataClass(m.x[3] >= 0, m.b[2].c)
+        m.b[2].c._data[3]._index = 3
+        ref.insert(3, 'b[2].c[3]')
+        self.assertEqual(names(), ref)
+
+        # Changes while iterating over a cached traversal
+        self.assertEqual(names(), ref)
+        ans = []
+        for c in m.component_data_objects(Constraint, active=True):
+            ans.append(c.name)
+            if c.name == 'b[2].c[1]':
+                m.b[2].c[2].deactivate()
+                del m.b[2].c[3]
+        self.assertEqual(ans, ['c', 'b[2].c[1]', 'b[2].d'])
+
+    def test_component_data_objects_cache_by_ctype(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2])
+        m.o = Objective(expr=m.x[1])
+        m.b = Block()
+        m.b.o = Objective(expr=m.x[2])
+        m.c = Constraint(expr=m.x[1] >= 0)
+
+        walk = BlockData._component_data_itervalues
+
+        def objectives():
+            with unittest.mock.patch.object(
+                BlockData, '_component_data_itervalues', autospec=True, side_effect=walk
+            ) as walked:
+                ans = [o.name for o in m.component_data_objects(Objective, active=True)]
+            return ans, walked.called
+
+        self.assertEqual(objectives(), (['o', 'b.o'], True))
+        self.assertEqual(objectives(), (['o', 'b.o'], False))
+        # Changes to other component types do not invalidate the cache
+        m.c.deactivate()
+        m.d = Constraint([1, 2], rule=lambda m, i: m.x[i] <= 1)
+        del m.d[1]
+        self.assertEqual(objectives(), (['o', 'b.o'], False))
+        # ... but changes to the traversed types and the blocks do
+        m.b.o.deactivate()
+        self.assertEqual(objectives(), (['o'], True))
+        self.assertEqual(objectives(), (['o'], False))
+        m.b2 = Block()
+        m.b2.o = Objective(expr=m.x[2])
+        self.assertEqual(objectives(), (['o', 'b2.o'], True))
+        m.b2.deactivate()
+        self.assertEqual(objectives(), (['o'], True))
+        m.c.activate()
+        self.assertEqual(objectives(), (['o'], False))
+        m.reclassify_component_type(m.c, Objective)
+        self.assertEqual(objectives(), (['o', 'c'], True))
+
+    @unittest.skipUnless(
+        'fork' in multiprocessing.get_all_start_methods(),
+        "parallel block construction requires the 'fork' start method",
+    )
+    def test_parallel_construction(self):
+        def build(parallel):
+            m = ConcreteModel()
+            m.x = Var([1, 2, 3], bounds=(0, 10))
+
+            def rule(b, s):
+                b.y = Var(range(4), bounds=(0, s))
+                b.c = Constraint(range(4), rule=lambda b, i: b.y[i] + m.x[s] >= s)
+                b.e = Expression(expr=sum(b.y.values()))
+                b.sub = Block()
+                b.sub.z = Var()
+                b.sub.c = Constraint(expr=b.sub.z == b.y[0] + m.x[1])
+
+            m.b = Block([3, 1, 2], rule=rule, parallel=parallel)
+            m.o = Objective(expr=sum(b.e for b in m.b.values()))
+            return m
+
+        serial = build(None)
+        m = build(2)
+        self.assertEqual(list(m.b.keys()), [3, 1, 2])
+        self.assertEqual(
+            [c.name for c in m.component_objects(descend_into=True)],
+            [c.name for c in serial.component_objects(descend_into=True)],
+        )
+        for s in m.b:
+            self.assertIs(m.b[s].parent_component(), m.b)
+            self.assertIs(m.b[s].parent_block(), m)
+            self.assertEqual(m.b[s].index(), s)
+            self.assertIs(m.b[s].sub.parent_block(), m.b[s])
+            self.assertIs(m.b[s].c[2].body.args[1], m.x[s])
+            self.assertEqual(
+                ComponentSet(EXPR.identify_variables(m.b[s].sub.c.body)),
+                ComponentSet([m.b[s].sub.z, m.b[s].y[0], m.x[1]]),
+            )
+            self.assertEqual(m.b[s].y[3].ub, s)
+        # Component rules declared within the block rule were returned
+        self.assertEqual(str(m.b[2].c.rule(m.b[2], 0)), "2  <=  b[2].y[0] + x[2]")
+        # Models built in parallel can be cloned
+        i = m.clone()
+        self.assertIs(i.b[1].c[0].body.args[1], i.x[1])
+
     def test_deepcopy(self):
         m = ConcreteModel()
         m.x = Var()
@@ -2532,6 +2670,34 @@ class TestBlock(unittest.TestCase):
             self.assertIs(m.d[i].parent_component(), m.d)
             self.assertIs(m.d[i].parent_block(), m)
 
+    def test_clone_expressions_and_state(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2], bounds=(0, 5), initialize=1)
+        m.p = Param(mutable=True, initialize=3)
+        m.c = Constraint(expr=m.p * m.x[1] + EXPR.exp(m.x[2]) <= 10)
+        m.b = Block()
+        m.b.y = Var()
+        m.b.c = Constraint(expr=m.b.y + (m.x[1] + m.x[2]) ** 2 >= 0)
+
+        n = m.clone()
+        assertExpressionsEqual(self, n.c.expr, n.p * n.x[1] + EXPR.exp(n.x[2]) <= 10)
+        self.assertIsNot(n.c.body, m.c.body)
+        # Mutable state is not shared
+        n.x[1].value = 4
+        n.x[2].setub(3)
+        n.p = 5
+        n.c.deactivate()
+        self.assertEqual(m.x[1].value, 1)
+        self.assertEqual(m.x[2].ub, 5)
+        self.assertEqual(m.p.value, 3)
+        self.assertTrue(m.c.active)
+
+        # Components outside the cloned block are referenced (not
+        # duplicated) by the cloned expressions
+        nb = m.b.clone()
+        self.assertIsNot(nb.c.body, m.b.c.body)
+        assertExpressionsEqual(self, nb.c.expr, nb.y + (m.x[1] + m.x[2]) ** 2 >= 0)
+
     def test_clone_unclonable_attribute(self):
         class foo(object):
             def __deepcopy__(bogus):
@@ -21,8 +21,11 @@ from pyomo.environ import (
     Block,
     Var,
     Set,
+    Param,
+    Constraint,
     ModelComponentFactory,
 )
+from pyomo.core.base.component import _ModelChangeObservers
 from pyomo.core.base.set import GlobalSets
 
 
@@ -112,6 +115,70 @@ class TestComponent(unittest.TestCase):
         self.assertFalse(m.comp.is_reference())
 
 
+class _RecordingObserver(object):
+    def __init__(self):
+        self.events = []
+
+    def structure_changed(self, obj):
+        self.events.append(('structure_changed', obj))
+
+    def var_changed(self, obj):
+        self.events.append(('var_changed', obj))
+
+    def param_changed(self, obj):
+        self.events.append(('param_changed', obj))
+
+    def expression_changed(self, obj):
+        self.events.append(('expression_changed', obj))
+
+
+class TestModelChangeObservers(unittest.TestCase):
+    def test_notifications(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2])
+        m.p = Param(mutable=True, initialize=1)
+        obs = _RecordingObserver()
+        _ModelChangeObservers.register(obs)
+        try:
+            m.x[1].setlb(0)
+            m.x[2].fix(3)
+            m.x[1].set_value(2)
+            m.p = 5
+            m.c = Constraint(expr=m.x[1] >= m.p)
+            c = m.c
+            c.set_value(m.x[2] >= m.p)
+            c.deactivate()
+            m.del_component(c)
+        finally:
+            _ModelChangeObservers.unregister(obs)
+        m.x[1].setub(4)
+        self.assertEqual(
+            [(e, id(o)) for e, o in obs.events],
+            [
+                ('var_changed', id(m.x[1])),
+                # fix() sets both the fixed flag and the value
+                ('var_changed', id(m.x[2])),
+                ('var_changed', id(m.x[2])),
+                ('param_changed', id(m.p)),
+                # construction sets the expression and adds the component
+                ('expression_changed', id(c)),
+                ('structure_changed', id(c)),
+                ('structure_changed', id(c)),
+                ('expression_changed', id(c)),
+                ('structure_changed', id(c)),
+                ('structure_changed', id(c)),
+            ],
+        )
+
+    def test_weak_registration(self):
+        obs = _RecordingObserver()
+        n = len(_ModelChangeObservers.observers)
+        _ModelChangeObservers.register(obs)
+        self.assertEqual(len(_ModelChangeObservers.observers), n + 1)
+        del obs
+        self.assertEqual(len(_ModelChangeObservers.observers), n)
+
+
 class TestEnviron(unittest.TestCase):
     def test_components(self):
         self.assertGreaterEqual(
@@ -979,6 +979,61 @@ class TestArrayCon(unittest.TestCase):
         model.A = Set(initialize=[1, 2, 3, 4])
         return model
 
+    def test_lazy_construction(self):
+        model = self.create_model()
+        model.x = Var(model.A)
+        calls = []
+
+        def f(model, i):
+            calls.append(i)
+            if i == 2:
+                return Constraint.Skip
+            return model.x[i] >= i
+
+        model.c = Constraint(model.A, rule=f, lazy=True)
+        self.assertEqual(calls, [])
+        self.assertEqual(model.c[3].lower, 3)
+        self.assertEqual(calls, [3])
+        self.assertNotIn(2, model.c)
+        self.assertIn(4, model.c)
+        self.assertEqual(calls, [3, 2, 4])
+        with self.assertRaises(KeyError):
+            model.c[5]
+        # Data generated by the rule after deactivation is inactive
+        model.c.deactivate()
+        self.assertFalse(model.c[3].active)
+        self.assertFalse(model.c[1].active)
+        model.c.activate()
+        # Iteration generates the remaining data (in index order) and
+        # does not revisit indices that were already processed
+        self.assertEqual(list(model.c.keys()), [1, 3, 4])
+        self.assertEqual(calls, [3, 2, 4, 1])
+        self.assertEqual(len(model.c), 3)
+        self.assertTrue(all(c.active for c in model.c.values()))
+
+    def test_lazy_construction_setitem_delitem(self):
+        model = self.create_model()
+        model.x = Var(model.A)
+        model.c = Constraint(model.A, rule=lambda m, i: m.x[i] >= i, lazy=True)
+        model.c[1] = model.x[1] <= 10
+        del model.c[2]
+        model.c[3] = Constraint.Skip
+        self.assertEqual(list(model.c.keys()), [1, 4])
+        self.assertEqual(model.c[1].upper, 10)
+        self.assertIsNone(model.c[1].lower)
+        self.assertEqual(model.c[4].lower, 4)
+
+    def test_lazy_construction_clone(self):
+        model = self.create_model()
+        model.x = Var(model.A)
+        model.c = Constraint(model.A, rule=lambda m, i: m.x[i] >= i, lazy=True)
+        model.c[2]
+        inst = model.clone()
+        self.assertEqual(len(inst.c._data), 1)
+        self.assertEqual(len(inst.c), 4)
+        self.assertIs(inst.c[4].body, inst.x[4])
+        self.assertEqual(len(model.c._data), 1)
+
     def test_rule_option1(self):
         model = self.create_model()
         model.B = RangeSet(1, 4)
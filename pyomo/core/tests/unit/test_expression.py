@@ -470,6 +470,24 @@ E : Size=2
         with self.assertRaises(KeyError):
             model.E.store_values({3: 3.0})
 
+    def test_lazy_construction(self):
+        model = ConcreteModel()
+        model.x = Var([1, 2, 3], initialize=2)
+        calls = []
+
+        def rule(m, i):
+            calls.append(i)
+            return m.x[i] * i
+
+        model.e = Expression([1, 2, 3], rule=rule, lazy=True)
+        self.assertEqual(calls, [])
+        self.assertEqual(value(model.e[2]), 4)
+        self.assertEqual(calls, [2])
+        model.e.store_values({3: model.x[3] + 1})
+        self.assertEqual(calls, [2, 1, 3])
+        self.assertEqual({k: value(v) for k, v in model.e.items()}, {1: 2, 2: 4, 3: 3})
+        self.assertEqual(calls, [2, 1, 3])
+
     def test_setitem(self):
         model = ConcreteModel()
         model.E = Expression([1])
@@ -9,10 +9,15 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import io
+import pickle
+
 import pyomo.common.unittest as unittest
 import pyomo.environ as pyo
 
-from pyomo.core.base.matrix_constraint import MatrixConstraint
+from pyomo.common.dependencies import numpy as np, numpy_available, scipy_available
+from pyomo.core.base.matrix_constraint import MatrixConstraint, MatrixConstraintData
+from pyomo.core.expr.relational_expr import InequalityExpression
 
 
 def _create_variable_list(size, **kwds):
@@ -29,6 +34,7 @@ def _get_csr(m, n, value):
     return data, indices, indptr
 
 
+@unittest.skipUnless(numpy_available, "numpy is not available")
 class TestMatrixConstraint(unittest.TestCase):
     def test_init(self):
         m = pyo.ConcreteModel()
@@ -93,6 +99,151 @@ class TestMatrixConstraint(unittest.TestCase):
             self.assertEqual(c.upper, 1)
             self.assertEqual(c.equality, True)
 
+    def test_init_matrix(self):
+        m = pyo.ConcreteModel()
+        m.v = pyo.Var(range(3), initialize=2)
+        m.c = MatrixConstraint([[1, -1, 0], [0, 2, -1]], lb=[None, -1], ub=0, x=m.v)
+        self.assertEqual(list(m.c.keys()), [0, 1])
+        self.assertIs(type(m.c[0]), MatrixConstraintData)
+        self.assertEqual(list(m.c.lb), [-float('inf'), -1])
+        self.assertEqual(list(m.c.ub), [0, 0])
+        self.assertEqual(m.c.x, tuple(m.v.values()))
+        self.assertEqual(list(m.c[1].terms), [(m.v[1], 2), (m.v[2], -1)])
+        self.assertEqual(m.c[0].lb, None)
+        self.assertEqual(m.c[0].ub, 0)
+        self.assertEqual(m.c[1].lb, -1)
+        self.assertEqual(m.c[1](), 2)
+        self.assertEqual(m.c[1].uslack(), -2)
+        self.assertEqual(m.c[1].lslack(), 3)
+        self.assertEqual(str(m.c[0].expr), "v[0] - v[1]  <=  0.0")
+        self.assertEqual(str(m.c[1].expr), "-1.0  <=  2.0*v[1] - v[2]  <=  0.0")
+        self.assertIsInstance(m.c[0].expr, InequalityExpression)
+
+        m.e = MatrixConstraint(np.eye(3), rhs=[1, 2, 3], x=list(m.v.values()))
+        self.assertEqual(len(m.e), 3)
+        self.assertTrue(all(c.equality for c in m.e.values()))
+        self.assertEqual(str(m.e[2].expr), "v[2]  ==  3.0")
+
+    @unittest.skipUnless(scipy_available, "scipy is not available")
+    def test_init_sparse(self):
+        from pyomo.common.dependencies import scipy
+
+        A = scipy.sparse.coo_array(([1.0, 2.0, 3.0], ([0, 0, 1], [0, 2, 1])), (2, 3))
+        m = pyo.ConcreteModel()
+        m.v = pyo.Var(range(3))
+        m.c = MatrixConstraint(A, lb=1, x=m.v)
+        self.assertEqual(list(m.c._A_indptr), [0, 2, 3])
+        self.assertEqual(list(m.c[0].terms), [(m.v[0], 1), (m.v[2], 2)])
+        self.assertEqual(list(m.c[1].terms), [(m.v[1], 3)])
+        self.assertEqual(m.c.A.toarray().tolist(), A.toarray().tolist())
+
+    def test_init_errors(self):
+        m = pyo.ConcreteModel()
+        m.v = pyo.Var(range(3))
+        with self.assertRaisesRegex(ValueError, "'x' is required"):
+            MatrixConstraint([[1, 2, 3]])
+        with self.assertRaisesRegex(ValueError, "must have length 3"):
+            MatrixConstraint([[1, 2, 3]], x=[m.v[0]])
+        with self.assertRaisesRegex(ValueError, "invalid CSR matrix data"):
+            MatrixConstraint([1, 2], [0, 1], [0, 1], x=m.v)
+        with self.assertRaisesRegex(ValueError, "column index out of range"):
+            MatrixConstraint([1, 2], [0, 3], [0, 2], x=m.v)
+        with self.assertRaisesRegex(ValueError, "'ub' array must have length 1"):
+            MatrixConstraint([[1, 2, 3]], ub=[1, 2], x=m.v)
+        with self.assertRaisesRegex(ValueError, "'rhs' keyword can not be used"):
+            MatrixConstraint([[1, 2, 3]], lb=0, rhs=0, x=m.v)
+        with self.assertRaisesRegex(TypeError, "received 2 positional"):
+            MatrixConstraint([[1, 2, 3]], [0], x=m.v)
+        m.c = MatrixConstraint([[1, 2, 3]], x=m.v)
+        with self.assertRaisesRegex(NotImplementedError, "can not be updated"):
+            m.c[0] = m.v[0] <= 1
+        with self.assertRaisesRegex(NotImplementedError, "can not be removed"):
+            del m.c[0]
+
+    def test_fixed_variables(self):
+        m = pyo.ConcreteModel()
+        m.v = pyo.Var(range(3), initialize=1)
+        m.c = MatrixConstraint([[1, 2, 3]], ub=10, x=m.v)
+        m.v[1].fix(4)
+        repn = m.c[0].canonical_form()
+        self.assertEqual(repn.linear_vars, (m.v[0], m.v[2]))
+        self.assertEqual(repn.linear_coefs, (1, 3))
+        self.assertEqual(repn.constant, 8)
+        self.assertEqual(m.c[0](), 12)
+
+    def test_clone_and_pickle(self):
+        m = pyo.ConcreteModel()
+        m.v = pyo.Var(range(3))
+        m.c = MatrixConstraint([[1, 0, 3], [0, 2, 0]], lb=0, ub=[1, None], x=m.v)
+        m.c[1].deactivate()
+        for i in (m.clone(), pickle.loads(pickle.dumps(m))):
+            self.assertEqual(list(i.c[0].terms), [(i.v[0], 1), (i.v[2], 3)])
+            self.assertIs(i.c[0].parent_component(), i.c)
+            self.assertEqual(i.c[0].ub, 1)
+            self.assertEqual(i.c[1].ub, None)
+            self.assertFalse(i.c[1].active)
+
+    def _writer_models(self):
+        A = [[2, 0, -3, 0], [0, 4, 5, 0], [0, 0, 0, 0], [-2, 0, 0, 7], [3, 3, 0, 0]]
+        lb = [None, -3.0, None, 2.0, 1.5]
+        ub = [4.0, 6.0, None, 2.0, None]
+        models = []
+        for matrix in (True, False):
+            m = pyo.ConcreteModel()
+            m.x = pyo.Var(range(4), bounds=(-5, 5))
+            m.x[2].fix(0.5)
+            m.o = pyo.Objective(expr=sum(m.x.values()))
+            if matrix:
+                m.c = MatrixConstraint(A, lb=lb, ub=ub, x=m.x)
+            else:
+                m.c = pyo.Constraint(range(len(A)))
+                for i, row in enumerate(A):
+                    if lb[i] is None and ub[i] is None:
+                        continue
+                    body = sum(float(a) * m.x[j] for j, a in enumerate(row) if a)
+                    if lb[i] == ub[i]:
+                        m.c[i] = body == ub[i]
+                    else:
+                        m.c[i] = (lb[i], body, ub[i])
+            models.append(m)
+        return models
+
+    def test_lp_writer(self):
+        from pyomo.repn.plugins.lp_writer import LPWriter
+
+        out = []
+        for m in self._writer_models():
+            OUT = io.StringIO()
+            LPWriter().write(m, OUT, symbolic_solver_labels=True)
+            out.append(OUT.getvalue())
+        self.assertEqual(*out)
+
+    def test_nl_writer(self):
+        from pyomo.repn.plugins.nl_writer import NLWriter
+
+        out = []
+        for m in self._writer_models():
+            OUT = io.StringIO()
+            NLWriter().write(m, OUT, symbolic_solver_labels=True)
+            out.append(OUT.getvalue())
+        self.assertEqual(*out)
+
+    @unittest.skipUnless(scipy_available, "scipy is not available")
+    def test_standard_form(self):
+        from pyomo.repn.plugins.standard_form import LinearStandardFormCompiler
+
+        # Note: hold on to the models so that the row names resolve
+        models = self._writer_models()
+        for opts in ({}, {'mixed_form': True}, {'slack_form': True}):
+            a, b = [LinearStandardFormCompiler().write(m, **opts) for m in models]
+            self.assertEqual(a.A.toarray().tolist(), b.A.toarray().tolist())
+            self.assertEqual(list(a.rhs), list(b.rhs))
+            self.assertEqual(
+                [(r.constraint.name, r.bound_type) for r in a.rows],
+                [(r.constraint.name, r.bound_type) for r in b.rows],
+            )
+            self.assertEqual([v.name for v in a.columns], [v.name for v in b.columns])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -16,6 +16,7 @@ import copy
 import pickle
 import math
 import os
+import threading
 from collections import defaultdict
 
 from os.path import abspath, dirname, join
@@ -103,7 +104,9 @@ from pyomo.core.expr.numeric_expr import (
     MaxExpression,
     MinExpression,
     _balanced_parens,
+    intern_expressions,
 )
+from pyomo.core.expr import numeric_expr
 from pyomo.core.expr.relational_expr import RelationalExpression, EqualityExpression
 from pyomo.core.expr.relational_expr import RelationalExpression, EqualityExpression
 from pyomo.common.errors import PyomoException
@@ -5731,5 +5734,119 @@ class TestEvaluation(unittest.TestCase):
         self.assertEqual(os.getvalue(), '')
 
 
+class TestInternExpressions(unittest.TestCase):
+    def test_intern_nodes(self):
+        m = ConcreteModel()
+        m.a = Param([1, 2], initialize=2, mutable=True)
+        m.x = Var([1, 2])
+        with intern_expressions():
+            e1 = m.a[1] * m.x[1] + exp(m.x[2])
+            e2 = m.a[1] * m.x[1] - exp(m.x[2])
+            e3 = m.a[2] * m.x[1]
+            e4 = m.x[1] ** 2 / (m.x[1] ** 2)
+            e5 = -(m.x[2] ** 2)
+            e6 = -(m.x[2] ** 2)
+        self.assertIs(e1.arg(0), e2.arg(0))
+        self.assertIs(e1.arg(1), e2.arg(1).arg(0))
+        self.assertIsNot(e1.arg(0), e3)
+        self.assertIs(e4.arg(0), e4.arg(1))
+        self.assertIs(e5, e6)
+
+        # Nodes are not interned outside the context
+        self.assertIsNot(m.a[1] * m.x[1], m.a[1] * m.x[1])
+        self.assertIsNot(exp(m.x[2]), exp(m.x[2]))
+
+    def test_intern_node_data(self):
+        m = ConcreteModel()
+        m.x = Var()
+        with intern_expressions():
+            self.assertIs(exp(m.x), exp(m.x))
+            self.assertIsNot(exp(m.x), log(m.x))
+            self.assertIs(m.x**2, m.x**2)
+            e1 = m.x**2
+            e2 = m.x**2.0
+            e3 = m.x**2.5
+        self.assertIsNot(e1, e2)
+        self.assertIs(e1.arg(1).__class__, int)
+        self.assertIs(e2.arg(1).__class__, float)
+        self.assertIsNot(e2, e3)
+
+    def test_sums_not_interned(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2])
+        with intern_expressions():
+            e1 = m.x[1] + m.x[2]
+            e2 = m.x[1] + m.x[2]
+            e1 += 1
+        self.assertIsNot(e1, e2)
+        self.assertEqual(e1.nargs(), 3)
+        self.assertEqual(e2.nargs(), 2)
+
+    def test_nested_contexts(self):
+        m = ConcreteModel()
+        m.x = Var()
+        base = numeric_expr._mul_dispatcher
+        with intern_expressions():
+            e1 = m.x * m.x
+            with intern_expressions():
+                e2 = m.x * m.x
+            e3 = m.x * m.x
+            self.assertIsNot(numeric_expr._mul_dispatcher, base)
+        self.assertIs(e1, e2)
+        self.assertIs(e1, e3)
+        self.assertIs(numeric_expr._mul_dispatcher, base)
+        self.assertEqual(numeric_expr._intern_tables, {})
+
+    def test_first_node_interned(self):
+        # The first node generated for a pair of argument types is
+        # returned by the handler registration function
+        m = ConcreteModel()
+        m.x = Var()
+        m.p = Param(mutable=True, initialize=2)
+        for name in numeric_expr._interned_dispatchers:
+            getattr(numeric_expr, name).clear()
+        with intern_expressions():
+            e1 = m.p * m.x
+            e2 = m.p * m.x
+            e3 = abs(m.x)
+            e4 = abs(m.x)
+        self.assertIs(e1, e2)
+        self.assertIs(e3, e4)
+
+    def test_thread_scope(self):
+        m = ConcreteModel()
+        m.x = Var()
+        ans = {}
+
+        def other_thread():
+            # Nodes generated by other threads are not interned...
+            ans['outside'] = (m.x * m.x, m.x * m.x)
+            # ...unless the thread enters its own context
+            with intern_expressions():
+                ans['inside'] = (m.x * m.x, m.x * m.x)
+
+        with intern_expressions():
+            e1 = m.x * m.x
+            t = threading.Thread(target=other_thread)
+            t.start()
+            t.join()
+            self.assertIs(e1, m.x * m.x)
+        self.assertIsNot(*ans['outside'])
+        self.assertIs(*ans['inside'])
+        self.assertIsNot(ans['inside'][0], e1)
+        self.assertEqual(numeric_expr._intern_tables, {})
+
+    def test_new_handlers_registered(self):
+        m = ConcreteModel()
+        m.x = Var()
+        with intern_expressions():
+            e1 = m.x * m.x
+            self.assertIn((m.x.__class__, m.x.__class__), numeric_expr._mul_dispatcher)
+        # Handlers discovered within the context are retained by the
+        # base dispatcher
+        self.assertIn((m.x.__class__, m.x.__class__), numeric_expr._mul_dispatcher)
+        self.assertIsNot(e1, m.x * m.x)
+
+
 if __name__ == "__main__":
     unittest.main()
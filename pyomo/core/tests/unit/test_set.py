@@ -108,6 +108,7 @@ from pyomo.environ import (
     Suffix,
     Constraint,
     Objective,
+    SortComponents,
 )
 
 
@@ -3465,6 +3466,51 @@ J : Size=1, Index=None, Ordered=False
         self.assertIn((2, 5), m.Z)
         self.assertNotIn((2, 5, 3), m.Z)
 
+    def test_nested_setproduct_positions(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[3, 1, 2])
+        m.J = Set(initialize=[(1, 'a'), (2, 'b')])
+        m.K = RangeSet(4)
+        m.Z = (m.I * m.J) * (m.K * m.I)
+        self.assertEqual(m.Z.dimen, 5)
+        ref = [
+            (i,) + j + (k, l) for i, j, k, l in itertools.product(m.I, m.J, m.K, m.I)
+        ]
+        self.assertEqual(len(m.Z), len(ref))
+        self.assertEqual(list(m.Z), ref)
+        self.assertEqual(list(reversed(m.Z)), ref[::-1])
+        self.assertEqual(m.Z.first(), ref[0])
+        self.assertEqual(m.Z.last(), ref[-1])
+        for i, val in enumerate(ref):
+            self.assertIn(val, m.Z)
+            self.assertEqual(m.Z.ord(val), i + 1)
+            self.assertEqual(m.Z.at(i + 1), val)
+        self.assertIn((3, (1, 'a'), 2, 1), m.Z)
+        self.assertEqual(m.Z.ord((3, (1, 'a'), 2, 1)), 5)
+        self.assertNotIn((3, 1, 'b', 2, 1), m.Z)
+        self.assertNotIn((3, 1, 'a', 5, 1), m.Z)
+        self.assertNotIn((3, 1, 'a', 2), m.Z)
+        with self.assertRaisesRegex(IndexError, "item not in Set"):
+            m.Z.ord((3, 1, 'a', 5, 1))
+
+    def test_sparse_component_keys_over_setproduct(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[5, 3, 1, 4, 2])
+        m.J = RangeSet(100)
+        m.x = Var(m.I, m.J, m.I, dense=False)
+        for idx in [(2, 7, 1), (5, 1, 4), (1, 10, 5), (5, 1, 5)]:
+            m.x[idx]
+        ref = [(5, 1, 5), (5, 1, 4), (1, 10, 5), (2, 7, 1)]
+        self.assertEqual(list(m.x.keys()), ref)
+        self.assertEqual(list(m.x.keys(SortComponents.ORDERED_INDICES)), ref)
+        self.assertEqual(list(m.x.keys(True)), sorted(ref))
+
+        # Data that is no longer in the index set is silently skipped
+        m.I.remove(3)
+        m.x[2, 7, 2]
+        m.I.remove(2)
+        self.assertEqual(list(m.x.keys()), ref[:3])
+
 
 class TestGlobalSets(unittest.TestCase):
     def test_globals(self):
@@ -5505,6 +5551,174 @@ I : Size=2, Index={1, 2, 3, 4, 5}, Ordered=Insertion
             normalize_index.flatten = _oldFlatten
 
 
+@unittest.skipUnless(
+    SetModule.compact_storage_available(), "compact Set storage not available"
+)
+class TestCompactSetStorage(unittest.TestCase):
+    def setUp(self):
+        self._threshold = SetModule.OrderedSetData._compact_threshold
+        SetModule.OrderedSetData._compact_threshold = 10
+
+    def tearDown(self):
+        SetModule.OrderedSetData._compact_threshold = self._threshold
+
+    def test_scalar_members(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[5, 3, -1, 2**40] + list(range(10, 20)), compact=True)
+        self.assertIs(type(m.I._values), SetModule._CompactSetValues)
+        self.assertEqual(len(m.I), 14)
+        self.assertEqual(list(m.I)[:4], [5, 3, -1, 2**40])
+        self.assertEqual(list(reversed(m.I))[-4:], [2**40, -1, 3, 5])
+        self.assertEqual(m.I.at(4), 2**40)
+        self.assertEqual(m.I.ord(-1), 3)
+        self.assertEqual(m.I.ord(3.0), 2)
+        self.assertEqual(m.I.next(3), -1)
+        self.assertIn(3, m.I)
+        self.assertIn(3.0, m.I)
+        self.assertIn(np.int64(3), m.I)
+        self.assertNotIn(4, m.I)
+        self.assertNotIn('3', m.I)
+        self.assertNotIn((3,), m.I._values)
+        with self.assertRaisesRegex(TypeError, 'unhashable'):
+            [3] in m.I._values
+
+        self.assertFalse(m.I.add(3.0))
+        self.assertTrue(m.I.add(2**62))
+        self.assertEqual(m.I.last(), 2**62)
+        m.I.remove(3)
+        self.assertEqual(list(m.I)[:3], [5, -1, 2**40])
+        self.assertEqual(m.I.ord(10), 4)
+        self.assertEqual(m.I.pop(), 2**62)
+        self.assertEqual(len(m.I), 13)
+        self.assertIs(type(m.I._values), SetModule._CompactSetValues)
+
+        # Members that do not fit revert the storage to a dict
+        self.assertTrue(m.I.add(2**70))
+        self.assertIs(type(m.I._values), dict)
+        self.assertEqual(list(m.I)[:3], [5, -1, 2**40])
+        self.assertEqual(m.I.last(), 2**70)
+        self.assertEqual(m.I.ord(10), 4)
+
+    def _longest_probe_run(self, values):
+        # Length of the longest run of occupied slots in the hash table
+        occupied = np.concatenate(([0], values._table != -1, [0]))
+        edges = np.flatnonzero(np.diff(occupied))
+        return (edges[1::2] - edges[::2]).max()
+
+    def test_contiguous_members_and_removal(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=range(4000), compact=True)
+        m.J = Set(
+            initialize=list(range(2000)) + list(range(2**18, 2**18 + 2000)),
+            compact=True,
+        )
+        for s in (m.I, m.J):
+            self.assertIs(type(s._values), SetModule._CompactSetValues)
+            # Contiguous ints must not form a single probe cluster
+            self.assertLess(self._longest_probe_run(s._values), 100)
+        self.assertIn(2**18 + 1999, m.J)
+        self.assertNotIn(2**18 + 2000, m.J)
+
+        for i in range(5, 2005):
+            m.I.remove(i)
+        m.I.discard(5)
+        self.assertNotIn(5, m.I)
+        self.assertNotIn(2004, m.I)
+        self.assertIn(2005, m.I)
+        self.assertEqual(len(m.I), 2000)
+        self.assertLess(self._longest_probe_run(m.I._values), 100)
+        # Removed members can be added back (at the end)
+        self.assertTrue(m.I.add(100))
+        self.assertEqual(m.I.last(), 100)
+        self.assertEqual(len(m.I), 2001)
+        self.assertEqual(m.I.at(6), 2005)
+        self.assertEqual(m.I.ord(2005), 6)
+        self.assertEqual(list(m.I), [0, 1, 2, 3, 4] + list(range(2005, 4000)) + [100])
+        self.assertIs(type(m.I._values), SetModule._CompactSetValues)
+
+    def test_tuple_members(self):
+        m = ConcreteModel()
+        data = [(t, n) for t in range(4, 0, -1) for n in range(3)]
+        m.I = Set(initialize=data, compact=True)
+        self.assertIs(type(m.I._values), SetModule._CompactSetValues)
+        self.assertEqual(m.I.dimen, 2)
+        self.assertEqual(list(m.I), data)
+        self.assertEqual(list(reversed(m.I)), data[::-1])
+        self.assertEqual(m.I.at(5), (3, 1))
+        self.assertEqual(m.I.ord((3, 1)), 5)
+        self.assertIn((3, 1.0), m.I)
+        self.assertNotIn((3, 5), m.I)
+        self.assertNotIn(3, m.I)
+
+        m.J = Set(initialize=data, ordered=Set.SortedOrder, compact=True)
+        self.assertIs(type(m.J._values), SetModule._CompactSetValues)
+        self.assertEqual(list(m.J), sorted(data))
+        m.J.add((0, 7))
+        self.assertEqual(m.J.first(), (0, 7))
+        self.assertEqual(m.J.ord((1, 0)), 2)
+
+        m.I.add(('a', 1))
+        self.assertIs(type(m.I._values), dict)
+        self.assertEqual(list(m.I), data + [('a', 1)])
+
+    def test_small_and_mixed_sets(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=range(5), compact=True)
+        self.assertIs(type(m.I._values), dict)
+        m.J = Set(initialize=list(range(20)) + ['a'], compact=True)
+        self.assertIs(type(m.J._values), dict)
+        self.assertEqual(list(m.J), list(range(20)) + ['a'])
+        m.K = Set(initialize=[1.5 * i for i in range(20)], compact=True)
+        self.assertIs(type(m.K._values), dict)
+        m.L = Set(initialize=lambda m: (i * i for i in range(20)), compact=True)
+        self.assertIs(type(m.L._values), SetModule._CompactSetValues)
+        self.assertEqual(list(m.L), [i * i for i in range(20)])
+
+    def test_default_storage(self):
+        # Compact storage is opt-in: large Sets default to a dict
+        m = ConcreteModel()
+        m.I = Set(initialize=range(20))
+        self.assertIs(type(m.I._values), dict)
+        m.J = Set(initialize=m.I * m.I)
+        self.assertIs(type(m.J._values), dict)
+        self.assertEqual(len(m.J), 400)
+        m.K = Set(initialize=range(20), compact=False)
+        self.assertIs(type(m.K._values), dict)
+
+    def test_product_initialization(self):
+        m = ConcreteModel()
+        m.A = Set(initialize=[3, 1, 2])
+        m.B = Set(initialize=[(1, 'a'), (2, 'b')])
+        m.C = Set(initialize=[(5, 6), (7, 8)])
+        m.I = Set(initialize=m.A * m.C * m.A, compact=True)
+        self.assertIs(type(m.I._values), SetModule._CompactSetValues)
+        self.assertEqual(m.I.dimen, 4)
+        self.assertEqual(list(m.I), list(m.A * m.C * m.A))
+        self.assertEqual(m.I.ord((1, 7, 8, 2)), 12)
+
+        m.J = Set(initialize=m.A * m.B * m.A, compact=True)
+        self.assertIs(type(m.J._values), dict)
+        self.assertEqual(list(m.J), list(m.A * m.B * m.A))
+
+        m.K = Set(
+            initialize=m.A * m.C * m.A,
+            filter=lambda m, i, j, k, l: i != l,
+            compact=True,
+        )
+        self.assertEqual(len(m.K), 12)
+
+    def test_clone_and_pickle(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[(i, -i) for i in range(20)], compact=True)
+        m.x = Var(m.I)
+        for model in (m.clone(), pickle.loads(pickle.dumps(m))):
+            self.assertIs(type(model.I._values), SetModule._CompactSetValues)
+            self.assertIsNot(model.I._values._rows, m.I._values._rows)
+            self.assertEqual(list(model.I), list(m.I))
+            self.assertEqual(model.I.ord((3, -3)), 4)
+            self.assertEqual(list(model.x.keys()), list(m.I))
+
+
 class TestAbstractSetAPI(unittest.TestCase):
     def testSetData(self):
         # This tests an anstract non-finite set API
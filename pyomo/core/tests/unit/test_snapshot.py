@@ -0,0 +1,225 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Unit Tests for model snapshots
+#
+
+import os
+from io import StringIO
+
+import pyomo.common.unittest as unittest
+from pyomo.common.dependencies import numpy_available
+from pyomo.common.tempfiles import TempfileManager
+from pyomo.core.base.set import _CompactSetValues
+from pyomo.core.expr.compare import assertExpressionsEqual
+from pyomo.environ import (
+    ConcreteModel,
+    Block,
+    Set,
+    RangeSet,
+    Param,
+    Var,
+    VarList,
+    Expression,
+    Constraint,
+    ConstraintList,
+    Objective,
+    Suffix,
+    Any,
+    Binary,
+    NonNegativeIntegers,
+    Integers,
+    maximize,
+    exp,
+    value,
+    save_snapshot,
+    load_snapshot,
+)
+
+
+@unittest.skipUnless(numpy_available, "numpy is not available")
+class TestSnapshot(unittest.TestCase):
+    def roundtrip(self, m):
+        with TempfileManager.new_context() as tempfile:
+            fname = tempfile.create_tempfile(suffix='.snap')
+            save_snapshot(m, fname)
+            self.assertGreater(os.path.getsize(fname), 0)
+            return load_snapshot(fname)
+
+    def assertSameModel(self, m, n):
+        ref = StringIO()
+        m.pprint(ostream=ref)
+        out = StringIO()
+        n.pprint(ostream=out)
+        self.assertEqual(ref.getvalue(), out.getvalue())
+
+    def test_roundtrip(self):
+        m = ConcreteModel(name='snap')
+        m.I = Set(initialize=[1, 2, 3])
+        m.J = Set(initialize=['b', 'a'], ordered=Set.SortedOrder)
+        m.K = Set(initialize=[(1, 'x'), (2, 'y')], ordered=False)
+        m.R = RangeSet(5)
+        m.S = Set(m.I, initialize={1: [4, 5], 3: [6]})
+        m.p = Param(m.I, initialize={1: 1.5, 2: 2, 3: 3}, mutable=True)
+        m.q = Param(initialize=4)
+        m.r = Param(m.J, initialize={'a': 'A'}, default='?', within=Any)
+        m.x = Var(m.I, m.J, bounds=(0, m.p[1]), initialize=1)
+        m.y = Var(domain=Binary)
+        m.y.fix(1)
+        m.z = Var(m.K, dense=False)
+        m.z[2, 'y'] = 5
+        m.e = Expression(expr=sum(m.x[i, 'a'] for i in m.I) ** 2)
+        m.c = Constraint(m.I, rule=lambda m, i: m.x[i, 'a'] + m.e * m.p[i] <= m.q)
+        m.c[2].deactivate()
+        m.cl = ConstraintList()
+        m.cl.add(exp(m.y) == 1)
+        m.cl.add((0, m.z[2, 'y'], 10))
+        m.o = Objective(expr=m.e + m.y, sense=maximize)
+        m.o.deactivate()
+        m.vl = VarList(domain=NonNegativeIntegers)
+        m.vl.add()
+        m.vl.add().value = 3
+        m.b = Block([1, 2])
+        m.b[1].z = Var(within=m.R)
+        m.b[2].c = Constraint(expr=m.b[1].z >= 1)
+        m.b[2].deactivate()
+
+        n = self.roundtrip(m)
+        self.assertEqual(n.name, 'snap')
+        self.assertSameModel(m, n)
+        for ref, new in zip(
+            m.component_data_objects((Constraint, Objective, Expression)),
+            n.component_data_objects((Constraint, Objective, Expression)),
+        ):
+            self.assertEqual(ref.name, new.name)
+            self.assertEqual(str(ref.expr), str(new.expr))
+
+        # References to Sets, Params, and named expressions are restored
+        self.assertIs(n.x.index_set().subsets(False).__next__(), n.I)
+        self.assertIs(n.b[1].z.domain, n.R)
+        self.assertIs(n.x[1, 'a']._ub, n.p[1])
+        self.assertIs(n.c[1].body.arg(1).arg(0), n.e)
+        self.assertEqual(value(n.o), 10)
+        self.assertFalse(n.b[2].active)
+        self.assertFalse(n.c[2].active)
+        self.assertEqual(n.r['b'], '?')
+        self.assertEqual(list(n.J), ['a', 'b'])
+        self.assertEqual(n.vl.add().domain, NonNegativeIntegers)
+
+        # The restored model is fully functional
+        n.p[1] = 20
+        self.assertEqual(n.x[1, 'a'].ub, 20)
+        n.cl.add(n.y <= 5)
+        self.assertEqual(len(n.cl), 3)
+        n.x[2, 'b'].value = 3
+        self.assertFalse(n.x[2, 'b'].stale)
+
+    def test_var_state(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3, 4], within=Integers)
+        m.x[1].value = 2**60
+        m.x[2].value = 1.5
+        m.x[2].setlb(-1)
+        m.x[3].fix(0)
+        m.x[4].domain = Binary
+        m.x[1].stale = False
+        m.x[2].stale = True
+
+        n = self.roundtrip(m)
+        self.assertEqual(n.x[1].value, 2**60)
+        self.assertIs(type(n.x[1].value), int)
+        self.assertEqual(n.x[2].value, 1.5)
+        self.assertEqual(n.x[2].lb, -1)
+        self.assertIsNone(n.x[3].lb)
+        self.assertTrue(n.x[3].fixed)
+        self.assertIs(n.x[1].domain, Integers)
+        self.assertIs(n.x[4].domain, Binary)
+        self.assertFalse(n.x[1].stale)
+        self.assertTrue(n.x[2].stale)
+
+    def test_shared_subexpressions(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3])
+        shared = m.x[1] * m.x[2] + m.x[3]
+        m.c1 = Constraint(expr=shared <= 1)
+        m.c2 = Constraint(expr=shared**2 >= 0)
+
+        n = self.roundtrip(m)
+        assertExpressionsEqual(self, n.c1.expr, (n.x[1] * n.x[2] + n.x[3]) <= 1)
+        self.assertIs(n.c1.body, n.c2.body.arg(0))
+
+    def test_sparse_and_large_sets(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=range(70000), compact=True)
+        m.J = Set(initialize=range(5))
+        self.assertIs(m.I._values.__class__, _CompactSetValues)
+        m.x = Var(m.I * m.J, dense=False)
+        m.x[5, 3] = 1
+        m.x[60000, 4] = 2
+        m.c = Constraint(m.J, rule=lambda m, j: m.x[5, 3] >= j)
+
+        n = self.roundtrip(m)
+        self.assertIs(n.I._values.__class__, _CompactSetValues)
+        self.assertEqual(list(n.I), list(m.I))
+        self.assertEqual(n.I.ord(65000), 65001)
+        self.assertEqual(list(n.x), [(5, 3), (60000, 4)])
+        self.assertEqual(n.x[60000, 4].value, 2)
+        # The Set arrays are shared with the snapshot until modified
+        n.I.add(-1)
+        n.I.remove(3)
+        self.assertEqual(len(n.I), 70000)
+        self.assertEqual(n.I.last(), -1)
+        self.assertIn(4, n.I)
+        self.assertNotIn(3, n.I)
+
+    def test_array_var(self):
+        m = ConcreteModel()
+        m.I = RangeSet(4)
+        m.x = Var(m.I, array=True, bounds=(0, 4), initialize=lambda m, i: i)
+        m.x[2].fix()
+        m.c = Constraint(expr=m.x[1] + m.x[3] <= 3)
+
+        n = self.roundtrip(m)
+        self.assertEqual(n.x.get_values_array().tolist(), [1, 2, 3, 4])
+        self.assertTrue(n.x[2].fixed)
+        self.assertEqual(n.x[4].ub, 4)
+        assertExpressionsEqual(self, n.c.expr, n.x[1] + n.x[3] <= 3)
+        n.x[1].value = 10
+        self.assertEqual(n.x.get_values_array().tolist(), [10, 2, 3, 4])
+
+    def test_unsupported(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.dual = Suffix()
+        with TempfileManager.new_context() as tempfile:
+            fname = tempfile.create_tempfile(suffix='.snap')
+            with self.assertRaisesRegex(
+                ValueError, "components of type Suffix are not supported"
+            ):
+                save_snapshot(m, fname)
+
+            m.del_component(m.dual)
+            other = ConcreteModel()
+            other.y = Var()
+            m.c = Constraint(expr=m.x + other.y <= 1)
+            with self.assertRaisesRegex(
+                ValueError, "the component is not part of the snapshot"
+            ):
+                save_snapshot(m, fname)
+
+            with open(fname, 'wb') as FILE:
+                FILE.write(b'not a snapshot')
+            with self.assertRaisesRegex(ValueError, "is not a Pyomo model snapshot"):
+                load_snapshot(fname)
+
+
+if __name__ == "__main__":
+    unittest.main()
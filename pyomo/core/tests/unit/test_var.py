@@ -22,7 +22,12 @@ currdir = dirname(abspath(__file__)) + os.sep
 
 from io import StringIO
 
+import gc
+import pickle
+import weakref
+
 import pyomo.common.unittest as unittest
+from pyomo.common.dependencies import numpy as np, numpy_available
 from pyomo.common.log import LoggingIntercept
 
 from pyomo.core.base import IntegerSet
@@ -52,6 +57,7 @@ from pyomo.environ import (
     value,
 )
 from pyomo.core.base.units_container import units, pint_available, UnitsError
+from pyomo.core.base.var import ArrayIndexedVar, ArrayVarData
 
 
 class TestVarData(unittest.TestCase):
@@ -1828,5 +1834,152 @@ class MiscVarTests(unittest.TestCase):
         self.assertEqual(x.bounds, (0, 1))
 
 
+@unittest.skipUnless(numpy_available, "array-backed Vars require numpy")
+class TestArrayIndexedVar(unittest.TestCase):
+    def test_construct(self):
+        m = ConcreteModel()
+        m.I = RangeSet(4)
+        m.x = Var(m.I, array=True, bounds=(0, 10), initialize={1: 1, 3: 3})
+        self.assertIs(type(m.x), ArrayIndexedVar)
+        self.assertEqual(len(m.x), 4)
+        self.assertIn(2, m.x)
+        self.assertNotIn(5, m.x)
+        # No VarData objects are created during construction
+        self.assertEqual(len(m.x._data), 0)
+        self.assertEqual(m.x.get_values(), {1: 1, 2: None, 3: 3, 4: None})
+        self.assertEqual(m.x[1].bounds, (0, 10))
+        self.assertFalse(m.x[1].stale)
+        self.assertTrue(m.x[2].stale)
+        self.assertIs(type(m.x[1]), ArrayVarData)
+        self.assertEqual(list(m.x.keys()), [1, 2, 3, 4])
+
+        m.y = Var(m.I, array=True, within=Binary, bounds=lambda m, i: (None, i))
+        self.assertEqual(m.y[3].bounds, (0, 1))
+        self.assertEqual(value(m.y[3].upper), 1)
+        self.assertTrue(m.y[3].is_binary())
+
+        with self.assertRaisesRegex(ValueError, "must be dense"):
+            m.z = Var(m.I, array=True, dense=False)
+
+    def test_flyweight_state(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3], array=True)
+        x = m.x[2]
+        self.assertIs(m.x[2], x)
+        x.value = 5
+        x.setlb(1)
+        x.fix()
+        self.assertEqual(m.x.get_values_array().tolist()[1], 5)
+        self.assertEqual(m.x.get_bounds_arrays()[0].tolist(), [-np.inf, 1, -np.inf])
+        self.assertEqual(m.x.get_fixed_array().tolist(), [False, True, False])
+        # Dropping the VarData does not lose the state
+        del x
+        self.assertEqual(m.x[2].value, 5)
+        self.assertEqual(m.x[2].lb, 1)
+        self.assertTrue(m.x[2].fixed)
+        m.x[2].domain = Integers
+        self.assertIs(m.x[2].domain, Integers)
+        self.assertIs(m.x[1].domain, Reals)
+
+    def test_stable_ids(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3], array=True)
+        ids = [id(m.x[i]) for i in m.x.index_set()]
+        ref = weakref.ref(m.x[2])
+        # The VarData objects are held by the component, so they are
+        # not collected (and recreated with a new id) when the last
+        # external reference is dropped
+        gc.collect()
+        self.assertIs(ref(), m.x[2])
+        self.assertEqual([id(m.x[i]) for i in m.x.index_set()], ids)
+        self.assertEqual([id(v) for v in m.x.values()], ids)
+
+    def test_vectorized_api(self):
+        m = ConcreteModel()
+        m.x = Var(range(5), array=True, within=NonNegativeReals)
+        m.x.set_values_array(np.arange(5.0))
+        self.assertEqual(m.x.get_values(), {i: float(i) for i in range(5)})
+        self.assertFalse(m.x[2].stale)
+        m.x.set_bounds_arrays(ub=[1, 2, None, 4, float('nan')])
+        self.assertEqual(m.x[2].bounds, (0, None))
+        self.assertEqual(m.x.get_bounds_arrays()[1].tolist(), [1, 2, np.inf, 4, np.inf])
+        self.assertEqual(m.x.get_bounds_arrays()[0].tolist(), [0] * 5)
+        with self.assertRaisesRegex(ValueError, "array of length 2"):
+            m.x.set_values_array([1, 2])
+
+        m.x.fix(3)
+        self.assertTrue(all(m.x.get_fixed_array()))
+        self.assertEqual(m.x[4].value, 3)
+        m.x.unfix()
+        m.x[1].fix()
+        self.assertEqual(m.x.get_values(False), {0: 3, 2: 3, 3: 3, 4: 3})
+        m.x.flag_as_stale()
+        self.assertTrue(m.x[0].stale)
+        m.x.set_values({1: 5, 4: None})
+        self.assertEqual(m.x[1].value, 5)
+        self.assertIsNone(m.x[4].value)
+        self.assertTrue(m.x[4].stale)
+        m.x.setlb(-1)
+        self.assertEqual(m.x[0].bounds, (0, 1))
+        self.assertEqual(value(m.x[0].lower), 0)
+
+    def test_validation(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3], array=True, within=Integers, bounds=(0, 5))
+        m.x[3].domain = Reals
+        OUT = StringIO()
+        with LoggingIntercept(OUT, 'pyomo.core'):
+            m.x.set_values_array([1.5, 6, 2.5])
+        self.assertEqual(
+            OUT.getvalue().replace('\n', ' '),
+            "Setting Var 'x[1]' to a value `1.5` (float) not in domain Integers. "
+            "Setting Var 'x[2]' to a numeric value `6.0` outside the bounds "
+            "(0.0, 5.0). ",
+        )
+        OUT = StringIO()
+        with LoggingIntercept(OUT, 'pyomo.core'):
+            m.x.set_values_array([1.5, 6, 2.5], skip_validation=True)
+        self.assertEqual(OUT.getvalue(), "")
+
+    def test_growing_index(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[1, 2])
+        m.x = Var(m.I, array=True, initialize=7)
+        m.I.add(3)
+        self.assertEqual(len(m.x), 3)
+        self.assertEqual(m.x[3].value, 7)
+        self.assertEqual(m.x.get_values_array().tolist(), [7, 7, 7])
+
+    def test_clone_and_pickle(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2], array=True, initialize=2)
+        m.x[1].fix()
+        m.c = Expression(expr=m.x[1] + m.x[2])
+        m.x[2].stale = True
+        for m2 in (m.clone(), pickle.loads(pickle.dumps(m))):
+            self.assertIsNot(m2.x, m.x)
+            self.assertIs(m2.c.expr.args[0], m2.x[1])
+            self.assertEqual(m2.x.get_values(), {1: 2, 2: 2})
+            self.assertTrue(m2.x[1].fixed)
+            self.assertFalse(m2.x[1].stale)
+            self.assertTrue(m2.x[2].stale)
+            m2.x[1].value = 5
+            self.assertEqual(m.x[1].value, 2)
+
+    def test_pprint(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2], array=True, bounds=(0, 1))
+        OUT = StringIO()
+        m.x.pprint(ostream=OUT)
+        self.assertEqual(
+            OUT.getvalue(),
+            """x : Size=2, Index={1, 2}
+    Key : Lower : Value : Upper : Fixed : Stale : Domain
+      1 :   0.0 :  None :   1.0 : False :  True :  Reals
+      2 :   0.0 :  None :   1.0 : False :  True :  Reals
+""",
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
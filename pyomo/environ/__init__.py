@@ -244,6 +244,8 @@ from pyomo.core import (
     Transformation,
     TransformationFactory,
     instance2dat,
+    save_snapshot,
+    load_snapshot,
     set_options,
     RealSet,
     IntegerSet,
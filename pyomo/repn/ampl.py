@@ -1187,6 +1187,41 @@ class AMPLRepnVisitor(StreamBasedExpressionVisitor):
         else:
             raise DeveloperError("unknown result type")
 
+    def walk_linear_terms(self, terms, src, src_idx, scale):
+        """Generate the compiled representation of a sum of linear terms
+
+        This returns the same result as walking the
+        :py:class:`LinearExpression` ``sum(c * v for v, c in terms)``
+        (the body of `src`) but without generating the expression.
+        `terms` is an iterable of (variable, coefficient) tuples where
+        the coefficients are native numeric values.
+
+        """
+        self.active_expression_source = (src_idx, id(src))
+        self.expression_scaling_factor = scale
+        var_map = self.var_map
+        const = 0
+        linear = {}
+        for v, coef in terms:
+            if not coef:
+                continue
+            _id = id(v)
+            if _id not in var_map:
+                if v.fixed:
+                    if _id not in self.fixed_vars:
+                        self.cache_fixed_var(_id, v)
+                    const += coef * self.fixed_vars[_id]
+                    continue
+                _before_child_handlers._record_var(self, v)
+                linear[_id] = coef
+            elif _id in linear:
+                linear[_id] += coef
+            else:
+                linear[_id] = coef
+        if linear:
+            return self.finalizeResult((_GENERAL, self.Result(const, linear, None)))
+        return self.finalizeResult((_CONSTANT, const))
+
     def initializeWalker(self, expr):
         expr, src, src_idx, self.expression_scaling_factor = expr
         self.active_expression_source = (src_idx, id(src))
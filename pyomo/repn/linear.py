@@ -65,6 +65,69 @@ _CONSTANT = ExprType.CONSTANT
 _LINEAR = ExprType.LINEAR
 _GENERAL = ExprType.GENERAL
 
+# If True, LinearRepnVisitor will use the compiled walker from the APPSI
+# extension (see ``pyomo build-extensions``) when it is available.
+# Expressions that the compiled walker does not support fall back on
+# the Python visitor.  The compiled walker is opt-in.
+USE_COMPILED_WALKER = False
+
+# The compiled walker class and the node types that it processes (None:
+# not yet loaded; False: not available)
+_compiled_walker_info = None
+
+
+def _new_compiled_walker():
+    """Return a new compiled walker (or None if it is not available)
+
+    The compiled walker holds the state of the current walk, so it is
+    neither reentrant nor thread-safe: each visitor creates its own.
+
+    """
+    global _compiled_walker_info
+    if _compiled_walker_info is None:
+        _compiled_walker_info = False
+        from pyomo.contrib.appsi.cmodel import cmodel, cmodel_available
+
+        # Note: older builds of the extension do not include the walker
+        if cmodel_available and hasattr(cmodel, 'LinearRepnWalker'):
+            _compiled_walker_info = (
+                cmodel.LinearRepnWalker,
+                _compiled_walker_node_types(),
+            )
+    if not _compiled_walker_info:
+        return None
+    walker_class, node_types = _compiled_walker_info
+    return walker_class(node_types)
+
+
+def _compiled_walker_node_types():
+    from pyomo.core.base.var import VarData, ScalarVar
+    from pyomo.core.base.param import ParamData, ScalarParam
+    from pyomo.core.expr.numeric_expr import (
+        NPV_SumExpression,
+        NPV_ProductExpression,
+        NPV_NegationExpression,
+        NPV_DivisionExpression,
+    )
+
+    # Note: the compiled walker matches the exact node type (so that
+    # derived classes with different semantics are never accelerated)
+    return {
+        'var': [VarData, ScalarVar],
+        'param': [ScalarParam],
+        'param_data': [ParamData],
+        'monomial': [MonomialTermExpression],
+        'linear': [LinearExpression],
+        'sum': [SumExpression],
+        'negation': [NegationExpression],
+        'product': [ProductExpression],
+        'division': [DivisionExpression],
+        'npv_sum': [NPV_SumExpression],
+        'npv_product': [NPV_ProductExpression],
+        'npv_negation': [NPV_NegationExpression],
+        'npv_division': [NPV_DivisionExpression],
+    }
+
 
 def _inv2str(val):
     return f"{val._str() if hasattr(val, '_str') else val}"
@@ -727,6 +790,53 @@ class LinearRepnVisitor(StreamBasedExpressionVisitor):
         self.var_map = var_recorder.var_map
         self._eval_expr_visitor = _EvaluationVisitor(True)
         self.evaluate = self._eval_expr_visitor.dfs_postorder_stack
+        # The compiled walker implements the semantics of this class
+        # (and not necessarily those of derived visitors)
+        if USE_COMPILED_WALKER and self.__class__ in _compiled_walker_visitors:
+            self._compiled_walker = _new_compiled_walker()
+        else:
+            self._compiled_walker = None
+
+    def walk_expression(self, expr):
+        if self._compiled_walker is not None:
+            ans = self._compiled_walker.walk(expr, self.var_map, self.var_recorder.add)
+            if ans is not None:
+                repn = self.Result()
+                repn.constant, repn.linear = ans
+                return repn
+        return super().walk_expression(expr)
+
+    def walk_linear_terms(self, terms):
+        """Generate the representation of a sum of linear terms
+
+        This returns the same result as walking the
+        :py:class:`LinearExpression` ``sum(c * v for v, c in terms)``,
+        but without generating the expression.  `terms` is an iterable
+        of (variable, coefficient) tuples (e.g., the :py:attr:`terms`
+        of a :py:class:`MatrixConstraintData`) where the coefficients
+        are native numeric values.
+
+        """
+        var_map = self.var_map
+        ans = self.Result()
+        const = 0
+        linear = ans.linear
+        for v, coef in terms:
+            if not coef:
+                continue
+            _id = id(v)
+            if _id not in var_map:
+                if v.fixed:
+                    const += coef * self.check_constant(v.value, v)
+                    continue
+                self.var_recorder.add(v)
+                linear[_id] = coef
+            elif _id in linear:
+                linear[_id] += coef
+            else:
+                linear[_id] = coef
+        ans.constant = const
+        return self.finalizeResult(ans.walker_exitNode())
 
     def check_constant(self, ans, obj):
         if ans.__class__ not in native_numeric_types:
@@ -834,3 +944,8 @@ class LinearRepnVisitor(StreamBasedExpressionVisitor):
         assert result[0] is _CONSTANT
         ans.constant = result[1]
         return ans
+
+
+# Visitors whose results (for the linear expressions supported by the
+# compiled walker) are exactly the results of the compiled walker
+_compiled_walker_visitors = {LinearRepnVisitor}
@@ -12,6 +12,7 @@ from copy import deepcopy
 from itertools import chain
 
 from pyomo.common.collections import ComponentSet
+from pyomo.common.dependencies import numpy as np
 from pyomo.common.errors import MouseTrap
 from pyomo.common.numeric_types import native_types
 
@@ -208,6 +209,57 @@ class LinearTemplateRepn(LinearRepn):
         exec(ans, env)
         return env.pop('build_expr')
 
+    def compile_vectorized(self, env, smap, expr_cache, args):
+        """Compile a function that evaluates this repn for a list of indices
+
+        The returned function accepts a list of index tuples and returns
+        a 3-tuple of (constant, columns, coefficients), where
+        `constant` is either a number (shared by all indices) or a list
+        with one entry per index, and `columns` and `coefficients`
+        contain one entry for each linear term in the repn.  Each
+        column entry is a list (with one entry per index); coefficient
+        entries are either a number (shared by all indices) or a list.
+
+        Returns None if the repn cannot be evaluated in this manner
+        (i.e., the number of linear terms is not the same for all
+        indices, or the repn references variables outside of an
+        indexed component).
+
+        """
+        if self.linear_sum or self.nonlinear is not None or not self.linear:
+            return None
+        loop = f" for ({', '.join(args)},) in index]"
+        constant = self.multiplier * self.constant
+        if constant.__class__ not in native_types and constant.is_expression_type():
+            constant = '[' + constant.to_string(smap=smap) + loop
+        else:
+            constant = repr(constant)
+        columns = []
+        coefficients = []
+        for k, coef in self.linear.items():
+            coef *= self.multiplier
+            if coef.__class__ not in native_types and coef.is_expression_type():
+                coef = '[' + coef.to_string(smap=smap) + loop
+            elif coef:
+                coef = repr(coef)
+            else:
+                continue
+            if k not in expr_cache:
+                return None
+            k = expr_cache[k]
+            if k.__class__ in native_types or not k.is_expression_type():
+                return None
+            columns.append('[' + k.to_string(smap=smap) + loop)
+            coefficients.append(coef)
+        if not columns:
+            return None
+        ans = (
+            "def build_exprs(index):\n    return ("
+            f"{constant}, [{', '.join(columns)}], [{', '.join(coefficients)}])"
+        )
+        exec(ans, env)
+        return env.pop('build_exprs')
+
 
 class LinearTemplateBeforeChildDispatcher(linear.LinearBeforeChildDispatcher):
 
@@ -291,6 +343,7 @@ class LinearTemplateRepnVisitor(linear.LinearRepnVisitor):
         self.env = var_recorder.env
         self.symbolmap = var_recorder.symbolmap
         self.expanded_templates = {}
+        self.vectorized_templates = {}
         self.remove_fixed_vars = remove_fixed_vars
 
     def enterNode(self, node):
@@ -357,3 +410,83 @@ class LinearTemplateRepnVisitor(linear.LinearRepnVisitor):
             lb,
             ub,
         )
+
+    def expand_expressions(self, objs, template_info):
+        """Expand a template for a list of component data at once
+
+        This is the vectorized equivalent of :py:meth:`expand_expression`
+        for a list of component data objects that all share the same
+        `template_info`.  The template body is evaluated for all
+        indices in a single call, and the results are assembled into
+        NumPy arrays.
+
+        Returns
+        -------
+        None or tuple
+
+            None if the template cannot be vectorized (see
+            :py:meth:`LinearTemplateRepn.compile_vectorized`), otherwise
+            a 5-tuple (offset, linear_indices, linear_data, lb, ub),
+            where `offset` is a vector with one entry per object,
+            `linear_indices` and `linear_data` are matrices with one row
+            per object and one column per linear term, and `lb` and `ub`
+            are either None or vectors with one entry per object.
+
+        """
+        try:
+            body = self.vectorized_templates[id(template_info)]
+        except KeyError:
+            expr, indices = template_info
+            if expr is None:
+                body = None
+            else:
+                if expr.is_expression_type(ExpressionType.RELATIONAL):
+                    expr = objs[0].to_bounded_expression()[1]
+                body = self.walk_expression(expr).compile_vectorized(
+                    self.env,
+                    self.symbolmap,
+                    self.expr_cache,
+                    [self.symbolmap.getSymbol(i) for i in indices],
+                )
+            self.vectorized_templates[id(template_info)] = body
+        if body is None:
+            return None
+        if id(template_info) not in self.expanded_templates:
+            # Compile the (scalar) bounds
+            self.expand_expression(objs[0], template_info)
+        _, lb, ub = self.expanded_templates[id(template_info)]
+
+        # Note: the objects came from iterating over their parent
+        # components, so we can bypass the (relatively expensive)
+        # validation in ComponentData.index()
+        index = [obj._index for obj in objs]
+        if index[0].__class__ is not tuple:
+            index = [(idx,) for idx in index]
+        constant, columns, coefficients = body(index)
+
+        n = len(index)
+        linear_indices = np.empty((n, len(columns)), dtype=np.int32)
+        linear_data = np.empty((n, len(columns)), dtype=np.float64)
+        for i, (col, coef) in enumerate(zip(columns, coefficients)):
+            linear_indices[:, i] = col
+            # Note: this will broadcast constant coefficients
+            linear_data[:, i] = coef
+        offset = np.empty(n, dtype=np.float64)
+        offset[:] = constant
+
+        bounds = []
+        for bound in (lb, ub):
+            if bound.__class__ is code_type:
+                tmp = []
+                bound = [bound(tmp, tmp, *idx) for idx in index]
+                if tmp:
+                    raise RuntimeError(
+                        f"Constraint {objs[0].parent_component()} has "
+                        "non-fixed bounds"
+                    )
+            if bound is not None:
+                bound = np.array(bound, dtype=np.float64)
+                if not bound.shape:
+                    bound = np.full(n, bound)
+            bounds.append(bound)
+        return offset, linear_indices, linear_data, bounds[0], bounds[1]
@@ -16,6 +16,7 @@ def load():
         ampl,
         baron_writer,
         mps,
+        mps_writer,
         gams_writer,
         lp_writer,
         nl_writer,
@@ -35,6 +36,9 @@ def load():
     WriterFactory.register('cpxlp', 'Generate the corresponding CPLEX LP file.')(
         WriterFactory.get_class('cpxlp_v2')
     )
+    WriterFactory.register('mps', 'Generate the corresponding MPS file.')(
+        WriterFactory.get_class('mps_v1')
+    )
 
 
 def activate_writer_version(name, ver):
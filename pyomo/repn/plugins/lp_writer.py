@@ -37,17 +37,21 @@ from pyomo.core.base import (
 )
 from pyomo.core.base.component import ActiveComponent
 from pyomo.core.base.label import LPFileLabeler, NumericLabeler
+from pyomo.core.base.matrix_constraint import MatrixConstraintData
 from pyomo.opt import WriterFactory
 from pyomo.repn.linear import LinearRepnVisitor
 from pyomo.repn.quadratic import QuadraticRepnVisitor
 from pyomo.repn.util import (
+    CompiledRepnCache,
     FileDeterminism,
     FileDeterminism_to_SortComponents,
     OrderedVarRecorder,
     categorize_valid_components,
+    get_repn_cache,
     initialize_var_map_from_column_order,
     int_float,
     ordered_active_constraints,
+    walk_cached_expression,
 )
 
 ### FIXME: Remove the following as soon as non-active components no
@@ -187,9 +191,27 @@ class LPWriter(object):
             description='If True, allow quadratic terms in the model constraints',
         ),
     )
+    CONFIG.declare(
+        'incremental',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Reuse compiled expressions from previous calls to write()',
+            doc="""
+            If True, the writer will cache the compiled representation of
+            each constraint and objective.  Subsequent calls to write()
+            (using the same writer instance) will only re-walk
+            expressions that were replaced, or that reference mutable
+            Params, fixed Vars, or named Expressions that changed since
+            the previous write.  This option is ignored (and the
+            model's cache is used) if a shared cache was attached to
+            the model with :py:func:`pyomo.repn.util.attach_repn_cache`.""",
+        ),
+    )
 
     def __init__(self):
         self.config = self.CONFIG()
+        self.repn_cache = None
 
     def __call__(self, model, filename, solver_capability, io_options):
         if filename is None:
@@ -235,18 +257,27 @@ class LPWriter(object):
                 "writer is deprecated and is ignored by the lp_v2 writer."
             )
 
+        # A cache attached to the model (see attach_repn_cache()) is
+        # shared with other writers and takes precedence
+        repn_cache = get_repn_cache(model)
+        if repn_cache is None and config.incremental:
+            if self.repn_cache is None:
+                self.repn_cache = CompiledRepnCache()
+            repn_cache = self.repn_cache
+
         # Pause the GC, as the walker that generates the compiled LP
         # representation generates (and disposes of) a large number of
         # small objects.
         with PauseGC():
-            return _LPWriter_impl(ostream, config).write(model)
+            return _LPWriter_impl(ostream, config, repn_cache).write(model)
 
 
 class _LPWriter_impl(object):
-    def __init__(self, ostream, config):
+    def __init__(self, ostream, config, repn_cache=None):
         self.ostream = ostream
         self.config = config
         self.symbol_map = None
+        self.repn_cache = repn_cache
 
     def write(self, model):
         timing_logger = logging.getLogger('pyomo.common.timing.writer')
@@ -375,7 +406,10 @@ class _LPWriter_impl(object):
             ("min \n%s:\n" if obj.sense == minimize else "max \n%s:\n")
             % (getSymbol(obj, labeler),)
         )
-        repn = objective_visitor.walk_expression(obj.expr)
+        if component_map[Objective]:
+            repn = self.walk_expression(objective_visitor, obj, obj.expr)
+        else:
+            repn = objective_visitor.walk_expression(obj.expr)
         if repn.nonlinear is not None:
             raise ValueError(
                 f"Model objective ({obj.name}) contains nonlinear terms that "
@@ -410,18 +444,27 @@ class _LPWriter_impl(object):
             if with_debug_timing and con.parent_component() is not last_parent:
                 timer.toc('Constraint %s', last_parent, level=logging.DEBUG)
                 last_parent = con.parent_component()
-            # Note: Constraint.to_bounded_expression(evaluate_bounds=True)
-            # guarantee a return value that is either a (finite)
-            # native_numeric_type, or None
-            lb, body, ub = con.to_bounded_expression(True)
-
-            if lb is None and ub is None:
-                # Note: you *cannot* output trivial (unbounded)
-                # constraints in LP format.  I suppose we could add a
-                # slack variable if skip_trivial_constraints is False,
-                # but that seems rather silly.
-                continue
-            repn = constraint_visitor.walk_expression(body)
+            if con.__class__ is MatrixConstraintData:
+                # MatrixConstraint rows are compiled directly from the
+                # CSR data (without generating the body expression)
+                lb = con.lb
+                ub = con.ub
+                if lb is None and ub is None:
+                    continue
+                repn = constraint_visitor.walk_linear_terms(con.terms)
+            else:
+                # Note: Constraint.to_bounded_expression(evaluate_bounds=True)
+                # guarantee a return value that is either a (finite)
+                # native_numeric_type, or None
+                lb, body, ub = con.to_bounded_expression(True)
+
+                if lb is None and ub is None:
+                    # Note: you *cannot* output trivial (unbounded)
+                    # constraints in LP format.  I suppose we could add a
+                    # slack variable if skip_trivial_constraints is False,
+                    # but that seems rather silly.
+                    continue
+                repn = self.walk_expression(constraint_visitor, con, body)
             if repn.nonlinear is not None:
                 raise ValueError(
                     f"Model constraint ({con.name}) contains nonlinear terms that "
@@ -571,10 +614,28 @@ class _LPWriter_impl(object):
 
         ostream.write("\nend\n")
 
+        if self.repn_cache is not None:
+            self.repn_cache.purge(objective_visitor.__class__)
+            if constraint_visitor.__class__ is not objective_visitor.__class__:
+                self.repn_cache.purge(constraint_visitor.__class__)
+
         info = LPWriterInfo(self.symbol_map)
         timer.toc("Generated LP representation", delta=False)
         return info
 
+    def walk_expression(self, visitor, comp, body):
+        """Generate the compiled representation of a constraint / objective
+
+        If the writer was provided a :py:class:`CompiledRepnCache`, then
+        a cached representation is returned (and the variables it
+        references are recorded in the var_map) when the cache is still
+        current.
+
+        """
+        return walk_cached_expression(
+            self.repn_cache, visitor, self.var_map, self.var_recorder, comp, body
+        )
+
     def write_expression(self, ostream, expr, is_objective):
         assert not expr.constant
         getSymbol = self.symbol_map.getSymbol
@@ -53,7 +53,7 @@ def _get_bound(exp):
     raise ValueError("non-fixed bound or weight: " + str(exp))
 
 
-@WriterFactory.register('mps', 'Generate the corresponding MPS file')
+@WriterFactory.register('mps_v1', 'Generate the corresponding MPS file (version 1).')
 class ProblemWriter_mps(AbstractProblemWriter):
     def __init__(self, int_marker=False):
         AbstractProblemWriter.__init__(self, ProblemFormat.mps)
@@ -0,0 +1,733 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import gzip
+import logging
+
+from pyomo.common.config import (
+    ConfigBlock,
+    ConfigValue,
+    InEnum,
+    document_kwargs_from_configdict,
+)
+from pyomo.common.dependencies import (
+    numpy as np,
+    numpy_available,
+    scipy,
+    scipy_available,
+)
+from pyomo.common.deprecation import deprecation_warning
+from pyomo.common.gc_manager import PauseGC
+from pyomo.common.timing import TicTocTimer
+
+from pyomo.core.base import SOSConstraint, SymbolMap, minimize
+from pyomo.core.base.label import NumericLabeler, TextLabeler
+from pyomo.opt import WriterFactory
+from pyomo.repn.linear import LinearRepnVisitor
+import pyomo.repn.linear as linear
+from pyomo.repn.plugins.mps import ProblemWriter_mps, _no_negative_zero
+from pyomo.repn.plugins.standard_form import (
+    LinearStandardFormCompiler,
+    _LinearStandardFormCompiler_impl,
+)
+from pyomo.repn.util import FileDeterminism, FileDeterminism_to_SortComponents
+
+logger = logging.getLogger(__name__)
+
+# The (approximate) number of nonzeros converted to Python objects at a
+# time when streaming the COLUMNS section.  This bounds the writer's
+# memory use (beyond the compiled sparse matrices) for large models.
+_COLUMN_CHUNK_NNZ = 1 << 16
+
+
+class _NonlinearModelError(ValueError):
+    """Raised when the model contains nonlinear (e.g., quadratic) terms"""
+
+
+class MPSWriterInfo(object):
+    """Return type for MPSWriter.write()
+
+    Attributes
+    ----------
+    symbol_map: SymbolMap
+
+        The :py:class:`SymbolMap` bimap between row/column labels and
+        Pyomo components.
+
+    """
+
+    def __init__(self, symbol_map):
+        self.symbol_map = symbol_map
+
+
+@WriterFactory.register('mps_v2', 'Generate the corresponding MPS file (version 2).')
+class MPSWriter(object):
+    """Write a linear (MI)LP model in MPS format
+
+    The model is first compiled to (mixed) standard form using the
+    :py:class:`LinearStandardFormCompiler`.  The (column-major) COLUMNS
+    section is then streamed directly from the compressed sparse column
+    (CSC) constraint matrix.
+
+    The MPS file is compressed with gzip if the file name passed to the
+    writer ends in ``.gz``.
+
+    """
+
+    CONFIG = ConfigBlock('mpswriter')
+    CONFIG.declare(
+        'show_section_timing',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Print timing after writing each section of the MPS file',
+        ),
+    )
+    CONFIG.declare(
+        'skip_trivial_constraints',
+        ConfigValue(
+            default=True,
+            domain=bool,
+            description='DEPRECATED option from MPSv1 that has no effect in MPSv2',
+            doc="""
+            Constraints whose body is constant are never written to the
+            MPS file: feasible trivial constraints are skipped and
+            infeasible ones raise an InfeasibleConstraintException.""",
+        ),
+    )
+    CONFIG.declare(
+        'file_determinism',
+        ConfigValue(
+            default=FileDeterminism.ORDERED,
+            domain=InEnum(FileDeterminism),
+            description='How much effort to ensure file is deterministic',
+            doc="""
+            How much effort do we want to put into ensuring the
+            MPS file is written deterministically for a Pyomo model:
+
+               - NONE (0) : None
+               - ORDERED (10): rely on underlying component ordering (default)
+               - SORT_INDICES (20) : sort keys of indexed components
+               - SORT_SYMBOLS (30) : sort keys AND sort names (not declaration order)
+
+            """,
+        ),
+    )
+    CONFIG.declare(
+        'symbolic_solver_labels',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Write variables/constraints using model names',
+            doc="""
+            Export variables and constraints to the MPS file using
+            human-readable text names derived from the corresponding
+            Pyomo component names.
+            """,
+        ),
+    )
+    CONFIG.declare(
+        'row_order',
+        ConfigValue(
+            default=None,
+            description='Preferred constraint ordering',
+            doc="""
+            List of constraints in the order that they should appear in the
+            MPS file.  Unspecified constraints will appear at the end.""",
+        ),
+    )
+    CONFIG.declare(
+        'column_order',
+        ConfigValue(
+            default=None,
+            description='Preferred variable ordering',
+            doc="""
+            List of variables in the order that they should appear in
+            the MPS file.  Unspecified variables will appear in the
+            order in which they are first encountered in the objective
+            followed by each constraint (so their order depends on the
+            order of the terms in the expressions).""",
+        ),
+    )
+    CONFIG.declare(
+        'labeler',
+        ConfigValue(
+            default=None,
+            description='Callable to use to generate symbol names in MPS file',
+        ),
+    )
+    CONFIG.declare(
+        'output_fixed_variable_bounds',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='DEPRECATED option from MPSv1 that has no effect in MPSv2',
+        ),
+    )
+    CONFIG.declare(
+        'force_objective_constant',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Always write the ONE_VAR_CONSTANT objective column',
+            doc="""
+            Write the ONE_VAR_CONSTANT column (used to represent the
+            objective constant) even when the objective constant is 0.""",
+        ),
+    )
+    CONFIG.declare(
+        'skip_objective_sense',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Omit the OBJSENSE section',
+            doc="""
+            Do not write the OBJSENSE section.  Some solvers (e.g.,
+            GLPK and CBC) either reject or ignore this section.""",
+        ),
+    )
+    CONFIG.declare(
+        'int_marker',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description="Declare integer columns using 'MARKER' lines",
+            doc="""
+            Wrap runs of integer columns in the COLUMNS section with
+            'INTORG' / 'INTEND' markers (in addition to declaring the
+            integer bounds in the BOUNDS section).""",
+        ),
+    )
+    CONFIG.declare(
+        'free_format',
+        ConfigValue(
+            default=True,
+            domain=bool,
+            description='Write free (True) or fixed (False) MPS format',
+            doc="""
+            If False, the file is written in the original fixed-column
+            MPS format.  Fixed MPS limits names to 8 characters and
+            numeric values to 12 characters (values are rounded to fit).""",
+        ),
+    )
+
+    def __init__(self, int_marker=False):
+        self.config = self.CONFIG()
+        if int_marker:
+            self.config.int_marker = True
+
+    def __call__(self, model, filename, solver_capability, io_options):
+        if filename is None:
+            filename = model.name + ".mps"
+        compress = filename.endswith('.gz')
+
+        # Duplicate io_options to avoid side-effects
+        io_options = dict(io_options)
+        if numpy_available and scipy_available:
+            try:
+                with _open(filename, compress) as FILE:
+                    info = self.write(model, FILE, **io_options)
+                return filename, info.symbol_map
+            except _NonlinearModelError:
+                # Quadratic models are written by the original (v1) MPS
+                # writer, which supports the QUADOBJ and QCMATRIX sections
+                if compress:
+                    raise
+                logger.debug(
+                    "Model '%s' is not linear: falling back on the mps_v1 writer",
+                    model.name,
+                )
+        elif compress:
+            raise ValueError("Writing compressed MPS files requires numpy and scipy")
+        return ProblemWriter_mps(int_marker=self.config.int_marker)(
+            model, filename, solver_capability, io_options
+        )
+
+    @document_kwargs_from_configdict(CONFIG)
+    def write(self, model, ostream, **options):
+        """Write a model in MPS format.
+
+        Returns
+        -------
+        MPSWriterInfo
+
+        Parameters
+        ----------
+        model: ConcreteModel
+            The concrete Pyomo model to write out.
+
+        ostream: io.TextIOBase
+            The text output stream where the MPS "file" will be written.
+            Could be an opened file or a io.StringIO.
+
+        """
+        config = self.config(options)
+
+        if config.output_fixed_variable_bounds:
+            deprecation_warning(
+                "The 'output_fixed_variable_bounds' option to the MPS "
+                "writer is deprecated and is ignored by the mps_v2 writer.",
+                version='6.9.3.dev0',
+            )
+
+        # Pause the GC, as the walker that generates the compiled
+        # representation generates (and disposes of) a large number of
+        # small objects.
+        with PauseGC():
+            return _MPSWriter_impl(ostream, config).write(model)
+
+
+def _open(filename, compress):
+    if compress:
+        return gzip.open(filename, 'wt', newline='')
+    return open(filename, 'w', newline='')
+
+
+class _MPSRepnVisitor(LinearRepnVisitor):
+    def finalizeResult(self, result):
+        ans = super().finalizeResult(result)
+        if ans.nonlinear is not None:
+            raise _NonlinearModelError(
+                "Model contains nonlinear terms that cannot be written by the "
+                "mps_v2 writer (use the mps_v1 writer for quadratic models)"
+            )
+        return ans
+
+
+linear._compiled_walker_visitors.add(_MPSRepnVisitor)
+
+
+class _MPSStandardFormCompiler_impl(_LinearStandardFormCompiler_impl):
+    _get_visitor = _MPSRepnVisitor
+    # SOSConstraints are written directly by the MPS writer
+    _ignored_ctypes = frozenset((SOSConstraint,))
+
+
+def _fixed_format_number(val):
+    # Fixed MPS limits numeric fields to 12 characters: use the most
+    # precise representation that fits.
+    ans = '%.12g' % (val,)
+    prec = 12
+    while len(ans) > 12:
+        prec -= 1
+        ans = '%.*g' % (prec, val)
+    return ans
+
+
+class _MPSWriter_impl(object):
+    # Line templates for the free-format MPS sections
+    _free_templates = {
+        'header': "* Source:     Pyomo MPS Writer\n* Format:     Free MPS\n*\n",
+        'name': "NAME %s\n",
+        'sense': " %s\n",
+        'row': " %s  %s\n",
+        'entry': "     %s %s %.17g\n",
+        'marker': "     MARK%04d 'MARKER' '%s'\n",
+        'rhs': "     RHS %s %.17g\n",
+        'bound': " %s BOUND %s %.17g\n",
+        'free_bound': " %s BOUND %s\n",
+        'sos': " S%s %s\n",
+        'sos_entry': "    %s %.17g\n",
+    }
+    # Line templates for the fixed-format MPS sections.  Numeric
+    # values are formatted by _fixed_format_number() before they are
+    # passed to the templates.
+    _fixed_templates = {
+        'header': "* Source:     Pyomo MPS Writer\n* Format:     Fixed MPS\n*\n",
+        'name': "NAME          %s\n",
+        'sense': "    %s\n",
+        'row': " %-2s %s\n",
+        'entry': "    %-8s  %-8s  %12s\n",
+        'marker': "    MARK%04d  'MARKER'                 '%s'\n",
+        'rhs': "    RHS       %-8s  %12s\n",
+        'bound': " %-2s BOUND     %-8s  %12s\n",
+        'free_bound': " %-2s BOUND     %s\n",
+        'sos': " S%s %s\n",
+        'sos_entry': "    %-8s  %12s\n",
+    }
+
+    def __init__(self, ostream, config):
+        self.ostream = ostream
+        self.config = config
+        self.symbol_map = None
+
+    def write(self, model):
+        timing_logger = logging.getLogger('pyomo.common.timing.writer')
+        timer = TicTocTimer(logger=timing_logger)
+
+        config = self.config
+        ostream = self.ostream
+        free_format = config.free_format
+        if free_format:
+            templates = self._free_templates
+            fmt = None
+        else:
+            templates = self._fixed_templates
+            fmt = _fixed_format_number
+
+        labeler = config.labeler
+        if labeler is None:
+            if config.symbolic_solver_labels:
+                labeler = TextLabeler()
+            else:
+                labeler = NumericLabeler('x')
+        self.symbol_map = symbol_map = SymbolMap(labeler)
+
+        #
+        # Compile the model to (mixed) standard form
+        #
+        compiler_config = LinearStandardFormCompiler.CONFIG(
+            {
+                'mixed_form': True,
+                'set_sense': None,
+                'file_determinism': config.file_determinism,
+                'row_order': config.row_order,
+                'column_order': config.column_order,
+                'show_section_timing': config.show_section_timing,
+            }
+        )
+        info = _MPSStandardFormCompiler_impl(compiler_config).write(model)
+        timer.toc('Compiled standard form', level=logging.DEBUG)
+
+        if len(info.objectives) != 1:
+            if not info.objectives:
+                raise ValueError(
+                    "Cannot write legal MPS file: No objective defined "
+                    "for input model '%s'." % (model.name,)
+                )
+            raise ValueError(
+                "More than one active objective defined for input model '%s'; "
+                "Cannot write legal MPS file\nObjectives: %s"
+                % (model.name, ' '.join(obj.name for obj in info.objectives))
+            )
+        obj = info.objectives[0]
+
+        #
+        # Collect the SOS constraints (their variables must appear as
+        # columns, even if they do not appear in any constraint)
+        #
+        sorter = FileDeterminism_to_SortComponents(config.file_determinism)
+        columns = info.columns
+        sos_cons = list(
+            model.component_data_objects(
+                SOSConstraint, active=True, descend_into=True, sort=sorter
+            )
+        )
+        sos_columns = []
+        if sos_cons:
+            in_columns = set(map(id, columns))
+            for soscon in sos_cons:
+                for v, w in getattr(soscon, 'get_items', soscon.items)():
+                    if v.fixed:
+                        raise RuntimeError(
+                            "SOSConstraint '%s' includes a fixed variable '%s'. "
+                            "This is currently not supported. Deactivate this "
+                            "constraint in order to proceed." % (soscon.name, v.name)
+                        )
+                    if id(v) not in in_columns:
+                        in_columns.add(id(v))
+                        sos_columns.append(v)
+
+        #
+        # Generate the labels
+        #
+        col_labels = [labeler(v) for v in columns]
+        sos_col_labels = [labeler(v) for v in sos_columns]
+        symbol_map.addSymbols(zip(columns, col_labels))
+        symbol_map.addSymbols(zip(sos_columns, sos_col_labels))
+
+        obj_label = labeler(obj)
+        symbol_map.addSymbol(obj, obj_label)
+        symbol_map.alias(obj, '__default_objective__')
+
+        rows = info.rows
+        row_labels = []
+        row_types = []
+        n_rows = len(rows)
+        last = None
+        for i, (con, bound_type) in enumerate(rows):
+            if con is last:
+                # The second (lower bound) row of a ranged constraint
+                label = f'r_l_{symbol}_'
+                symbol_map.alias(con, label)
+                row_labels.append(label)
+                row_types.append('G')
+                continue
+            last = con
+            symbol = labeler(con)
+            if not bound_type:
+                label = f'c_e_{symbol}_'
+                row_types.append('E')
+            elif bound_type > 0:
+                if i + 1 < n_rows and rows[i + 1].constraint is con:
+                    label = f'r_u_{symbol}_'
+                else:
+                    label = f'c_u_{symbol}_'
+                row_types.append('L')
+            else:
+                label = f'c_l_{symbol}_'
+                row_types.append('G')
+            symbol_map.addSymbol(con, label)
+            row_labels.append(label)
+
+        sos_labels = [labeler(soscon) for soscon in sos_cons]
+        symbol_map.addSymbols(zip(sos_cons, sos_labels))
+
+        if not free_format:
+            for labels in (col_labels, sos_col_labels, row_labels, sos_labels):
+                for label in labels:
+                    if len(label) > 8:
+                        raise ValueError(
+                            f"Cannot write fixed-format MPS file: the name "
+                            f"'{label}' is longer than 8 characters.  Use "
+                            "free_format=True or a labeler that generates "
+                            "shorter names."
+                        )
+            if len(obj_label) > 8:
+                raise ValueError(
+                    f"Cannot write fixed-format MPS file: the name "
+                    f"'{obj_label}' is longer than 8 characters."
+                )
+
+        timer.toc('Generated row and column labels', level=logging.DEBUG)
+
+        #
+        # The objective constant.  In free format, the constant is
+        # written as the coefficient on ONE_VAR_CONSTANT (for
+        # compatibility with the v1 writer).  The ONE_VAR_CONSTANT names
+        # do not fit in fixed format, so there the constant is written
+        # as the (negated) RHS of the objective row.
+        #
+        c = info.c
+        n_cols = len(columns)
+        obj_constant = info.c_offset[0].item()
+        one_var_constant = free_format and (
+            config.force_objective_constant or obj_constant != 0 or not c.nnz
+        )
+        if not c.nnz and not obj_constant and free_format:
+            logger.warning(
+                "Constant objective detected, replacing "
+                "with a placeholder to prevent solver failure."
+            )
+
+        #
+        # Header, OBJSENSE, and ROWS
+        #
+        ostream.write(templates['header'])
+        ostream.write(templates['name'] % (model.name,))
+        if not config.skip_objective_sense:
+            ostream.write("OBJSENSE\n")
+            ostream.write(
+                templates['sense'] % ('MIN' if obj.sense == minimize else 'MAX')
+            )
+        ostream.write("ROWS\n")
+        row_template = templates['row']
+        ostream.write(row_template % ('N', obj_label))
+        ostream.write(''.join(map(row_template.__mod__, zip(row_types, row_labels))))
+        if one_var_constant:
+            ostream.write(row_template % ('E', 'c_e_ONE_VAR_CONSTANT'))
+        timer.toc('Wrote ROWS section', level=logging.DEBUG)
+
+        #
+        # COLUMNS (streamed from the CSC matrix)
+        #
+        ostream.write("COLUMNS\n")
+        entry = templates['entry'].__mod__
+        marker = templates['marker']
+        int_marker = config.int_marker
+        in_integer_section = False
+        mark_cnt = 0
+
+        # Stack the objective on top of the constraint matrix (as row
+        # 0) so that each column's objective coefficient is written
+        # before its constraint coefficients
+        M = scipy.sparse.vstack((c, info.A), format='csc')
+        M.sort_indices()
+        M_ip = M.indptr
+        M_indices = M.indices
+        M_data = M.data
+        getRowLabel = ([obj_label] + row_labels).__getitem__
+        getColLabel = col_labels.__getitem__
+
+        # Split the columns into runs of integer / continuous columns
+        # (so the MARKER lines can be written between runs)
+        if int_marker and n_cols:
+            is_int = np.fromiter(
+                (v.is_integer() for v in columns), dtype=bool, count=n_cols
+            )
+            runs = [0]
+            runs.extend((np.flatnonzero(is_int[1:] != is_int[:-1]) + 1).tolist())
+            runs.append(n_cols)
+        else:
+            runs = [0, n_cols]
+
+        for run_start, run_end in zip(runs, runs[1:]):
+            if int_marker:
+                if is_int[run_start]:
+                    ostream.write(marker % (mark_cnt, 'INTORG'))
+                    in_integer_section = True
+                    mark_cnt += 1
+                elif in_integer_section:
+                    ostream.write(marker % (mark_cnt, 'INTEND'))
+                    in_integer_section = False
+                    mark_cnt += 1
+            start = run_start
+            while start < run_end:
+                # Stream the block of columns containing (approximately)
+                # _COLUMN_CHUNK_NNZ nonzeros
+                lo = M_ip[start]
+                end = int(np.searchsorted(M_ip, lo + _COLUMN_CHUNK_NNZ, 'right')) - 1
+                end = min(max(end, start + 1), run_end)
+                hi = M_ip[end]
+                cols = np.repeat(
+                    np.arange(start, end), np.diff(M_ip[start : end + 1])
+                ).tolist()
+                data = M_data[lo:hi].tolist()
+                if fmt is not None:
+                    data = map(fmt, data)
+                ostream.write(
+                    ''.join(
+                        map(
+                            entry,
+                            zip(
+                                map(getColLabel, cols),
+                                map(getRowLabel, M_indices[lo:hi].tolist()),
+                                data,
+                            ),
+                        )
+                    )
+                )
+                start = end
+
+        # Variables that only appear in SOS constraints are given an
+        # explicit 0 objective coefficient (not all solvers accept
+        # empty columns)
+        zero = 0 if fmt is None else fmt(0)
+        lines = []
+        for v, name in zip(sos_columns, sos_col_labels):
+            if int_marker:
+                if v.is_integer():
+                    if not in_integer_section:
+                        lines.append(marker % (mark_cnt, 'INTORG'))
+                        in_integer_section = True
+                        mark_cnt += 1
+                elif in_integer_section:
+                    lines.append(marker % (mark_cnt, 'INTEND'))
+                    in_integer_section = False
+                    mark_cnt += 1
+            lines.append(entry((name, obj_label, zero)))
+        if in_integer_section:
+            lines.append(marker % (mark_cnt, 'INTEND'))
+        if one_var_constant:
+            one = 1 if fmt is None else fmt(1)
+            constant = _no_negative_zero(obj_constant)
+            if fmt is not None:
+                constant = fmt(constant)
+            lines.append(entry(('ONE_VAR_CONSTANT', obj_label, constant)))
+            lines.append(entry(('ONE_VAR_CONSTANT', 'c_e_ONE_VAR_CONSTANT', one)))
+        ostream.write(''.join(lines))
+        timer.toc('Wrote COLUMNS section', level=logging.DEBUG)
+
+        #
+        # RHS
+        #
+        ostream.write("RHS\n")
+        rhs = [_no_negative_zero(val) for val in info.rhs]
+        if obj_constant and not free_format:
+            row_labels.insert(0, obj_label)
+            rhs.insert(0, -obj_constant)
+        if one_var_constant:
+            row_labels.append('c_e_ONE_VAR_CONSTANT')
+            rhs.append(1)
+        if fmt is not None:
+            rhs = map(fmt, rhs)
+        ostream.write(''.join(map(templates['rhs'].__mod__, zip(row_labels, rhs))))
+        timer.toc('Wrote RHS section', level=logging.DEBUG)
+
+        #
+        # BOUNDS
+        #
+        ostream.write("BOUNDS\n")
+        bound = templates['bound']
+        free_bound = templates['free_bound']
+        if fmt is None:
+            pos_inf, neg_inf = '10E20', '-10E20'
+            int_bound = " %s BOUND %s %s\n"
+        else:
+            pos_inf, neg_inf = fmt(1e21), fmt(-1e21)
+            int_bound = bound
+        lines = []
+        for v, name in zip(columns + sos_columns, col_labels + sos_col_labels):
+            # Note: Var.bounds guarantees the values are either (finite)
+            # native_numeric_types or None
+            lb, ub = v.bounds
+            is_integer = v.is_integer()
+            if is_integer and lb == 0 and ub == 1:
+                lines.append(free_bound % ('BV', name))
+                continue
+            if lb is not None:
+                lb = _no_negative_zero(lb)
+                if fmt is not None:
+                    lb = fmt(lb)
+            if ub is not None:
+                ub = _no_negative_zero(ub)
+                if fmt is not None:
+                    ub = fmt(ub)
+            if is_integer:
+                # The only way to declare integer columns (without
+                # markers) is through the BOUNDS section.  Unbounded
+                # integer columns are declared with "large" bounds
+                # (not all solvers accept infinite values)
+                if lb is None:
+                    lines.append(int_bound % ('LI', name, neg_inf))
+                else:
+                    lines.append(bound % ('LI', name, lb))
+                if ub is None:
+                    lines.append(int_bound % ('UI', name, pos_inf))
+                else:
+                    lines.append(bound % ('UI', name, ub))
+            elif lb is None and ub is None:
+                lines.append(free_bound % ('FR', name))
+            else:
+                if lb is None:
+                    lines.append(free_bound % ('MI', name))
+                else:
+                    lines.append(bound % ('LO', name, lb))
+                if ub is not None:
+                    lines.append(bound % ('UP', name, ub))
+        ostream.write(''.join(lines))
+        timer.toc('Wrote BOUNDS section', level=logging.DEBUG)
+
+        #
+        # SOS
+        #
+        if sos_cons:
+            ostream.write("SOS\n")
+            getSymbol = symbol_map.byObject.__getitem__
+            sos_entry = templates['sos_entry']
+            for soscon, label in zip(sos_cons, sos_labels):
+                ostream.write(templates['sos'] % (soscon.level, label))
+                for v, w in getattr(soscon, 'get_items', soscon.items)():
+                    w = float(w)
+                    if w < 0:
+                        raise ValueError(
+                            "Cannot use negative weight %f for variable %s in "
+                            "special ordered set %s" % (w, v.name, soscon.name)
+                        )
+                    ostream.write(
+                        sos_entry % (getSymbol(id(v)), w if fmt is None else fmt(w))
+                    )
+
+        ostream.write("ENDATA\n")
+
+        info = MPSWriterInfo(symbol_map)
+        timer.toc("Generated MPS representation", delta=False)
+        return info
@@ -11,7 +11,10 @@
 
 import logging
 import os
+import struct
+import sys
 from collections import defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import nullcontext
 from itertools import filterfalse, product
 from math import log10 as _log10
@@ -22,6 +25,7 @@ from pyomo.common.config import (
     ConfigDict,
     ConfigValue,
     InEnum,
+    NonNegativeInt,
     document_kwargs_from_configdict,
 )
 from pyomo.common.deprecation import relocated_module_attribute
@@ -47,6 +51,7 @@ from pyomo.core.base import (
 from pyomo.core.base.component import ActiveComponent
 from pyomo.core.base.constraint import ConstraintData
 from pyomo.core.base.expression import ScalarExpression, ExpressionData
+from pyomo.core.base.matrix_constraint import MatrixConstraintData
 from pyomo.core.base.objective import ScalarObjective, ObjectiveData
 from pyomo.core.base.suffix import SuffixFinder
 from pyomo.core.base.var import VarData
@@ -54,13 +59,22 @@ import pyomo.core.kernel as kernel
 from pyomo.core.pyomoobject import PyomoObject
 from pyomo.opt import WriterFactory
 
-from pyomo.repn.ampl import AMPLRepnVisitor, evaluate_ampl_nl_expression, TOL
+from pyomo.repn.ampl import (
+    AMPLBeforeChildDispatcher,
+    AMPLRepnVisitor,
+    NLFragment,
+    evaluate_ampl_nl_expression,
+    TOL,
+)
 from pyomo.repn.util import (
+    CompiledRepnCache,
     FileDeterminism,
     FileDeterminism_to_SortComponents,
     categorize_valid_components,
+    get_repn_cache,
     initialize_var_map_from_column_order,
     int_float,
+    new_var_map_entries,
     ordered_active_constraints,
 )
 from pyomo.repn.plugins.ampl.ampl_ import set_pyomo_amplfunc_env
@@ -281,9 +295,61 @@ class NLWriter(object):
         variable elimination (without fill-in).""",
         ),
     )
+    CONFIG.declare(
+        'parallel_workers',
+        ConfigValue(
+            default=0,
+            domain=NonNegativeInt,
+            description='Number of threads used to compile the constraints',
+            doc="""
+        If greater than 1, the active constraints are split into
+        (contiguous) shards and the compiled representation of each
+        shard is generated in a separate thread.  The shards are merged
+        in order, so the resulting NL file (and NLWriterInfo) is
+        identical to the one generated serially.  Note that the
+        constraint expressions must be walked in the same process as
+        the model, so this option is only used by Python interpreters
+        that run threads concurrently (i.e., free-threaded builds with
+        the GIL disabled); otherwise the constraints are compiled
+        serially.  Models that reference ExternalFunctions in the
+        constraints are always compiled serially.""",
+        ),
+    )
+    CONFIG.declare(
+        'binary',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Write the NL file in binary format',
+            doc="""
+        If True, the writer will generate a binary ('b' format) NL
+        file.  The output stream must be opened in binary mode.  Note
+        that the row / col files are still written as text.""",
+        ),
+    )
+    CONFIG.declare(
+        'incremental',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Reuse compiled expressions from previous calls to write()',
+            doc="""
+        If True, the writer will cache the compiled representation of
+        each constraint and objective that does not reference named
+        Expressions or ExternalFunctions.  Subsequent calls to write()
+        (using the same writer instance) will only re-walk expressions
+        that were replaced, or that reference mutable Params or fixed
+        Vars that changed since the previous write.  The cache is not
+        used when compiling constraints with `parallel_workers`.  This
+        option is ignored (and the model's cache is used) if a shared
+        cache was attached to the model with
+        :py:func:`pyomo.repn.util.attach_repn_cache`.""",
+        ),
+    )
 
     def __init__(self):
         self.config = self.CONFIG()
+        self.repn_cache = None
 
     def __call__(self, model, filename, solver_capability, io_options):
         if filename is None:
@@ -309,8 +375,12 @@ class NLWriter(object):
             _open = lambda fname: open(fname, 'w')
         else:
             _open = nullcontext
+        if config.binary:
+            _open_nl = lambda fname: open(fname, 'wb')
+        else:
+            _open_nl = lambda fname: open(fname, 'w', newline='')
         with (
-            open(filename, 'w', newline='') as FILE,
+            _open_nl(filename) as FILE,
             _open(row_fname) as ROWFILE,
             _open(col_fname) as COLFILE,
         ):
@@ -354,7 +424,9 @@ class NLWriter(object):
 
         ostream: io.TextIOBase
             The text output stream where the NL "file" will be written.
-            Could be an opened file or a io.StringIO.
+            Could be an opened file or a io.StringIO.  If `binary` is
+            True, this must be a binary stream (e.g., a file opened in
+            'wb' mode or a io.BytesIO).
 
         rowstream: io.TextIOBase
             A text output stream to write the ASL "row file" (list of
@@ -368,10 +440,18 @@ class NLWriter(object):
         """
         config = options.pop('config', self.config)(options)
 
+        # A cache attached to the model (see attach_repn_cache()) is
+        # shared with other writers and takes precedence
+        repn_cache = get_repn_cache(model)
+        if repn_cache is None and config.incremental:
+            if self.repn_cache is None:
+                self.repn_cache = CompiledRepnCache()
+            repn_cache = self.repn_cache
+
         # Pause the GC, as the walker that generates the compiled NL
         # representation generates (and disposes of) a large number of
         # small objects.
-        with _NLWriter_impl(ostream, rowstream, colstream, config) as impl:
+        with _NLWriter_impl(ostream, rowstream, colstream, config, repn_cache) as impl:
             return impl.write(model)
 
     def _generate_symbol_map(self, info):
@@ -499,8 +579,216 @@ class _NoScalingFactor(object):
         return 1
 
 
+def _compile_constraints(walk, walk_terms, constraints, scaling_factor):
+    """Generate the compiled representation for each constraint
+
+    Yields 5-tuples of ``(con, lb, ub, scale, expr_info)``, where
+    ``lb`` and ``ub`` are the (unscaled) evaluated bounds and
+    ``expr_info`` is the :py:class:`AMPLRepn` of the (scaled) body
+    returned by ``walk(con, body, 0, scale)``.  Rows of
+    :py:class:`MatrixConstraint` components are compiled directly from
+    their (CSR) terms by ``walk_terms(terms, con, 0, scale)`` without
+    generating the body expression.
+
+    """
+    for con in constraints:
+        scale = scaling_factor(con)
+        if con.__class__ is MatrixConstraintData:
+            yield con, con.lb, con.ub, scale, walk_terms(con.terms, con, 0, scale)
+            continue
+        # Note: Constraint.to_bounded_expression(evaluate_bounds=True)
+        # guarantee a return value that is either a (finite)
+        # native_numeric_type, or None
+        lb, body, ub = con.to_bounded_expression(True)
+        yield con, lb, ub, scale, walk(con, body, 0, scale)
+
+
+def _threads_run_concurrently():
+    """Return True if Python threads can execute concurrently
+
+    This is only the case for free-threaded Python builds running with
+    the GIL disabled.  Otherwise, walking expressions in multiple
+    threads is slower than walking them serially.
+
+    """
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def _remap_repn_ids(repn, remap):
+    """Replace references to duplicate subexpression ids in an AMPLRepn"""
+    if repn.nonlinear:
+        nl, args = repn.nonlinear
+        repn.nonlinear = nl, [remap.get(_id, _id) for _id in args]
+    if repn.nl:
+        nl, args = repn.nl
+        repn.nl = nl, tuple(remap.get(_id, _id) for _id in args)
+    if repn.named_exprs:
+        repn.named_exprs = {remap.get(_id, _id) for _id in repn.named_exprs}
+
+
+class _BinaryNLStream(object):
+    """Output stream that encodes text NL segments in binary NL format
+
+    The NL writer generates (and emits) the NL file as text.  When
+    writing binary NL files, this stream is placed between the writer
+    and the (binary) output stream and encodes each (complete) line of
+    NL text into the equivalent binary record: segment keys and
+    expression graph operators are single characters followed by the
+    segment / operator arguments packed as native C ints (or doubles),
+    and strings are encoded as an int length followed by the raw bytes.
+    The 10-line header is identical in both formats (except for the
+    leading 'b' and the arithmetic flag), and is passed through as text.
+
+    The writer can also bypass the text encoding for the larger numeric
+    sections by calling :py:meth:`write_bytes` with complete binary
+    segments.
+
+    """
+
+    mode = 'wb'
+    int_fmt = struct.Struct('=i')
+    int2_fmt = struct.Struct('=ii')
+    int3_fmt = struct.Struct('=iii')
+    real_fmt = struct.Struct('=d')
+    real2_fmt = struct.Struct('=dd')
+    int_real_fmt = struct.Struct('=id')
+    int_int_fmt = int2_fmt
+
+    def __init__(self, ostream):
+        self.ostream = ostream
+        self.buffer = ''
+        self.header_lines = 10
+        self.n_vars = 0
+        self.n_cons = 0
+        # The encoder for the data lines in the current segment, and the
+        # number of remaining data lines
+        self.data_encoder = None
+        self.data_lines = 0
+
+    def write(self, text):
+        if self.buffer:
+            text = self.buffer + text
+        lines = text.split('\n')
+        self.buffer = lines.pop()
+        if lines:
+            self.ostream.write(b''.join(map(self._encode_line, lines)))
+
+    def write_bytes(self, data):
+        assert not self.buffer and not self.data_lines
+        self.ostream.write(data)
+
+    def flush(self):
+        assert not self.buffer
+        self.ostream.flush()
+
+    @staticmethod
+    def encode_str(val):
+        val = val.encode('utf-8')
+        return _BinaryNLStream.int_fmt.pack(len(val)) + val
+
+    def _encode_line(self, line):
+        if self.header_lines:
+            self.header_lines -= 1
+            if self.header_lines == 8:
+                # Header line 2: "n_vars n_cons n_objs n_ranges n_eqns"
+                tokens = line.split('#', 1)[0].split()
+                self.n_vars = int(tokens[0])
+                self.n_cons = int(tokens[1])
+            return (line + '\n').encode('utf-8')
+        key = line[0]
+        if key == 'h':
+            # String constant (these may contain '#')
+            return b'h' + self.encode_str(line.split(':', 1)[1])
+        tokens = line.split('#', 1)[0].split()
+        if self.data_lines:
+            self.data_lines -= 1
+            return self.data_encoder(tokens)
+        if key == 'n':
+            return b'n' + self.real_fmt.pack(float(tokens[0][1:]))
+        if key == 'o' or key == 'v':
+            return key.encode() + self.int_fmt.pack(int(tokens[0][1:]))
+        if key in '0123456789':
+            # argument count for n-ary operators
+            return self.int_fmt.pack(int(tokens[0]))
+        if key == 'f':
+            return b'f' + self.int2_fmt.pack(int(tokens[0][1:]), int(tokens[1]))
+        if key == 'C':
+            return b'C' + self.int_fmt.pack(int(tokens[0][1:]))
+        if key == 'O':
+            return b'O' + self.int2_fmt.pack(int(tokens[0][1:]), int(tokens[1]))
+        if key == 'V':
+            args = int(tokens[0][1:]), int(tokens[1]), int(tokens[2])
+            self._start_segment(self._encode_int_real, args[1])
+            return b'V' + self.int3_fmt.pack(*args)
+        if key in 'JGdx':
+            args = tuple(map(int, (tokens[0][1:],) + tuple(tokens[1:])))
+            self._start_segment(self._encode_int_real, args[-1])
+            return key.encode() + b''.join(map(self.int_fmt.pack, args))
+        if key == 'r' or key == 'b':
+            self._start_segment(
+                self._encode_bound, self.n_cons if key == 'r' else self.n_vars
+            )
+            return key.encode()
+        if key == 'k':
+            n = int(tokens[0][1:])
+            self._start_segment(self._encode_int, n)
+            return b'k' + self.int_fmt.pack(n)
+        if key == 'S':
+            kind, n = int(tokens[0][1:]), int(tokens[1])
+            self._start_segment(
+                self._encode_int_real if kind & 4 else self._encode_int_int, n
+            )
+            return b'S' + self.int2_fmt.pack(kind, n) + self.encode_str(tokens[2])
+        if key == 'F':
+            args = int(tokens[0][1:]), int(tokens[1]), int(tokens[2])
+            return b'F' + self.int3_fmt.pack(*args) + self.encode_str(tokens[3])
+        raise DeveloperError(
+            f"Unsupported line format when encoding binary NL file: '{line}'"
+        )
+
+    def _start_segment(self, encoder, n):
+        self.data_encoder = encoder
+        self.data_lines = max(n, 0)
+
+    def write_linear(self, key, idx, linear, column_order):
+        """Write a complete J / G segment"""
+        pack = self.int_real_fmt.pack
+        self.write_bytes(
+            key
+            + self.int2_fmt.pack(idx, len(linear))
+            + b''.join(
+                pack(column_order[_id], linear[_id])
+                for _id in sorted(linear, key=column_order.__getitem__)
+            )
+        )
+
+    def _encode_int(self, tokens):
+        return self.int_fmt.pack(int(tokens[0]))
+
+    def _encode_int_real(self, tokens):
+        return self.int_real_fmt.pack(int(tokens[0]), float(tokens[1]))
+
+    def _encode_int_int(self, tokens):
+        return self.int_int_fmt.pack(int(tokens[0]), int(tokens[1]))
+
+    def _encode_bound(self, tokens):
+        _type = tokens[0]
+        if _type == '3':
+            return b'3'
+        elif _type == '0':
+            return b'0' + self.real2_fmt.pack(float(tokens[1]), float(tokens[2]))
+        elif _type == '5':
+            return b'5' + self.int2_fmt.pack(int(tokens[1]), int(tokens[2]))
+        else:
+            return _type.encode() + self.real_fmt.pack(float(tokens[1]))
+
+
 class _NLWriter_impl(object):
-    def __init__(self, ostream, rowstream, colstream, config):
+    def __init__(self, ostream, rowstream, colstream, config, repn_cache=None):
+        self.binary = config.binary
+        if self.binary:
+            ostream = _BinaryNLStream(ostream)
         self.ostream = ostream
         self.rowstream = rowstream
         self.colstream = colstream
@@ -525,6 +813,7 @@ class _NLWriter_impl(object):
         self.next_V_line_id = 0
         self.pause_gc = None
         self.template = self.visitor.Result.template
+        self.repn_cache = repn_cache
 
     def __enter__(self):
         self.pause_gc = PauseGC()
@@ -639,7 +928,7 @@ class _NLWriter_impl(object):
                 else:
                     timer.toc('Objective %s', last_parent, level=logging.DEBUG)
                 last_parent = obj.parent_component()
-            expr_info = visitor.walk_expression((obj.expr, obj, 1, scaling_factor(obj)))
+            expr_info = self.walk_expression(obj, obj.expr, 1, scaling_factor(obj))
             if expr_info.named_exprs:
                 self._record_named_expression_usage(expr_info.named_exprs, obj, 1)
             if expr_info.nonlinear:
@@ -673,20 +962,25 @@ class _NLWriter_impl(object):
         n_complementarity_range = 0
         n_complementarity_nz_var_lb = 0
         #
+        if self.config.parallel_workers > 1 and _threads_run_concurrently():
+            compiled_constraints = self._compile_constraints_in_shards(
+                list(ordered_active_constraints(model, self.config)), scaling_factor
+            )
+        else:
+            compiled_constraints = _compile_constraints(
+                self.walk_expression,
+                self.visitor.walk_linear_terms,
+                ordered_active_constraints(model, self.config),
+                scaling_factor,
+            )
         last_parent = None
-        for con in ordered_active_constraints(model, self.config):
+        for con, lb, ub, scale, expr_info in compiled_constraints:
             if with_debug_timing and con.parent_component() is not last_parent:
                 if last_parent is None:
                     timer.toc(None)
                 else:
                     timer.toc('Constraint %s', last_parent, level=logging.DEBUG)
                 last_parent = con.parent_component()
-            scale = scaling_factor(con)
-            # Note: Constraint.to_bounded_expression(evaluate_bounds=True)
-            # guarantee a return value that is either a (finite)
-            # native_numeric_type, or None
-            lb, body, ub = con.to_bounded_expression(True)
-            expr_info = visitor.walk_expression((body, con, 0, scale))
             if expr_info.named_exprs:
                 self._record_named_expression_usage(expr_info.named_exprs, con, 0)
 
@@ -1153,7 +1447,8 @@ class _NLWriter_impl(object):
             except IOError:
                 _written_bytes = None
 
-        line_1_txt = f"g3 1 1 0\t# problem {model.name}\n"
+        binary = self.binary
+        line_1_txt = f"{'b' if binary else 'g'}3 1 1 0\t# problem {model.name}\n"
         ostream.write(line_1_txt)
 
         # If there were any string arguments, then we need to ensure
@@ -1250,10 +1545,17 @@ class _NLWriter_impl(object):
         #
         # LINE 6
         #
+        # The binary format requires the arithmetic type (byte order) of
+        # the machine that wrote the file: 1 for IEEE little-endian, 2
+        # for IEEE big-endian
+        if binary:
+            arith = 1 if sys.byteorder == 'little' else 2
+        else:
+            arith = 0
         ostream.write(
-            " 0 %d 0 1\t"
+            " 0 %d %d 1\t"
             "# linear network variables; functions; arith, flags\n"
-            % (len(self.external_functions),)
+            % (len(self.external_functions), arith)
         )
         #
         # LINE 7
@@ -1460,16 +1762,27 @@ class _NLWriter_impl(object):
                 (var_idx, val * variable_scaling[var_idx])
                 for var_idx, val in _init_lines
             ]
-        ostream.write(
-            'x%d%s\n'
-            % (len(_init_lines), "\t# initial guess" if symbolic_solver_labels else '')
-        )
-        ostream.write(
-            ''.join(
-                f'{var_idx} {val!s}{col_comments[var_idx]}\n'
-                for var_idx, val in _init_lines
+        if binary:
+            pack = ostream.int_real_fmt.pack
+            ostream.write_bytes(
+                b'x'
+                + ostream.int_fmt.pack(len(_init_lines))
+                + b''.join(pack(var_idx, val) for var_idx, val in _init_lines)
+            )
+        else:
+            ostream.write(
+                'x%d%s\n'
+                % (
+                    len(_init_lines),
+                    "\t# initial guess" if symbolic_solver_labels else '',
+                )
+            )
+            ostream.write(
+                ''.join(
+                    f'{var_idx} {val!s}{col_comments[var_idx]}\n'
+                    for var_idx, val in _init_lines
+                )
             )
-        )
 
         #
         # "r" lines (constraint bounds)
@@ -1491,17 +1804,38 @@ class _NLWriter_impl(object):
         #
         # "b" lines (variable bounds)
         #
-        ostream.write(
-            'b%s\n'
-            % (
-                (
-                    "\t#%d bounds (on variables)" % len(variables)
-                    if symbolic_solver_labels
-                    else ''
-                ),
+        if binary:
+            real = ostream.real_fmt.pack
+            real2 = ostream.real2_fmt.pack
+            bounds = [b'b']
+            for _id in variables:
+                lb, ub = var_bounds[_id]
+                if lb == ub:
+                    if lb is None:  # unbounded
+                        bounds.append(b'3')
+                    else:  # ==
+                        bounds.append(b'4' + real(lb))
+                elif lb is None:  # var <= ub
+                    bounds.append(b'1' + real(ub))
+                elif ub is None:  # lb <= body
+                    bounds.append(b'2' + real(lb))
+                else:  # lb <= body <= ub
+                    bounds.append(b'0' + real2(lb, ub))
+            ostream.write_bytes(b''.join(bounds))
+            variables_txt = ()
+        else:
+            ostream.write(
+                'b%s\n'
+                % (
+                    (
+                        "\t#%d bounds (on variables)" % len(variables)
+                        if symbolic_solver_labels
+                        else ''
+                    ),
+                )
             )
-        )
-        for var_idx, _id in enumerate(variables):
+            variables_txt = variables
+        for var_idx, _id in enumerate(variables_txt):
             lb, ub = var_bounds[_id]
             if lb == ub:
                 if lb is None:  # unbounded
@@ -1518,21 +1852,30 @@ class _NLWriter_impl(object):
         #
         # "k" lines (column offsets in Jacobian NNZ)
         #
-        ostream.write(
-            'k%d%s\n'
-            % (
-                len(variables) - 1,
-                (
-                    "\t#intermediate Jacobian column lengths"
-                    if symbolic_solver_labels
-                    else ''
-                ),
+        if binary:
+            pack = ostream.int_fmt.pack
+            k_lines = [b'k', pack(len(variables) - 1)]
+            ktot = 0
+            for _id in variables[:-1]:
+                ktot += con_nnz_by_var.get(_id, 0)
+                k_lines.append(pack(ktot))
+            ostream.write_bytes(b''.join(k_lines))
+        else:
+            ostream.write(
+                'k%d%s\n'
+                % (
+                    len(variables) - 1,
+                    (
+                        "\t#intermediate Jacobian column lengths"
+                        if symbolic_solver_labels
+                        else ''
+                    ),
+                )
             )
-        )
-        ktot = 0
-        for var_idx, _id in enumerate(variables[:-1]):
-            ktot += con_nnz_by_var.get(_id, 0)
-            ostream.write(f"{ktot}\n")
+            ktot = 0
+            for var_idx, _id in enumerate(variables[:-1]):
+                ktot += con_nnz_by_var.get(_id, 0)
+                ostream.write(f"{ktot}\n")
 
         #
         # "J" lines (non-empty terms in the Jacobian)
@@ -1546,6 +1889,9 @@ class _NLWriter_impl(object):
             if scale_model:
                 for _id, val in linear.items():
                     linear[_id] /= scaling_cache[_id]
+            if binary:
+                ostream.write_linear(b'J', row_idx, linear, column_order)
+                continue
             ostream.write(f'J{row_idx} {len(linear)}{row_comments[row_idx]}\n')
             for _id in sorted(linear, key=column_order.__getitem__):
                 ostream.write(f'{column_order[_id]} {linear[_id]!s}\n')
@@ -1562,6 +1908,9 @@ class _NLWriter_impl(object):
             if scale_model:
                 for _id, val in linear.items():
                     linear[_id] /= scaling_cache[_id]
+            if binary:
+                ostream.write_linear(b'G', obj_idx, linear, column_order)
+                continue
             ostream.write(f'G{obj_idx} {len(linear)}{row_comments[obj_idx + n_cons]}\n')
             for _id in sorted(linear, key=column_order.__getitem__):
                 ostream.write(f'{column_order[_id]} {linear[_id]!s}\n')
@@ -1590,10 +1939,161 @@ class _NLWriter_impl(object):
             eliminated_vars=eliminated_vars,
             scaling=scaling,
         )
+        if self.repn_cache is not None:
+            self.repn_cache.purge(visitor.Result)
         timer.toc("Wrote NL stream", level=logging.DEBUG)
         timer.toc("Generated NL representation", delta=False)
         return info
 
+    def walk_expression(self, comp, expr, src_idx, scale):
+        """Generate the compiled representation of a constraint / objective
+
+        If the writer was provided a :py:class:`CompiledRepnCache`, then
+        a cached representation is returned (and the variables it
+        references are recorded in the var_map) when the cache is still
+        current.  Only representations that do not reference named
+        Expressions or ExternalFunctions (i.e., whose nonlinear
+        fragment only references variables) are cached.
+
+        """
+        cache = self.repn_cache
+        visitor = self.visitor
+        if cache is None or hasattr(comp, 'template_expr'):
+            return visitor.walk_expression((expr, comp, src_idx, scale))
+        var_map = self.var_map
+        namespace = visitor.Result
+        comp_expr = comp.expr
+        repn, new_vars = cache.get(comp, comp_expr, namespace, scale)
+        if repn is not None:
+            record_var = AMPLBeforeChildDispatcher._record_var
+            for v in new_vars:
+                if id(v) not in var_map:
+                    record_var(visitor, v)
+            return repn
+        n_vars = len(var_map)
+        repn = visitor.walk_expression((expr, comp, src_idx, scale))
+        if repn.named_exprs:
+            return repn
+        if repn.nonlinear and any(_id not in var_map for _id in repn.nonlinear[1]):
+            return repn
+        new_vars = new_var_map_entries(var_map, n_vars)
+        new_vars.extend(map(var_map.__getitem__, repn.linear))
+        if repn.nonlinear:
+            new_vars.extend(map(var_map.__getitem__, repn.nonlinear[1]))
+        cache.add(comp, comp_expr, namespace, scale, repn, new_vars)
+        return repn
+
+    def _compile_constraints_in_shards(self, constraints, scaling_factor):
+        """Compile the constraint expressions using a pool of threads
+
+        The constraint list is split into contiguous shards, each of
+        which is walked by an independent :py:class:`AMPLRepnVisitor`
+        (seeded with copies of the current writer state, so that the
+        shards do not share any mutable state).  The shard results are
+        then merged back into the writer state in shard order.  As both
+        the ``var_map`` and the ``subexpression_cache`` are ordered by
+        first encounter, merging in shard order reproduces exactly the
+        state generated by a serial walk.
+
+        """
+        n_shards = min(self.config.parallel_workers, len(constraints))
+        if n_shards < 2:
+            return list(
+                _compile_constraints(
+                    self.walk_expression,
+                    self.visitor.walk_linear_terms,
+                    constraints,
+                    scaling_factor,
+                )
+            )
+        shard_size = -(-len(constraints) // n_shards)
+        visitor = self.visitor
+        shards = []
+        for i in range(n_shards):
+            shards.append(
+                AMPLRepnVisitor(
+                    dict(self.subexpression_cache),
+                    dict(self.external_functions),
+                    dict(self.var_map),
+                    set(),
+                    self.symbolic_solver_labels,
+                    self.config.export_defined_variables,
+                    self.sorter,
+                )
+            )
+
+        def _compile_shard(i):
+            walk = shards[i].walk_expression
+            return list(
+                _compile_constraints(
+                    lambda con, body, idx, scale: walk((body, con, idx, scale)),
+                    shards[i].walk_linear_terms,
+                    constraints[i * shard_size : (i + 1) * shard_size],
+                    scaling_factor,
+                )
+            )
+
+        with ThreadPoolExecutor(max_workers=n_shards) as executor:
+            results = list(executor.map(_compile_shard, range(n_shards)))
+
+        n_ef = len(self.external_functions)
+        if any(len(shard.external_functions) != n_ef for shard in shards):
+            # External function IDs are embedded in the compiled NL
+            # fragments in the order that they are encountered: we
+            # cannot (cheaply) renumber them, so fall back on the serial
+            # walker.
+            return list(
+                _compile_constraints(
+                    self.walk_expression,
+                    self.visitor.walk_linear_terms,
+                    constraints,
+                    scaling_factor,
+                )
+            )
+
+        var_map = self.var_map
+        subexpression_cache = self.subexpression_cache
+        # Each shard generates its own NLFragment for the nonlinear
+        # portion of a named expression.  Only retain the first one
+        # (keyed by the id() of the parent named expression).
+        fragments = {
+            id(node._node): _id
+            for _id, (node, _, _) in subexpression_cache.items()
+            if node.__class__ is NLFragment
+        }
+        ans = []
+        for shard, compiled in zip(shards, results):
+            for _id, v in shard.var_map.items():
+                if _id not in var_map:
+                    var_map[_id] = v
+            remap = {}
+            new_subexpressions = []
+            for _id, info in shard.subexpression_cache.items():
+                if _id in subexpression_cache:
+                    continue
+                node = info[0]
+                if node.__class__ is NLFragment:
+                    parent_id = id(node._node)
+                    if parent_id in fragments:
+                        remap[_id] = fragments[parent_id]
+                        continue
+                    fragments[parent_id] = _id
+                new_subexpressions.append((_id, info))
+            for _id, info in new_subexpressions:
+                if remap:
+                    _remap_repn_ids(info[1], remap)
+                subexpression_cache[_id] = info
+            if remap:
+                for info in compiled:
+                    _remap_repn_ids(info[4], remap)
+            self.used_named_expressions.update(
+                remap.get(_id, _id) for _id in shard.used_named_expressions
+            )
+            if shard.encountered_string_arguments:
+                visitor.encountered_string_arguments = True
+            ans.extend(compiled)
+        return ans
+
     def _categorize_vars(self, comp_list, linear_by_comp):
         """Categorize compiled expression vars into linear and nonlinear
 
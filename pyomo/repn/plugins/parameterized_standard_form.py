@@ -287,6 +287,14 @@ class _CSCMatrix(_SparseMatrixBase):
 class _ParameterizedLinearStandardFormCompiler_impl(_LinearStandardFormCompiler_impl):
     _csc_matrix = _CSCMatrix
     _csr_matrix = _CSRMatrix
+    # The template expansion does not support parameterized coefficients
+    _vectorize_templates = False
+    # MatrixConstraint columns may include `wrt` variables, so the
+    # rows are processed through the (parameterized) expression walker
+    _compile_matrix_constraints = False
+    # Parameterized representations depend on `wrt` (and not just the
+    # expression), so they are not cached
+    _cache_repns = False
 
     def _get_visitor(self, subexpression_cache, var_recorder):
         wrt = self.config.wrt
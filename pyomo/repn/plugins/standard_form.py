@@ -22,10 +22,13 @@ from pyomo.common.config import (
 )
 from pyomo.common.dependencies import scipy, numpy as np
 from pyomo.common.enums import ObjectiveSense
+from pyomo.common.errors import InfeasibleConstraintException
 from pyomo.common.gc_manager import PauseGC
 from pyomo.common.numeric_types import native_types, value
 from pyomo.common.timing import TicTocTimer
 
+from pyomo.core.base.constraint import TemplateConstraintData
+from pyomo.core.base.matrix_constraint import MatrixConstraintData
 from pyomo.core.base import (
     Block,
     Objective,
@@ -45,8 +48,10 @@ from pyomo.repn.util import (
     FileDeterminism_to_SortComponents,
     TemplateVarRecorder,
     categorize_valid_components,
+    get_repn_cache,
     initialize_var_map_from_column_order,
     ordered_active_constraints,
+    walk_cached_expression,
 )
 
 ### FIXME: Remove the following as soon as non-active components no
@@ -57,6 +62,10 @@ from pyomo.network import Port
 logger = logging.getLogger(__name__)
 
 RowEntry = collections.namedtuple('RowEntry', ['constraint', 'bound_type'])
+TemplateBlock = collections.namedtuple(
+    'TemplateBlock', ['constraints', 'offset', 'index', 'data', 'lb', 'ub']
+)
+MatrixBlock = collections.namedtuple('MatrixBlock', ['constraints'])
 
 
 # TODO: make a proper base class
@@ -271,6 +280,20 @@ class LinearStandardFormCompiler(object):
 class _LinearStandardFormCompiler_impl(object):
     # Making these methods class attributes so that others can change the hooks
     _get_visitor = LinearRepnVisitor
+    # Compile runs of templatized constraints (that share a common
+    # template) in a single vectorized pass
+    _vectorize_templates = True
+    # Compile MatrixConstraint rows directly from their CSR data (runs
+    # of rows from a single MatrixConstraint are added in a single
+    # vectorized pass)
+    _compile_matrix_constraints = True
+    # Reuse compiled representations from a CompiledRepnCache attached
+    # to the model (see attach_repn_cache())
+    _cache_repns = True
+    # Additional (active) component types that the compiler will not
+    # reject.  Derived writers that process these components directly
+    # (e.g., SOSConstraints in the MPS writer) can extend this set.
+    _ignored_ctypes = frozenset()
     _to_vector = None
     _csc_matrix = None
     _csr_matrix = None
@@ -309,7 +332,8 @@ class _LinearStandardFormCompiler_impl(object):
                 RangeSet,
                 Port,
                 # TODO: Piecewise, Complementarity
-            },
+            }
+            | self._ignored_ctypes,
             targets={Suffix, Objective},
         )
         if unknown:
@@ -333,6 +357,7 @@ class _LinearStandardFormCompiler_impl(object):
         var_recorder = TemplateVarRecorder(var_map, None, sorter)
         visitor = self._get_visitor({}, var_recorder=var_recorder)
         template_visitor = LinearTemplateRepnVisitor({}, var_recorder=var_recorder)
+        repn_cache = get_repn_cache(model) if self._cache_repns else None
 
         timer.toc('Initialized column order', level=logging.DEBUG)
 
@@ -386,7 +411,9 @@ class _LinearStandardFormCompiler_impl(object):
                 obj_data.append(linear_data)
                 obj_offset.append(offset)
             else:
-                repn = visitor.walk_expression(obj.expr)
+                repn = walk_cached_expression(
+                    repn_cache, visitor, var_map, var_recorder, obj, obj.expr
+                )
                 N = len(repn.linear)
                 obj_index.append(map(var_recorder.var_order.__getitem__, repn.linear))
                 obj_data.append(repn.linear.values())
@@ -419,8 +446,69 @@ class _LinearStandardFormCompiler_impl(object):
         con_data = []
         con_index = []
         con_index_ptr = [0]
+        # Vectorized (NumPy) blocks of con_data / con_index.  Any
+        # pending (Python) rows are converted to a block when a new
+        # vectorized block is encountered.
+        con_blocks = []
+        con_block_nnz = 0
         last_parent = None
-        for con in ordered_active_constraints(model, self.config):
+        constraints = ordered_active_constraints(model, self.config)
+        if self._vectorize_templates and not slack_form:
+            constraints = self._expand_template_blocks(constraints, template_visitor)
+        if self._compile_matrix_constraints and not slack_form:
+            constraints = self._expand_matrix_blocks(constraints)
+        for con in constraints:
+            if con.__class__ is MatrixBlock:
+                if (
+                    with_debug_timing
+                    and con.constraints[0]._component is not last_parent
+                ):
+                    if last_parent is not None:
+                        timer.toc('Constraint %s', last_parent(), level=logging.DEBUG)
+                    last_parent = con.constraints[0]._component
+                if con_nnz > con_block_nnz:
+                    con_blocks.append(
+                        self._create_block(con_data, con_index, con_nnz - con_block_nnz)
+                    )
+                    con_data = []
+                    con_index = []
+                con_nnz, block = self._add_matrix_block(
+                    con.constraints,
+                    mixed_form,
+                    con_nnz,
+                    rows,
+                    rhs,
+                    con_index_ptr,
+                    var_map,
+                    var_recorder,
+                )
+                con_blocks.append(block)
+                con_block_nnz = con_nnz
+                continue
+
+            if con.__class__ is TemplateBlock:
+                if (
+                    with_debug_timing
+                    and con.constraints[0]._component is not last_parent
+                ):
+                    if last_parent is not None:
+                        timer.toc('Constraint %s', last_parent(), level=logging.DEBUG)
+                    last_parent = con.constraints[0]._component
+                if con.lb is None and con.ub is None:
+                    continue
+                if con_nnz > con_block_nnz:
+                    con_blocks.append(
+                        self._create_block(con_data, con_index, con_nnz - con_block_nnz)
+                    )
+                    con_data = []
+                    con_index = []
+                con_nnz, block = self._add_template_block(
+                    con, mixed_form, con_nnz, rows, rhs, con_index_ptr
+                )
+                con_blocks.append(block)
+                con_block_nnz = con_nnz
+                continue
+
             if with_debug_timing and con._component is not last_parent:
                 if last_parent is not None:
                     timer.toc('Constraint %s', last_parent(), level=logging.DEBUG)
@@ -431,6 +519,17 @@ class _LinearStandardFormCompiler_impl(object):
                     template_visitor.expand_expression(con, con.template_expr())
                 )
                 N = len(linear_data)
+            elif (
+                con.__class__ is MatrixConstraintData
+                and self._compile_matrix_constraints
+            ):
+                lb = con.lb
+                ub = con.ub
+                repn = visitor.walk_linear_terms(con.terms)
+                N = len(repn.linear)
+                offset = repn.constant
+                linear_index = map(var_recorder.var_order.__getitem__, repn.linear)
+                linear_data = repn.linear.values()
             else:
                 # Note: lb and ub could be a number, expression, or None
                 lb, body, ub = con.to_bounded_expression()
@@ -438,7 +537,9 @@ class _LinearStandardFormCompiler_impl(object):
                     lb = value(lb)
                 if ub.__class__ not in native_types:
                     ub = value(ub)
-                repn = visitor.walk_expression(body)
+                repn = walk_cached_expression(
+                    repn_cache, visitor, var_map, var_recorder, con, body
+                )
                 if repn.nonlinear is not None:
                     raise ValueError(
                         f"Model constraint ({con.name}) contains nonlinear terms that "
@@ -462,7 +563,7 @@ class _LinearStandardFormCompiler_impl(object):
                 # TODO: add a (configurable) feasibility tolerance
                 if (lb is None or lb <= offset) and (ub is None or ub >= offset):
                     continue
-                raise InfeasibleError(
+                raise InfeasibleConstraintException(
                     f"model contains a trivially infeasible constraint, '{con.name}'"
                 )
 
@@ -547,6 +648,14 @@ class _LinearStandardFormCompiler_impl(object):
         columns = list(var_map.values())
         n_cols = len(columns)
 
+        if con_blocks:
+            if con_nnz > con_block_nnz:
+                con_blocks.append(
+                    self._create_block(con_data, con_index, con_nnz - con_block_nnz)
+                )
+            con_data = np.concatenate([block[0] for block in con_blocks])
+            con_index = np.concatenate([block[1] for block in con_blocks])
+
         # Convert the compiled data to scipy sparse matrices
         c = self._create_csc(obj_data, obj_index, obj_index_ptr, obj_nnz, n_cols)
         A = self._create_csc(con_data, con_index, con_index_ptr, con_nnz, n_cols)
@@ -590,6 +699,9 @@ class _LinearStandardFormCompiler_impl(object):
         else:
             eliminated_vars = []
 
+        if repn_cache is not None:
+            repn_cache.purge(visitor.__class__)
+
         info = LinearStandardFormInfo(
             c, np.array(obj_offset), A, rhs, rows, columns, objectives, eliminated_vars
         )
@@ -608,8 +720,8 @@ class _LinearStandardFormCompiler_impl(object):
                 (data, index, index_ptr), [len(index_ptr) - 1, n_cols]
             ).tocsc()
 
-        data = self._to_vector(itertools.chain.from_iterable(data), np.float64, nnz)
-        index = self._to_vector(itertools.chain.from_iterable(index), np.int32, nnz)
+        if data.__class__ is not np.ndarray:
+            data, index = self._create_block(data, index, nnz)
         index_ptr = np.array(index_ptr, dtype=np.int32)
         A = self._csr_matrix((data, index, index_ptr), [len(index_ptr) - 1, n_cols])
         A = A.tocsc()
@@ -617,6 +729,224 @@ class _LinearStandardFormCompiler_impl(object):
         A.eliminate_zeros()
         return A
 
+    def _create_block(self, data, index, nnz):
+        return (
+            self._to_vector(itertools.chain.from_iterable(data), np.float64, nnz),
+            self._to_vector(itertools.chain.from_iterable(index), np.int32, nnz),
+        )
+
+    def _expand_template_blocks(self, constraints, template_visitor):
+        """Group consecutive templatized constraints into TemplateBlocks
+
+        Consecutive constraints that share a common template are
+        expanded in a single vectorized pass (see
+        :py:meth:`LinearTemplateRepnVisitor.expand_expressions`).
+        Constraints that are not templatized (or whose templates cannot
+        be vectorized) are passed through unchanged.
+
+        """
+        for key, group in itertools.groupby(
+            constraints,
+            lambda con: (
+                id(con._expr) if con.__class__ is TemplateConstraintData else None
+            ),
+        ):
+            if key is None:
+                yield from group
+                continue
+            group = list(group)
+            if len(group) > 1:
+                ans = template_visitor.expand_expressions(
+                    group, group[0].template_expr()
+                )
+                if ans is not None:
+                    yield TemplateBlock(group, *ans)
+                    continue
+            yield from group
+
+    def _add_template_block(self, block, mixed_form, nnz, rows, rhs, index_ptr):
+        """Add the rows for a vectorized TemplateBlock
+
+        Each constraint in the block can generate up to two rows
+        (the upper bound row followed by the lower bound row).  We
+        build both candidate rows for every constraint and then use a
+        mask to select the rows that are actually present.
+
+        """
+        cons, offset, index, data, lb, ub = block
+        n_cons, N = index.shape
+        present = np.zeros((n_cons, 2), dtype=bool)
+        bound_type = np.empty((n_cons, 2), dtype=np.int8)
+        row_rhs = np.empty((n_cons, 2), dtype=np.float64)
+        row_mult = np.ones((n_cons, 2), dtype=np.float64)
+        bound_type[:, 0] = 1
+        bound_type[:, 1] = -1
+        if ub is not None:
+            present[:, 0] = True
+            row_rhs[:, 0] = ub - offset
+        if lb is not None:
+            present[:, 1] = True
+            if mixed_form:
+                row_rhs[:, 1] = lb - offset
+            else:
+                row_rhs[:, 1] = offset - lb
+                row_mult[:, 1] = -1
+        if mixed_form and lb is not None and ub is not None:
+            # Equality constraints generate a single row
+            eq = lb == ub
+            bound_type[eq, 0] = 0
+            present[eq, 1] = False
+
+        present = present.ravel()
+        row_con = np.repeat(np.arange(n_cons), 2)[present]
+        n_rows = len(row_con)
+        rows.extend(
+            map(
+                RowEntry,
+                map(cons.__getitem__, row_con.tolist()),
+                bound_type.ravel()[present].tolist(),
+            )
+        )
+        rhs.extend(row_rhs.ravel()[present].tolist())
+        index_ptr.extend(range(nnz + N, nnz + N * (n_rows + 1), N))
+        data = data[row_con] * row_mult.ravel()[present, None]
+        return nnz + N * n_rows, (data.ravel(), index[row_con].ravel())
+
+    def _expand_matrix_blocks(self, constraints):
+        """Group consecutive rows of a MatrixConstraint into MatrixBlocks
+
+        All other constraints (and TemplateBlocks) are passed through
+        unchanged.
+
+        """
+        for key, group in itertools.groupby(
+            constraints,
+            lambda con: (
+                con._component if con.__class__ is MatrixConstraintData else None
+            ),
+        ):
+            if key is None:
+                yield from group
+            else:
+                yield MatrixBlock(list(group))
+
+    def _add_matrix_block(
+        self, cons, mixed_form, nnz, rows, rhs, index_ptr, var_map, var_recorder
+    ):
+        """Add the rows for a run of rows from a single MatrixConstraint
+
+        The rows are assembled directly from the CSR data stored on the
+        MatrixConstraint (without generating any expressions).  As with
+        :py:meth:`_add_template_block`, each constraint can generate up
+        to two rows (the upper bound row followed by the lower bound
+        row), and we use a mask to select the rows that are actually
+        present.
+
+        """
+        comp = cons[0].parent_component()
+        x = comp._x
+        n_cons = len(cons)
+
+        # Map the MatrixConstraint columns to the standard form
+        # columns.  Fixed variables (that are not already in the
+        # var_map) are moved to the constant offset (column -1).
+        var_order = var_recorder.var_order
+        col = np.empty(len(x), dtype=np.int64)
+        x_fixed = {}
+        for j, v in enumerate(x):
+            _id = id(v)
+            if _id not in var_map:
+                if v.fixed:
+                    col[j] = -1
+                    x_fixed[j] = value(v)
+                    continue
+                var_recorder.add(v)
+            col[j] = var_order[_id]
+
+        # Gather the (nonzero) entries for the requested rows
+        con_idx = np.fromiter((con._index for con in cons), np.int64, n_cons)
+        starts = comp._A_indptr[con_idx]
+        lens = comp._A_indptr[con_idx + 1] - starts
+        row_of = np.repeat(np.arange(n_cons), lens)
+        pos = np.arange(len(row_of)) + np.repeat(
+            starts - (np.cumsum(lens) - lens), lens
+        )
+        x_idx = comp._A_indices[pos]
+        data = comp._A_data[pos]
+        index = col[x_idx]
+        fixed = index < 0
+        if x_fixed:
+            x_val = np.zeros(len(x))
+            x_val[list(x_fixed)] = list(x_fixed.values())
+            offset = np.bincount(
+                row_of[fixed],
+                weights=data[fixed] * x_val[x_idx[fixed]],
+                minlength=n_cons,
+            )
+        else:
+            offset = np.zeros(n_cons)
+        keep = ~fixed & (data != 0)
+        row_of = row_of[keep]
+        data = data[keep]
+        index = index[keep]
+        N = np.bincount(row_of, minlength=n_cons)
+        row_start = np.cumsum(N) - N
+
+        lb = comp._lower[con_idx]
+        ub = comp._upper[con_idx]
+        has_lb = lb != -np.inf
+        has_ub = ub != np.inf
+        bounded = has_lb | has_ub
+        # Constant (trivial) constraints: skip them if they are
+        # feasible, otherwise report the (first) infeasible one
+        trivial = bounded & (N == 0)
+        if trivial.any():
+            infeasible = trivial & ((lb > offset) | (ub < offset))
+            if infeasible.any():
+                con = cons[int(np.flatnonzero(infeasible)[0])]
+                raise InfeasibleConstraintException(
+                    f"model contains a trivially infeasible constraint, '{con.name}'"
+                )
+            bounded &= N > 0
+
+        present = np.empty((n_cons, 2), dtype=bool)
+        present[:, 0] = bounded & has_ub
+        present[:, 1] = bounded & has_lb
+        bound_type = np.empty((n_cons, 2), dtype=np.int8)
+        bound_type[:, 0] = 1
+        bound_type[:, 1] = -1
+        row_rhs = np.empty((n_cons, 2), dtype=np.float64)
+        row_rhs[:, 0] = ub - offset
+        row_mult = np.ones((n_cons, 2), dtype=np.float64)
+        if mixed_form:
+            row_rhs[:, 1] = lb - offset
+            # Equality constraints generate a single row
+            eq = present[:, 0] & (lb == ub)
+            bound_type[eq, 0] = 0
+            present[eq, 1] = False
+        else:
+            row_rhs[:, 1] = offset - lb
+            row_mult[:, 1] = -1
+
+        present = present.ravel()
+        row_con = np.repeat(np.arange(n_cons), 2)[present]
+        row_len = N[row_con]
+        row_nnz = np.cumsum(row_len)
+        pos = np.arange(row_nnz[-1] if len(row_nnz) else 0) + np.repeat(
+            row_start[row_con] - (row_nnz - row_len), row_len
+        )
+        rows.extend(
+            map(
+                RowEntry,
+                map(cons.__getitem__, row_con.tolist()),
+                bound_type.ravel()[present].tolist(),
+            )
+        )
+        rhs.extend(row_rhs.ravel()[present].tolist())
+        index_ptr.extend((row_nnz + nnz).tolist())
+        data = data[pos] * np.repeat(row_mult.ravel()[present], row_len)
+        return nnz + len(pos), (data, index[pos].astype(np.int32))
+
     def _csc_to_nonnegative_vars(self, c, A, columns):
         eliminated_vars = []
         new_columns = []
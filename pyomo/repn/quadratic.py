@@ -334,3 +334,8 @@ class QuadraticRepnVisitor(linear.LinearRepnVisitor):
         util.initialize_exit_node_dispatcher(define_exit_node_handlers())
     )
     max_exponential_expansion = 2
+
+
+# The compiled walker only processes linear expressions, for which the
+# QuadraticRepnVisitor and LinearRepnVisitor generate identical results
+linear._compiled_walker_visitors.add(QuadraticRepnVisitor)
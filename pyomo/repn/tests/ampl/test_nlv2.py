@@ -17,6 +17,8 @@ import logging
 import math
 import os
 import re
+import struct
+import sys
 
 import pyomo.repn.util as repn_util
 import pyomo.repn.plugins.nl_writer as nl_writer
@@ -2797,3 +2799,242 @@ k-1
                 OUT.getvalue(),
             )
         )
+
+    def _sharded_test_model(self):
+        m = ConcreteModel()
+        m.I = pyo.RangeSet(12)
+        m.x = Var(m.I, bounds=(-5, 5), initialize=1)
+        m.y = Var(m.I, domain=Binary)
+        m.z = Var()
+        m.p = Param(m.I, initialize=lambda m, i: i, mutable=True)
+        # Named expressions that are referenced from multiple shards
+        # (both nonlinear-only and mixed linear / nonlinear)
+        m.E1 = Expression(expr=m.x[1] * m.x[2])
+        m.E2 = Expression(expr=2 * m.z + m.x[3] ** 2)
+        m.E3 = Expression(expr=m.x[4])
+        m.obj = Objective(expr=m.E1 + sum(m.x[i] for i in m.I))
+        m.c = Constraint(
+            m.I,
+            rule=lambda m, i: (
+                m.p[i] * m.x[i] + m.E2 + (m.E1 if i % 3 else m.E3) + m.y[i] <= 10
+                if i % 2
+                else m.x[i] ** 2 + m.z + m.E2 == i
+            ),
+        )
+        m.d = Constraint(m.I, rule=lambda m, i: m.x[i] - m.y[i] >= -i)
+        return m
+
+    @unittest.mock.patch.object(nl_writer, '_threads_run_concurrently', lambda: True)
+    def test_parallel_workers(self):
+        m = self._sharded_test_model()
+        for symbolic in (False, True):
+            for presolve in (False, True):
+                REF = io.StringIO()
+                ref_info = nl_writer.NLWriter().write(
+                    m, REF, symbolic_solver_labels=symbolic, linear_presolve=presolve
+                )
+                for workers in (2, 3, 7, 100):
+                    OUT = io.StringIO()
+                    info = nl_writer.NLWriter().write(
+                        m,
+                        OUT,
+                        symbolic_solver_labels=symbolic,
+                        linear_presolve=presolve,
+                        parallel_workers=workers,
+                    )
+                    self.assertEqual(REF.getvalue(), OUT.getvalue())
+                    self.assertEqual(ref_info.variables, info.variables)
+                    self.assertEqual(ref_info.constraints, info.constraints)
+                    self.assertEqual(ref_info.objectives, info.objectives)
+                    self.assertEqual(ref_info.row_labels, info.row_labels)
+                    self.assertEqual(ref_info.column_labels, info.column_labels)
+                    self.assertEqual(
+                        [v for v, _ in ref_info.eliminated_vars],
+                        [v for v, _ in info.eliminated_vars],
+                    )
+
+    def test_parallel_workers_with_gil(self):
+        # Threads cannot speed up the (pure Python) expression walkers
+        # when the GIL is enabled: the constraints are compiled serially
+        m = self._sharded_test_model()
+        with (
+            unittest.mock.patch.object(
+                nl_writer, '_threads_run_concurrently', lambda: False
+            ),
+            unittest.mock.patch.object(
+                nl_writer._NLWriter_impl,
+                '_compile_constraints_in_shards',
+                side_effect=AssertionError('sharded'),
+            ),
+        ):
+            OUT = io.StringIO()
+            nl_writer.NLWriter().write(m, OUT, parallel_workers=4)
+        REF = io.StringIO()
+        nl_writer.NLWriter().write(m, REF)
+        self.assertEqual(REF.getvalue(), OUT.getvalue())
+
+    @unittest.mock.patch.object(nl_writer, '_threads_run_concurrently', lambda: True)
+    def test_parallel_workers_external_function(self):
+        DLL = find_GSL()
+        if not DLL:
+            self.skipTest("Could not find the amplgsl.dll library")
+
+        m = ConcreteModel()
+        m.hypot = ExternalFunction(library=DLL, function="gsl_hypot")
+        m.x = Var(range(4), initialize=1)
+        m.o = Objective(expr=sum(m.x.values()))
+        m.c = Constraint(range(4), rule=lambda m, i: m.hypot(m.x[i], m.x[0]) <= 5)
+
+        REF = io.StringIO()
+        nl_writer.NLWriter().write(m, REF, symbolic_solver_labels=True)
+        OUT = io.StringIO()
+        nl_writer.NLWriter().write(
+            m, OUT, symbolic_solver_labels=True, parallel_workers=4
+        )
+        self.assertEqual(REF.getvalue(), OUT.getvalue())
+
+    def test_incremental(self):
+        m = ConcreteModel()
+        m.I = pyo.RangeSet(4)
+        m.x = Var(m.I, bounds=(0, 10), initialize=1)
+        m.y = Var()
+        m.z = Var()
+        m.p = Param(m.I, initialize=lambda m, i: i, mutable=True)
+        m.e = Expression(expr=m.x[1] * m.x[2])
+        m.o = Objective(expr=sum(m.p[i] * m.x[i] for i in m.I) + m.y**2)
+        m.c = Constraint(m.I, rule=lambda m, i: m.p[i] * m.x[i] + log(m.y) >= i)
+        m.d = Constraint(expr=m.e + m.z <= 5)
+        m.f = Constraint(expr=m.x[1] + m.x[3] == 5)
+
+        def check(writer, n_cached):
+            for presolve in (False, True):
+                REF = io.StringIO()
+                nl_writer.NLWriter().write(
+                    m, REF, symbolic_solver_labels=True, linear_presolve=presolve
+                )
+                OUT = io.StringIO()
+                writer.write(
+                    m,
+                    OUT,
+                    symbolic_solver_labels=True,
+                    linear_presolve=presolve,
+                    incremental=True,
+                )
+                self.assertEqual(REF.getvalue(), OUT.getvalue())
+            # Note: constraints / objectives that reference named
+            # Expressions are not cached
+            self.assertEqual(len(writer.repn_cache), n_cached)
+
+        writer = nl_writer.NLWriter()
+        self.assertIsNone(writer.repn_cache)
+        check(writer, 6)
+        # Nothing changed
+        check(writer, 6)
+        # Update a mutable Param
+        m.p[2] = 7
+        check(writer, 6)
+        # Fix / unfix variables
+        m.y.fix(3)
+        check(writer, 6)
+        m.y.fix(4)
+        check(writer, 6)
+        m.y.unfix()
+        check(writer, 6)
+        # Replace a constraint expression
+        m.c[4] = m.x[4] ** 2 <= m.z
+        check(writer, 6)
+        # Deactivated constraints are purged from the cache
+        m.c[1].deactivate()
+        check(writer, 5)
+        m.c[1].activate()
+        check(writer, 6)
+
+    def test_binary(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3], bounds=(0, 4), initialize=1)
+        m.y = Var()
+        m.z = Var(bounds=(None, 3))
+        m.c = Constraint(expr=m.x[1] ** 2 + pyo.sin(m.x[2]) + m.y >= 1)
+        m.d = Constraint(expr=m.x[1] + 2 * m.x[3] == 3)
+        m.e = Constraint(expr=(0, m.x[1] * m.x[2] + m.y + m.z, 5))
+        m.o = Objective(expr=m.x[1] + m.x[2] ** 2 + m.x[3] * m.y)
+
+        OUT = io.BytesIO()
+        nl_writer.NLWriter().write(m, OUT, binary=True, linear_presolve=False)
+        binary_nl = OUT.getvalue()
+        header, body = binary_nl.split(b'# common exprs: b,c,o,c1,o1\n')
+        header = header.decode().splitlines()
+        arith = 1 if sys.byteorder == 'little' else 2
+        self.assertEqual(header[0], "b3 1 1 0\t# problem unknown")
+        self.assertEqual(
+            header[5],
+            f" 0 0 {arith} 1\t# linear network variables; functions; arith, flags",
+        )
+
+        def i(*args):
+            return struct.pack('=%di' % len(args), *args)
+
+        def d(*args):
+            return struct.pack('=%dd' % len(args), *args)
+
+        self.assertEqual(
+            body,
+            b''.join(
+                [
+                    # C0: x[1]**2 + sin(x[2])
+                    b'C' + i(0),
+                    b'o' + i(0) + b'o' + i(5) + b'v' + i(1) + b'n' + d(2),
+                    b'o' + i(41) + b'v' + i(0),
+                    # C1: x[1]*x[2]
+                    b'C' + i(1),
+                    b'o' + i(2) + b'v' + i(1) + b'v' + i(0),
+                    # C2
+                    b'C' + i(2) + b'n' + d(0),
+                    # O0: x[2]**2 + x[3]*y
+                    b'O' + i(0, 0),
+                    b'o' + i(0) + b'o' + i(5) + b'v' + i(0) + b'n' + d(2),
+                    b'o' + i(2) + b'v' + i(2) + b'v' + i(3),
+                    # initial values
+                    b'x' + i(3) + i(0) + d(1) + i(1) + d(1) + i(2) + d(1),
+                    # constraint bounds
+                    b'r' + b'2' + d(1) + b'0' + d(0, 5) + b'4' + d(3),
+                    # variable bounds
+                    b'b' + b'0' + d(0, 4) + b'0' + d(0, 4) + b'0' + d(0, 4),
+                    b'3' + b'1' + d(3),
+                    # column offsets
+                    b'k' + i(4, 2, 5, 6, 8),
+                    # Jacobian
+                    b'J' + i(0, 3) + i(0) + d(0) + i(1) + d(0) + i(3) + d(1),
+                    b'J' + i(1, 4) + i(0) + d(0) + i(1) + d(0),
+                    i(3) + d(1) + i(4) + d(1),
+                    b'J' + i(2, 2) + i(1) + d(1) + i(2) + d(2),
+                    # objective gradient
+                    b'G' + i(0, 4) + i(0) + d(0) + i(1) + d(1),
+                    i(2) + d(0) + i(3) + d(0),
+                ]
+            ),
+        )
+
+        # The natively-packed sections must match the (transcoded) text
+        # output, including with symbolic labels (comments)
+        for symbolic in (False, True):
+            TXT = io.StringIO()
+            nl_writer.NLWriter().write(m, TXT, symbolic_solver_labels=symbolic)
+            txt = TXT.getvalue().replace('g3', 'b3', 1)
+            txt = txt.replace(' 0 0 0 1\t#', f' 0 0 {arith} 1\t#', 1)
+            REF = io.BytesIO()
+            stream = nl_writer._BinaryNLStream(REF)
+            stream.write(txt)
+            stream.flush()
+            OUT = io.BytesIO()
+            nl_writer.NLWriter().write(
+                m, OUT, symbolic_solver_labels=symbolic, binary=True
+            )
+            self.assertEqual(REF.getvalue(), OUT.getvalue())
+
+        # Writing to a file opens the NL file in binary mode
+        with TempfileManager:
+            fname = TempfileManager.create_tempfile(suffix='.nl')
+            m.write(fname, format='nl', io_options={'binary': True})
+            with open(fname, 'rb') as FILE:
+                self.assertEqual(FILE.read(), binary_nl)
@@ -139,3 +139,53 @@ end
         self.assertEqual(LOG.getvalue(), "")
 
         self.assertEqual(ref, OUT.getvalue())
+
+    def test_incremental(self):
+        m = pyo.ConcreteModel()
+        m.I = pyo.RangeSet(4)
+        m.x = pyo.Var(m.I, bounds=(0, 10))
+        m.y = pyo.Var()
+        m.z = pyo.Var()
+        m.p = pyo.Param(m.I, initialize=lambda m, i: i, mutable=True)
+        m.e = pyo.Expression(expr=m.x[1] + m.x[2])
+        m.o = pyo.Objective(expr=sum(m.p[i] * m.x[i] for i in m.I) + m.y**2)
+        m.c = pyo.Constraint(m.I, rule=lambda m, i: m.p[i] * m.x[i] + m.y >= i)
+        m.d = pyo.Constraint(expr=m.e + m.z <= 5)
+
+        def check(writer, n_cached):
+            REF = StringIO()
+            LPWriter().write(m, REF, symbolic_solver_labels=True)
+            OUT = StringIO()
+            writer.write(m, OUT, symbolic_solver_labels=True, incremental=True)
+            self.assertEqual(REF.getvalue(), OUT.getvalue())
+            self.assertEqual(len(writer.repn_cache), n_cached)
+
+        writer = LPWriter()
+        self.assertIsNone(writer.repn_cache)
+        check(writer, 6)
+        # Nothing changed
+        check(writer, 6)
+        # Update a mutable Param
+        m.p[2] = 7
+        check(writer, 6)
+        # Fix / unfix variables
+        m.y.fix(3)
+        check(writer, 6)
+        m.y.fix(4)
+        check(writer, 6)
+        m.y.unfix()
+        check(writer, 6)
+        # Change a named expression
+        m.e.expr = m.x[3] - m.z
+        check(writer, 6)
+        # Replace a constraint expression
+        m.c[4] = m.x[4] <= m.z
+        check(writer, 6)
+        # Deactivated constraints are purged from the cache
+        m.c[1].deactivate()
+        check(writer, 5)
+        m.c[1].activate()
+        check(writer, 6)
+        # Switching to a linear-only objective
+        m.o.expr = m.x[1]
+        check(writer, 6)
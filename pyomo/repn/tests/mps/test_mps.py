@@ -12,28 +12,38 @@
 # Test the canonical expressions
 #
 
+import gzip
 import os
 import random
 
 from filecmp import cmp
+from io import StringIO
+
 import pyomo.common.unittest as unittest
 
+from pyomo.common.dependencies import numpy_available, scipy_available
+from pyomo.common.tempfiles import TempfileManager
 from pyomo.environ import (
     ConcreteModel,
     Var,
     Objective,
     Constraint,
+    SOSConstraint,
     ComponentMap,
     minimize,
+    maximize,
     Binary,
+    Integers,
     NonNegativeReals,
     NonNegativeIntegers,
 )
+from pyomo.opt import WriterFactory
+import pyomo.repn.plugins.mps_writer as mps_writer
 
 thisdir = os.path.dirname(os.path.abspath(__file__))
 
 
-class TestMPSOrdering(unittest.TestCase):
+class _MPSOrdering_Suite(object):
     def _cleanup(self, fname):
         try:
             os.remove(fname)
@@ -43,7 +53,10 @@ class TestMPSOrdering(unittest.TestCase):
     def _get_fnames(self):
         class_name, test_name = self.id().split('.')[-2:]
         prefix = os.path.join(thisdir, test_name.replace("test_", "", 1))
-        return prefix + ".mps.baseline", prefix + ".mps.out"
+        baseline = prefix + f".{self._mps_version}.baseline"
+        if not os.path.exists(baseline):
+            baseline = prefix + ".mps.baseline"
+        return baseline, prefix + f".{self._mps_version}.out"
 
     def _check_baseline(self, model, **kwds):
         int_marker = kwds.pop("int_marker", False)
@@ -52,7 +65,10 @@ class TestMPSOrdering(unittest.TestCase):
         io_options = {"symbolic_solver_labels": True}
         io_options.update(kwds)
         model.write(
-            test_fname, format="mps", io_options=io_options, int_marker=int_marker
+            test_fname,
+            format=self._mps_version,
+            io_options=io_options,
+            int_marker=int_marker,
         )
 
         self.assertTrue(
@@ -63,15 +79,19 @@ class TestMPSOrdering(unittest.TestCase):
 
     # generates an expression in a randomized way so that
     # we can test for consistent ordering of expressions
-    # in the MPS file
+    # in the MPS file.  Note that the terms are not shuffled for MPSv2,
+    # as the default variable ordering in MPSv2 is the order in which
+    # variables are encountered when walking the expressions.
     def _gen_expression(self, terms):
         terms = list(terms)
-        random.shuffle(terms)
+        if self._shuffle_terms:
+            random.shuffle(terms)
         expr = 0.0
         for term in terms:
             if type(term) is tuple:
                 prodterms = list(term)
-                random.shuffle(prodterms)
+                if self._shuffle_terms:
+                    random.shuffle(prodterms)
                 prodexpr = 1.0
                 for x in prodterms:
                     prodexpr *= x
@@ -246,5 +266,221 @@ class TestMPSOrdering(unittest.TestCase):
         self._check_baseline(model, int_marker=True)
 
 
+class TestMPSOrdering_v1(_MPSOrdering_Suite, unittest.TestCase):
+    _mps_version = 'mps_v1'
+    _shuffle_terms = True
+
+
+@unittest.skipUnless(
+    numpy_available and scipy_available, "mps_v2 requires numpy and scipy"
+)
+class TestMPSOrdering_v2(_MPSOrdering_Suite, unittest.TestCase):
+    _mps_version = 'mps_v2'
+    _shuffle_terms = False
+
+
+@unittest.skipUnless(
+    numpy_available and scipy_available, "mps_v2 requires numpy and scipy"
+)
+class TestMPSWriter_v2(unittest.TestCase):
+    def _model(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3], bounds=(0, 4))
+        m.y = Var(within=Integers, bounds=(None, 5))
+        m.z = Var(within=Binary)
+        m.w = Var([1, 2])
+        m.o = Objective(expr=2 * m.x[1] + 3 * m.y - m.z + 5, sense=maximize)
+        m.c1 = Constraint(expr=m.x[1] + m.x[2] + m.y <= 10)
+        m.c2 = Constraint(expr=(-1, m.x[3] - m.y, 1))
+        m.c3 = Constraint(expr=m.z + m.x[2] == 1)
+        m.s1 = SOSConstraint(var=m.x, sos=1, weights={1: 1, 2: 2, 3: 3})
+        m.s2 = SOSConstraint(var=m.w, sos=2)
+        return m
+
+    def _write(self, m, **options):
+        OUT = StringIO()
+        info = mps_writer.MPSWriter().write(m, OUT, **options)
+        return OUT.getvalue(), info
+
+    def test_free_format(self):
+        m = self._model()
+        out, info = self._write(m, int_marker=True)
+        self.assertEqual(
+            out,
+            """* Source:     Pyomo MPS Writer
+* Format:     Free MPS
+*
+NAME unknown
+OBJSENSE
+ MAX
+ROWS
+ N  x8
+ L  c_u_x9_
+ L  r_u_x10_
+ G  r_l_x10_
+ E  c_e_x11_
+ E  c_e_ONE_VAR_CONSTANT
+COLUMNS
+     x1 x8 2
+     x1 c_u_x9_ 1
+     x2 c_u_x9_ 1
+     x2 c_e_x11_ 1
+     x3 r_u_x10_ 1
+     x3 r_l_x10_ 1
+     MARK0000 'MARKER' 'INTORG'
+     x4 x8 3
+     x4 c_u_x9_ 1
+     x4 r_u_x10_ -1
+     x4 r_l_x10_ -1
+     x5 x8 -1
+     x5 c_e_x11_ 1
+     MARK0001 'MARKER' 'INTEND'
+     x6 x8 0
+     x7 x8 0
+     ONE_VAR_CONSTANT x8 5
+     ONE_VAR_CONSTANT c_e_ONE_VAR_CONSTANT 1
+RHS
+     RHS c_u_x9_ 10
+     RHS r_u_x10_ 1
+     RHS r_l_x10_ -1
+     RHS c_e_x11_ 1
+     RHS c_e_ONE_VAR_CONSTANT 1
+BOUNDS
+ LO BOUND x1 0
+ UP BOUND x1 4
+ LO BOUND x2 0
+ UP BOUND x2 4
+ LO BOUND x3 0
+ UP BOUND x3 4
+ LI BOUND x4 -10E20
+ UI BOUND x4 5
+ BV BOUND x5
+ FR BOUND x6
+ FR BOUND x7
+SOS
+ S1 x12
+    x1 1
+    x2 2
+    x3 3
+ S2 x13
+    x6 1
+    x7 2
+ENDATA
+""",
+        )
+        smap = info.symbol_map
+        self.assertIs(smap.getObject('x4'), m.y)
+        self.assertIs(smap.getObject('r_u_x10_'), m.c2)
+        self.assertIs(smap.getObject('r_l_x10_'), m.c2)
+        self.assertIs(smap.getObject('__default_objective__'), m.o)
+
+    def test_fixed_format(self):
+        m = self._model()
+        m.s1.deactivate()
+        m.s2.deactivate()
+        out, info = self._write(m, free_format=False)
+        self.assertEqual(
+            out,
+            """* Source:     Pyomo MPS Writer
+* Format:     Fixed MPS
+*
+NAME          unknown
+OBJSENSE
+    MAX
+ROWS
+ N  x6
+ L  c_u_x7_
+ L  r_u_x8_
+ G  r_l_x8_
+ E  c_e_x9_
+COLUMNS
+    x1        x6                   2
+    x1        c_u_x7_              1
+    x2        c_u_x7_              1
+    x2        c_e_x9_              1
+    x3        r_u_x8_              1
+    x3        r_l_x8_              1
+    x4        x6                   3
+    x4        c_u_x7_              1
+    x4        r_u_x8_             -1
+    x4        r_l_x8_             -1
+    x5        x6                  -1
+    x5        c_e_x9_              1
+RHS
+    RHS       x6                  -5
+    RHS       c_u_x7_             10
+    RHS       r_u_x8_              1
+    RHS       r_l_x8_             -1
+    RHS       c_e_x9_              1
+BOUNDS
+ LO BOUND     x1                   0
+ UP BOUND     x1                   4
+ LO BOUND     x2                   0
+ UP BOUND     x2                   4
+ LO BOUND     x3                   0
+ UP BOUND     x3                   4
+ LI BOUND     x4              -1e+21
+ UI BOUND     x4                   5
+ BV BOUND     x5
+ENDATA
+""",
+        )
+
+        m.c3.set_value(m.z + m.x[2] == 1 / 3.0)
+        out, info = self._write(m, free_format=False)
+        self.assertIn("    RHS       c_e_x9_   0.3333333333\n", out)
+
+        m.long_name = Constraint(expr=m.x[1] >= 1)
+        with self.assertRaisesRegex(ValueError, "longer than 8 characters"):
+            self._write(m, free_format=False, symbolic_solver_labels=True)
+
+    def test_streaming_columns(self):
+        m = ConcreteModel()
+        m.x = Var(range(50), within=NonNegativeIntegers)
+        m.o = Objective(expr=sum((i % 7) * m.x[i] for i in m.x))
+        m.c = Constraint(
+            range(20),
+            rule=lambda m, j: sum((i + j) * m.x[i] for i in m.x if (i + j) % 3) >= j,
+        )
+        ref, _ = self._write(m, int_marker=True)
+        orig = mps_writer._COLUMN_CHUNK_NNZ
+        try:
+            for chunk in (1, 5, 17):
+                mps_writer._COLUMN_CHUNK_NNZ = chunk
+                out, _ = self._write(m, int_marker=True)
+                self.assertEqual(ref, out)
+        finally:
+            mps_writer._COLUMN_CHUNK_NNZ = orig
+
+    def test_gzip(self):
+        m = self._model()
+        ref, _ = self._write(m)
+        with TempfileManager.new_context() as tempfile:
+            tmpdir = tempfile.mkdtemp()
+            fname = os.path.join(tmpdir, 'model.mps.gz')
+            m.write(fname, format='mps_v2')
+            with gzip.open(fname, 'rt') as FILE:
+                self.assertEqual(ref, FILE.read())
+
+    def test_default_writer(self):
+        # The v1 writer remains the default 'mps' writer
+        self.assertIs(WriterFactory.get_class('mps'), WriterFactory.get_class('mps_v1'))
+
+    def test_quadratic_fallback(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.y = Var()
+        m.o = Objective(expr=m.x**2 + m.y)
+        m.c = Constraint(expr=m.x + m.y >= 1)
+        with self.assertRaisesRegex(ValueError, "nonlinear terms"):
+            self._write(m)
+        with TempfileManager.new_context() as tempfile:
+            tmpdir = tempfile.mkdtemp()
+            fname = os.path.join(tmpdir, 'model.mps')
+            WriterFactory('mps_v2')(m, fname, lambda x: True, {})
+            with open(fname) as FILE:
+                self.assertIn("QUADOBJ", FILE.read())
+
+
 if __name__ == "__main__":
     unittest.main()
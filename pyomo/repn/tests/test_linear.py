@@ -13,6 +13,7 @@ import pyomo.common.unittest as unittest
 
 from pyomo.common.log import LoggingIntercept
 from pyomo.common.dependencies import numpy, numpy_available
+from pyomo.contrib.appsi.cmodel import cmodel_available
 
 from pyomo.core.expr.compare import assertExpressionsEqual
 from pyomo.core.expr.numeric_expr import LinearExpression, MonomialTermExpression
@@ -1698,3 +1699,107 @@ class TestLinear(unittest.TestCase):
         self.assertEqual(repn.constant, 0)
         self.assertEqual(repn.linear, {id(m.x[0]): InvalidNumber(None)})
         self.assertEqual(repn.nonlinear, InvalidNumber(None))
+
+
+@unittest.skipUnless(cmodel_available, 'appsi extensions are not available')
+class TestCompiledWalker(unittest.TestCase):
+    def setUp(self):
+        if linear._new_compiled_walker() is None:
+            self.skipTest('The appsi extension does not include the compiled walker')
+        self._use_compiled = linear.USE_COMPILED_WALKER
+
+    def tearDown(self):
+        linear.USE_COMPILED_WALKER = self._use_compiled
+
+    def _walk(self, expr, compiled):
+        linear.USE_COMPILED_WALKER = compiled
+        cfg = VisitorConfig()
+        visitor = LinearRepnVisitor(**cfg)
+        self.assertEqual(visitor._compiled_walker is not None, compiled)
+        repn = visitor.walk_expression(expr)
+
+        def _str(val):
+            # Note: repr() distinguishes int and float values
+            if val.__class__ is InvalidNumber:
+                return val._str()
+            return repr(val)
+
+        return (
+            _str(repn.multiplier),
+            _str(repn.constant),
+            [(vid, _str(coef)) for vid, coef in repn.linear.items()],
+            str(repn.nonlinear),
+            list(cfg.var_map),
+        )
+
+    def test_compiled_matches_python(self):
+        m = ConcreteModel()
+        m.x = Var(range(4))
+        m.y = Var()
+        m.z = Var(initialize=4)
+        m.z.fix()
+        m.p = Param(range(3), mutable=True, initialize={0: 0, 1: 2, 2: 0.5})
+        m.q = Param(initialize=3, mutable=True)
+
+        exprs = [
+            m.x[1],
+            m.z,
+            5,
+            m.q,
+            2 * m.x[2],
+            0 * m.x[3],
+            m.p[2] * m.x[1] + 3 * m.z - m.y + 5,
+            m.p[0] * m.x[1] + m.p[1] * m.x[2] + m.q,
+            (m.p[1] + m.q) * m.x[0] + m.x[0] / m.q,
+            2 * (m.x[1] + 3 * (m.x[2] - m.y)) - (m.x[1] + 1) / 4,
+            -(m.x[3] - m.z * m.x[1]) * m.p[2],
+            m.q * (m.x[1] + m.x[2]) * 0 + m.y,
+            (m.x[1] - m.x[1]) * 2 + 1.5,
+            sum(i * m.x[i] for i in range(4)) + sum(m.x[i] for i in range(4)),
+        ]
+        for e in exprs:
+            self.assertEqual(self._walk(e, True), self._walk(e, False))
+
+    def test_fallback(self):
+        m = ConcreteModel()
+        m.x = Var(range(3))
+        m.z = Var()
+        m.z.fix(None)
+        m.p = Param(mutable=True, initialize=1)
+        m.e = Expression(expr=m.x[0] + 1)
+
+        walker = linear._new_compiled_walker()
+        exprs = [
+            # nonlinear
+            m.x[0] * m.x[1] + m.x[2],
+            cos(m.x[0]) + m.x[1],
+            # named expression
+            m.e + m.x[2],
+            # fixed Var without a value
+            m.z * m.x[1] + m.x[2],
+            # division by 0
+            m.x[0] / (m.p - m.p),
+            # NaN
+            nan * m.x[0],
+        ]
+        for e in exprs:
+            self.assertIsNone(walker.walk(e, {}, lambda v: None))
+            with LoggingIntercept():
+                self.assertEqual(self._walk(e, True), self._walk(e, False))
+
+    def test_walker_per_visitor(self):
+        # The compiled walker is not reentrant: each visitor has its own
+        linear.USE_COMPILED_WALKER = True
+        a = LinearRepnVisitor({})
+        b = LinearRepnVisitor({})
+        self.assertIsNotNone(a._compiled_walker)
+        self.assertIsNotNone(b._compiled_walker)
+        self.assertIsNot(a._compiled_walker, b._compiled_walker)
+
+    def test_derived_visitors(self):
+        from pyomo.repn.parameterized_linear import ParameterizedLinearRepnVisitor
+        from pyomo.repn.quadratic import QuadraticRepnVisitor
+
+        linear.USE_COMPILED_WALKER = True
+        self.assertIsNotNone(QuadraticRepnVisitor({})._compiled_walker)
+        self.assertIsNone(ParameterizedLinearRepnVisitor({}, wrt=[])._compiled_walker)
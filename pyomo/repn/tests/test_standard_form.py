@@ -15,6 +15,7 @@ import pyomo.common.unittest as unittest
 import pyomo.environ as pyo
 
 from pyomo.common.dependencies import numpy as np, scipy_available, numpy_available
+from pyomo.common.errors import InfeasibleConstraintException
 from pyomo.common.log import LoggingIntercept
 from pyomo.repn.plugins.standard_form import LinearStandardFormCompiler
 
@@ -77,6 +78,24 @@ class TestLinearStandardFormCompiler(unittest.TestCase):
         self.assertEqual(repn.rows, [(m.d, 1), (m.c, -1)])
         self.assertEqual(repn.columns, [m.y[3], m.x, m.y[1]])
 
+    def test_trivially_infeasible_constraint(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var()
+        m.y = pyo.Var()
+        m.c = pyo.Constraint(expr=m.x + m.y >= 1)
+        m.d = pyo.Constraint(expr=m.x >= 2)
+        m.x.fix(3)
+        # Trivially feasible constraints are omitted
+        repn = LinearStandardFormCompiler().write(m)
+        self.assertEqual(repn.rows, [(m.c, -1)])
+
+        m.x.fix(1)
+        with self.assertRaisesRegex(
+            InfeasibleConstraintException,
+            "model contains a trivially infeasible constraint, 'd'",
+        ):
+            LinearStandardFormCompiler().write(m)
+
     def test_suffix_warning(self):
         m = pyo.ConcreteModel()
         m.x = pyo.Var()
@@ -309,3 +328,46 @@ class TestLinearStandardFormCompiler(unittest.TestCase):
         ref = np.array([[1, -1, 0, 5, -5, 0, 0, 0, 0], [-1, 1, 0, 0, 0, -15, 0, 0, 0]])
         self.assertTrue(np.all(repn.c == ref))
         self._verify_solution(soln, repn, True)
+
+    def test_templatized_constraints(self):
+        def build():
+            m = pyo.ConcreteModel()
+            m.I = pyo.RangeSet(6)
+            m.J = pyo.RangeSet(5)
+            m.x = pyo.Var(m.I, bounds=(0, 10))
+            m.y = pyo.Var(m.I, m.I)
+            m.c = pyo.Constraint(
+                m.J, rule=lambda m, i: 3 * m.x[i] + 2 * m.x[i + 1] <= 5 + i
+            )
+            m.d = pyo.Constraint(m.J, rule=lambda m, i: (1, m.x[i] - m.x[i + 1] + 3, 5))
+            m.e = pyo.Constraint(m.J, rule=lambda m, i: m.x[i] + m.y[i, i] == 2 * i)
+            m.f = pyo.Constraint(m.I, m.I, rule=lambda m, i, j: m.y[i, j] >= m.x[j])
+            m.o = pyo.Objective(expr=sum(m.x.values()))
+            m.d[3].deactivate()
+            return m
+
+        import pyomo.core.base.constraint as constraint
+
+        orig = constraint.TEMPLATIZE_CONSTRAINTS
+        try:
+            for options in ({}, {'mixed_form': True}, {'slack_form': True}):
+                constraint.TEMPLATIZE_CONSTRAINTS = False
+                m = build()
+                ref = LinearStandardFormCompiler().write(m, **options)
+                ref_rows = [(r.constraint.name, r.bound_type) for r in ref.rows]
+                ref_cols = [v.name for v in ref.columns]
+
+                constraint.TEMPLATIZE_CONSTRAINTS = True
+                m = build()
+                self.assertTrue(hasattr(m.f[1, 1], 'template_expr'))
+                repn = LinearStandardFormCompiler().write(m, **options)
+
+                self.assertEqual(
+                    [(r.constraint.name, r.bound_type) for r in repn.rows], ref_rows
+                )
+                self.assertEqual([v.name for v in repn.columns], ref_cols)
+                self.assertEqual(list(repn.rhs), list(ref.rhs))
+                self.assertTrue(np.all(repn.A.toarray() == ref.A.toarray()))
+                self.assertTrue(np.all(repn.c.toarray() == ref.c.toarray()))
+        finally:
+            constraint.TEMPLATIZE_CONSTRAINTS = orig
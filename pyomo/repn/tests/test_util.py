@@ -41,15 +41,20 @@ from pyomo.environ import (
 import pyomo.repn.util
 from pyomo.repn.util import (
     _CONSTANT,
+    _RepnCacheEntry,
     BeforeChildDispatcher,
+    CompiledRepnCache,
     ExitNodeDispatcher,
     FileDeterminism,
     FileDeterminism_to_SortComponents,
     InvalidNumber,
     apply_node_operation,
+    attach_repn_cache,
     categorize_valid_components,
     complex_number_error,
+    detach_repn_cache,
     ftoa,
+    get_repn_cache,
     initialize_var_map_from_column_order,
     ordered_active_constraints,
 )
@@ -61,6 +66,8 @@ try:
 except:
     numpy_available = False
 
+from pyomo.common.dependencies import scipy_available
+
 
 class TestRepnUtils(unittest.TestCase):
     def test_ftoa(self):
@@ -835,6 +842,139 @@ class TestRepnUtils(unittest.TestCase):
         self.assertIs(bcd[DivisionExpression], bcd._before_general_expression)
         self.assertEqual(len(bcd), 14)
 
+    def test_compiled_repn_cache(self):
+        from pyomo.repn.linear import LinearRepnVisitor
+
+        m = ConcreteModel()
+        m.x = Var([1, 2])
+        m.y = Var()
+        m.p = Param([1, 2], initialize=1, mutable=True)
+        m.e = Expression(expr=m.p[2] * m.y)
+        m.c = Constraint(expr=m.p[1] * m.x[1] + m.e >= 0)
+        m.d = Constraint(expr=m.x[2] + m.y >= 0)
+
+        cache = CompiledRepnCache()
+        visitor = LinearRepnVisitor({})
+        for con in (m.c, m.d):
+            cache.add(con, con.expr, 'ns', None, visitor.walk_expression(con.body), [])
+        self.assertEqual(len(cache), 2)
+
+        is_current = _RepnCacheEntry.is_current
+        with unittest.mock.patch.object(
+            _RepnCacheEntry, 'is_current', autospec=True, side_effect=is_current
+        ) as validate:
+
+            def hits():
+                return [
+                    cache.get(con, con.expr, 'ns')[0] is not None for con in (m.c, m.d)
+                ]
+
+            # Unmodified entries are returned without re-validation
+            self.assertEqual(hits(), [True, True])
+            self.assertEqual(validate.call_count, 0)
+            # Entries depending on a modified component are re-validated
+            m.p[1] = 1
+            self.assertEqual(hits(), [True, True])
+            self.assertEqual(validate.call_count, 1)
+            self.assertEqual(hits(), [True, True])
+            self.assertEqual(validate.call_count, 1)
+            m.p[1] = 2
+            self.assertEqual(hits(), [False, True])
+            # ... including changes notified for the whole component
+            m.x.fix(0)
+            self.assertEqual(hits(), [False, False])
+            m.x.unfix()
+            self.assertEqual(hits(), [False, True])
+            # ... and changes to named Expressions
+            m.p[1] = 1
+            e_expr = m.e.expr
+            m.e.expr = m.y
+            self.assertEqual(hits(), [False, True])
+            m.e.expr = e_expr
+            self.assertEqual(hits(), [True, True])
+            validate.reset_mock()
+            self.assertEqual(hits(), [True, True])
+            self.assertEqual(validate.call_count, 0)
+            # Replacing the constraint expression misses without
+            # re-validation
+            m.d = m.x[2] <= 1
+            self.assertEqual(hits(), [True, False])
+            self.assertEqual(validate.call_count, 0)
+
+    @unittest.skipUnless(
+        numpy_available and scipy_available, "standard form requires numpy, scipy"
+    )
+    def test_model_repn_cache(self):
+        from pyomo.repn.linear import LinearRepnVisitor
+        from pyomo.repn.plugins.lp_writer import LPWriter
+        from pyomo.repn.plugins.standard_form import LinearStandardFormCompiler
+
+        m = ConcreteModel()
+        m.I = Set(initialize=[1, 2, 3])
+        m.x = Var(m.I, bounds=(0, 10))
+        m.y = Var()
+        m.p = Param(m.I, initialize=lambda m, i: i, mutable=True)
+        m.o = Objective(expr=sum(m.p[i] * m.x[i] for i in m.I))
+        m.c = Constraint(m.I, rule=lambda m, i: m.p[i] * m.x[i] + m.y >= i)
+        m.d = Constraint(expr=m.x[1] + m.y <= 5)
+
+        def write(model):
+            OUT = StringIO()
+            LPWriter().write(model, OUT, symbolic_solver_labels=True)
+            sf = LinearStandardFormCompiler().write(model)
+            return (
+                OUT.getvalue(),
+                sf.c.todense().tolist(),
+                sf.A.todense().tolist(),
+                list(sf.rhs),
+            )
+
+        walk_expression = LinearRepnVisitor.walk_expression
+
+        def check(n_cached, n_walked):
+            # Note: the reference is generated from a clone, which does
+            # not share the original model's cache
+            ref_model = m.clone()
+            self.assertIsNone(get_repn_cache(ref_model))
+            ref = write(ref_model)
+            with unittest.mock.patch.object(
+                LinearRepnVisitor,
+                'walk_expression',
+                autospec=True,
+                side_effect=walk_expression,
+            ) as walk:
+                self.assertEqual(write(m), ref)
+            # Only the expressions whose cached entries were stale are
+            # walked (by each of the two writers)
+            self.assertEqual(walk.call_count, n_walked)
+            self.assertEqual(len(cache), n_cached)
+
+        self.assertIsNone(get_repn_cache(m))
+        cache = attach_repn_cache(m)
+        self.assertIs(get_repn_cache(m), cache)
+        self.assertIs(attach_repn_cache(m), cache)
+        self.assertEqual(len(cache), 0)
+
+        # Each expression is cached for both the LP writer (quadratic
+        # visitor) and the standard form (linear visitor)
+        check(10, 10)
+        check(10, 0)
+        # Update a mutable Param
+        m.p[2] = 7
+        check(10, 4)
+        # Reassign a constraint expression
+        m.d = m.x[2] + 2 * m.y <= 4
+        check(10, 2)
+        # Fix a variable
+        m.y.fix(3)
+        check(10, 8)
+        # Deactivate a constraint
+        m.c[3].deactivate()
+        check(8, 0)
+
+        detach_repn_cache(m)
+        self.assertIsNone(get_repn_cache(m))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -15,6 +15,7 @@ import itertools
 import logging
 import operator
 import sys
+import weakref
 
 from pyomo.common import enums
 from pyomo.common.collections import Sequence, ComponentMap, ComponentSet
@@ -40,7 +41,7 @@ from pyomo.core.base import (
     Suffix,
     SortComponents,
 )
-from pyomo.core.base.component import ActiveComponent
+from pyomo.core.base.component import ActiveComponent, _ModelChangeObservers
 from pyomo.core.base.expression import NamedExpressionData
 from pyomo.core.expr.numvalue import is_fixed, value
 import pyomo.core.expr as EXPR
@@ -859,6 +860,324 @@ class TemplateVarRecorder(object):
                 vo[vid] = i
 
 
+def collect_expression_dependencies(expr):
+    """Collect the modeling components that an expression depends on
+
+    Returns
+    -------
+    variables: list
+        The (unique) Var data objects appearing in the expression
+        (including fixed variables)
+
+    params: list
+        The (unique) mutable Param data objects appearing in the expression
+
+    named_expressions: list
+        The (unique) named Expression data objects appearing in the
+        expression (the expressions are descended into)
+
+    """
+    variables = {}
+    params = {}
+    named_expressions = {}
+    stack = [expr]
+    while stack:
+        node = stack.pop()
+        if node.__class__ in native_types:
+            continue
+        if not node.is_expression_type():
+            if node.is_variable_type():
+                variables[id(node)] = node
+            elif node.is_parameter_type():
+                params[id(node)] = node
+            continue
+        if node.is_named_expression_type():
+            named_expressions[id(node)] = node
+        stack.extend(node.args)
+    return (
+        list(variables.values()),
+        list(params.values()),
+        list(named_expressions.values()),
+    )
+
+
+class _RepnCacheEntry(object):
+    __slots__ = (
+        'component',
+        'expr',
+        'context',
+        'repn',
+        'new_vars',
+        'variables',
+        'params',
+        'named_expressions',
+        'seen',
+        'dirty',
+    )
+
+    def __init__(self, component, expr, context, repn, new_vars):
+        self.component = component
+        self.expr = expr
+        self.context = context
+        self.repn = repn
+        self.new_vars = new_vars
+        variables, params, named_expressions = collect_expression_dependencies(expr)
+        self.variables = [(v, v.fixed, v.value if v.fixed else None) for v in variables]
+        self.params = [(p, p.value) for p in params]
+        self.named_expressions = [(e, e.expr) for e in named_expressions]
+        self.seen = True
+        self.dirty = False
+
+    def dependencies(self):
+        for v, _, _ in self.variables:
+            yield id(v)
+        for p, _ in self.params:
+            yield id(p)
+        for e, _ in self.named_expressions:
+            yield id(e)
+
+    def is_current(self):
+        for v, fixed, val in self.variables:
+            if v.fixed:
+                if not fixed or v.value != val:
+                    return False
+            elif fixed:
+                return False
+        for p, val in self.params:
+            if p.value != val:
+                return False
+        for e, expr in self.named_expressions:
+            if e.expr is not expr:
+                return False
+        return True
+
+
+class CompiledRepnCache(object):
+    """Cache of the compiled representations of component expressions
+
+    This supports writers that are called repeatedly on a mostly
+    unchanged model: a cached representation is reused (instead of
+    re-walking the expression) as long as the component's expression
+    has not been replaced, and none of the Vars (fixed status and fixed
+    value), mutable Params (value), or named Expressions (expression)
+    referenced by the expression have changed since the representation
+    was generated.
+
+    Entries are keyed by the component and a `namespace` (so that
+    different writers / visitors can share a single cache).  The
+    `context` is additional writer-specific information (e.g., the
+    scaling factor) that must match for the entry to be reused.
+
+    The cache is registered with the model change observers (see
+    :py:class:`~pyomo.core.base.component._ModelChangeObservers`):
+    entries are flagged when a Var, Param, or named Expression they
+    depend on is modified, and only flagged entries are re-validated
+    when they are retrieved.
+
+    """
+
+    __slots__ = ('_data', '_dependents', '__weakref__')
+
+    def __init__(self):
+        self._data = {}
+        # map of id(Var / Param / named Expression data) to the set of
+        # keys of the entries that depend on it
+        self._dependents = {}
+        _ModelChangeObservers.register(self)
+
+    def __len__(self):
+        return len(self._data)
+
+    def clear(self):
+        self._data.clear()
+        self._dependents.clear()
+
+    def get(self, component, expr, namespace, context=None):
+        """Return the cached repn for `component` (or None if it is stale)
+
+        On success, the variables that were originally added to the
+        writer's var_map by the expression walker are returned so that
+        the caller can replay the registration (preserving the writer's
+        variable ordering).
+
+        Returns
+        -------
+        repn:
+            A copy of the cached representation (or None)
+
+        new_vars: list
+            The variables that were recorded in the var_map when the
+            expression was originally walked
+
+        """
+        entry = self._data.get((id(component), namespace), None)
+        if entry is None or entry.expr is not expr or entry.context != context:
+            return None, None
+        if entry.dirty:
+            if not entry.is_current():
+                return None, None
+            entry.dirty = False
+        entry.seen = True
+        return entry.repn.duplicate(), entry.new_vars
+
+    def add(self, component, expr, namespace, context, repn, new_vars):
+        """Record the compiled representation of `component`
+
+        Note that `repn` is duplicated, so the caller is free to modify
+        the original after this call.
+
+        """
+        key = id(component), namespace
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self._remove_dependents(key, entry)
+        entry = self._data[key] = _RepnCacheEntry(
+            component, expr, context, repn.duplicate(), new_vars
+        )
+        dependents = self._dependents
+        for _id in entry.dependencies():
+            if _id in dependents:
+                dependents[_id].add(key)
+            else:
+                dependents[_id] = {key}
+
+    def purge(self, namespace):
+        """Remove all entries in `namespace` not used since the last purge()"""
+        data = self._data
+        for key in [k for k, v in data.items() if k[1] == namespace]:
+            entry = data[key]
+            if entry.seen:
+                entry.seen = False
+            else:
+                del data[key]
+                self._remove_dependents(key, entry)
+
+    def _remove_dependents(self, key, entry):
+        dependents = self._dependents
+        for _id in entry.dependencies():
+            keys = dependents.get(_id, None)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del dependents[_id]
+
+    def _invalidate(self, obj):
+        dependents = self._dependents
+        if not dependents:
+            return
+        if obj.is_indexed():
+            # Note: iterate over the stored data (and not values()) so
+            # that we do not construct data for array-backed Vars
+            obj_ids = map(id, obj._data.values())
+        else:
+            obj_ids = (id(obj),)
+        data = self._data
+        for _id in obj_ids:
+            for key in dependents.get(_id, ()):
+                data[key].dirty = True
+
+    #
+    # _ModelChangeObservers notification interface
+    #
+
+    def structure_changed(self, obj):
+        # Entries are keyed by (and validated against) the component
+        # expressions, so structural changes do not invalidate them
+        pass
+
+    def var_changed(self, obj):
+        self._invalidate(obj)
+
+    def param_changed(self, obj):
+        self._invalidate(obj)
+
+    def expression_changed(self, obj):
+        self._invalidate(obj)
+
+
+def new_var_map_entries(var_map, n):
+    """Return the variables added to `var_map` after it had `n` entries"""
+    n = len(var_map) - n
+    if not n:
+        return []
+    ans = list(itertools.islice(reversed(var_map.values()), n))
+    ans.reverse()
+    return ans
+
+
+def walk_cached_expression(cache, visitor, var_map, var_recorder, comp, body):
+    """Walk `body` (the expression of `comp`) using a CompiledRepnCache
+
+    This implements the cache lookup for writers built on the
+    :py:class:`LinearRepnVisitor` / :py:class:`QuadraticRepnVisitor`.
+    When the cached representation is current, the variables that it
+    references are recorded through `var_recorder` (preserving the
+    variable ordering of a full walk) and the expression is not
+    walked.  Only linear / quadratic representations (i.e., without a
+    nonlinear part) are cached.
+
+    """
+    if cache is None or hasattr(comp, 'template_expr'):
+        return visitor.walk_expression(body)
+    namespace = visitor.__class__
+    expr = comp.expr
+    repn, new_vars = cache.get(comp, expr, namespace)
+    if repn is not None:
+        add = var_recorder.add
+        for v in new_vars:
+            if id(v) not in var_map:
+                add(v)
+        return repn
+    n_vars = len(var_map)
+    repn = visitor.walk_expression(body)
+    if repn.nonlinear is None:
+        new_vars = new_var_map_entries(var_map, n_vars)
+        new_vars.extend(map(var_map.__getitem__, repn.linear))
+        quadratic = getattr(repn, 'quadratic', None)
+        if quadratic:
+            for vids in quadratic:
+                new_vars.extend(map(var_map.__getitem__, vids))
+        cache.add(comp, expr, namespace, None, repn, new_vars)
+    return repn
+
+
+# Model-level CompiledRepnCache instances.  The caches are held in a
+# WeakKeyDictionary (and not as attributes on the block) so that they
+# do not participate in clone() / pickling, and are released along
+# with the model.
+_model_repn_caches = weakref.WeakKeyDictionary()
+
+
+def attach_repn_cache(model):
+    """Attach a shared :py:class:`CompiledRepnCache` to `model`
+
+    Once attached, the LP, NL, and linear standard form writers will
+    reuse (and update) the cached representations of the model's
+    constraint and objective expressions every time they are called on
+    `model`.  Cached entries are invalidated when the component's
+    expression is reassigned, or when any mutable Param value, Var fixed
+    status / fixed value, or named Expression referenced by the
+    expression changes.
+
+    Returns the (new or existing) cache.
+
+    """
+    cache = _model_repn_caches.get(model, None)
+    if cache is None:
+        cache = _model_repn_caches[model] = CompiledRepnCache()
+    return cache
+
+
+def detach_repn_cache(model):
+    """Remove (and discard) the :py:class:`CompiledRepnCache` attached to `model`"""
+    _model_repn_caches.pop(model, None)
+
+
+def get_repn_cache(model):
+    """Return the :py:class:`CompiledRepnCache` attached to `model` (or None)"""
+    return _model_repn_caches.get(model, None)
+
+
 # Copied from cpxlp.py:
 # Keven Hunter made a nice point about using %.16g in his attachment
 # to ticket #4319. I am adjusting this to %.17g as this mocks the
@@ -0,0 +1,87 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Compare the LinearRepnVisitor using the compiled walker from the APPSI
+# extension (built with "pyomo build-extensions") against the pure
+# Python visitor.
+#
+# Usage: python linear_walker.py [N]
+
+import sys
+import timeit
+
+import pyomo.environ as pyo
+import pyomo.repn.linear as linear
+from pyomo.repn.linear import LinearRepnVisitor
+from pyomo.core.base import SortComponents
+from pyomo.repn.util import VarRecorder
+
+
+def build_model(N):
+    m = pyo.ConcreteModel()
+    m.I = pyo.RangeSet(N)
+    m.J = pyo.RangeSet(10)
+    m.x = pyo.Var(m.I, m.J, bounds=(0, None))
+    m.y = pyo.Var(m.I)
+    m.p = pyo.Param(m.J, mutable=True, initialize=lambda m, j: j)
+    exprs = {
+        # LinearExpression
+        'linear': [sum(j * m.x[i, j] for j in m.J) + m.y[i] + 5 for i in m.I],
+        # LinearExpression with mutable Param coefficients
+        'param_coefs': [sum(m.p[j] * m.x[i, j] for j in m.J) - m.y[i] for i in m.I],
+        # General sums / products / negations / divisions
+        'general': [
+            2 * (m.x[i, 1] + m.x[i, 2])
+            - (m.y[i] - 3 * m.x[i, 3]) / 4
+            + m.p[2] * (m.x[i, 4] + sum(m.x[i, j] for j in range(5, 11)))
+            for i in m.I
+        ],
+    }
+    return m, exprs
+
+
+def walk(visitor, exprs):
+    for e in exprs:
+        visitor.walk_expression(e)
+
+
+def time_walk(exprs):
+    # Note: the first walk populates the var_map (the cost of which is
+    # dominated by the VarRecorder and is independent of the walker);
+    # the timing reports subsequent walks.
+    visitor = LinearRepnVisitor(
+        {}, var_recorder=VarRecorder({}, SortComponents.deterministic)
+    )
+    walk(visitor, exprs)
+    return min(timeit.repeat(lambda: walk(visitor, exprs), number=1, repeat=3))
+
+
+def main(N):
+    m, exprs = build_model(N)
+    if linear._new_compiled_walker() is None:
+        print("The compiled walker is not available: run 'pyomo build-extensions'")
+        return
+    use_compiled = linear.USE_COMPILED_WALKER
+    print(f"{'expressions':>12} {'python':>10} {'compiled':>10} {'speedup':>8}")
+    for name, e in exprs.items():
+        times = {}
+        for compiled in (False, True):
+            linear.USE_COMPILED_WALKER = compiled
+            times[compiled] = time_walk(e)
+        print(
+            f"{name:>12} {times[False]:10.3f} {times[True]:10.3f} "
+            f"{times[False] / times[True]:7.1f}x"
+        )
+    linear.USE_COMPILED_WALKER = use_compiled
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
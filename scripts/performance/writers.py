@@ -0,0 +1,378 @@
+#!/usr/bin/env python
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Benchmark the problem writers in pyomo.repn.plugins on synthetic
+# models of increasing size.
+#
+# For every (model family, size, writer) combination this records the
+# wall time of each replicate, the peak (Python) memory allocated while
+# writing, and the per-section timings the writers report through the
+# 'pyomo.common.timing.writer' logger.  Results are stored in the same
+# JSON layout as main.py, so two runs (e.g., from different releases)
+# can be compared with compare.py:
+#
+#   python writers.py -o base.json
+#   ... (switch branches / releases) ...
+#   python writers.py -o test.json
+#   python compare.py base.json test.json
+#
+# Usage: python writers.py [-h] [-o OUTPUT] [-s SIZES] [-m MODELS]
+#                          [-w WRITERS] [-n REPLICATES]
+
+import argparse
+import gc
+import logging
+import math
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+try:
+    import ujson as json
+except ImportError:
+    import json
+
+from collections import OrderedDict
+
+import pyomo.environ as pyo
+from pyomo.common.tempfiles import TempfileManager
+from pyomo.opt import WriterFactory
+
+from main import getRunInfo
+
+#
+# Synthetic model families.  The `size` is (approximately) the number
+# of nonzeros in the constraint Jacobian.
+#
+
+
+def dense_linear(size):
+    "A single dense block: n rows by n columns"
+    n = max(int(math.sqrt(size)), 1)
+    rng = random.Random(n)
+    m = pyo.ConcreteModel()
+    m.I = pyo.RangeSet(n)
+    m.x = pyo.Var(m.I, bounds=(0, 10))
+    m.obj = pyo.Objective(expr=sum(rng.randint(1, 9) * m.x[j] for j in m.I))
+    m.c = pyo.Constraint(
+        m.I, rule=lambda m, i: sum(rng.randint(-9, 9) * m.x[j] for j in m.I) <= i
+    )
+    return m
+
+
+def sparse_linear(size):
+    "A sparse MIP with 5 nonzeros per row and a mix of variable domains"
+    n = max(size // 5, 5)
+    rng = random.Random(n)
+    m = pyo.ConcreteModel()
+    m.I = pyo.RangeSet(n)
+    m.x = pyo.Var(m.I, bounds=(0, 10))
+    m.y = pyo.Var(m.I, within=pyo.Binary)
+    m.obj = pyo.Objective(expr=sum(m.x[i] + 2 * m.y[i] for i in m.I))
+    m.c = pyo.Constraint(
+        m.I,
+        rule=lambda m, i: (
+            1,
+            sum(rng.randint(1, 9) * m.x[rng.randint(1, n)] for _ in range(4))
+            - 3 * m.y[i],
+            100,
+        ),
+    )
+    return m
+
+
+def quadratic(size):
+    "A sparse QCQP"
+    n = max(size // 4, 4)
+    m = pyo.ConcreteModel()
+    m.I = pyo.RangeSet(n)
+    m.x = pyo.Var(m.I, bounds=(-10, 10))
+    m.obj = pyo.Objective(expr=sum(m.x[i] ** 2 + m.x[i] * m.x[i % n + 1] for i in m.I))
+    m.c = pyo.Constraint(
+        m.I,
+        rule=lambda m, i: m.x[i] * m.x[i % n + 1]
+        + 2 * m.x[(i + 1) % n + 1]
+        + m.x[(i + 2) % n + 1]
+        >= -5,
+    )
+    return m
+
+
+def nonlinear(size):
+    "A sparse NLP built from named Expressions"
+    n = max(size // 4, 4)
+    m = pyo.ConcreteModel()
+    m.I = pyo.RangeSet(n)
+    m.x = pyo.Var(m.I, bounds=(0.1, 10), initialize=1)
+    m.y = pyo.Var(m.I, bounds=(0.1, 10), initialize=1)
+    m.e = pyo.Expression(m.I, rule=lambda m, i: m.x[i] ** 2 + pyo.exp(m.y[i]))
+    m.obj = pyo.Objective(expr=sum(m.e[i] for i in m.I))
+    m.c = pyo.Constraint(
+        m.I,
+        rule=lambda m, i: m.e[i] + pyo.log(m.x[i % n + 1]) * m.y[(i + 1) % n + 1]
+        <= 100,
+    )
+    return m
+
+
+def deep_blocks(size, depth=4, branching=3):
+    "A linear model distributed over a deep (nested) Block hierarchy"
+    n_leaves = branching**depth
+    n = max(size // (3 * n_leaves), 1)
+
+    def leaf(b):
+        b.I = pyo.RangeSet(n)
+        b.x = pyo.Var(b.I, bounds=(0, 1))
+        b.c = pyo.Constraint(
+            b.I,
+            rule=lambda b, i: b.x[i] + 2 * b.x[i % n + 1] - b.x[(i + 1) % n + 1] <= 1,
+        )
+
+    def node(b, level):
+        if level == depth:
+            leaf(b)
+        else:
+            b.b = pyo.Block(range(branching), rule=lambda b, i: node(b, level + 1))
+
+    m = pyo.ConcreteModel()
+    node(m, 0)
+    m.obj = pyo.Objective(
+        expr=sum(v for v in m.component_data_objects(pyo.Var, descend_into=True))
+    )
+    return m
+
+
+MODELS = OrderedDict(
+    [
+        ('dense_linear', dense_linear),
+        ('sparse_linear', sparse_linear),
+        ('quadratic', quadratic),
+        ('nonlinear', nonlinear),
+        ('deep_blocks', deep_blocks),
+    ]
+)
+
+#
+# The writers: (WriterFactory name, file extension, model families the
+# writer supports)
+#
+_linear = {'dense_linear', 'sparse_linear', 'deep_blocks'}
+_quadratic = _linear | {'quadratic'}
+_all = set(MODELS)
+
+WRITERS = OrderedDict(
+    [
+        ('lp', ('lp', 'lp', _quadratic)),
+        ('nl', ('nl', 'nl', _all)),
+        ('mps', ('mps', 'mps', _quadratic)),
+        ('mps_v1', ('mps_v1', 'mps', _quadratic)),
+        ('gams', ('gams', 'gms', _all)),
+        ('baron', ('bar', 'bar', _all)),
+        ('standard_form', ('compile_standard_form', None, _linear)),
+    ]
+)
+
+
+class SectionTimingHandler(logging.Handler):
+    """Collect the section timing emitted by the writers
+
+    The writers report the time spent in each section through the
+    'pyomo.common.timing.writer' logger (at the DEBUG level).  Each
+    record's message is a :py:class:`GeneralTimer` whose `data` is the
+    tuple (elapsed time, message template).
+
+    """
+
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.sections = None
+
+    def emit(self, record):
+        if self.sections is None:
+            return
+        try:
+            elapsed, msg = record.msg.data[0], record.msg.data[-1]
+        except AttributeError:
+            return
+        if record.args:
+            msg = msg % record.args
+        # Sections may be reported more than once (e.g., once per
+        # constraint component): accumulate them
+        self.sections[msg] = self.sections.get(msg, 0) + elapsed
+
+
+def run_writer(writer, model, fname):
+    factory_name, ext, valid = WRITERS[writer]
+    if ext is None:
+        WriterFactory(factory_name).write(model)
+    else:
+        WriterFactory(factory_name)(model, fname, lambda x: True, {})
+
+
+def benchmark(writer, model, fname, handler):
+    # Timing pass (with the section timing handler attached)
+    gc.collect()
+    handler.sections = sections = OrderedDict()
+    start = time.perf_counter()
+    run_writer(writer, model, fname)
+    wall_time = time.perf_counter() - start
+    handler.sections = None
+
+    # Memory pass (tracemalloc significantly slows down execution, so
+    # it is not enabled when collecting the timing information)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run_writer(writer, model, fname)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    ans = OrderedDict()
+    ans['test_time'] = wall_time
+    ans['peak_memory_mb'] = peak_memory / 2.0**20
+    if os.path.exists(fname):
+        ans['file_size_mb'] = os.path.getsize(fname) / 2.0**20
+    ans['timing'] = sections
+    return ans
+
+
+def run(options):
+    handler = SectionTimingHandler()
+    timing_logger = logging.getLogger('pyomo.common.timing.writer')
+    timing_logger.setLevel(logging.DEBUG)
+    timing_logger.propagate = False
+    timing_logger.addHandler(handler)
+
+    results = [OrderedDict() for i in range(options.replicates)]
+    try:
+        with TempfileManager.new_context() as tempfile:
+            tmpdir = tempfile.mkdtemp()
+            # Warm up the writers (so that the first test does not
+            # include the cost of importing optional dependencies)
+            for model_name in options.models:
+                model = MODELS[model_name](10)
+                for writer in options.writers:
+                    factory_name, ext, valid = WRITERS[writer]
+                    if model_name in valid:
+                        fname = os.path.join(tmpdir, f'warmup.{ext}')
+                        run_writer(writer, model, fname)
+            for model_name in options.models:
+                for size in options.sizes:
+                    start = time.perf_counter()
+                    model = MODELS[model_name](size)
+                    print(
+                        f"{model_name}[{size}]: built model in "
+                        f"{time.perf_counter() - start:.2f} s"
+                    )
+                    for writer in options.writers:
+                        factory_name, ext, valid = WRITERS[writer]
+                        if model_name not in valid:
+                            continue
+                        fname = os.path.join(tmpdir, f'{model_name}.{ext}')
+                        test = f'writers.py::{model_name}[{size}]::{writer}'
+                        for data in results:
+                            data[test] = benchmark(writer, model, fname, handler)
+                            if os.path.exists(fname):
+                                os.remove(fname)
+                        times = [data[test]['test_time'] for data in results]
+                        print(
+                            f"    {writer:>22}: {min(times):8.3f} s "
+                            f"{results[0][test]['peak_memory_mb']:10.1f} MB"
+                        )
+                    del model
+    finally:
+        timing_logger.removeHandler(handler)
+    return results
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(
+        description="Benchmark the pyomo.repn problem writers"
+    )
+    parser.add_argument(
+        '-o',
+        '--output',
+        action='store',
+        dest='output',
+        default=None,
+        help='Store the results (JSON) to the specified file.',
+    )
+    parser.add_argument(
+        '-s',
+        '--sizes',
+        action='store',
+        dest='sizes',
+        default='1000,10000,100000',
+        help='Comma-separated list of (approximate) model sizes '
+        '(number of constraint nonzeros).  [default=%(default)s]',
+    )
+    parser.add_argument(
+        '-m',
+        '--models',
+        action='store',
+        dest='models',
+        default=','.join(MODELS),
+        help='Comma-separated list of model families.  [default=%(default)s]',
+    )
+    parser.add_argument(
+        '-w',
+        '--writers',
+        action='store',
+        dest='writers',
+        default=','.join(WRITERS),
+        help='Comma-separated list of writers.  [default=%(default)s]',
+    )
+    parser.add_argument(
+        '-n',
+        '--replicates',
+        action='store',
+        dest='replicates',
+        type=int,
+        default=1,
+        help='Number of replicates to run.',
+    )
+    options = parser.parse_args(argv[1:])
+    options.sizes = [int(i) for i in options.sizes.split(',')]
+    options.models = options.models.split(',')
+    options.writers = options.writers.split(',')
+    for name, valid in (('model', MODELS), ('writer', WRITERS)):
+        for i in getattr(options, name + 's'):
+            if i not in valid:
+                parser.error(f"unknown {name} '{i}' (expected one of {list(valid)})")
+    # getRunInfo() (from main.py) records the git / version info
+    options.projects = ['pyomo']
+    options.cython = False
+
+    results = (getRunInfo(options),) + tuple(run(options))
+
+    if options.output:
+        print(f"Writing results to {options.output}")
+        ostream = open(options.output, 'w')
+        close_ostream = True
+    else:
+        ostream = sys.stdout
+        close_ostream = False
+    try:
+        # Note: explicitly specify sort_keys=False so that ujson
+        # preserves the OrderedDict keys in the JSON
+        json.dump(results, ostream, indent=2, sort_keys=False)
+    finally:
+        if close_ostream:
+            ostream.close()
+    return results
+
+
+if __name__ == '__main__':
+    main(sys.argv)